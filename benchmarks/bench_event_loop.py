@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call overhead of running a coroutine from synchronous code.
+
+Compares creating and tearing down a fresh loop with ``asyncio.run()`` on every
+call (the previous behaviour) with submitting to the persistent background
+loop through ``run_coroutine_threadsafe``.
+
+Usage: python benchmarks/bench_event_loop.py [iterations]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+# Add project root to path
+sys.path.append(".")
+
+from src.core.event_loop import background_loop, run_async
+
+
+async def noop():
+    """Smallest possible coroutine, so only the bridge cost is measured."""
+    return None
+
+
+async def short_io():
+    """Coroutine that yields to the loop once, like a cached client call."""
+    await asyncio.sleep(0)
+    return None
+
+
+def measure(call, iterations: int) -> dict:
+    """Per-call latency in microseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    samples.sort()
+    return {
+        "mean": statistics.mean(samples),
+        "p50": samples[len(samples) // 2],
+        "p99": samples[int(len(samples) * 0.99) - 1],
+    }
+
+
+def report(label: str, result: dict) -> None:
+    print(
+        f"⏱️  {label:<28} mean {result['mean']:8.1f} µs | "
+        f"p50 {result['p50']:8.1f} µs | p99 {result['p99']:8.1f} µs"
+    )
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    background_loop.start()
+
+    for name, coro in (("noop", noop), ("sleep(0)", short_io)):
+        before = measure(lambda: asyncio.run(coro()), iterations)
+        after = measure(lambda: run_async(coro()), iterations)
+        print(f"📦 {name} coroutine, {iterations} calls")
+        report("asyncio.run() per call", before)
+        report("background loop bridge", after)
+        print(f"🚀 Speedup: {before['mean'] / after['mean']:.1f}x")
+        print()
+
+    background_loop.stop()
+
+
+if __name__ == "__main__":
+    main()
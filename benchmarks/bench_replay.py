@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Benchmark: record and replay MCP stdio sessions against the server.
+
+``record`` sits between Cursor and the server: it forwards stdio unchanged
+and appends every client message, with its time offset, to a JSONL file.
+
+``replay`` starts ``protocol_server.py``, replays a recording at a fixed rate
+and concurrency and reports per-tool p50/p95/p99 latency, throughput, peak RSS
+and error rates. By default the server runs offline, on the in-memory vector
+store and a local stub LLM, so results are reproducible without Qdrant or
+Ollama. ``--json-out`` saves the report and ``--baseline`` compares a run
+against a saved one, e.g. the previous release.
+
+Usage:
+  python benchmarks/bench_replay.py record --out session.jsonl -- python protocol_server.py
+  python benchmarks/bench_replay.py replay benchmarks/recordings/smoke.jsonl \\
+      [--rate 50] [--concurrency 8] [--repeat 10] [--json-out report.json] \\
+      [--baseline previous.json] [--online]
+
+Recordings hold one message per line, either ``{"t": seconds, "message": ...}``
+as written by ``record`` or a bare JSON-RPC message or batch array.
+"""
+
+import argparse
+import copy
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add project root to path
+sys.path.append(".")
+
+SETUP_METHODS = {"initialize", "notifications/initialized", "initialized"}
+CANCEL_PARAMS = {"notifications/cancelled": "requestId", "$/cancelRequest": "id"}
+STUB_MODELS = ["llama3.1:8b", "llama3.2:3b", "codellama:7b", "mistral:7b"]
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+
+def record(out_path: str, command: List[str]) -> int:
+    """Run the server behind a pass-through proxy that logs client messages."""
+    server = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    start = time.monotonic()
+
+    def pump_output():
+        for chunk in iter(lambda: server.stdout.read1(65536), b""):
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+
+    output = threading.Thread(target=pump_output, daemon=True)
+    output.start()
+
+    with open(out_path, "a", encoding="utf-8") as recording:
+        for line in iter(sys.stdin.buffer.readline, b""):
+            server.stdin.write(line)
+            server.stdin.flush()
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            entry = {"t": round(time.monotonic() - start, 6), "message": message}
+            recording.write(json.dumps(entry) + "\n")
+            recording.flush()
+
+    server.stdin.close()
+    code = server.wait()
+    output.join(5)
+    return code
+
+
+def load_recording(path: str) -> List[Tuple[float, Any]]:
+    """Read ``(offset, message)`` pairs from a recording."""
+    entries = []
+    with open(path, encoding="utf-8") as recording:
+        for line in recording:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if isinstance(entry, dict) and "message" in entry:
+                entries.append((float(entry.get("t", 0.0)), entry["message"]))
+            else:
+                entries.append((0.0, entry))
+    return entries
+
+
+# ---------------------------------------------------------------------------
+# Offline stub LLM (Ollama-compatible)
+# ---------------------------------------------------------------------------
+
+
+class StubLLMHandler(BaseHTTPRequestHandler):
+    """Answers Ollama API calls after a fixed delay."""
+
+    latency = 0.05
+
+    def _reply(self, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply({"models": [{"name": name} for name in STUB_MODELS]})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(self.latency)
+        text = "stub response"
+        if self.path.endswith("/api/chat"):
+            self._reply(
+                {
+                    "model": request.get("model"),
+                    "message": {"role": "assistant", "content": text},
+                    "done": True,
+                }
+            )
+        else:
+            self._reply({"model": request.get("model"), "response": text, "done": True})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_llm(latency_ms: float) -> ThreadingHTTPServer:
+    """Serve the stub LLM on a free localhost port."""
+    handler = type(
+        "ConfiguredStubLLM", (StubLLMHandler,), {"latency": latency_ms / 1000}
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def label_of(message: Dict[str, Any]) -> str:
+    """Report key: the tool name for tool calls, the method otherwise."""
+    if message.get("method") == "tools/call":
+        return (message.get("params") or {}).get("name", "tools/call")
+    return message.get("method", "?")
+
+
+def peak_rss_mb(pid: int) -> Optional[float]:
+    """Peak resident set size of a running process (Linux)."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+class Group:
+    """Requests sent on one line (a single call or a batch array)."""
+
+    def __init__(self, size: int):
+        self.remaining = size
+
+
+class Replayer:
+    """Drives one server process through a recording."""
+
+    def __init__(self, server: subprocess.Popen, concurrency: int):
+        self.server = server
+        self.slots = threading.Semaphore(concurrency)
+        self.lock = threading.Lock()
+        self.pending: Dict[int, Tuple[str, float, Group]] = {}
+        self.drained = threading.Condition(self.lock)
+        self.next_id = 0
+        self.samples: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.error_codes: Dict[str, int] = {}
+        self.notifications = 0
+        self.reader = threading.Thread(target=self._read, daemon=True)
+        self.reader.start()
+
+    def _read(self) -> None:
+        for line in self.server.stdout:
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            for item in message if isinstance(message, list) else [message]:
+                self._receive(item)
+
+    def _receive(self, message: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if "id" not in message:
+            with self.lock:
+                self.notifications += 1
+            return
+
+        with self.lock:
+            entry = self.pending.pop(message["id"], None)
+            if entry is None:
+                return
+            label, sent_at, group = entry
+            self.samples.setdefault(label, []).append((now - sent_at) * 1000)
+            if "error" in message:
+                self.errors[label] = self.errors.get(label, 0) + 1
+                code = str(message["error"].get("code"))
+                self.error_codes[code] = self.error_codes.get(code, 0) + 1
+            group.remaining -= 1
+            if group.remaining == 0:
+                self.slots.release()
+            if not self.pending:
+                self.drained.notify_all()
+
+    def send(self, message: Any, id_map: Dict[Any, int]) -> None:
+        """Send one recorded line with fresh ids, respecting the concurrency cap."""
+        message = copy.deepcopy(message)
+        members = message if isinstance(message, list) else [message]
+        calls = [m for m in members if isinstance(m, dict) and "id" in m]
+
+        for member in members:
+            if isinstance(member, dict) and member.get("method") in CANCEL_PARAMS:
+                params = member.get("params") or {}
+                key = CANCEL_PARAMS[member["method"]]
+                params[key] = id_map.get(params.get(key), params.get(key))
+
+        if calls:
+            self.slots.acquire()
+        group = Group(len(calls))
+        with self.lock:
+            sent_at = time.perf_counter()
+            for call in calls:
+                self.next_id += 1
+                id_map[call["id"]] = self.next_id
+                call["id"] = self.next_id
+                self.pending[self.next_id] = (label_of(call), sent_at, group)
+
+        self.server.stdin.write((json.dumps(message) + "\n").encode("utf-8"))
+        self.server.stdin.flush()
+
+    def wait(self, timeout: float) -> int:
+        """Wait for outstanding responses; returns how many never arrived."""
+        deadline = time.monotonic() + timeout
+        with self.lock:
+            while self.pending and time.monotonic() < deadline:
+                self.drained.wait(deadline - time.monotonic())
+            return len(self.pending)
+
+
+def replay(args) -> Dict[str, Any]:
+    """Replay a recording and build the report."""
+    entries = load_recording(args.recording)
+    setup = [
+        m
+        for _, m in entries
+        if isinstance(m, dict) and m.get("method") in SETUP_METHODS
+    ]
+    calls = [
+        (t, m)
+        for t, m in entries
+        if not (isinstance(m, dict) and m.get("method") in SETUP_METHODS)
+    ]
+    if not setup:
+        setup = [{"jsonrpc": "2.0", "id": 0, "method": "initialize", "params": {}}]
+
+    env = dict(os.environ)
+    stub = None
+    if not args.online:
+        stub = start_stub_llm(args.llm_latency_ms)
+        env["QDRANT_URL"] = "memory"
+        env["VECTOR_STORE_DIR"] = "none"
+        env["EMBEDDING_CACHE_PATH"] = "none"
+        env["OLLAMA_URL"] = f"http://127.0.0.1:{stub.server_address[1]}"
+
+    server_log = open(args.server_log, "ab") if args.server_log else subprocess.DEVNULL
+    server = subprocess.Popen(
+        [sys.executable, args.server],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=server_log,
+        env=env,
+    )
+    replayer = Replayer(server, args.concurrency)
+
+    # The session handshake is replayed once and not measured
+    for message in setup:
+        replayer.send(message, {})
+    if replayer.wait(args.timeout):
+        raise RuntimeError("Server did not answer initialize")
+    replayer.samples.clear()
+    replayer.errors.clear()
+    replayer.error_codes.clear()
+
+    interval = 1.0 / args.rate if args.rate > 0 else 0.0
+    start = time.perf_counter()
+    sent = 0
+    for repeat in range(args.repeat):
+        id_map: Dict[Any, int] = {}
+        offset = time.perf_counter() - start
+        for t, message in calls:
+            if args.recorded_timing:
+                due = offset + t / args.speed
+            else:
+                due = sent * interval
+            delay = due - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+            replayer.send(message, id_map)
+            sent += 1
+
+    lost = replayer.wait(args.timeout)
+    duration = time.perf_counter() - start
+    rss = peak_rss_mb(server.pid)
+
+    server.stdin.close()
+    try:
+        server.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+    if rss is None:
+        # ru_maxrss is in KB on Linux and bytes on macOS
+        maxrss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        rss = maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    if stub is not None:
+        stub.shutdown()
+
+    tools = {}
+    for label, samples in sorted(replayer.samples.items()):
+        errors = replayer.errors.get(label, 0)
+        tools[label] = {
+            "count": len(samples),
+            "errors": errors,
+            "error_rate": round(errors / len(samples), 4),
+            "p50_ms": round(percentile(samples, 50), 3),
+            "p95_ms": round(percentile(samples, 95), 3),
+            "p99_ms": round(percentile(samples, 99), 3),
+            "mean_ms": round(sum(samples) / len(samples), 3),
+            "max_ms": round(max(samples), 3),
+        }
+
+    answered = sum(tool["count"] for tool in tools.values())
+    errors = sum(tool["errors"] for tool in tools.values())
+    return {
+        "recording": args.recording,
+        "offline": not args.online,
+        "rate": args.rate,
+        "concurrency": args.concurrency,
+        "repeat": args.repeat,
+        "duration_s": round(duration, 3),
+        "requests": answered + lost,
+        "throughput_rps": round(answered / duration, 3) if duration else 0.0,
+        "errors": errors,
+        "error_rate": round((errors + lost) / max(answered + lost, 1), 4),
+        "error_codes": replayer.error_codes,
+        "lost": lost,
+        "notifications": replayer.notifications,
+        "peak_rss_mb": round(rss, 1) if rss else None,
+        "tools": tools,
+    }
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    """Print the report, with p95 and throughput deltas against a baseline."""
+    mode = "offline" if report["offline"] else "online"
+    print(f"📊 Replay of {report['recording']} ({mode})")
+    print(
+        f"   {report['requests']} requests in {report['duration_s']}s → "
+        f"{report['throughput_rps']} req/s, errors {report['errors']} "
+        f"({report['error_rate']:.1%}), lost {report['lost']}, "
+        f"peak RSS {report['peak_rss_mb']} MB"
+    )
+    if report["error_codes"]:
+        print(f"   error codes: {report['error_codes']}")
+
+    header = f"   {'tool':<32}{'count':>7}{'err':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    if baseline:
+        header += f"{'Δp95':>9}"
+    print(header)
+    for label, tool in report["tools"].items():
+        line = (
+            f"   {label:<32}{tool['count']:>7}{tool['errors']:>6}"
+            f"{tool['p50_ms']:>10.2f}{tool['p95_ms']:>10.2f}"
+            f"{tool['p99_ms']:>10.2f}{tool['max_ms']:>10.2f}"
+        )
+        before = (baseline or {}).get("tools", {}).get(label)
+        if before and before["p95_ms"]:
+            line += f"{(tool['p95_ms'] / before['p95_ms'] - 1):>+9.0%}"
+        print(line)
+
+    if baseline and baseline.get("throughput_rps"):
+        change = report["throughput_rps"] / baseline["throughput_rps"] - 1
+        print(
+            f"   throughput vs baseline: {baseline['throughput_rps']} → "
+            f"{report['throughput_rps']} req/s ({change:+.0%})"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="Proxy and record a session")
+    record_parser.add_argument("--out", required=True, help="JSONL file to append to")
+    record_parser.add_argument("server_command", nargs=argparse.REMAINDER)
+
+    replay_parser = commands.add_parser("replay", help="Replay a recording")
+    replay_parser.add_argument("recording")
+    replay_parser.add_argument("--server", default="protocol_server.py")
+    replay_parser.add_argument(
+        "--rate", type=float, default=0.0, help="Requests/s, 0 = unpaced"
+    )
+    replay_parser.add_argument("--concurrency", type=int, default=8)
+    replay_parser.add_argument("--repeat", type=int, default=1)
+    replay_parser.add_argument(
+        "--recorded-timing",
+        action="store_true",
+        help="Send at the recorded offsets instead of --rate",
+    )
+    replay_parser.add_argument(
+        "--speed", type=float, default=1.0, help="Recorded timing speed-up"
+    )
+    replay_parser.add_argument("--timeout", type=float, default=120.0)
+    replay_parser.add_argument(
+        "--online", action="store_true", help="Use real Qdrant/LLM"
+    )
+    replay_parser.add_argument("--llm-latency-ms", type=float, default=50.0)
+    replay_parser.add_argument("--server-log", help="File for the server's stderr")
+    replay_parser.add_argument("--json-out", help="Save the report as JSON")
+    replay_parser.add_argument("--baseline", help="Report JSON to compare against")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        command = [c for c in args.server_command if c != "--"]
+        if not command:
+            parser.error("record needs a server command after --")
+        sys.exit(record(args.out, command))
+
+    print(
+        f"🚀 Replaying {args.recording} x{args.repeat} (rate {args.rate or 'unpaced'}, concurrency {args.concurrency})"
+    )
+    report = replay(args)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report saved to {args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
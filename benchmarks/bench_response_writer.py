@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON-RPC response transport cost.
+
+Compares the previous path (``json.dumps`` plus a flushed write per response,
+on the handler thread) with the buffered writer thread, for each available
+encoder. Output goes to /dev/null so only serialization and syscalls count.
+
+Usage: python benchmarks/bench_response_writer.py [responses]
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+# Add project root to path
+sys.path.append(".")
+
+from src.mcp_tools.writer import ResponseWriter
+
+
+def make_response(i: int) -> dict:
+    """A typical tool response: summary text plus structured content."""
+    items = [
+        {"id": f"item-{j}", "content": "x" * 80, "priority": j % 3} for j in range(20)
+    ]
+    return {
+        "jsonrpc": "2.0",
+        "id": i,
+        "result": {
+            "content": [{"type": "text", "text": f"Retrieved {len(items)} items"}],
+            "structuredContent": {"items": items, "total": len(items)},
+        },
+    }
+
+
+def direct(stream, responses, threads: int) -> float:
+    """Previous behaviour: serialize and flush under a lock, per response."""
+    lock = threading.Lock()
+
+    def send(chunk):
+        for response in chunk:
+            line = json.dumps(response).encode("utf-8")
+            with lock:
+                stream.write(line + b"\n")
+                stream.flush()
+
+    return run_threads(send, responses, threads)
+
+
+def buffered(writer: ResponseWriter, responses, threads: int):
+    """Current behaviour: hand off to the writer thread.
+
+    Returns (seconds handlers spent sending, seconds until everything was
+    written).
+    """
+
+    def send(chunk):
+        for response in chunk:
+            writer.write(response)
+
+    handed_off = run_threads(send, responses, threads)
+    start = time.perf_counter()
+    writer.flush()
+    return handed_off, handed_off + (time.perf_counter() - start)
+
+
+def run_threads(send, responses, threads: int) -> float:
+    chunks = [responses[i::threads] for i in range(threads)]
+    workers = [threading.Thread(target=send, args=(chunk,)) for chunk in chunks]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    threads = 8
+    responses = [make_response(i) for i in range(count)]
+    size = len(json.dumps(responses[0]))
+    print(f"📦 {count} responses (~{size} bytes each) from {threads} threads")
+
+    with open(os.devnull, "wb") as stream:
+        elapsed = direct(stream, responses, threads)
+        print(
+            f"⏱️  json.dumps + flush per response: {count / elapsed:10.0f} msg/s"
+            f" | handlers blocked {elapsed:6.3f} s"
+        )
+
+        for encoder in ("json", "msgspec", "orjson"):
+            writer = ResponseWriter(stream=stream, encoder=encoder)
+            if writer.encoder_name != encoder:
+                print(f"⚠️  {encoder} not installed, skipped")
+                continue
+            handed_off, elapsed = buffered(writer, responses, threads)
+            stats = writer.get_statistics()
+            writer.close()
+            print(
+                f"⏱️  writer thread ({encoder:>7}):        {count / elapsed:10.0f} msg/s"
+                f" | handlers blocked {handed_off:6.3f} s"
+                f" | {stats['bytes'] / elapsed / 1e6:6.1f} MB/s"
+                f" | {stats['messages_per_write']:5.1f} msg/write"
+            )
+
+
+if __name__ == "__main__":
+    main()
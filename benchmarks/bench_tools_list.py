@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: tools/list and initialize response cost.
+
+Compares rebuilding the tool schemas from the handler modules and serializing
+them on every request (the previous behaviour) with writing the catalogue that
+is pre-serialized at startup.
+
+Usage: python benchmarks/bench_tools_list.py [iterations]
+"""
+
+import json
+import sys
+import time
+
+# Add project root to path
+sys.path.append(".")
+
+from src.mcp_tools.catalog import ToolCatalog
+from src.mcp_tools.consolidated_handlers import tool_registry
+from src.mcp_tools.handlers import (
+    basic_tools,
+    system_tools,
+    database_tools,
+    autogen_tools,
+    communication_tools,
+    knowledge_tools,
+)
+
+
+def rebuild_and_serialize(request_id: int) -> bytes:
+    """Previous tools/list path: rebuild every schema, then json.dumps."""
+    tools = []
+    tools.extend(basic_tools.get_basic_tools())
+    tools.extend(system_tools.get_system_tools())
+    tools.extend(database_tools.get_database_tools())
+    tools.extend(autogen_tools.get_autogen_tools())
+    tools.extend(communication_tools.get_communication_tools())
+    tools.extend(knowledge_tools.get_knowledge_tools())
+    response = {"jsonrpc": "2.0", "id": request_id, "result": {"tools": tools}}
+    return json.dumps(response).encode("utf-8")
+
+
+def precomputed(catalog: ToolCatalog, request_id: int) -> bytes:
+    """Current tools/list path: frame the cached bytes."""
+    return (
+        b'{"jsonrpc":"2.0","id":'
+        + json.dumps(request_id).encode("utf-8")
+        + b',"result":'
+        + catalog.tools_list_bytes
+        + b"}"
+    )
+
+
+def measure(func, iterations: int) -> float:
+    """Mean microseconds per call."""
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(i)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    catalog = ToolCatalog(tool_registry, {"name": "benchmark", "version": "0"})
+    catalog.refresh()
+
+    # Both paths must produce the same tool list
+    assert (
+        json.loads(rebuild_and_serialize(1))["result"]
+        == json.loads(precomputed(catalog, 1))["result"]
+    )
+
+    rebuild_us = measure(rebuild_and_serialize, iterations)
+    cached_us = measure(lambda i: precomputed(catalog, i), iterations)
+    init_us = measure(lambda i: catalog.initialize_bytes, iterations)
+
+    stats = catalog.get_statistics()
+    print(f"📦 Catalogue {stats['version']}: {stats['tools']} tools")
+    print(f"   tools/list payload: {stats['tools_list_bytes']} bytes")
+    print(f"   build time: {stats['build_time_ms']} ms (once at startup)")
+    print(f"⏱️  rebuild + json.dumps: {rebuild_us:10.1f} µs/request")
+    print(f"⏱️  precomputed bytes:    {cached_us:10.1f} µs/request")
+    print(f"⏱️  initialize bytes:     {init_us:10.1f} µs/request")
+    print(f"🚀 Speedup: {rebuild_us / cached_us:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
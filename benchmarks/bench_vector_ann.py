@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: recall@k vs latency of the approximate in-memory vector index.
+
+Builds a collection of synthetic clustered vectors (points scattered around
+random topic centres, like sentence embeddings), trains its IVF index and
+sweeps ``nprobe``. Each setting reports recall@10 against the exact search,
+the rows scored per query and the per-query latency, so ``nlist``/``nprobe``
+(``VECTOR_ANN_NLIST`` / ``VECTOR_ANN_NPROBE``) can be tuned offline.
+
+Usage: python benchmarks/bench_vector_ann.py [points] [dimensions] [nlist]
+"""
+
+import statistics
+import sys
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(".")
+
+from src.database.ann_index import IVFConfig
+from src.database.vector_collection import VectorCollection, normalize_rows
+
+LIMIT = 10
+QUERIES = 200
+
+
+def clustered(rng, points: int, dimensions: int, topics: int) -> np.ndarray:
+    """Unit vectors around ``topics`` random centres."""
+    centres = rng.normal(size=(topics, dimensions)).astype(np.float32)
+    vectors = centres[rng.integers(topics, size=points)]
+    vectors += 1.5 * rng.normal(size=(points, dimensions)).astype(np.float32)
+    return normalize_rows(vectors)
+
+
+def measure(collection, queries) -> tuple:
+    """Hit ids per query and per-query latencies in milliseconds."""
+    hits, samples = [], []
+    for query in queries:
+        start = time.perf_counter()
+        result = collection.search(query, LIMIT)
+        samples.append((time.perf_counter() - start) * 1000)
+        hits.append([hit["id"] for hit in result])
+    samples.sort()
+    return hits, samples
+
+
+def recall(found, truth) -> float:
+    return statistics.mean(
+        len(set(hits) & set(expected)) / len(expected)
+        for hits, expected in zip(found, truth)
+    )
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    dimensions = int(sys.argv[2]) if len(sys.argv) > 2 else 384
+    nlist = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    rng = np.random.default_rng(0)
+    vectors = clustered(
+        rng, points + QUERIES, dimensions, topics=max(points // 5000, 8)
+    )
+    matrix, queries = vectors[:points], vectors[points:]
+    print(f"📦 {points} points x {dimensions} dimensions, {QUERIES} queries, top 10")
+
+    collection = VectorCollection("bench", ann=IVFConfig(nlist=nlist, min_points=1))
+    collection.upsert(list(range(points)), matrix, [{} for _ in range(points)])
+    collection.wait_for_training()
+    collection.ann.reset()
+    start = time.perf_counter()
+    collection.train_index()
+    info = collection.get_info()["ann"]
+    print(
+        f"🏗️  trained {info['nlist']} lists in "
+        f"{(time.perf_counter() - start) * 1000:.0f} ms"
+    )
+
+    exact = VectorCollection("exact")
+    exact.upsert(list(range(points)), matrix, [{} for _ in range(points)])
+    truth, samples = measure(exact, queries)
+    print(
+        f"⏱️  {'exact':<12} recall 1.000 | rows {points:>8} | "
+        f"mean {statistics.mean(samples):7.3f} ms | p50 {samples[len(samples) // 2]:7.3f} ms"
+    )
+
+    for nprobe in (1, 2, 4, 8, 16, 32, 64):
+        if nprobe > info["nlist"]:
+            break
+        collection.ann.nprobe = nprobe
+        found, samples = measure(collection, queries)
+        rows = statistics.mean(
+            len(candidates) for candidates in collection.ann.probe(queries)
+        )
+        print(
+            f"⏱️  {f'nprobe {nprobe}':<12} recall {recall(found, truth):.3f} | "
+            f"rows {rows:8.0f} | mean {statistics.mean(samples):7.3f} ms | "
+            f"p50 {samples[len(samples) // 2]:7.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory, recall and latency of int8 quantized vector storage.
+
+Loads the same synthetic clustered vectors into a float32 collection and into
+an int8 quantized one, and reports the resident bytes per point of each
+(next to the Python list of floats points used to be stored as), recall@10
+against the exact float32 search with and without rescoring against the
+float16 originals, and the per-query latency.
+
+Usage: python benchmarks/bench_vector_quantized.py [points] [dimensions]
+"""
+
+import statistics
+import sys
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(".")
+
+from src.database.quantization import QuantizationConfig
+from src.database.vector_collection import VectorCollection, normalize_rows
+
+LIMIT = 10
+QUERIES = 200
+
+
+def clustered(rng, points: int, dimensions: int, topics: int) -> np.ndarray:
+    """Unit vectors around ``topics`` random centres."""
+    centres = rng.normal(size=(topics, dimensions)).astype(np.float32)
+    vectors = centres[rng.integers(topics, size=points)]
+    vectors += 1.5 * rng.normal(size=(points, dimensions)).astype(np.float32)
+    return normalize_rows(vectors)
+
+
+def measure(collection, queries) -> tuple:
+    """Hit ids per query and per-query latencies in milliseconds."""
+    hits, samples = [], []
+    for query in queries:
+        start = time.perf_counter()
+        result = collection.search(query, LIMIT)
+        samples.append((time.perf_counter() - start) * 1000)
+        hits.append([hit["id"] for hit in result])
+    samples.sort()
+    return hits, samples
+
+
+def recall(found, truth) -> float:
+    return statistics.mean(
+        len(set(hits) & set(expected)) / len(expected)
+        for hits, expected in zip(found, truth)
+    )
+
+
+def report(label: str, bytes_per_point: float, found, truth, samples) -> None:
+    print(
+        f"⏱️  {label:<22} {bytes_per_point:9.0f} B/point | "
+        f"recall {recall(found, truth):.3f} | "
+        f"mean {statistics.mean(samples):7.3f} ms | "
+        f"p50 {samples[len(samples) // 2]:7.3f} ms"
+    )
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    dimensions = int(sys.argv[2]) if len(sys.argv) > 2 else 1536
+    rng = np.random.default_rng(0)
+    vectors = clustered(rng, points + QUERIES, dimensions, max(points // 5000, 8))
+    matrix, queries = vectors[:points], vectors[points:]
+    payloads = [{} for _ in range(points)]
+    print(f"📦 {points} points x {dimensions} dimensions, {QUERIES} queries, top 10")
+
+    # A list of Python floats: 8-byte pointer plus 24-byte float object each
+    python_bytes = sys.getsizeof([0.0] * dimensions) + 24 * dimensions
+    print(f"🐍 list of floats             {python_bytes:9.0f} B/point")
+
+    exact = VectorCollection("exact")
+    exact.upsert(list(range(points)), matrix, payloads)
+    truth, samples = measure(exact, queries)
+    report("float32", exact.matrix[: exact.rows].nbytes / points, truth, truth, samples)
+
+    for rescore in (1, 2, 4, 8):
+        quantized = VectorCollection(
+            "int8", quantization=QuantizationConfig(rescore=rescore)
+        )
+        quantized.upsert(list(range(points)), matrix, payloads)
+        found, samples = measure(quantized, queries)
+        resident = quantized.get_info()["quantization"]["memory_bytes"]
+        report(
+            f"int8, rescore {rescore}x",
+            resident / quantized.capacity,
+            found,
+            truth,
+            samples,
+        )
+    print(
+        f"💾 float16 originals (mmap)  {2 * dimensions:9.0f} B/point, "
+        f"{python_bytes / (dimensions + 4):.0f}x smaller in memory than lists, "
+        f"{4 * dimensions / (dimensions + 4):.1f}x smaller than float32"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: restarting the persisted in-memory vector store.
+
+Compares rebuilding a collection by inserting every point again with opening
+a stored one, both from a snapshot segment (memory mapped) and from the
+write-ahead log alone (replayed).
+
+Usage: python benchmarks/bench_vector_restart.py [points] [dimensions]
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(".")
+
+from src.database.enhanced_vector_store import InMemoryVectorStore
+
+
+def timed(label: str, call):
+    start = time.perf_counter()
+    result = call()
+    print(f"⏱️  {label:<32} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    dimensions = int(sys.argv[2]) if len(sys.argv) > 2 else 384
+    rng = np.random.default_rng(0)
+    batch = [
+        {
+            "id": f"p{n}",
+            "vector": vector,
+            "payload": {"project_id": f"proj{n % 10}", "content": f"point {n}"},
+        }
+        for n, vector in enumerate(
+            rng.normal(size=(points, dimensions)).astype(np.float32)
+        )
+    ]
+    print(f"📦 {points} points x {dimensions} dimensions")
+
+    directory = tempfile.mkdtemp(prefix="bench_vectors_")
+    try:
+        timed(
+            "insert into memory only",
+            lambda: InMemoryVectorStore().upsert_points("docs", batch),
+        )
+
+        store = InMemoryVectorStore(directory)
+        timed("insert with write-ahead log", lambda: store.upsert_points("docs", batch))
+        store.close()
+        timed("restart: replay log", lambda: InMemoryVectorStore(directory)).close()
+
+        store = InMemoryVectorStore(directory)
+        timed("write snapshot", store.write_snapshots)
+        store.close()
+        store = timed("restart: map snapshot", lambda: InMemoryVectorStore(directory))
+        timed(
+            "first search after restart",
+            lambda: store.search_points("docs", list(batch[0]["vector"]), 10),
+        )
+        store.close()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: in-memory vector search latency.
+
+Compares the previous search (a pure Python dot product per stored vector, a
+result dict per point and a full sort) with the NumPy collection: one
+matrix-vector product over pre-normalized float32 rows and an ``argpartition``
+top-k, plus the batch path scoring many queries in one matrix product.
+Filtered searches resolve a ``project_id`` filter through the payload index
+and score only the matching rows; they are compared with scoring everything
+and filtering the hits afterwards.
+
+Usage: python benchmarks/bench_vector_search.py [points] [dimensions]
+"""
+
+import statistics
+import sys
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(".")
+
+from src.database.vector_collection import VectorCollection
+
+
+def python_search(vectors, payloads, query, limit):
+    """Previous behaviour: score and build a dict for every point, then sort."""
+    results = []
+    for i, stored in enumerate(vectors):
+        similarity = sum(a * b for a, b in zip(query, stored))
+        results.append({"id": i, "score": similarity, "payload": payloads[i]})
+    results.sort(key=lambda x: x["score"], reverse=True)
+    return results[:limit]
+
+
+def measure(call, iterations: int) -> dict:
+    """Per-call latency in milliseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {"mean": statistics.mean(samples), "p50": samples[len(samples) // 2]}
+
+
+def report(label: str, result: dict) -> None:
+    print(
+        f"⏱️  {label:<30} mean {result['mean']:9.3f} ms | p50 {result['p50']:9.3f} ms"
+    )
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    dimensions = int(sys.argv[2]) if len(sys.argv) > 2 else 1536
+    rng = np.random.default_rng(0)
+    matrix = rng.normal(size=(points, dimensions)).astype(np.float32)
+    queries = rng.normal(size=(32, dimensions)).astype(np.float32)
+    payloads = [{"n": n, "project_id": f"proj{n % 100}"} for n in range(points)]
+    print(f"📦 {points} points x {dimensions} dimensions, top 10")
+
+    vectors = matrix.tolist()
+    query = queries[0].tolist()
+    iterations = max(1, 20000 // points)
+    report(
+        "pure Python loop + sort",
+        measure(lambda: python_search(vectors, payloads, query, 10), iterations),
+    )
+
+    collection = VectorCollection("bench")
+    start = time.perf_counter()
+    collection.upsert(list(range(points)), matrix, payloads)
+    print(f"📥 NumPy load: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    report(
+        "NumPy matvec + argpartition",
+        measure(lambda: collection.search(query, 10), 200),
+    )
+    batch = measure(lambda: collection.search_batch(queries, 10), 20)
+    report(f"NumPy batch of {len(queries)} queries", batch)
+    print(f"   per query in batch: {batch['mean'] / len(queries):.3f} ms")
+
+    report(
+        "scan all, filter 1% after",
+        measure(
+            lambda: [
+                hit
+                for hit in collection.search(query, points)
+                if hit["payload"]["project_id"] == "proj7"
+            ][:10],
+            50,
+        ),
+    )
+    report(
+        "payload index, filter 1% first",
+        measure(lambda: collection.search(query, 10, {"project_id": "proj7"}), 200),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,33 +9,80 @@ import threading
 import subprocess
 import os
 import time
-import requests
-
-# Import the new Qdrant vector store system
-try:
-    from src.database import vector_store
-
-    QDRANT_AVAILABLE = True
-    logger = logging.getLogger("enhanced-mcp-server")
-    logger.info("Qdrant vector store integration available")
-except ImportError as e:
-    QDRANT_AVAILABLE = False
-    logger = logging.getLogger("enhanced-mcp-server")
-    logger.warning(f"Qdrant vector store not available: {e}")
-
-# Import security middleware
-try:
+import importlib.util
+
+from src.core.startup_profiler import startup_profiler
+
+# Startup profiling must hook imports before anything heavy is loaded
+if "--profile-startup" in sys.argv:
+    startup_profiler.install()
+
+# In daemon mode each Cursor window only runs the stdio shim
+if __name__ == "__main__" and "--connect" in sys.argv:
+    from src.core.mcp_shim import run_shim
+
+    sys.exit(run_shim(os.path.abspath(__file__)))
+
+from src.core.cancellation import current_token
+from src.core.event_loop import background_loop, run_async
+from src.core.lazy_loader import subsystem_loader
+from src.core.tool_metrics import ERRORS, current_tool, tool_metrics
+from src.mcp_tools.admission import CHEAP, LLM
+from src.mcp_tools.daemon import MCPDaemon, current_session
+from src.mcp_tools.dispatcher import (
+    BatchCollector,
+    RequestDispatcher,
+    Route,
+    MODE_ASYNC,
+    MODE_BLOCKING,
+    MODE_INLINE,
+)
+from src.mcp_tools.registry import tool_registry
+from src.mcp_tools.catalog import ToolCatalog
+from src.mcp_tools.consolidated_handlers import get_tool_spec, handle_mcp_tool
+from src.mcp_tools.handlers import system_tools
+from src.mcp_tools.writer import response_writer
+
+# Heavy subsystems are built on first use (or warmed after initialize), so
+# these flags only report whether the packages are present
+QDRANT_AVAILABLE = importlib.util.find_spec("src.database") is not None
+SECURITY_AVAILABLE = importlib.util.find_spec("src.security") is not None
+
+
+def _load_vector_store():
+    """Build the vector store (connects to Qdrant or falls back to memory)."""
+    from src.database import get_vector_store
+
+    return get_vector_store()
+
+
+def _load_security():
+    """Build the security middleware and rate limiter."""
     from src.security.middleware import security_middleware
-    from src.security.headers import SecurityHeaders
     from src.security.rate_limiting import rate_limiter
 
-    SECURITY_AVAILABLE = True
-    logger = logging.getLogger("enhanced-mcp-server")
-    logger.info("Security middleware integration available")
-except ImportError as e:
-    SECURITY_AVAILABLE = False
-    logger = logging.getLogger("enhanced-mcp-server")
-    logger.warning(f"Security middleware not available: {e}")
+    return security_middleware
+
+
+def _load_llm_gateway():
+    """Build the LLM gateway."""
+    from src.llm.llm_gateway import llm_gateway
+
+    return llm_gateway
+
+
+def _load_agent_modules():
+    """Import the agent implementations used by the coordinator tools."""
+    from src.agents.coordinator import coordinator_integration
+    from src.agents.specialized import agile_agent, backend_agent
+
+    return coordinator_integration
+
+
+subsystem_loader.register("vector_store", _load_vector_store)
+subsystem_loader.register("security", _load_security)
+subsystem_loader.register("llm_gateway", _load_llm_gateway)
+subsystem_loader.register("agents", _load_agent_modules)
 
 # Enhanced logging configuration
 logging.basicConfig(
@@ -71,15 +118,10 @@ class AgentSystem:
             logger.warning(f"Instance registry not available: {e}")
             self.registry = None
 
-        # Initialize vector store if available
-        self.vector_store = None
-        if QDRANT_AVAILABLE:
-            try:
-                self.vector_store = vector_store
-                logger.info("Vector store initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize vector store: {e}")
-                self.vector_store = None
+    @property
+    def vector_store(self):
+        """Vector store, built on first use by the subsystem loader."""
+        return subsystem_loader.get("vector_store")
 
     def initialize_instance(
         self, cursor_client_id: str = None, working_directory: str = None
@@ -278,6 +320,7 @@ class AgentSystem:
 
                     # Check if process started successfully (non-blocking)
                     import time
+                    import requests
 
                     time.sleep(3)  # Give it more time to start
                     if process.poll() is None:
@@ -496,9 +539,7 @@ class AgentSystem:
             if not message.strip().startswith("{"):
                 logger.info("Using LLM-based coordinator for natural language message")
                 try:
-                    import asyncio
-
-                    response = asyncio.run(coordinator_agent.process_message(message))
+                    response = run_async(coordinator_agent.process_message(message))
                     return {
                         "success": True,
                         "response": response.get(
@@ -903,8 +944,6 @@ What would you like to work on?""",
                     # Store in vector database (async)
                     def store_in_vector_db():
                         try:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
                             # Convert ConversationPoint to the format expected by upsert_conversation
                             self.vector_store.upsert_conversation(
                                 conversation_id=conversation_point.id,
@@ -951,23 +990,20 @@ What would you like to work on?""",
                         metadata={"stored_in_redis": True},
                     )
 
-                    # Store in Redis (async operation in background)
-                    def store_in_redis():
-                        try:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            loop.run_until_complete(
-                                self.real_time_handler.store_cross_chat_message(event)
+                    # Store in Redis on the background loop without waiting
+                    def redis_stored(future):
+                        if future.cancelled() or future.exception() is not None:
+                            logger.warning(
+                                f"Redis storage failed: {future.exception()}"
                             )
+                        else:
                             logger.info(
                                 f"Message stored in Redis: {message_data['message_id']}"
                             )
-                        except Exception as e:
-                            logger.warning(f"Redis storage failed: {e}")
 
-                    # Start Redis storage in background thread
-                    redis_thread = threading.Thread(target=store_in_redis, daemon=True)
-                    redis_thread.start()
+                    background_loop.submit(
+                        self.real_time_handler.store_cross_chat_message(event)
+                    ).add_done_callback(redis_stored)
 
             except Exception as e:
                 logger.warning(f"Redis integration not available: {e}")
@@ -1006,7 +1042,7 @@ What would you like to work on?""",
             if self.vector_store:
                 try:
                     # Get conversation history from vector store
-                    vector_messages = asyncio.run(
+                    vector_messages = run_async(
                         self.vector_store.get_session_history(chat_id or "all", limit)
                     )
 
@@ -1055,7 +1091,6 @@ What would you like to work on?""",
                 "chat_id": chat_id,
                 "messages": messages,
                 "message_count": len(messages),
-                "total_messages": len(messages),
                 "storage": (
                     "vector_database" if self.vector_store and messages else "in_memory"
                 ),
@@ -1081,7 +1116,7 @@ What would you like to work on?""",
             if self.vector_store:
                 try:
                     # Search conversations in vector store
-                    vector_results = asyncio.run(
+                    vector_results = run_async(
                         self.vector_store.search_conversations(
                             query, chat_id, limit=limit
                         )
@@ -1136,8 +1171,6 @@ What would you like to work on?""",
                 "chat_id": chat_id,
                 "results": results,
                 "results_count": len(results),
-                "result_count": len(results),
-                "total_messages": len(results),
                 "storage": (
                     "vector_database" if self.vector_store and results else "in_memory"
                 ),
@@ -1155,7 +1188,7 @@ What would you like to work on?""",
             if self.vector_store:
                 try:
                     # Get vector store statistics
-                    stats = asyncio.run(self.vector_store.get_collection_stats())
+                    stats = run_async(self.vector_store.get_collection_stats())
                     vector_stats = {
                         "status": "connected",
                         "available": True,
@@ -1341,6 +1374,25 @@ What would you like to work on?""",
             logger.error(f"Error generating project: {e}")
             return {"success": False, "error": str(e)}
 
+    def iter_generate_project(
+        self,
+        template_id: str,
+        project_name: str,
+        target_path: str = ".",
+        customizations: Dict[str, Any] = None,
+    ):
+        """Generate a project, yielding a progress update per template file."""
+        try:
+            project_gen_agent = self._get_or_create_project_gen_agent()
+            return (
+                yield from project_gen_agent.iter_generate_project(
+                    template_id, project_name, target_path, customizations
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error generating project: {e}")
+            return {"success": False, "error": str(e)}
+
     def customize_project_template(
         self, template_id: str, customizations: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -1761,7 +1813,7 @@ What would you like to work on?""",
             from src.llm.llm_gateway import llm_gateway
 
             # Get available models from the LLM gateway
-            available_models = asyncio.run(llm_gateway.get_available_models())
+            available_models = run_async(llm_gateway.get_available_models())
 
             # Convert models to serializable format and filter out non-provider keys
             serializable_models = {}
@@ -1877,7 +1929,7 @@ What would you like to work on?""",
             from src.llm.llm_gateway import llm_gateway
 
             # Select best model using the LLM gateway
-            selected_model = asyncio.run(
+            selected_model = run_async(
                 llm_gateway.select_best_model(task_type, context)
             )
 
@@ -1917,7 +1969,7 @@ What would you like to work on?""",
             from src.llm.llm_gateway import llm_gateway
 
             # Generate text using the LLM gateway
-            result = asyncio.run(
+            result = run_async(
                 llm_gateway.generate_with_fallback(
                     prompt,
                     task_type,
@@ -1972,7 +2024,7 @@ What would you like to work on?""",
 
             if test_type == "connectivity":
                 # Test basic connectivity
-                available_models = asyncio.run(llm_gateway.get_available_models())
+                available_models = run_async(llm_gateway.get_available_models())
                 total_models = 0
                 providers = []
                 for provider_name, models in available_models.items():
@@ -1994,7 +2046,7 @@ What would you like to work on?""",
             elif test_type == "generation":
                 # Test text generation
                 test_prompt = "Hello, this is a test message."
-                result = asyncio.run(
+                result = run_async(
                     llm_gateway.generate_with_fallback(test_prompt, "general")
                 )
 
@@ -2031,7 +2083,7 @@ What would you like to work on?""",
             from src.llm.llm_gateway import llm_gateway
 
             # Get available models
-            available_models = asyncio.run(llm_gateway.get_available_models())
+            available_models = run_async(llm_gateway.get_available_models())
 
             # Select models based on required capabilities
             selected_models = []
@@ -2103,11 +2155,41 @@ What would you like to work on?""",
             return {"success": False, "error": str(e)}
 
 
+# Server identity reported in the initialize response
+SERVER_INFO = {
+    "name": "enhanced-mcp-server",
+    "version": "1.1.0",
+    "description": "Enhanced MCP server with AI agent system capabilities",
+}
+
+# Pre-serialized initialize and tools/list results
+tool_catalog = ToolCatalog(tool_registry, SERVER_INFO)
+
+# Responses held back until every call of their batch array has finished
+response_batches = BatchCollector()
+
 # Initialize agent system
 agent_system = AgentSystem()
 current_instance_id = None
 
 
+def _request_abandoned() -> bool:
+    """Whether the request handled in this context was cancelled or timed out."""
+    token = current_token()
+    if token is not None and token.cancelled:
+        logger.info(f"Dropping response for request {token.request_id}: {token.reason}")
+        return True
+    return False
+
+
+def _transport():
+    """Writer and batch collector of the client this request came from."""
+    session = current_session()
+    if session is not None:
+        return session.writer, session.batches
+    return response_writer, response_batches
+
+
 def send_response(request_id, result=None, error=None):
     """Send a JSON-RPC response with security headers."""
     response = {"jsonrpc": "2.0", "id": request_id}
@@ -2119,7 +2201,47 @@ def send_response(request_id, result=None, error=None):
     # Security metadata is disabled for MCP compatibility
     # The security middleware still works but doesn't add metadata to responses
 
-    print(json.dumps(response), flush=True)
+    # Cancelled or timed-out requests must not be answered (again)
+    if _request_abandoned():
+        return
+
+    tool = current_tool()
+    if error:
+        tool_metrics.increment(tool, ERRORS)
+
+    # Calls from a batch array are answered together by the dispatcher
+    writer, batches = _transport()
+    if batches.collect(request_id, response):
+        return
+
+    # Serialized and written by the writer thread
+    writer.write(response, label=tool)
+
+
+def send_raw_response(request_id, result_json: bytes):
+    """Send a JSON-RPC response whose result is already serialized."""
+    response = (
+        b'{"jsonrpc":"2.0","id":'
+        + json.dumps(request_id).encode("utf-8")
+        + b',"result":'
+        + result_json
+        + b"}"
+    )
+    if _request_abandoned():
+        return
+    writer, batches = _transport()
+    if batches.collect(request_id, response):
+        return
+    writer.write_raw(response, label=current_tool())
+
+
+def send_message(message):
+    """Write a JSON-RPC message object, or a list of them as a batch response."""
+    writer, _ = _transport()
+    if isinstance(message, list):
+        writer.write_batch(message)
+    else:
+        writer.write(message)
 
 
 def send_notification(method, params=None):
@@ -2128,7 +2250,8 @@ def send_notification(method, params=None):
     if params:
         notification["params"] = params
 
-    print(json.dumps(notification), flush=True)
+    writer, _ = _transport()
+    writer.write(notification)
 
 
 def main():
@@ -2145,6 +2268,9 @@ Options:
   --help, -h          Show this help message
   --version, -v       Show version information
   --test              Run in test mode (no MCP protocol)
+  --profile-startup   Print an import/init time breakdown and exit
+  --daemon            Serve many clients over a Unix socket or localhost TCP
+  --connect           Forward stdio to the daemon (starting it if needed)
 
 This server provides:
 - MCP (Model Context Protocol) server for Cursor IDE integration
@@ -2169,11 +2295,108 @@ For more information, see the documentation in docs/
 
     # Initialize agent system first (core functionality)
     global agent_system, current_instance_id
-    agent_system = AgentSystem()
+    with startup_profiler.phase("agent system"):
+        agent_system = AgentSystem()
     current_instance_id = agent_system.instance_id
+    system_tools.set_agent_system(agent_system)
     logger.info(f"Initialized MCP server instance {agent_system.instance_id}")
 
     # Try to initialize instance management (non-blocking)
+    with startup_profiler.phase("instance management"):
+        _initialize_instance_management()
+
+    # Build the tool catalogue once so initialize and tools/list are pre-serialized
+    with startup_profiler.phase("tool catalogue"):
+        tool_catalog.refresh()
+
+    startup_profiler.mark_ready()
+    logger.info(f"Ready to initialize after {startup_profiler.ready_ms:.1f}ms")
+
+    if "--profile-startup" in sys.argv:
+        profile_startup()
+        return
+
+    # Streaming tools report progress as notifications/progress messages
+    tool_registry.set_notifier(send_notification)
+    # Cached tool results are stored serialized and sent as they are
+    tool_registry.set_raw_sender(send_raw_response)
+
+    # Per-tool latency histograms, served by the dashboard's /metrics endpoint
+    tool_metrics.start_export(agent_system.instance_id)
+
+    if "--daemon" in sys.argv:
+        try:
+            serve_daemon()
+        finally:
+            tool_metrics.stop_export()
+        return
+
+    # Serve requests concurrently so slow tools don't stall cheap ones
+    dispatcher = RequestDispatcher(
+        router=route_request,
+        on_error=send_internal_error,
+        send_message=send_message,
+        batches=response_batches,
+        classify=classify_request,
+    )
+    asyncio.run(dispatcher.run(sys.stdin))
+
+    # Drain responses still queued for stdout before exiting
+    response_writer.close()
+    tool_metrics.stop_export()
+    transport = response_writer.get_statistics()
+    logger.info(
+        f"Transport: {transport['messages']} messages, {transport['bytes']} bytes "
+        f"({transport['messages_per_second']} msg/s, "
+        f"{transport['bytes_per_second']} B/s, encoder {transport['encoder']})"
+    )
+
+
+def create_client_dispatcher(session) -> RequestDispatcher:
+    """Dispatcher serving one daemon client, answering through its session."""
+    return RequestDispatcher(
+        router=route_request,
+        on_error=send_internal_error,
+        max_workers=int(os.getenv("MCP_DAEMON_CLIENT_WORKERS", "4")),
+        send_message=session.send,
+        batches=session.batches,
+        classify=classify_request,
+        client_id=session.client_id,
+    )
+
+
+def serve_daemon():
+    """Serve every Cursor window from this process until terminated."""
+    daemon = MCPDaemon(create_client_dispatcher)
+    system_tools.set_daemon(daemon)
+    daemon.bind()
+    try:
+        daemon.serve_forever()
+    finally:
+        # Also reached through SystemExit from the signal handler
+        daemon.stop()
+        logger.info(f"MCP daemon stopped: {daemon.get_statistics()}")
+
+
+def profile_startup():
+    """Report startup timings on stderr and exit non-zero if over budget."""
+    # Subsystems are warmed after initialize in normal runs; time them here too
+    subsystem_loader.warm_all()
+    startup_profiler.uninstall()
+
+    report = startup_profiler.format_report()
+    report += "\n\nLazy subsystems (warmed after initialize):"
+    for name, status in subsystem_loader.get_statistics().items():
+        state = "ok" if status["available"] else f"unavailable: {status['error']}"
+        report += f"\n  {status['init_time_ms']:10.1f} ms  {name} ({state})"
+    print(report, file=sys.stderr)
+
+    if not startup_profiler.within_budget():
+        sys.exit(1)
+
+
+def _initialize_instance_management():
+    """Register this instance and start dashboard spawning."""
     try:
         import os
 
@@ -2200,592 +2423,199 @@ For more information, see the documentation in docs/
         )
         # Continue without instance management - MCP server still works
 
-    # Enhanced initialization response with agent tools
-    init_response = {
-        "protocolVersion": "2024-11-05",
-        "capabilities": {
-            "tools": {
-                "tools": [
-                    # Existing tools (preserved)
-                    {
-                        "name": "add_numbers",
-                        "description": "Add two integers and return the sum.",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "a": {"type": "integer"},
-                                "b": {"type": "integer"},
-                            },
-                            "required": ["a", "b"],
-                        },
-                    },
-                    {
-                        "name": "reverse_text",
-                        "description": "Reverse the given string.",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {"text": {"type": "string"}},
-                            "required": ["text"],
-                        },
-                    },
-                    # New agent system tools
-                    {
-                        "name": "start_project",
-                        "description": "Start a new project with PDCA framework",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_type": {"type": "string"},
-                                "project_name": {"type": "string"},
-                            },
-                            "required": ["project_type", "project_name"],
-                        },
-                    },
-                    {
-                        "name": "chat_with_coordinator",
-                        "description": "Direct communication with Coordinator Agent",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {"message": {"type": "string"}},
-                            "required": ["message"],
-                        },
-                    },
-                    # Phase 4: Communication System Tools
-                    {
-                        "name": "start_communication_system",
-                        "description": "Start the communication system (WebSocket + Redis)",
-                        "inputSchema": {"type": "object", "properties": {}},
-                    },
-                    {
-                        "name": "get_communication_status",
-                        "description": "Get communication system status and health",
-                        "inputSchema": {"type": "object", "properties": {}},
-                    },
-                    # Phase 4.2: Cross-Chat Communication Tools
-                    {
-                        "name": "create_cross_chat_session",
-                        "description": "Create a new cross-chat session for multi-chat communication",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "chat_id": {"type": "string"},
-                                "chat_type": {"type": "string"},
-                                "participants": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                },
-                            },
-                            "required": ["chat_id", "chat_type", "participants"],
-                        },
-                    },
-                    {
-                        "name": "broadcast_cross_chat_message",
-                        "description": "Broadcast a message across multiple chat sessions",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "source_chat": {"type": "string"},
-                                "source_agent": {"type": "string"},
-                                "content": {"type": "string"},
-                                "target_chats": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                },
-                            },
-                            "required": [
-                                "source_chat",
-                                "source_agent",
-                                "content",
-                                "target_chats",
-                            ],
-                        },
-                    },
-                    # Phase 4.3: Message Queue Integration Tools
-                    {
-                        "name": "get_cross_chat_messages",
-                        "description": "Get cross-chat messages for a specific chat or all chats",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "chat_id": {"type": "string"},
-                                "limit": {"type": "integer"},
-                            },
-                            "required": [],
-                        },
-                    },
-                    {
-                        "name": "search_cross_chat_messages",
-                        "description": "Search cross-chat messages by content",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "query": {"type": "string"},
-                                "chat_id": {"type": "string"},
-                                "limit": {"type": "integer"},
-                            },
-                            "required": ["query"],
-                        },
-                    },
-                    # New Agile Agent Tools
-                    {
-                        "name": "create_agile_project",
-                        "description": "Create a new agile project",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_name": {"type": "string"},
-                                "project_type": {"type": "string", "default": "scrum"},
-                                "sprint_length": {"type": "integer"},
-                                "team_size": {"type": "integer", "default": 5},
-                            },
-                            "required": ["project_name"],
-                        },
-                    },
-                    {
-                        "name": "create_user_story",
-                        "description": "Create a new user story in an agile project",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_id": {"type": "string"},
-                                "title": {"type": "string"},
-                                "description": {"type": "string"},
-                                "acceptance_criteria": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                },
-                                "story_points": {"type": "integer"},
-                                "priority": {"type": "string", "default": "medium"},
-                                "epic": {"type": "string"},
-                            },
-                            "required": [
-                                "project_id",
-                                "title",
-                                "description",
-                                "acceptance_criteria",
-                            ],
-                        },
-                    },
-                    {
-                        "name": "create_sprint",
-                        "description": "Create a new sprint in an agile project",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_id": {"type": "string"},
-                                "sprint_name": {"type": "string"},
-                                "start_date": {"type": "string"},
-                                "end_date": {"type": "string"},
-                                "goal": {"type": "string"},
-                            },
-                            "required": ["project_id", "sprint_name"],
-                        },
-                    },
-                    {
-                        "name": "plan_sprint",
-                        "description": "Plan a sprint by assigning user stories",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "sprint_id": {"type": "string"},
-                                "story_ids": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                },
-                            },
-                            "required": ["sprint_id", "story_ids"],
-                        },
-                    },
-                    {
-                        "name": "complete_user_story",
-                        "description": "Mark a user story as completed",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "story_id": {"type": "string"},
-                                "actual_hours": {"type": "number"},
-                            },
-                            "required": ["story_id"],
-                        },
-                    },
-                    {
-                        "name": "get_project_status",
-                        "description": "Get comprehensive project status and metrics for an agile project",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {"project_id": {"type": "string"}},
-                            "required": ["project_id"],
-                        },
-                    },
-                    {
-                        "name": "get_sprint_burndown",
-                        "description": "Generate burndown chart data for a sprint",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {"sprint_id": {"type": "string"}},
-                            "required": ["sprint_id"],
-                        },
-                    },
-                    {
-                        "name": "calculate_team_velocity",
-                        "description": "Calculate team velocity based on completed sprints",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_id": {"type": "string"},
-                                "sprint_count": {"type": "integer"},
-                            },
-                            "required": ["project_id"],
-                        },
-                    },
-                    # New Project Generation Agent Tools
-                    {
-                        "name": "list_project_templates",
-                        "description": "List available project templates with optional filtering by language and category",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "language": {
-                                    "type": "string",
-                                    "description": "Filter by programming language (python, cpp, java, go, rust, typescript, etc.)",
-                                },
-                                "category": {
-                                    "type": "string",
-                                    "description": "Filter by project category (web, api, library, cli, data-science, etc.)",
-                                },
-                            },
-                            "required": [],
-                        },
-                    },
-                    {
-                        "name": "generate_project",
-                        "description": "Generate a new project from a template",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "template_id": {
-                                    "type": "string",
-                                    "description": "ID of the template to use",
-                                },
-                                "project_name": {
-                                    "type": "string",
-                                    "description": "Name of the project to create",
-                                },
-                                "target_path": {
-                                    "type": "string",
-                                    "default": ".",
-                                    "description": "Path where to create the project",
-                                },
-                                "customizations": {
-                                    "type": "object",
-                                    "description": "Optional customizations for the project",
-                                },
-                            },
-                            "required": ["template_id", "project_name"],
-                        },
-                    },
-                    {
-                        "name": "customize_project_template",
-                        "description": "Customize an existing project template",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "template_id": {
-                                    "type": "string",
-                                    "description": "ID of the template to customize",
-                                },
-                                "customizations": {
-                                    "type": "object",
-                                    "description": "Customizations to apply to the template",
-                                },
-                            },
-                            "required": ["template_id", "customizations"],
-                        },
-                    },
-                    {
-                        "name": "get_generated_project_status",
-                        "description": "Get status of a generated project",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_id": {
-                                    "type": "string",
-                                    "description": "ID of the generated project",
-                                }
-                            },
-                            "required": ["project_id"],
-                        },
-                    },
-                    {
-                        "name": "list_generated_projects",
-                        "description": "List all generated projects",
-                        "inputSchema": {"type": "object", "properties": {}},
-                    },
-                    # Phase 9.1: Project-Specific Qdrant Database Tools
-                    {
-                        "name": "start_container",
-                        "description": "Start Qdrant Docker container with error handling",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {},
-                            "required": [],
-                        },
-                    },
-                    {
-                        "name": "create_database",
-                        "description": "Create a new project-specific database with validation",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_name": {
-                                    "type": "string",
-                                    "description": "Name of the project",
-                                },
-                                "project_id": {
-                                    "type": "string",
-                                    "description": "Optional project ID (auto-generated if not provided)",
-                                },
-                            },
-                            "required": ["project_name"],
-                        },
-                    },
-                    {
-                        "name": "list_databases",
-                        "description": "List all project databases with fallback",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {},
-                            "required": [],
-                        },
-                    },
-                    {
-                        "name": "switch_database",
-                        "description": "Switch to a specific project database with error handling",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_id": {
-                                    "type": "string",
-                                    "description": "Project ID to switch to",
-                                }
-                            },
-                            "required": ["project_id"],
-                        },
-                    },
-                    {
-                        "name": "archive_database",
-                        "description": "Archive a project database with confirmation",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_id": {
-                                    "type": "string",
-                                    "description": "Project ID to archive",
-                                }
-                            },
-                            "required": ["project_id"],
-                        },
-                    },
-                    {
-                        "name": "restore_database",
-                        "description": "Restore an archived project database with validation",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_id": {
-                                    "type": "string",
-                                    "description": "Project ID to restore",
-                                }
-                            },
-                            "required": ["project_id"],
-                        },
-                    },
-                    {
-                        "name": "delete_database",
-                        "description": "Delete a project database with safety checks",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_id": {
-                                    "type": "string",
-                                    "description": "Project ID to delete",
-                                },
-                                "confirm": {
-                                    "type": "boolean",
-                                    "description": "Confirmation flag for deletion",
-                                },
-                            },
-                            "required": ["project_id", "confirm"],
-                        },
-                    },
-                    {
-                        "name": "get_stats",
-                        "description": "Get database statistics with fallback data",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "project_id": {
-                                    "type": "string",
-                                    "description": "Optional project ID for specific stats",
-                                }
-                            },
-                            "required": [],
-                        },
-                    },
-                ]
-            },
-            "chat": {"message": True},
-        },
-        "serverInfo": {
-            "name": "enhanced-mcp-server",
-            "version": "1.1.0",
-            "description": "Enhanced MCP server with AI agent system capabilities",
-        },
-    }
-
-    # Read input and respond
-    for line in sys.stdin:
-        try:
-            data = json.loads(line.strip())
-            logger.info(f"Received: {data}")
-
-            method = data.get("method")
-            request_id = data.get("id")
 
-            # Security middleware is disabled for MCP compatibility
-            # Security features are still available via MCP tools but don't interfere with protocol
-
-            if method == "initialize":
-                send_response(request_id, init_response)
-                # Send initialized notification
-                send_notification("initialized")
-                logger.info("MCP server initialized successfully")
+def _progress_token(params: Dict[str, Any]) -> Any:
+    """Progress token a client attached to a tool call, if any."""
+    meta = params.get("_meta") or {}
+    return meta.get("progressToken") if isinstance(meta, dict) else None
+
+
+def route_request(data: Dict[str, Any]) -> Route:
+    """Decide how a JSON-RPC message is executed by the dispatcher."""
+    method = data.get("method")
+
+    # Protocol bookkeeping is cheap and answered straight from the loop thread
+    if method == "tools/list":
+        return Route(lambda: handle_request(data), MODE_INLINE)
+
+    # Tool calls are scheduled according to their registry flags
+    if method == "tools/call":
+        params = data.get("params", {})
+        spec = get_tool_spec(params.get("name"))
+        if spec is not None and spec.is_async:
+            # Coroutine handlers run on the shared background loop, which owns
+            # the async clients they use
+            return Route(
+                lambda: asyncio.wrap_future(
+                    background_loop.submit(
+                        tool_registry.dispatch_async(
+                            spec.name,
+                            params.get("arguments", {}),
+                            data.get("id"),
+                            send_response,
+                            progress_token=_progress_token(params),
+                        )
+                    )
+                ),
+                MODE_ASYNC,
+                tool_registry.get_timeout(spec.name),
+            )
+        if spec is not None and not spec.blocking:
+            return Route(lambda: handle_request(data), MODE_INLINE)
+        if spec is not None:
+            return Route(
+                lambda: handle_request(data),
+                MODE_BLOCKING,
+                tool_registry.get_timeout(spec.name),
+            )
 
-                # Automatically spawn dashboard for Cursor connection
-                try:
-                    logger.info("Auto-spawning dashboard for Cursor connection...")
+    # Everything else may block (coordinator chat, dashboard spawn)
+    return Route(lambda: handle_request(data), MODE_BLOCKING)
+
+
+def classify_request(data: Dict[str, Any]) -> str:
+    """Admission cost class of a JSON-RPC message."""
+    method = data.get("method")
+    if method == "tools/call":
+        spec = get_tool_spec(data.get("params", {}).get("name"))
+        return spec.cost if spec is not None else CHEAP
+    if method == "chat/message":
+        return LLM
+    # initialize, tools/list and notifications are protocol bookkeeping
+    return CHEAP
+
+
+def send_internal_error(data: Dict[str, Any], error: Exception):
+    """Report an unexpected dispatcher failure for a request."""
+    request_id = data.get("id")
+    if request_id is not None:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Internal error: {str(error)}"},
+        )
 
-                    # Only spawn if we have instance info and no dashboard is running
-                    if (
-                        agent_system.instance_info
-                        and agent_system.instance_info.dashboard_port
-                    ):
-                        # Check if dashboard is already running for this instance
-                        import subprocess
 
-                        try:
-                            result = subprocess.run(
-                                [
-                                    "pgrep",
-                                    "-f",
-                                    f"dashboard.*--instance-id {agent_system.instance_id}",
-                                ],
-                                capture_output=True,
-                                text=True,
-                            )
-                            if result.returncode == 0:
-                                logger.info(
-                                    f"Dashboard already running for instance {agent_system.instance_id}"
-                                )
-                            else:
-                                # Spawn dashboard using the existing mechanism
-                                logger.info(
-                                    f"Spawning dashboard for instance {agent_system.instance_id} on port {agent_system.instance_info.dashboard_port}"
-                                )
-                                agent_system._start_dashboard_spawning()
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to check for existing dashboard: {e}"
-                            )
-                            # Try to spawn anyway
-                            agent_system._start_dashboard_spawning()
-                    else:
-                        logger.info("No instance info available for dashboard spawning")
-                except Exception as e:
-                    logger.warning(f"Error auto-spawning dashboard: {e}")
+def handle_request(data: Dict[str, Any]):
+    """Handle a single parsed JSON-RPC message."""
+    logger.info(f"Received: {data}")
 
-            elif method == "tools/list":
-                # Import consolidated MCP tools
-                from src.mcp_tools.consolidated_handlers import get_all_mcp_tools
+    method = data.get("method")
+    request_id = data.get("id")
 
-                tools_response = {"tools": get_all_mcp_tools()}
-                send_response(request_id, tools_response)
+    # Security middleware is disabled for MCP compatibility
+    # Security features are still available via MCP tools but don't interfere with protocol
 
-            elif method == "tools/call":
-                # Handle tool calls
-                tool_name = data.get("params", {}).get("name")
-                arguments = data.get("params", {}).get("arguments", {})
+    if method == "initialize":
+        send_raw_response(request_id, tool_catalog.initialize_bytes)
+        # Send initialized notification
+        send_notification("initialized")
+        logger.info("MCP server initialized successfully")
 
-                # Import consolidated MCP tools handler
-                from src.mcp_tools.consolidated_handlers import handle_mcp_tool
+        # Build heavy subsystems now that the client is no longer waiting
+        subsystem_loader.warm_in_background()
 
-                # Try to handle the tool with consolidated handler
-                if handle_mcp_tool(tool_name, arguments, request_id, send_response):
-                    # Tool was handled successfully
-                    pass
-                else:
-                    # Tool not found
-                    send_response(
-                        request_id,
-                        error={"code": -32601, "message": f"Unknown tool: {tool_name}"},
-                    )
+        # Automatically spawn dashboard for Cursor connection
+        try:
+            logger.info("Auto-spawning dashboard for Cursor connection...")
 
-            elif method == "chat/message":
-                # Handle natural language messages - route to Coordinator Agent
+            # Only spawn if we have instance info and no dashboard is running
+            if agent_system.instance_info and agent_system.instance_info.dashboard_port:
+                # Check if dashboard is already running for this instance
                 try:
-                    message_content = data.get("params", {}).get("content", "")
-                    if not message_content:
-                        send_response(
-                            request_id,
-                            error={
-                                "code": -32602,
-                                "message": "Message content is required",
-                            },
-                        )
-                        return
-
-                    # Route to Coordinator Agent
-                    result = agent_system.chat_with_coordinator(message_content)
-
-                    if result["success"]:
-                        send_response(
-                            request_id,
-                            {
-                                "content": [
-                                    {"type": "text", "text": result["response"]}
-                                ],
-                                "structuredContent": result,
-                            },
+                    result = subprocess.run(
+                        [
+                            "pgrep",
+                            "-f",
+                            f"dashboard.*--instance-id {agent_system.instance_id}",
+                        ],
+                        capture_output=True,
+                        text=True,
+                    )
+                    if result.returncode == 0:
+                        logger.info(
+                            f"Dashboard already running for instance {agent_system.instance_id}"
                         )
                     else:
-                        send_response(
-                            request_id,
-                            error={"code": -32603, "message": result["error"]},
+                        # Spawn dashboard using the existing mechanism
+                        logger.info(
+                            f"Spawning dashboard for instance {agent_system.instance_id} on port {agent_system.instance_info.dashboard_port}"
                         )
-
+                        agent_system._start_dashboard_spawning()
                 except Exception as e:
-                    logger.error(f"Error handling chat message: {e}")
-                    send_response(
-                        request_id,
-                        error={
-                            "code": -32603,
-                            "message": f"Error processing message: {str(e)}",
-                        },
-                    )
-
+                    logger.warning(f"Failed to check for existing dashboard: {e}")
+                    # Try to spawn anyway
+                    agent_system._start_dashboard_spawning()
             else:
-                # Handle other methods
-                logger.info(f"Unhandled method: {method}")
-
-        except json.JSONDecodeError:
-            logger.error(f"Invalid JSON: {line}")
+                logger.info("No instance info available for dashboard spawning")
         except Exception as e:
-            logger.error(f"Error: {e}")
-            if "request_id" in locals():
+            logger.warning(f"Error auto-spawning dashboard: {e}")
+
+    elif method == "tools/list":
+        send_raw_response(request_id, tool_catalog.tools_list_bytes)
+
+    elif method == "tools/call":
+        # Handle tool calls
+        tool_name = data.get("params", {}).get("name")
+        arguments = data.get("params", {}).get("arguments", {})
+        progress_token = _progress_token(data.get("params", {}))
+
+        # Dispatch through the tool registry
+        if handle_mcp_tool(
+            tool_name, arguments, request_id, send_response, progress_token
+        ):
+            # Tool was handled successfully
+            pass
+        else:
+            # Tool not found
+            send_response(
+                request_id,
+                error={"code": -32601, "message": f"Unknown tool: {tool_name}"},
+            )
+
+    elif method == "chat/message":
+        # Handle natural language messages - route to Coordinator Agent
+        try:
+            message_content = data.get("params", {}).get("content", "")
+            if not message_content:
                 send_response(
                     request_id,
-                    error={"code": -32603, "message": f"Internal error: {str(e)}"},
+                    error={
+                        "code": -32602,
+                        "message": "Message content is required",
+                    },
                 )
+                return
+
+            # Route to Coordinator Agent
+            result = agent_system.chat_with_coordinator(message_content)
+
+            if result["success"]:
+                send_response(
+                    request_id,
+                    {
+                        "content": [{"type": "text", "text": result["response"]}],
+                        "structuredContent": result,
+                    },
+                )
+            else:
+                send_response(
+                    request_id,
+                    error={"code": -32603, "message": result["error"]},
+                )
+
+        except Exception as e:
+            logger.error(f"Error handling chat message: {e}")
+            send_response(
+                request_id,
+                error={
+                    "code": -32603,
+                    "message": f"Error processing message: {str(e)}",
+                },
+            )
+
+    else:
+        # Handle other methods
+        logger.info(f"Unhandled method: {method}")
 
 
 def cleanup_on_exit():
@@ -2797,6 +2627,8 @@ def cleanup_on_exit():
         import time
         from datetime import datetime
 
+        import requests
+
         # Only cleanup dashboard for current instance
         if current_instance_id:
             logger.info(f"🧹 Cleaning up dashboard for instance {current_instance_id}")
@@ -2935,6 +2767,9 @@ def cleanup_on_exit():
     except Exception as e:
         logger.warning(f"⚠️ Failed to cleanup dashboards: {e}")
 
+    # Cancel whatever is still running on the shared async loop
+    background_loop.stop()
+
 
 if __name__ == "__main__":
     import atexit
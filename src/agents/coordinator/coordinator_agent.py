@@ -1,11 +1,11 @@
 """Coordinator Agent for orchestrating the AI agent system."""
 
 import logging
-import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from dataclasses import dataclass, field
 
+from ...core.event_loop import run_async
 from ..base.base_agent import BaseAgent, AgentType, AgentCapability, AgentTask
 from ..registry import AgentRegistry
 from .pdca_framework import PDCAFramework, PDCACycle, PDCAObjective
@@ -382,7 +382,7 @@ Let's discuss this together and customize the agent team for your specific needs
             agents_created = []
 
             # Create Agile Agent
-            agile_result = asyncio.run(
+            agile_result = run_async(
                 self.create_agent(
                     agent_type="agile",
                     name="Agile/Scrum Agent",
@@ -399,7 +399,7 @@ Let's discuss this together and customize the agent team for your specific needs
                 agents_created.append(agile_result["agent_info"])
 
             # Create Frontend Agent
-            frontend_result = asyncio.run(
+            frontend_result = run_async(
                 self.create_agent(
                     agent_type="frontend",
                     name="Frontend Agent",
@@ -416,7 +416,7 @@ Let's discuss this together and customize the agent team for your specific needs
                 agents_created.append(frontend_result["agent_info"])
 
             # Create Backend Agent
-            backend_result = asyncio.run(
+            backend_result = run_async(
                 self.create_agent(
                     agent_type="backend",
                     name="Backend Agent",
@@ -433,7 +433,7 @@ Let's discuss this together and customize the agent team for your specific needs
                 agents_created.append(backend_result["agent_info"])
 
             # Create Testing Agent
-            testing_result = asyncio.run(
+            testing_result = run_async(
                 self.create_agent(
                     agent_type="testing",
                     name="Testing Agent",
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 
 from .coordinator_agent import CoordinatorAgent, ProjectPlan
 from .pdca_framework import PDCAFramework, PDCACycle, PDCAPhase
+from ...database.embedding_service import embedding_service
 from ...database.enhanced_vector_store import get_enhanced_vector_store
 from ...knowledge.predetermined_knowledge import get_predetermined_knowledge
 
@@ -138,63 +139,66 @@ class MemoryEnhancedCoordinator(CoordinatorAgent):
             # Get all knowledge domains
             all_knowledge = self.knowledge_base.get_all_knowledge()
 
-            for domain, knowledge_items in all_knowledge.items():
-                for item in knowledge_items:
-                    # Create embedding for knowledge content
-                    content = f"{item.title}. {item.content}"
-
-                    # Generate a simple embedding (in real implementation, use actual embedding model)
-                    embedding = await self._generate_embedding(content)
-
-                    # Store in vector database
-                    success = self.vector_store.upsert_knowledge(
-                        knowledge_id=f"{domain}_{item.title.replace(' ', '_').lower()}",
-                        content=content,
-                        embedding=embedding,
-                        metadata={
-                            "domain": domain,
-                            "category": item.category,
-                            "subcategory": item.subcategory,
-                            "priority": item.priority,
-                            "tags": item.tags,
-                            "source": item.source,
-                            "version": item.version,
-                            "last_updated": item.last_updated,
-                        },
-                    )
-
-                    if not success:
-                        logger.warning(f"Failed to store knowledge item: {item.title}")
-
-            logger.info(
-                f"Initialized {sum(len(items) for items in all_knowledge.values())} knowledge items in vector store"
+            # A persisted store already holds the knowledge from an earlier run,
+            # if it was embedded by the model in use now
+            await asyncio.to_thread(embedding_service.wait_ready)
+            total = sum(len(items) for items in all_knowledge.values())
+            stored = self.vector_store.count_points(
+                self.vector_store.get_collection_name("knowledge"),
+                {"embedding_model": embedding_service.model_id},
             )
+            if stored >= total:
+                logger.info(f"Knowledge already in vector store ({total} items)")
+                return
+
+            items = [
+                (domain, item)
+                for domain, knowledge_items in all_knowledge.items()
+                for item in knowledge_items
+            ]
+            contents = [f"{item.title}. {item.content}" for _, item in items]
+            # One call, so the embedding service encodes them in batches
+            embeddings = await embedding_service.encode_async(contents)
+
+            points = (
+                self.vector_store.build_knowledge_point(
+                    knowledge_id=f"{domain}_{item.title.replace(' ', '_').lower()}",
+                    content=content,
+                    embedding=embedding.tolist(),
+                    metadata={
+                        "domain": domain,
+                        "category": item.category,
+                        "subcategory": item.subcategory,
+                        "priority": item.priority,
+                        "tags": item.tags,
+                        "source": item.source,
+                        "version": item.version,
+                        "last_updated": item.last_updated,
+                        "embedding_model": embedding_service.model_id,
+                    },
+                )
+                for (domain, item), content, embedding in zip(
+                    items, contents, embeddings
+                )
+            )
+            # Store in vector database, streamed in batches
+            stats = self.vector_store.bulk_upsert(
+                self.vector_store.get_collection_name("knowledge"), points
+            )
+            if stats["failed_batches"]:
+                logger.warning(
+                    f"Failed to store {stats['failed_batches']} knowledge batches"
+                )
+
+            logger.info(f"Initialized {total} knowledge items in vector store")
 
         except Exception as e:
             logger.error(f"Failed to initialize knowledge in vector store: {e}")
             # Continue anyway - the system can work without pre-loaded knowledge
 
     async def _generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding for text (placeholder - use actual embedding model in production)."""
-        # This is a placeholder - in production, use actual embedding models like OpenAI, Sentence Transformers, etc.
-        import hashlib
-        import struct
-
-        # Create a deterministic embedding based on text hash
-        text_hash = hashlib.md5(text.encode()).digest()
-        embedding = []
-
-        for i in range(0, len(text_hash), 4):
-            chunk = text_hash[i : i + 4]
-            if len(chunk) == 4:
-                val = struct.unpack("f", chunk)[0]
-                embedding.append(val)
-
-        # Pad to standard embedding size (384 dimensions)
-        while len(embedding) < 384:
-            embedding.append(0.0)
-
-        return embedding[:384]
+        """Generate embedding for text with the shared embedding service."""
+        return (await embedding_service.encode_async([text]))[0].tolist()
 
     async def start_intelligent_conversation(self, user_message: str) -> Dict[str, Any]:
         """Start an intelligent conversation with memory-driven context."""
@@ -8,7 +8,7 @@ for Python, C++, Java, Go, Rust, TypeScript, and other programming languages.
 import logging
 import uuid
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Generator, List, Optional
 from dataclasses import dataclass, field
 
 from ..base.base_agent import BaseAgent, AgentType, AgentCapability
@@ -645,6 +645,26 @@ class ProjectGenerationAgent(BaseAgent):
         customizations: Dict[str, Any] = None,
     ) -> Dict[str, Any]:
         """Generate a new project from a template."""
+        updates = self.iter_generate_project(
+            template_id, project_name, target_path, customizations
+        )
+        while True:
+            try:
+                next(updates)
+            except StopIteration as done:
+                return done.value
+
+    def iter_generate_project(
+        self,
+        template_id: str,
+        project_name: str,
+        target_path: str = ".",
+        customizations: Dict[str, Any] = None,
+    ) -> Generator[Dict[str, Any], None, Dict[str, Any]]:
+        """Generate a project, yielding a progress update per template file.
+
+        Returns the same result as :meth:`generate_project`.
+        """
         try:
             if template_id not in self.project_templates:
                 return {"success": False, "error": f"Template {template_id} not found"}
@@ -672,6 +692,14 @@ class ProjectGenerationAgent(BaseAgent):
             # Store project structure
             self.generated_projects[project_id] = project_structure
 
+            for index, file_info in enumerate(template.files, start=1):
+                yield {
+                    "progress": index,
+                    "total": len(template.files),
+                    "message": f"Planned {file_info['path']}",
+                    "partial": {"project_id": project_id, "file": file_info},
+                }
+
             logger.info(
                 f"Generated project {project_name} using template {template_id}"
             )
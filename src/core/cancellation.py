@@ -0,0 +1,138 @@
+"""Request cancellation tokens and deadlines.
+
+The dispatcher creates one :class:`CancelToken` per JSON-RPC request and binds
+it to the context the handler runs in. Code doing slow work (LLM calls, the
+background event loop bridge) asks the current token how much time is left and
+registers callbacks so a cancelled or timed-out request stops using CPU and LLM
+capacity instead of finishing for a client that no longer waits.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC error code for requests that exceed their deadline (as used by MCP SDKs)
+REQUEST_TIMEOUT = -32001
+
+
+class RequestCancelled(Exception):
+    """Raised when work is abandoned because its request was cancelled."""
+
+
+class CancelToken:
+    """Cancellation flag and deadline for one request."""
+
+    def __init__(self, request_id: Any = None, timeout: Optional[float] = None):
+        """Initialize token.
+
+        Args:
+            request_id: JSON-RPC id of the request
+            timeout: Seconds from now until the deadline, None for no deadline
+        """
+        self.request_id = request_id
+        # When the request arrived, for queue wait metrics
+        self.created = time.perf_counter()
+        self.deadline: Optional[float] = None
+        self.reason: Optional[str] = None
+        self.lock = threading.Lock()
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], Any]] = []
+        if timeout is not None:
+            self.start(timeout)
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the request was cancelled or ran out of time."""
+        return self._event.is_set()
+
+    def start(self, timeout: Optional[float]) -> None:
+        """Start the deadline clock."""
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left until the deadline, None without a deadline."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def limit(self, timeout: Optional[float]) -> Optional[float]:
+        """Shorten a timeout so it does not outlive the deadline."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """Cancel the request; returns False if it already was."""
+        with self.lock:
+            if self._event.is_set():
+                return False
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Cancel callback for {self.request_id} failed: {e}")
+        return True
+
+    def add_callback(self, callback: Callable[[], Any]) -> None:
+        """Call ``callback`` on cancellation (immediately if already cancelled)."""
+        with self.lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], Any]) -> None:
+        """Forget a callback once the work it would cancel has finished."""
+        with self.lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def check(self) -> None:
+        """Raise :class:`RequestCancelled` if the request was cancelled."""
+        if self.cancelled:
+            raise RequestCancelled(
+                f"Request {self.request_id} {self.reason or 'cancelled'}"
+            )
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or ``timeout`` passes; returns cancelled."""
+        return self._event.wait(timeout)
+
+
+_current_token: contextvars.ContextVar[Optional[CancelToken]] = contextvars.ContextVar(
+    "mcp_cancel_token", default=None
+)
+
+
+def current_token() -> Optional[CancelToken]:
+    """Token of the request being handled in this context, if any."""
+    return _current_token.get()
+
+
+@contextmanager
+def bind_token(token: Optional[CancelToken]):
+    """Make ``token`` the current token for the enclosed code."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def request_timeout(default: float) -> float:
+    """A timeout for blocking I/O bounded by the current request's deadline."""
+    token = current_token()
+    if token is None:
+        return default
+    token.check()
+    return token.limit(default)
@@ -0,0 +1,176 @@
+"""Persistent background event loop.
+
+One long-lived asyncio loop runs on a dedicated daemon thread and owns all
+async resources (HTTP sessions, clients, caches bound to a loop). Synchronous
+code submits coroutines to it through ``run_coroutine_threadsafe`` instead of
+paying for a fresh ``asyncio.run()`` loop on every call.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Any, Coroutine, Dict, Optional
+
+from .cancellation import current_token
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundEventLoop:
+    """An asyncio loop running forever on its own thread."""
+
+    def __init__(self, name: str = "mcp-event-loop", default_timeout: float = None):
+        """Initialize background loop; the thread starts on first use.
+
+        Args:
+            name: Thread name
+            default_timeout: Deadline in seconds for ``run`` when none is given
+        """
+        self.name = name
+        self.default_timeout = (
+            default_timeout
+            if default_timeout is not None
+            else float(os.getenv("MCP_ASYNC_TIMEOUT", "120"))
+        )
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "timeouts": 0}
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop thread is alive."""
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if needed and return the loop."""
+        if self.running:
+            return self.loop
+
+        with self.lock:
+            if self.running:
+                return self.loop
+
+            ready = threading.Event()
+            loop = asyncio.new_event_loop()
+
+            def run_forever():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self.loop = loop
+            self.thread = threading.Thread(
+                target=run_forever, name=self.name, daemon=True
+            )
+            self.thread.start()
+            ready.wait()
+            logger.info(f"Started background event loop {self.name}")
+            return loop
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller is running on the loop thread."""
+        return self.thread is not None and threading.current_thread() is self.thread
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop; returns a concurrent future."""
+        loop = self.start()
+        self.stats["submitted"] += 1
+        future: concurrent.futures.Future = asyncio.run_coroutine_threadsafe(coro, loop)
+        future.add_done_callback(self._record)
+        return future
+
+    def _record(self, future: concurrent.futures.Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            self.stats["failed"] += 1
+        else:
+            self.stats["completed"] += 1
+
+    def run(
+        self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None
+    ) -> Any:
+        """Run a coroutine on the loop and wait for its result.
+
+        The wait is bounded by the current request's deadline, and cancelling
+        the request cancels the coroutine.
+
+        Raises:
+            RuntimeError: If called from the loop thread itself (would deadlock)
+            TimeoutError: If the deadline passes; the coroutine is cancelled
+            RequestCancelled: If the current request was cancelled
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("Cannot block on the background loop from itself")
+
+        token = current_token()
+        if token is not None and token.cancelled:
+            coro.close()
+            token.check()
+
+        timeout = self.default_timeout if timeout is None else timeout
+        if token is not None:
+            timeout = token.limit(timeout)
+
+        future = self.submit(coro)
+        if token is not None:
+            token.add_callback(future.cancel)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            self.stats["timeouts"] += 1
+            raise TimeoutError(f"Coroutine did not finish within {timeout}s")
+        except concurrent.futures.CancelledError:
+            if token is not None and token.cancelled:
+                token.check()
+            raise
+        finally:
+            if token is not None:
+                token.remove_callback(future.cancel)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Cancel pending tasks and stop the loop thread."""
+        with self.lock:
+            loop, thread = self.loop, self.thread
+            if loop is None or thread is None or not thread.is_alive():
+                return
+
+            async def shutdown():
+                tasks = [
+                    t for t in asyncio.all_tasks() if t is not asyncio.current_task()
+                ]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            try:
+                asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+            except Exception as e:
+                logger.warning(f"Background loop shutdown incomplete: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            loop.close()
+            self.loop = None
+            self.thread = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get loop statistics."""
+        return {
+            "running": self.running,
+            "default_timeout": self.default_timeout,
+            "pending_tasks": (len(asyncio.all_tasks(self.loop)) if self.running else 0),
+            **self.stats,
+        }
+
+
+# Global background event loop instance
+background_loop = BackgroundEventLoop()
+
+
+def run_async(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+    """Run a coroutine to completion on the shared background loop."""
+    return background_loop.run(coro, timeout)
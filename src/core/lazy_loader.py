@@ -0,0 +1,125 @@
+"""Lazy subsystem loader for fast MCP server startup.
+
+Heavy subsystems (vector store, LLM gateway, agents, security middleware) are
+registered as factories and only built on first use, or warmed in a background
+thread once the client has its ``initialize`` response.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazySubsystem:
+    """A subsystem built on first access."""
+
+    def __init__(self, name: str, factory: Callable[[], Any], warm: bool = True):
+        """Initialize lazy subsystem.
+
+        Args:
+            name: Subsystem name used in logs and statistics
+            factory: Zero-argument callable building the subsystem
+            warm: Whether background warm-up should build it
+        """
+        self.name = name
+        self.factory = factory
+        self.warm = warm
+        self.lock = threading.Lock()
+
+        self.value: Any = None
+        self.loaded = False
+        self.error: Optional[str] = None
+        self.init_time_ms = 0.0
+        self.loaded_by: Optional[str] = None
+
+    def get(self) -> Any:
+        """Get the subsystem, building it if needed; None if building failed."""
+        if self.loaded:
+            return self.value
+
+        with self.lock:
+            if self.loaded:
+                return self.value
+
+            start = time.perf_counter()
+            try:
+                self.value = self.factory()
+                logger.info(f"Subsystem {self.name} ready")
+            except Exception as e:
+                self.value = None
+                self.error = str(e)
+                logger.warning(f"Subsystem {self.name} not available: {e}")
+            finally:
+                self.init_time_ms = (time.perf_counter() - start) * 1000
+                self.loaded_by = threading.current_thread().name
+                self.loaded = True
+
+            return self.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get subsystem status."""
+        return {
+            "loaded": self.loaded,
+            "available": self.loaded and self.error is None,
+            "init_time_ms": round(self.init_time_ms, 3),
+            "loaded_by": self.loaded_by,
+            "error": self.error,
+        }
+
+
+class SubsystemLoader:
+    """Registry of lazily built subsystems."""
+
+    def __init__(self):
+        """Initialize subsystem loader."""
+        self.subsystems: Dict[str, LazySubsystem] = {}
+        self.warm_thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def register(
+        self, name: str, factory: Callable[[], Any], warm: bool = True
+    ) -> LazySubsystem:
+        """Register a subsystem factory."""
+        subsystem = LazySubsystem(name, factory, warm)
+        self.subsystems[name] = subsystem
+        return subsystem
+
+    def get(self, name: str) -> Any:
+        """Get a subsystem by name, building it on first use."""
+        subsystem = self.subsystems.get(name)
+        if subsystem is None:
+            raise KeyError(f"Unknown subsystem: {name}")
+        return subsystem.get()
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a subsystem has been built."""
+        subsystem = self.subsystems.get(name)
+        return bool(subsystem and subsystem.loaded)
+
+    def warm_all(self, names: Optional[List[str]] = None) -> None:
+        """Build subsystems marked for warm-up in the calling thread."""
+        for name, subsystem in list(self.subsystems.items()):
+            if (names is None and subsystem.warm) or (names and name in names):
+                subsystem.get()
+
+    def warm_in_background(self) -> threading.Thread:
+        """Build warm subsystems on a daemon thread; safe to call repeatedly."""
+        with self.lock:
+            if self.warm_thread is None:
+                self.warm_thread = threading.Thread(
+                    target=self.warm_all, name="subsystem-warmup", daemon=True
+                )
+                self.warm_thread.start()
+                logger.info("Started background subsystem warm-up")
+            return self.warm_thread
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get status of all subsystems."""
+        return {name: s.to_dict() for name, s in self.subsystems.items()}
+
+
+# Global subsystem loader instance
+subsystem_loader = SubsystemLoader()
@@ -0,0 +1,149 @@
+"""Thin stdio shim for the shared MCP daemon.
+
+In daemon mode every Cursor window still launches ``protocol_server.py``, but
+with ``--connect`` the process only forwards its stdin to the daemon's socket
+and the daemon's replies to its stdout. It imports nothing beyond the standard
+library, so a new window is ready in milliseconds and costs a few MB instead
+of a full agent system. If no daemon is listening the shim can start one.
+"""
+
+import logging
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import BinaryIO, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Address = Tuple[str, Union[str, Tuple[str, int]]]
+
+
+def daemon_address() -> Address:
+    """Where the daemon listens: ``("tcp", (host, port))`` or ``("unix", path)``.
+
+    TCP is used when ``MCP_DAEMON_PORT`` is set or Unix sockets are missing;
+    otherwise a per-user socket in the temp directory (``MCP_DAEMON_SOCKET``).
+    """
+    port = os.getenv("MCP_DAEMON_PORT")
+    if port or not hasattr(socket, "AF_UNIX"):
+        host = os.getenv("MCP_DAEMON_HOST", "127.0.0.1")
+        return "tcp", (host, int(port or 5008))
+
+    default_path = os.path.join(
+        tempfile.gettempdir(), f"cursor-mcp-{getattr(os, 'getuid', lambda: 0)()}.sock"
+    )
+    return "unix", os.getenv("MCP_DAEMON_SOCKET", default_path)
+
+
+def connect(address: Optional[Address] = None, timeout: float = 1.0) -> socket.socket:
+    """Open a connection to the daemon.
+
+    Raises:
+        OSError: If no daemon is listening at the address
+    """
+    kind, target = address or daemon_address()
+    family = socket.AF_UNIX if kind == "unix" else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(target)
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return sock
+
+
+def start_daemon(server_script: str) -> subprocess.Popen:
+    """Start ``protocol_server.py --daemon`` detached from this process."""
+    log_path = os.getenv(
+        "MCP_DAEMON_LOG", os.path.join(tempfile.gettempdir(), "cursor-mcp-daemon.log")
+    )
+    log_file = open(log_path, "ab")
+    try:
+        return subprocess.Popen(
+            [sys.executable, server_script, "--daemon"],
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            start_new_session=True,
+        )
+    finally:
+        log_file.close()
+
+
+def connect_or_start(
+    server_script: Optional[str] = None,
+    address: Optional[Address] = None,
+    start_timeout: Optional[float] = None,
+) -> socket.socket:
+    """Connect to the daemon, starting it first if allowed and needed.
+
+    Raises:
+        OSError: If the daemon is not reachable within ``start_timeout``
+    """
+    try:
+        return connect(address)
+    except OSError:
+        autostart = os.getenv("MCP_DAEMON_AUTOSTART", "true").lower() == "true"
+        if not autostart or server_script is None:
+            raise
+
+    start_timeout = start_timeout or float(os.getenv("MCP_DAEMON_START_TIMEOUT", "30"))
+    process = start_daemon(server_script)
+    deadline = time.monotonic() + start_timeout
+    while True:
+        try:
+            return connect(address)
+        except OSError:
+            if process.poll() is not None or time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def _pump_input(source: BinaryIO, sock: socket.socket) -> None:
+    """Forward client lines to the daemon, half-closing on EOF."""
+    try:
+        for line in iter(source.readline, b""):
+            sock.sendall(line)
+    except OSError as e:
+        logger.warning(f"Lost connection to MCP daemon: {e}")
+    finally:
+        try:
+            # The daemon finishes in-flight requests, then closes its side
+            sock.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+
+
+def forward(sock: socket.socket, source: BinaryIO, sink: BinaryIO) -> None:
+    """Relay ``source`` to the daemon and its output to ``sink`` until closed."""
+    reader = threading.Thread(
+        target=_pump_input, args=(source, sock), name="mcp-shim-input", daemon=True
+    )
+    reader.start()
+    try:
+        while True:
+            data = sock.recv(65536)
+            if not data:
+                return
+            sink.write(data)
+            sink.flush()
+    finally:
+        sock.close()
+
+
+def run_shim(server_script: Optional[str] = None) -> int:
+    """Serve this process's stdio through the daemon; returns an exit code."""
+    try:
+        sock = connect_or_start(server_script)
+    except OSError as e:
+        print(f"MCP daemon not reachable at {daemon_address()}: {e}", file=sys.stderr)
+        return 1
+
+    forward(sock, sys.stdin.buffer, sys.stdout.buffer)
+    return 0
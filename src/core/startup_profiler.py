@@ -0,0 +1,199 @@
+"""Startup profiler for the MCP server (``--profile-startup``).
+
+Records how long each module takes to import (self and cumulative time, like
+``python -X importtime``) and how long each named initialization phase takes,
+then reports the time-to-initialize against a budget.
+"""
+
+import importlib.abc
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ImportRecord:
+    """Timing for one imported module."""
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Loader proxy that times ``exec_module``."""
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder wrapping every found loader with a timer."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        # Avoid recursing into ourselves while asking the other finders
+        if getattr(self._local, "searching", False):
+            return None
+        self._local.searching = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self._profiler)
+                    return spec
+            return None
+        finally:
+            self._local.searching = False
+
+
+class StartupProfiler:
+    """Collects import and initialization timings."""
+
+    def __init__(self):
+        """Initialize startup profiler."""
+        self.start_time = time.perf_counter()
+        self.finder: Optional[_TimingFinder] = None
+        self.imports: List[ImportRecord] = []
+        self.phases: List[Dict[str, Any]] = []
+        self.ready_ms: Optional[float] = None
+        self.ready_import_count: Optional[int] = None
+        self._stack: List[float] = []
+        self._lock = threading.Lock()
+        self.budget_ms = float(os.getenv("MCP_STARTUP_BUDGET_MS", "1000"))
+
+    @property
+    def enabled(self) -> bool:
+        """Whether import timing is installed."""
+        return self.finder is not None
+
+    def install(self) -> None:
+        """Start timing imports from now on."""
+        if self.finder is None:
+            self.start_time = time.perf_counter()
+            self.finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self.finder)
+
+    def uninstall(self) -> None:
+        """Stop timing imports."""
+        if self.finder is not None and self.finder in sys.meta_path:
+            sys.meta_path.remove(self.finder)
+        self.finder = None
+
+    def _enter(self) -> None:
+        with self._lock:
+            self._stack.append(0.0)
+
+    def _exit(self, module: str, elapsed: float) -> None:
+        with self._lock:
+            children = self._stack.pop() if self._stack else 0.0
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.imports.append(
+                ImportRecord(
+                    module=module,
+                    self_ms=(elapsed - children) * 1000,
+                    cumulative_ms=elapsed * 1000,
+                    depth=len(self._stack),
+                )
+            )
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a named initialization phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append(
+                {"phase": name, "ms": (time.perf_counter() - start) * 1000}
+            )
+
+    def mark_ready(self) -> float:
+        """Record that the server can answer ``initialize``."""
+        self.ready_ms = (time.perf_counter() - self.start_time) * 1000
+        self.ready_import_count = len(self.imports)
+        return self.ready_ms
+
+    def within_budget(self) -> bool:
+        """Whether time-to-initialize is within the budget."""
+        return self.ready_ms is not None and self.ready_ms <= self.budget_ms
+
+    def get_statistics(self, top: int = 25) -> Dict[str, Any]:
+        """Get profile data for imports made before the server was ready."""
+        imports = self.imports[: self.ready_import_count]
+        slowest = sorted(imports, key=lambda r: r.cumulative_ms, reverse=True)
+        return {
+            "time_to_initialize_ms": self.ready_ms,
+            "budget_ms": self.budget_ms,
+            "within_budget": self.within_budget(),
+            "modules_imported": len(imports),
+            "import_total_ms": sum(r.self_ms for r in imports),
+            "phases": self.phases,
+            "slowest_imports": [
+                {
+                    "module": r.module,
+                    "self_ms": round(r.self_ms, 3),
+                    "cumulative_ms": round(r.cumulative_ms, 3),
+                }
+                for r in slowest[:top]
+            ],
+        }
+
+    def format_report(self, top: int = 25) -> str:
+        """Format a human readable report."""
+        stats = self.get_statistics(top)
+        lines = ["", "🚀 MCP server startup profile", ""]
+        lines.append(f"{'self ms':>10} | {'cumulative':>10} | module")
+        for record in stats["slowest_imports"]:
+            lines.append(
+                f"{record['self_ms']:10.1f} | {record['cumulative_ms']:10.1f} | "
+                f"{record['module']}"
+            )
+        lines.append(
+            f"({stats['modules_imported']} modules, "
+            f"{stats['import_total_ms']:.1f} ms importing)"
+        )
+        lines.append("")
+        lines.append("Initialization phases:")
+        for phase in stats["phases"]:
+            lines.append(f"  {phase['ms']:10.1f} ms  {phase['phase']}")
+        lines.append("")
+
+        ready = stats["time_to_initialize_ms"] or 0.0
+        status = "✅ within" if stats["within_budget"] else "❌ over"
+        lines.append(
+            f"Time to initialize: {ready:.1f} ms ({status} budget of "
+            f"{stats['budget_ms']:.0f} ms, MCP_STARTUP_BUDGET_MS)"
+        )
+        return "\n".join(lines)
+
+
+# Global startup profiler instance
+startup_profiler = StartupProfiler()
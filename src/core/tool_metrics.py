@@ -0,0 +1,506 @@
+"""Always-on latency and size histograms for MCP tool calls.
+
+:class:`Histogram` uses HDR-style log-linear buckets: values below 64 get a
+bucket each and every power of two above that is split into 32 buckets, so
+percentiles are accurate to about 3% and a histogram never holds more than
+~1,100 counters however many values it records.
+
+:class:`ToolMetrics` keeps the histograms per tool and per recording thread.
+Recording touches only the calling thread's shard and takes no lock; readers
+merge the shards into a snapshot. The MCP server exports snapshots to
+``MCP_METRICS_DIR`` so the dashboard backend, a separate process, can serve
+them in the Prometheus text format.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SUB_BUCKET_BITS = 6
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_BUCKETS = SUB_BUCKETS // 2
+# Largest trackable value: 2**40 microseconds (~12 days) or bytes (1 TiB)
+MAX_VALUE_BITS = 40
+BUCKET_COUNT = SUB_BUCKETS + (MAX_VALUE_BITS - SUB_BUCKET_BITS) * HALF_BUCKETS
+
+# Histograms recorded per tool call (times in microseconds)
+QUEUE_WAIT = "queue_wait_us"
+EXECUTION = "execution_us"
+SERIALIZATION = "serialization_us"
+RESPONSE_BYTES = "response_bytes"
+HISTOGRAMS = (QUEUE_WAIT, EXECUTION, SERIALIZATION, RESPONSE_BYTES)
+
+# Counters recorded per tool call
+CALLS = "calls"
+ERRORS = "errors"
+COUNTERS = (CALLS, ERRORS)
+
+
+def bucket_index(value: int) -> int:
+    """Bucket a non-negative integer value falls into."""
+    if value < SUB_BUCKETS:
+        return max(value, 0)
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    if shift > MAX_VALUE_BITS - SUB_BUCKET_BITS:
+        return BUCKET_COUNT - 1
+    return SUB_BUCKETS + (shift - 1) * HALF_BUCKETS + (value >> shift) - HALF_BUCKETS
+
+
+def bucket_upper_bound(index: int) -> int:
+    """Largest value counted in a bucket."""
+    if index < SUB_BUCKETS:
+        return index
+    shift = (index - SUB_BUCKETS) // HALF_BUCKETS + 1
+    lower = (HALF_BUCKETS + (index - SUB_BUCKETS) % HALF_BUCKETS) << shift
+    return lower + (1 << shift) - 1
+
+
+class Histogram:
+    """Fixed-memory histogram of non-negative integer values."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        # Sparse bucket counts: typical latencies touch a few dozen buckets
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max = 0
+
+    def record(self, value: float) -> None:
+        """Count one value (negative values count as zero)."""
+        value = max(int(value), 0)
+        index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if self.min is None or value < self.min:
+            self.min = value
+
+    def merge(self, other: "Histogram") -> None:
+        """Add another histogram's values to this one."""
+        # dict() copies in one step, safe while the owning thread records
+        for index, count in dict(other.counts).items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+
+    def percentile(self, percent: float) -> int:
+        """Value at or below which ``percent`` of the recorded values fall."""
+        if not self.count:
+            return 0
+        rank = max(percent / 100.0 * self.count, 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(bucket_upper_bound(index), self.max)
+        return self.max
+
+    def count_at_or_below(self, value: float) -> int:
+        """Number of recorded values not above ``value`` (bucket precision)."""
+        return sum(
+            count
+            for index, count in self.counts.items()
+            if bucket_upper_bound(index) <= value
+        )
+
+    def mean(self) -> float:
+        """Average recorded value."""
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self, scale: float = 1.0, digits: int = 3) -> Dict[str, Any]:
+        """Count and percentiles, with values divided by ``scale``."""
+
+        def scaled(value: float) -> float:
+            return round(value / scale, digits)
+
+        return {
+            "count": self.count,
+            "mean": scaled(self.mean()),
+            "p50": scaled(self.percentile(50)),
+            "p90": scaled(self.percentile(90)),
+            "p95": scaled(self.percentile(95)),
+            "p99": scaled(self.percentile(99)),
+            "max": scaled(self.max),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form that :meth:`from_dict` restores exactly."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {str(index): count for index, count in self.counts.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Histogram":
+        """Restore a histogram from :meth:`to_dict` output."""
+        histogram = cls()
+        histogram.counts = {
+            int(index): count for index, count in data.get("buckets", {}).items()
+        }
+        histogram.count = data.get("count", 0)
+        histogram.total = data.get("sum", 0)
+        histogram.min = data.get("min")
+        histogram.max = data.get("max", 0)
+        return histogram
+
+
+class _Shard:
+    """Histograms and counters written by one thread."""
+
+    __slots__ = ("thread", "histograms", "counters")
+
+    def __init__(self, thread: Optional[threading.Thread]):
+        self.thread = thread
+        self.histograms: Dict[str, Dict[str, Histogram]] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    def merge_into(self, tools: Dict[str, Dict[str, Any]]) -> None:
+        for tool, histograms in list(self.histograms.items()):
+            entry = tools.setdefault(tool, _empty_entry())
+            for name, histogram in list(histograms.items()):
+                entry.setdefault(name, Histogram()).merge(histogram)
+        for tool, counters in list(self.counters.items()):
+            entry = tools.setdefault(tool, _empty_entry())
+            for name, value in list(counters.items()):
+                entry[name] = entry.get(name, 0) + value
+
+
+def _empty_entry() -> Dict[str, Any]:
+    entry: Dict[str, Any] = {name: Histogram() for name in HISTOGRAMS}
+    entry.update({name: 0 for name in COUNTERS})
+    return entry
+
+
+_current_tool: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "mcp_current_tool", default=None
+)
+
+
+def current_tool() -> Optional[str]:
+    """Name of the tool whose call is handled in this context, if any."""
+    return _current_tool.get()
+
+
+@contextmanager
+def bind_tool(name: Optional[str]):
+    """Attribute responses sent by the enclosed code to tool ``name``."""
+    reset = _current_tool.set(name)
+    try:
+        yield name
+    finally:
+        _current_tool.reset(reset)
+
+
+class ToolMetrics:
+    """Per-tool call counters and latency/size histograms."""
+
+    def __init__(self, enabled: Optional[bool] = None):
+        """Initialize metrics.
+
+        Args:
+            enabled: Record anything at all (``MCP_TOOL_METRICS``, default on)
+        """
+        if enabled is None:
+            enabled = os.getenv("MCP_TOOL_METRICS", "true").lower() == "true"
+        self.enabled = enabled
+        self.started_at = time.time()
+
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        # Folded shards of threads that have exited
+        self._retired = _Shard(None)
+        self.lock = threading.Lock()
+
+        self._export_stop = threading.Event()
+        self._export_thread: Optional[threading.Thread] = None
+        self._export_path: Optional[str] = None
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard(threading.current_thread())
+            with self.lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def record(self, tool: Optional[str], name: str, value: float) -> None:
+        """Record a value into one of a tool's histograms."""
+        if not self.enabled or not tool:
+            return
+        histograms = self._shard().histograms
+        by_name = histograms.get(tool)
+        if by_name is None:
+            by_name = histograms[tool] = {}
+        histogram = by_name.get(name)
+        if histogram is None:
+            histogram = by_name[name] = Histogram()
+        histogram.record(value)
+
+    def record_seconds(self, tool: Optional[str], name: str, seconds: float) -> None:
+        """Record a duration given in seconds into a microsecond histogram."""
+        self.record(tool, name, seconds * 1_000_000)
+
+    def increment(self, tool: Optional[str], name: str, amount: int = 1) -> None:
+        """Increase one of a tool's counters."""
+        if not self.enabled or not tool:
+            return
+        counters = self._shard().counters
+        by_name = counters.get(tool)
+        if by_name is None:
+            by_name = counters[tool] = {}
+        by_name[name] = by_name.get(name, 0) + amount
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Merged histograms and counters keyed by tool name."""
+        tools: Dict[str, Dict[str, Any]] = {}
+        with self.lock:
+            live = []
+            for shard in self._shards:
+                if shard.thread is not None and not shard.thread.is_alive():
+                    _fold(shard, self._retired)
+                else:
+                    live.append(shard)
+            self._shards = live
+            self._retired.merge_into(tools)
+        for shard in live:
+            shard.merge_into(tools)
+        return tools
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self.lock:
+            for shard in self._shards:
+                shard.histograms = {}
+                shard.counters = {}
+            self._retired = _Shard(None)
+
+    def get_statistics(self, tool: Optional[str] = None) -> Dict[str, Any]:
+        """Per-tool counts with times in milliseconds and sizes in bytes."""
+        tools = {}
+        for name, entry in sorted(self.snapshot().items()):
+            if tool and name != tool:
+                continue
+            tools[name] = {
+                "calls": entry[CALLS],
+                "errors": entry[ERRORS],
+                "queue_wait_ms": entry[QUEUE_WAIT].summary(scale=1000.0),
+                "execution_ms": entry[EXECUTION].summary(scale=1000.0),
+                "serialization_ms": entry[SERIALIZATION].summary(scale=1000.0),
+                "response_bytes": entry[RESPONSE_BYTES].summary(digits=0),
+            }
+        return {
+            "enabled": self.enabled,
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "tools": tools,
+        }
+
+    def to_dict(self, instance_id: Optional[str] = None) -> Dict[str, Any]:
+        """Serializable snapshot for other processes (see :func:`load_exports`)."""
+        return {
+            "instance_id": instance_id,
+            "pid": os.getpid(),
+            "started_at": self.started_at,
+            "timestamp": time.time(),
+            "tools": {
+                tool: {
+                    name: value.to_dict() if isinstance(value, Histogram) else value
+                    for name, value in entry.items()
+                }
+                for tool, entry in self.snapshot().items()
+            },
+        }
+
+    def export(self, path: str, instance_id: Optional[str] = None) -> None:
+        """Atomically write a snapshot to ``path``."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as f:
+            json.dump(self.to_dict(instance_id), f, separators=(",", ":"))
+        os.replace(temporary, path)
+
+    def start_export(
+        self,
+        instance_id: str,
+        directory: Optional[str] = None,
+        interval: Optional[float] = None,
+    ) -> Optional[str]:
+        """Export snapshots periodically; returns the file path, None if off."""
+        interval = (
+            interval
+            if interval is not None
+            else float(os.getenv("MCP_METRICS_EXPORT_INTERVAL", "10"))
+        )
+        if not self.enabled or interval <= 0:
+            return None
+
+        path = os.path.join(directory or metrics_dir(), f"{instance_id}.json")
+
+        def run():
+            while not self._export_stop.wait(interval):
+                try:
+                    self.export(path, instance_id)
+                except OSError as e:
+                    logger.warning(f"Failed to export tool metrics to {path}: {e}")
+
+        self._export_path = path
+        self._export_stop.clear()
+        self._export_thread = threading.Thread(
+            target=run, name="mcp-metrics-export", daemon=True
+        )
+        self._export_thread.start()
+        return path
+
+    def stop_export(self) -> None:
+        """Stop the export thread and remove this process's snapshot file."""
+        self._export_stop.set()
+        if self._export_path and os.path.exists(self._export_path):
+            os.unlink(self._export_path)
+        self._export_path = None
+
+
+def _fold(shard: _Shard, retired: _Shard) -> None:
+    """Move a finished thread's data into the retired shard."""
+    for tool, histograms in shard.histograms.items():
+        target = retired.histograms.setdefault(tool, {})
+        for name, histogram in histograms.items():
+            target.setdefault(name, Histogram()).merge(histogram)
+    for tool, counters in shard.counters.items():
+        target_counters = retired.counters.setdefault(tool, {})
+        for name, value in counters.items():
+            target_counters[name] = target_counters.get(name, 0) + value
+
+
+def metrics_dir() -> str:
+    """Directory MCP servers export their tool metrics snapshots to."""
+    return os.getenv(
+        "MCP_METRICS_DIR", os.path.join(os.path.expanduser("~"), ".mcp_metrics")
+    )
+
+
+def load_exports(
+    directory: Optional[str] = None, instance_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Read exported snapshots, all of them or one instance's."""
+    directory = directory or metrics_dir()
+    if instance_id:
+        names = [f"{instance_id}.json"]
+    elif os.path.isdir(directory):
+        names = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+    else:
+        names = []
+
+    snapshots = []
+    for name in names:
+        try:
+            with open(os.path.join(directory, name)) as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return snapshots
+
+
+# Prometheus histogram boundaries: seconds for durations, bytes for sizes
+SECONDS_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+_PROMETHEUS_HISTOGRAMS = (
+    (QUEUE_WAIT, "mcp_tool_queue_wait_seconds", "Time from admission to start", 1e6),
+    (EXECUTION, "mcp_tool_execution_seconds", "Tool handler run time", 1e6),
+    (SERIALIZATION, "mcp_tool_serialization_seconds", "Response encoding time", 1e6),
+    (RESPONSE_BYTES, "mcp_tool_response_bytes", "Serialized response size", 1.0),
+)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    pairs = (
+        f'{key}="{_escape(value)}"'
+        for key, value in labels.items()
+        if value is not None
+    )
+    return "{" + ",".join(pairs) + "}"
+
+
+def render_prometheus(snapshots: Iterable[Dict[str, Any]]) -> str:
+    """Render exported snapshots in the Prometheus text exposition format."""
+    snapshots = list(snapshots)
+    lines: List[str] = []
+
+    for counter, help_text in (
+        (CALLS, "Tool calls dispatched"),
+        (ERRORS, "Tool calls answered with an error"),
+    ):
+        metric = f"mcp_tool_{counter}_total"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for snapshot in snapshots:
+            for tool, entry in sorted(snapshot.get("tools", {}).items()):
+                labels = _labels(instance_id=snapshot.get("instance_id"), tool=tool)
+                lines.append(f"{metric}{labels} {entry.get(counter, 0)}")
+
+    for name, metric, help_text, scale in _PROMETHEUS_HISTOGRAMS:
+        boundaries = BYTES_BUCKETS if scale == 1.0 else SECONDS_BUCKETS
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} histogram")
+        for snapshot in snapshots:
+            instance_id = snapshot.get("instance_id")
+            for tool, entry in sorted(snapshot.get("tools", {}).items()):
+                histogram = Histogram.from_dict(entry.get(name, {}))
+                if not histogram.count:
+                    continue
+                for boundary in boundaries:
+                    labels = _labels(instance_id=instance_id, tool=tool, le=boundary)
+                    count = histogram.count_at_or_below(boundary * scale)
+                    lines.append(f"{metric}_bucket{labels} {count}")
+                labels = _labels(instance_id=instance_id, tool=tool, le="+Inf")
+                lines.append(f"{metric}_bucket{labels} {histogram.count}")
+                labels = _labels(instance_id=instance_id, tool=tool)
+                lines.append(f"{metric}_sum{labels} {histogram.total / scale}")
+                lines.append(f"{metric}_count{labels} {histogram.count}")
+
+    return "\n".join(lines) + "\n"
+
+
+# Global tool metrics instance
+tool_metrics = ToolMetrics()
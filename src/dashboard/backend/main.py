@@ -212,6 +212,22 @@ async def health_check():
     }
 
 
+@app.get("/metrics")
+async def prometheus_metrics(all_instances: bool = False):
+    """Per-tool MCP metrics in the Prometheus text format.
+
+    Reads the snapshots MCP servers export periodically; by default only the
+    instance this dashboard belongs to.
+    """
+    from src.core.tool_metrics import load_exports, render_prometheus
+
+    instance_id = None if all_instances else os.environ.get("MCP_INSTANCE_ID")
+    return Response(
+        content=render_prometheus(load_exports(instance_id=instance_id)),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 @app.get("/api/lit/info")
 async def get_lit_info():
     """Get comprehensive Lit 3 library information."""
@@ -1,17 +1,53 @@
-"""Database package."""
+"""Database package.
 
-from .enhanced_vector_store import EnhancedVectorStore, InMemoryVectorStore
+The vector store is created on first access rather than at import time, so
+importing this package never connects to Qdrant.
+"""
 
-# Create a global instance for backward compatibility
-try:
-    vector_store = EnhancedVectorStore()
-except Exception as e:
-    import logging
+import logging
+import threading
 
-    logger = logging.getLogger(__name__)
-    logger.warning(
-        f"Failed to create EnhancedVectorStore, using InMemoryVectorStore: {e}"
-    )
-    vector_store = InMemoryVectorStore()
+logger = logging.getLogger(__name__)
 
-__all__ = ["EnhancedVectorStore", "InMemoryVectorStore", "vector_store"]
+_vector_store = None
+_vector_store_lock = threading.Lock()
+
+
+def get_vector_store():
+    """Get the global vector store, creating it on first use."""
+    global _vector_store
+    if _vector_store is None:
+        with _vector_store_lock:
+            if _vector_store is None:
+                from .enhanced_vector_store import (
+                    InMemoryVectorStore,
+                    get_enhanced_vector_store,
+                )
+
+                try:
+                    _vector_store = get_enhanced_vector_store()
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to create EnhancedVectorStore, using InMemoryVectorStore: {e}"
+                    )
+                    _vector_store = InMemoryVectorStore()
+    return _vector_store
+
+
+def __getattr__(name):
+    """Resolve package attributes lazily for backward compatibility."""
+    if name == "vector_store":
+        return get_vector_store()
+    if name in ("EnhancedVectorStore", "InMemoryVectorStore"):
+        from . import enhanced_vector_store
+
+        return getattr(enhanced_vector_store, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "EnhancedVectorStore",
+    "InMemoryVectorStore",
+    "vector_store",
+    "get_vector_store",
+]
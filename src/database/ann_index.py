@@ -0,0 +1,203 @@
+"""Approximate nearest neighbour index for in-memory vector collections.
+
+:class:`IVFIndex` is an inverted file index ("IVF-flat"): spherical k-means
+splits the unit vectors into ``nlist`` cells, every row is filed under its
+nearest centroid, and a search only scores the rows of the ``nprobe`` cells
+whose centroids are closest to the query. Rows keep their float32 vectors in
+the collection matrix, so the scores of the rows that are probed are exact
+and only recall is approximate.
+
+New rows are filed as they are upserted. Centroids are trained once a
+collection reaches ``min_points`` and retrained as it grows; until then, and
+for filtered searches, collections are searched exactly.
+"""
+
+import logging
+import math
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Rows scored per chunk when assigning rows to centroids
+ASSIGN_CHUNK = 16384
+
+
+@dataclass
+class IVFConfig:
+    """Parameters of an :class:`IVFIndex`."""
+
+    # Cells; None picks about sqrt(points) at training time
+    nlist: Optional[int] = None
+    # Cells scored per query; more raises recall and latency
+    nprobe: int = 16
+    # Collections smaller than this are searched exactly
+    min_points: int = 20000
+    # Retrain once the collection grew by this factor since training
+    retrain_growth: float = 4.0
+    # Training rows sampled per cell
+    sample_per_list: int = 64
+    # k-means iterations
+    iterations: int = 10
+
+    def lists_for(self, points: int) -> int:
+        """Number of cells to train for a collection of ``points``."""
+        if self.nlist:
+            return self.nlist
+        return int(min(max(math.sqrt(points), 16), 4096))
+
+
+def config_from_env() -> Optional[IVFConfig]:
+    """Index parameters for new collections, or None for exact search only.
+
+    ``VECTOR_ANN`` selects ``ivf`` (default) or ``exact``;
+    ``VECTOR_ANN_NLIST``, ``VECTOR_ANN_NPROBE`` and ``VECTOR_ANN_MIN_POINTS``
+    override the defaults of :class:`IVFConfig`.
+    """
+    if os.getenv("VECTOR_ANN", "ivf").lower() != "ivf":
+        return None
+    config = IVFConfig()
+    if os.getenv("VECTOR_ANN_NLIST"):
+        config.nlist = int(os.environ["VECTOR_ANN_NLIST"])
+    if os.getenv("VECTOR_ANN_NPROBE"):
+        config.nprobe = int(os.environ["VECTOR_ANN_NPROBE"])
+    if os.getenv("VECTOR_ANN_MIN_POINTS"):
+        config.min_points = int(os.environ["VECTOR_ANN_MIN_POINTS"])
+    return config
+
+
+def nearest_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the most similar centroid for each row of ``vectors``."""
+    nearest = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), ASSIGN_CHUNK):
+        chunk = vectors[start : start + ASSIGN_CHUNK]
+        nearest[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return nearest
+
+
+def train_centroids(
+    vectors: np.ndarray, nlist: int, iterations: int = 10, seed: int = 0
+) -> np.ndarray:
+    """Spherical k-means: ``nlist`` unit centroids of unit ``vectors``."""
+    rng = np.random.default_rng(seed)
+    nlist = min(nlist, len(vectors))
+    seeds = rng.choice(len(vectors), nlist, replace=False)
+    centroids: np.ndarray = vectors[seeds].copy()
+    for _ in range(iterations):
+        assignment = nearest_centroids(vectors, centroids)
+        order = np.argsort(assignment, kind="stable")
+        cells, starts = np.unique(assignment[order], return_index=True)
+        sums = np.add.reduceat(vectors[order], starts, axis=0)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        centroids[cells] = sums / norms
+        # Reseed cells that attracted no rows
+        empty = np.setdiff1d(np.arange(nlist), cells)
+        if empty.size:
+            centroids[empty] = vectors[rng.choice(len(vectors), empty.size)]
+    return centroids
+
+
+class IVFIndex:
+    """Rows of a collection filed under their nearest k-means centroid."""
+
+    def __init__(self, config: IVFConfig):
+        self.config = config
+        self.nprobe = config.nprobe
+        self.centroids: Optional[np.ndarray] = None
+        self.trained_points = 0
+        self.assignment = np.full(0, -1, dtype=np.int32)
+        self.lists: List[List[int]] = []
+        self._arrays: Dict[int, np.ndarray] = {}
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    def due(self, points: int) -> bool:
+        """Whether a collection of ``points`` should (re)train its centroids."""
+        if points < self.config.min_points:
+            return False
+        return (
+            not self.trained
+            or points >= self.trained_points * self.config.retrain_growth
+        )
+
+    def install(
+        self, centroids: np.ndarray, assignment: np.ndarray, points: int
+    ) -> None:
+        """Replace centroids and file rows ``0..len(assignment)`` as given."""
+        self.centroids = centroids
+        self.trained_points = points
+        self.assignment = assignment.astype(np.int32, copy=True)
+        self._rebuild_lists()
+
+    def _rebuild_lists(self) -> None:
+        self.lists = [[] for _ in range(len(self.centroids))]
+        for row, cell in enumerate(self.assignment.tolist()):
+            if cell >= 0:
+                self.lists[cell].append(row)
+        self._arrays = {}
+
+    def assign(self, rows: Sequence[int], vectors: np.ndarray) -> None:
+        """File (or refile) ``rows``, whose vectors are ``vectors``."""
+        if not self.trained or not len(rows):
+            return
+        end = max(rows) + 1
+        if end > len(self.assignment):
+            grown = np.full(max(end, 2 * len(self.assignment)), -1, dtype=np.int32)
+            grown[: len(self.assignment)] = self.assignment
+            self.assignment = grown
+        for row, cell in zip(rows, nearest_centroids(vectors, self.centroids).tolist()):
+            previous = int(self.assignment[row])
+            if previous == cell:
+                continue
+            if previous >= 0:
+                self.lists[previous].remove(row)
+                self._arrays.pop(previous, None)
+            self.lists[cell].append(row)
+            self._arrays.pop(cell, None)
+            self.assignment[row] = cell
+
+    def remap(self, kept_rows: np.ndarray) -> None:
+        """Renumber after compaction: old row ``kept_rows[n]`` becomes row n."""
+        if not self.trained:
+            return
+        assignment = np.full(len(kept_rows), -1, dtype=np.int32)
+        filed = kept_rows < len(self.assignment)
+        assignment[filed] = self.assignment[kept_rows[filed]]
+        self.assignment = assignment
+        self._rebuild_lists()
+
+    def reset(self) -> None:
+        """Forget the centroids; the collection is searched exactly again."""
+        self.centroids = None
+        self.trained_points = 0
+        self.assignment = np.full(0, -1, dtype=np.int32)
+        self.lists = []
+        self._arrays = {}
+
+    def _cell(self, cell: int) -> np.ndarray:
+        array = self._arrays.get(cell)
+        if array is None:
+            array = self._arrays[cell] = np.array(self.lists[cell], dtype=np.intp)
+        return array
+
+    def probe(self, queries: np.ndarray) -> List[np.ndarray]:
+        """Rows in the ``nprobe`` cells nearest to each query."""
+        nprobe = min(self.nprobe, len(self.centroids))
+        closest = np.argpartition(-(queries @ self.centroids.T), nprobe - 1, axis=1)
+        return [
+            np.concatenate([self._cell(cell) for cell in cells[:nprobe]])
+            for cells in closest
+        ]
+
+    def get_info(self) -> Dict[str, int]:
+        return {
+            "nlist": len(self.lists),
+            "nprobe": self.nprobe,
+            "trained_points": self.trained_points,
+        }
@@ -0,0 +1,148 @@
+"""Batching and parallel upload for bulk vector upserts.
+
+:func:`iter_batches` groups a stream of points into batches bounded by point
+count and by estimated request size, without materializing the stream.
+:func:`upload_batches` sends them with at most ``parallel`` uploads in
+flight; :func:`send_with_retries` retries a failed batch with exponential
+backoff before giving up on it.
+"""
+
+import concurrent.futures
+import functools
+import json
+import logging
+import random
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_BATCH_BYTES = 8 * 1024 * 1024
+
+Batch = List[Dict[str, Any]]
+
+
+def point_bytes(point: Dict[str, Any]) -> int:
+    """Rough request size of a point: JSON payload plus float vector text."""
+    payload = json.dumps(point.get("payload", {}), default=str)
+    # A float serializes to about 10 characters in the JSON request body
+    return len(payload) + 10 * len(point.get("vector") or ())
+
+
+def iter_batches(
+    points: Iterable[Dict[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_bytes: int = DEFAULT_BATCH_BYTES,
+) -> Iterator[Batch]:
+    """Group points into batches of at most ``batch_size`` points and
+    ``max_bytes`` estimated bytes; a single larger point gets its own batch."""
+    batch: Batch = []
+    size = 0
+    for point in points:
+        weight = point_bytes(point) if max_bytes else 0
+        if batch and (len(batch) >= batch_size or size + weight > max_bytes):
+            yield batch
+            batch, size = [], 0
+        batch.append(point)
+        size += weight
+    if batch:
+        yield batch
+
+
+def send_with_retries(
+    batch: Batch,
+    upload: Callable[[Batch], Any],
+    max_retries: int = 3,
+    backoff: float = 0.5,
+    on_failure: Callable[[Batch, Exception], None] = None,
+    stats: Dict[str, Any] = None,
+) -> None:
+    """Upload one batch, retrying with jittered exponential backoff.
+
+    After ``max_retries`` retries the batch goes to ``on_failure``, or the
+    last error is raised if there is none. Retries are counted in
+    ``stats["retries"]``.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            upload(batch)
+            return
+        except Exception as e:
+            if attempt == max_retries:
+                if on_failure is None:
+                    raise
+                on_failure(batch, e)
+                return
+            if stats is not None:
+                stats["retries"] += 1
+            delay = backoff * (2**attempt) * (0.5 + random.random())
+            logger.warning(
+                f"Upload of {len(batch)} points failed ({e}), "
+                f"retrying in {delay:.2f}s"
+            )
+            time.sleep(delay)
+
+
+def upload_batches(
+    batches: Iterable[Batch],
+    upload: Callable[[Batch], Any],
+    parallel: int = 4,
+    max_retries: int = 3,
+    backoff: float = 0.5,
+    on_failure: Callable[[Batch, Exception], None] = None,
+) -> Dict[str, Any]:
+    """Upload batches, ``parallel`` at a time, retrying failures.
+
+    Batches are pulled from ``batches`` only as upload slots free up, so a
+    generator is never read far ahead. A batch that still fails after
+    ``max_retries`` retries is passed to ``on_failure`` (or counted as
+    failed if there is none).
+
+    Returns:
+        Counts of points, batches, retries and failed batches, and seconds
+    """
+    stats: Dict[str, Any] = {
+        "points": 0,
+        "batches": 0,
+        "retries": 0,
+        "failed_batches": 0,
+    }
+    started = time.perf_counter()
+    send = functools.partial(
+        send_with_retries,
+        upload=upload,
+        max_retries=max_retries,
+        backoff=backoff,
+        on_failure=on_failure,
+        stats=stats,
+    )
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(parallel, 1), thread_name_prefix="bulk-upsert"
+    ) as pool:
+        in_flight: Dict[concurrent.futures.Future, Batch] = {}
+
+        def collect(done) -> None:
+            for future in done:
+                batch = in_flight.pop(future)
+                if future.exception() is not None:
+                    stats["failed_batches"] += 1
+                    logger.error(
+                        f"Giving up on {len(batch)} points: {future.exception()}"
+                    )
+                else:
+                    stats["points"] += len(batch)
+                    stats["batches"] += 1
+
+        for batch in batches:
+            if len(in_flight) >= max(parallel, 1):
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                collect(done)
+            in_flight[pool.submit(send, batch)] = batch
+        collect(concurrent.futures.wait(in_flight).done)
+
+    stats["seconds"] = round(time.perf_counter() - started, 3)
+    return stats
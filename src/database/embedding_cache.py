@@ -0,0 +1,265 @@
+"""Persistent cache of text embeddings.
+
+Entries are keyed by the embedding model id and the SHA-256 of the
+normalized text (Unicode NFC, whitespace collapsed), so a text is embedded
+once per model, across restarts and across processes. Lookups go through an
+in-process LRU first and then a SQLite file (``.cursor-agents/`` by default)
+opened in WAL mode, so several processes can read it while one writes. The
+file is capped in size; once it grows past the cap the least recently used
+entries are deleted.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.path.join(".cursor-agents", "embedding_cache.sqlite3")
+
+# Eviction trims the file to this share of its cap, so it does not run per write
+EVICT_TO = 0.9
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def text_digest(text: str) -> bytes:
+    """SHA-256 of the normalized text."""
+    normalized = _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Two-level (memory LRU, then SQLite) cache of embedding vectors."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        memory_entries: int = 4096,
+    ):
+        """Initialize the cache; the file is opened on first use.
+
+        Args:
+            path: SQLite file (default: ``EMBEDDING_CACHE_PATH`` or
+                ``.cursor-agents/embedding_cache.sqlite3``); ``"none"`` or
+                empty keeps only the in-process LRU
+            max_bytes: Size cap of the stored vectors (default:
+                ``EMBEDDING_CACHE_MB``, else 256 MB)
+            memory_entries: Vectors kept in the in-process LRU
+        """
+        path = (
+            path
+            if path is not None
+            else os.getenv("EMBEDDING_CACHE_PATH", DEFAULT_PATH)
+        )
+        self.path = None if not path or path.lower() == "none" else path
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(float(os.getenv("EMBEDDING_CACHE_MB", "256")) * 1024 * 1024)
+        )
+        self.memory_entries = memory_entries
+        self.memory: "OrderedDict[Tuple[str, bytes], np.ndarray]" = OrderedDict()
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.connection: Optional[sqlite3.Connection] = None
+        self.lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evicted": 0}
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite file; the caller holds the lock."""
+        if self.connection is not None or self.path is None:
+            return self.connection
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=5.0, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("""CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    digest BLOB NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (model, digest)
+                )""")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_used "
+                "ON embeddings (last_used)"
+            )
+            self.disk_bytes = connection.execute(
+                "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+            ).fetchone()[0]
+            self.connection = connection
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache {self.path} unavailable: {e}")
+            self.path = None
+        return self.connection
+
+    def _remember(self, key: Tuple[str, bytes], vector: np.ndarray) -> None:
+        """Put a vector at the front of the LRU; the caller holds the lock."""
+        previous = self.memory.pop(key, None)
+        if previous is not None:
+            self.memory_bytes -= previous.nbytes
+        self.memory[key] = vector
+        self.memory_bytes += vector.nbytes
+        while len(self.memory) > self.memory_entries:
+            _, dropped = self.memory.popitem(last=False)
+            self.memory_bytes -= dropped.nbytes
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Cached vectors for ``texts``, None where a text is not cached.
+
+        Each call returns its own writable copies of the cached vectors.
+        """
+        keys = [(model, text_digest(text)) for text in texts]
+        found: List[Optional[np.ndarray]] = [None] * len(keys)
+        with self.lock:
+            missing = []
+            for position, key in enumerate(keys):
+                vector = self.memory.get(key)
+                if vector is None:
+                    missing.append(position)
+                else:
+                    self.memory.move_to_end(key)
+                    found[position] = vector.copy()
+            self.stats["memory_hits"] += len(keys) - len(missing)
+
+            connection = self._connect() if missing else None
+            if connection is not None:
+                digests = list({keys[position][1] for position in missing})
+                rows: Dict[bytes, bytes] = {}
+                try:
+                    for start in range(0, len(digests), 500):
+                        chunk = digests[start : start + 500]
+                        rows.update(
+                            connection.execute(
+                                "SELECT digest, vector FROM embeddings WHERE model = ? "
+                                f"AND digest IN ({','.join('?' * len(chunk))})",
+                                [model, *chunk],
+                            ).fetchall()
+                        )
+                    if rows:
+                        connection.executemany(
+                            "UPDATE embeddings SET last_used = ? "
+                            "WHERE model = ? AND digest = ?",
+                            [(time.time(), model, digest) for digest in rows],
+                        )
+                        connection.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Embedding cache read failed: {e}")
+
+                still_missing = []
+                for position in missing:
+                    blob = rows.get(keys[position][1])
+                    if blob is None:
+                        still_missing.append(position)
+                        continue
+                    # Copied: frombuffer arrays are read-only views of the blob
+                    vector = np.frombuffer(blob, dtype=np.float32).copy()
+                    self._remember(keys[position], vector)
+                    found[position] = vector.copy()
+                self.stats["disk_hits"] += len(missing) - len(still_missing)
+                missing = still_missing
+            self.stats["misses"] += len(missing)
+        return found
+
+    def put_many(
+        self, model: str, texts: Sequence[str], vectors: Sequence[np.ndarray]
+    ) -> None:
+        """Store copies of the vectors for ``texts``.
+
+        Copying keeps a row of the encoder's batch matrix from holding the
+        whole batch in memory while the LRU only counts the row.
+        """
+        entries = [
+            ((model, text_digest(text)), np.array(vector, dtype=np.float32))
+            for text, vector in zip(texts, vectors)
+        ]
+        with self.lock:
+            for key, vector in entries:
+                self._remember(key, vector)
+
+            connection = self._connect()
+            if connection is None:
+                return
+            now = time.time()
+            try:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)",
+                    [
+                        (model, digest, vector.tobytes(), now)
+                        for (model, digest), vector in entries
+                    ],
+                )
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+                return
+            self.disk_bytes += sum(vector.nbytes for _, vector in entries)
+            if self.disk_bytes > self.max_bytes:
+                self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete least recently used rows down to ``EVICT_TO`` of the cap."""
+        try:
+            self.disk_bytes = connection.execute(
+                "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+            ).fetchone()[0]
+            excess = self.disk_bytes - int(self.max_bytes * EVICT_TO)
+            if excess <= 0:
+                return
+            rows = connection.execute(
+                "SELECT model, digest, LENGTH(vector) FROM embeddings "
+                "ORDER BY last_used"
+            )
+            doomed = []
+            for model, digest, size in rows:
+                if excess <= 0:
+                    break
+                doomed.append((model, digest))
+                excess -= size
+                self.disk_bytes -= size
+            rows.close()
+            connection.executemany(
+                "DELETE FROM embeddings WHERE model = ? AND digest = ?", doomed
+            )
+            connection.commit()
+            self.stats["evicted"] += len(doomed)
+            logger.info(f"Evicted {len(doomed)} embeddings from {self.path}")
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache eviction failed: {e}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Hit ratio and sizes."""
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        lookups = hits + self.stats["misses"]
+        return {
+            "path": self.path,
+            **self.stats,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory_bytes,
+            "disk_bytes": self.disk_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        """Close the SQLite file."""
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
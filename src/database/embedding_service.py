@@ -0,0 +1,316 @@
+"""Batched text embeddings for the vector store.
+
+:class:`EmbeddingService` loads a small sentence-transformers model once, on
+its worker thread, the first time it is needed. Callers hand texts to the
+worker and wait on a future; the worker collects requests for up to
+``batch_window`` seconds (or ``max_batch`` texts) and encodes them in a single
+model call, so concurrent tool calls share one forward pass. Embeddings come
+back as L2-normalized float32 NumPy arrays.
+
+Without sentence-transformers, when the model cannot be loaded, or with
+``EMBEDDING_MODEL=hash``, the service runs in a degraded mode. It then uses a
+hashed bag-of-words embedding, which only captures word overlap, and reports
+``degraded`` in its statistics.
+
+With an :class:`.embedding_cache.EmbeddingCache`, texts embedded before by
+the same model are served from the cache and only new texts reach the model.
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.core.tool_metrics import Histogram
+
+from .embedding_cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+HASH_MODEL = "hash"
+DIMENSIONS = 384
+
+_TOKEN = re.compile(r"\w+")
+
+
+def hash_embedding(text: str, dimensions: int = DIMENSIONS) -> np.ndarray:
+    """Signed feature-hashing embedding of the words in ``text``.
+
+    Deterministic across processes; texts sharing words score higher.
+    """
+    vector = np.zeros(dimensions, dtype=np.float32)
+    for token in _TOKEN.findall(text.lower()):
+        digest = int.from_bytes(
+            hashlib.blake2b(token.encode(), digest_size=8).digest(), "little"
+        )
+        vector[digest % dimensions] += 1.0 if digest >> 63 else -1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class EmbeddingService:
+    """Sentence embeddings computed in micro-batches on a worker thread."""
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        batch_window: Optional[float] = None,
+        max_batch: int = 64,
+        cache: Optional[EmbeddingCache] = None,
+    ):
+        """Initialize the service; the model and thread start on first use.
+
+        Args:
+            model_name: sentence-transformers model, or ``"hash"`` for the
+                degraded mode (default: ``EMBEDDING_MODEL`` or MiniLM)
+            batch_window: Seconds to wait for more texts before encoding
+                (default: ``EMBEDDING_BATCH_WINDOW_MS`` / 1000, else 0.005)
+            max_batch: Texts that end the wait early
+            cache: Cache consulted before encoding and filled afterwards
+        """
+        self.model_name = model_name or os.getenv("EMBEDDING_MODEL", DEFAULT_MODEL)
+        self.batch_window = (
+            batch_window
+            if batch_window is not None
+            else float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5")) / 1000
+        )
+        self.max_batch = max_batch
+        self.cache = cache
+        self.degraded = self.model_name == HASH_MODEL
+        self.dimensions = DIMENSIONS
+        self.model: Optional[Any] = None
+        self.requests: "queue.Queue" = queue.Queue()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+        self.ready = threading.Event()
+
+        self.batch_sizes = Histogram()
+        self.encode_us = Histogram()
+        self.stats = {"requests": 0, "texts": 0, "batches": 0, "failed": 0}
+        self.encode_seconds = 0.0
+
+    @property
+    def model_id(self) -> str:
+        """Identifies the vectors this service produces."""
+        return HASH_MODEL if self.degraded else self.model_name
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is alive."""
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self) -> None:
+        """Start the worker thread if needed."""
+        if self.running:
+            return
+        with self.lock:
+            if not self.running:
+                self.thread = threading.Thread(
+                    target=self._run, name="embedding-worker", daemon=True
+                )
+                self.thread.start()
+
+    def _load_model(self) -> None:
+        if self.degraded or self.model is not None:
+            return
+        try:
+            from sentence_transformers import SentenceTransformer
+
+            started = time.perf_counter()
+            self.model = SentenceTransformer(self.model_name, device="cpu")
+            self.dimensions = self.model.get_sentence_embedding_dimension()
+            logger.info(
+                f"Loaded embedding model {self.model_name} "
+                f"({self.dimensions}-d) in {time.perf_counter() - started:.1f}s"
+            )
+        except Exception as e:
+            logger.warning(
+                f"Embedding model {self.model_name} unavailable ({e}) - "
+                "using degraded hash embeddings"
+            )
+            self.degraded = True
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Start the worker and wait until the model is loaded (or given up).
+
+        Afterwards :attr:`model_id` and :attr:`dimensions` are final.
+        """
+        self.start()
+        return self.ready.wait(timeout)
+
+    def _run(self) -> None:
+        self._load_model()
+        self.ready.set()
+        while True:
+            batch = [self.requests.get()]
+            size = len(batch[0][0])
+            deadline = time.monotonic() + self.batch_window
+            while size < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self.requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(request)
+                size += len(request[0])
+            self._encode_batch(batch)
+
+    def _encode_batch(self, batch) -> None:
+        """Encode queued ``(texts, future, looked_up)`` requests together."""
+        live = [
+            (texts, future, looked_up)
+            for texts, future, looked_up in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not live:
+            return
+        try:
+            results = [
+                self._cached(texts) if not looked_up else [None] * len(texts)
+                for texts, _, looked_up in live
+            ]
+            missing = list(
+                dict.fromkeys(
+                    text
+                    for (texts, _, _), cached in zip(live, results)
+                    for text, vector in zip(texts, cached)
+                    if vector is None
+                )
+            )
+            encoded = dict(zip(missing, self._encode(missing))) if missing else {}
+            if self.cache is not None and missing:
+                self.cache.put_many(self.model_id, missing, list(encoded.values()))
+        except Exception as e:
+            self.stats["failed"] += len(live)
+            for _, future, _ in live:
+                future.set_exception(e)
+            return
+
+        for (texts, future, _), cached in zip(live, results):
+            future.set_result(
+                np.stack(
+                    [
+                        encoded[text] if vector is None else vector
+                        for text, vector in zip(texts, cached)
+                    ]
+                )
+            )
+
+    def _cached(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Cached vectors for ``texts`` (None where not cached)."""
+        if self.cache is None:
+            return [None] * len(texts)
+        return self.cache.get_many(self.model_id, texts)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        started = time.perf_counter()
+        if self.degraded:
+            vectors = np.stack(
+                [hash_embedding(text, self.dimensions) for text in texts]
+            )
+        else:
+            vectors = self.model.encode(
+                texts,
+                batch_size=self.max_batch,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            ).astype(np.float32, copy=False)
+        elapsed = time.perf_counter() - started
+
+        self.stats["texts"] += len(texts)
+        self.stats["batches"] += 1
+        self.encode_seconds += elapsed
+        self.batch_sizes.record(len(texts))
+        self.encode_us.record(elapsed * 1_000_000)
+        return vectors
+
+    def submit(self, texts: Sequence[str]) -> concurrent.futures.Future:
+        """Queue texts for encoding; the future resolves to a 2-d array.
+
+        Once the model is loaded, cached texts are looked up on the calling
+        thread and only the rest are queued.
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        texts = list(texts)
+        if not texts:
+            future.set_result(np.empty((0, self.dimensions), dtype=np.float32))
+            return future
+        self.start()
+        self.stats["requests"] += 1
+        if self.cache is None or not self.ready.is_set():
+            self.requests.put((texts, future, False))
+            return future
+
+        cached = self._cached(texts)
+        missing = [text for text, vector in zip(texts, cached) if vector is None]
+        if not missing:
+            future.set_result(np.stack(cached))
+            return future
+
+        def combine(encoded: concurrent.futures.Future) -> None:
+            if encoded.cancelled():
+                future.cancel()
+            elif encoded.exception() is not None:
+                future.set_exception(encoded.exception())
+            else:
+                rows = iter(encoded.result())
+                future.set_result(
+                    np.stack(
+                        [next(rows) if vector is None else vector for vector in cached]
+                    )
+                )
+
+        inner: concurrent.futures.Future = concurrent.futures.Future()
+        inner.add_done_callback(combine)
+        self.requests.put((missing, inner, True))
+        return future
+
+    def encode(
+        self, texts: Sequence[str], timeout: Optional[float] = None
+    ) -> np.ndarray:
+        """Embeddings of ``texts``, one row each, waiting for the worker."""
+        return np.asarray(self.submit(texts).result(timeout))
+
+    def encode_one(self, text: str, timeout: Optional[float] = None) -> np.ndarray:
+        """Embedding of a single text."""
+        vector: np.ndarray = self.encode([text], timeout)[0]
+        return vector
+
+    async def encode_async(self, texts: Sequence[str]) -> np.ndarray:
+        """Embeddings of ``texts`` without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(texts))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Throughput and batch size statistics."""
+        return {
+            "model": self.model_id,
+            "degraded": self.degraded,
+            "dimensions": self.dimensions,
+            "running": self.running,
+            "queued": self.requests.qsize(),
+            **self.stats,
+            "texts_per_second": (
+                round(self.stats["texts"] / self.encode_seconds, 1)
+                if self.encode_seconds
+                else 0.0
+            ),
+            "batch_size": self.batch_sizes.summary(digits=1),
+            "encode_ms": self.encode_us.summary(scale=1000),
+            "cache": self.cache.get_statistics() if self.cache else None,
+        }
+
+
+# Global embedding service instance
+embedding_service = EmbeddingService(cache=EmbeddingCache())
@@ -2,12 +2,33 @@
 
 import logging
 import json
+import os
 import uuid
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Generator, Iterable, List, Optional, Union
 from datetime import datetime
 import asyncio
 from dataclasses import dataclass
 
+from .ann_index import IVFConfig
+from .ann_index import config_from_env as ann_config_from_env
+from .lexical_index import BM25Index, fuse_hits
+from .bulk_upsert import (
+    DEFAULT_BATCH_BYTES,
+    DEFAULT_BATCH_SIZE,
+    iter_batches,
+    upload_batches,
+)
+from .payload_index import is_range
+from .quantization import QuantizationConfig
+from .quantization import config_from_env as quantization_from_env
+from .vector_collection import HYBRID_DEPTH, VectorCollection
+from .vector_persistence import (
+    CollectionJournal,
+    collection_path,
+    default_storage_dir,
+    stored_collections,
+)
+
 # Try to import Qdrant with fallback
 try:
     from qdrant_client import QdrantClient
@@ -17,7 +38,11 @@ try:
         PointStruct,
         Filter,
         FieldCondition,
+        MatchAny,
         MatchValue,
+        PointIdsList,
+        Range,
+        SearchRequest,
     )
 
     QDRANT_AVAILABLE = True
@@ -31,7 +56,11 @@ except ImportError:
     PointStruct = None
     Filter = None
     FieldCondition = None
+    MatchAny = None
     MatchValue = None
+    PointIdsList = None
+    Range = None
+    SearchRequest = None
     logger = logging.getLogger(__name__)
     logger.warning("Qdrant client not available - using in-memory fallback")
 
@@ -71,96 +100,211 @@ class ProjectContext:
 class InMemoryVectorStore:
     """In-memory fallback for vector storage."""
 
-    def __init__(self):
-        self.collections: Dict[str, List[Dict[str, Any]]] = {}
-        self.embeddings: Dict[str, List[float]] = {}
-        logger.info("Initialized in-memory vector store fallback")
+    def __init__(
+        self,
+        storage_dir: Optional[str] = None,
+        ann: Optional[IVFConfig] = None,
+        quantization: Optional[QuantizationConfig] = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            storage_dir: Directory to persist collections to and load them
+                from; None keeps everything in memory only
+            ann: Approximate index parameters for new collections (default:
+                from ``VECTOR_ANN*`` environment variables)
+            quantization: Quantized storage for new collections (default:
+                from ``VECTOR_QUANTIZATION``)
+        """
+        self.storage_dir = storage_dir
+        self.ann = ann if ann is not None else ann_config_from_env()
+        self.quantization = (
+            quantization if quantization is not None else quantization_from_env()
+        )
+        self.collections: Dict[str, VectorCollection] = {}
+        if storage_dir:
+            for collection_name in stored_collections(storage_dir):
+                self.create_collection(collection_name)
+            logger.info(
+                f"Initialized in-memory vector store fallback in {storage_dir} "
+                f"({len(self.collections)} stored collections)"
+            )
+        else:
+            logger.info("Initialized in-memory vector store fallback")
 
-    def create_collection(self, collection_name: str, vector_size: int = 1536) -> bool:
-        """Create a collection."""
+    def create_collection(
+        self, collection_name: str, vector_size: Optional[int] = None
+    ) -> bool:
+        """Create a collection.
+
+        Vectors of another size are zero padded or truncated to
+        ``vector_size``; None takes it from the first point written.
+        """
         if collection_name not in self.collections:
-            self.collections[collection_name] = []
-            self.embeddings[collection_name] = []
+            collection = VectorCollection(
+                collection_name,
+                vector_size,
+                ann=self.ann,
+                quantization=self.quantization,
+            )
+            if self.storage_dir:
+                collection.attach(
+                    CollectionJournal(
+                        collection_path(self.storage_dir, collection_name)
+                    )
+                )
+            self.collections[collection_name] = collection
             logger.info(f"Created in-memory collection: {collection_name}")
             return True
         return False
 
+    def write_snapshots(self) -> None:
+        """Snapshot every persisted collection now."""
+        for collection in list(self.collections.values()):
+            collection.write_snapshot()
+
+    def close(self) -> None:
+        """Finish background work and release the storage directory."""
+        for collection in list(self.collections.values()):
+            collection.close()
+
     def upsert_points(self, collection_name: str, points: List[Dict[str, Any]]) -> bool:
         """Upsert points to collection."""
         if collection_name not in self.collections:
             self.create_collection(collection_name)
 
-        for point in points:
-            point_id = point.get("id", str(uuid.uuid4()))
-            vector = point.get("vector", [0.0] * 1536)  # Default vector
-            payload = point.get("payload", {})
-
-            # Store in memory
-            self.collections[collection_name].append(
-                {
-                    "id": point_id,
-                    "payload": payload,
-                    "timestamp": datetime.now().isoformat(),
-                }
-            )
-            self.embeddings[collection_name].append(vector)
+        self.collections[collection_name].upsert(
+            [point.get("id", str(uuid.uuid4())) for point in points],
+            [point.get("vector", [0.0] * 1536) for point in points],
+            [point.get("payload", {}) for point in points],
+        )
 
         logger.info(f"Upserted {len(points)} points to {collection_name}")
         return True
 
+    def bulk_upsert(
+        self,
+        collection_name: str,
+        points: Iterable[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """Upsert a stream of points, one matrix write per batch."""
+        return upload_batches(
+            iter_batches(points, batch_size, max_bytes=0),
+            lambda batch: self.upsert_points(collection_name, batch),
+            parallel=1,
+            max_retries=0,
+        )
+
+    def delete_points(
+        self,
+        collection_name: str,
+        point_ids: Optional[List[Any]] = None,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Delete points by id and/or by a payload filter.
+
+        Returns the number of points deleted.
+        """
+        if collection_name not in self.collections:
+            return 0
+        collection = self.collections[collection_name]
+
+        deleted = collection.delete(point_ids) if point_ids else 0
+        if filter_conditions:
+            deleted += collection.delete_where(filter_conditions)
+
+        logger.info(f"Deleted {deleted} points from {collection_name}")
+        return deleted
+
+    def set_payload(
+        self, collection_name: str, point_ids: List[Any], payload: Dict[str, Any]
+    ) -> int:
+        """Merge payload fields into existing points.
+
+        Returns the number of points updated.
+        """
+        if collection_name not in self.collections:
+            return 0
+        return self.collections[collection_name].set_payload(point_ids, payload)
+
+    def count_points(
+        self, collection_name: str, filter_conditions: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Number of points, or of points matching a payload filter."""
+        if collection_name not in self.collections:
+            return 0
+        return self.collections[collection_name].count_matching(filter_conditions)
+
     def search_points(
-        self, collection_name: str, query_vector: List[float], limit: int = 10
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        limit: int = 10,
+        filter_conditions: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        """Search points in collection."""
+        """Search points in collection by cosine similarity."""
         if collection_name not in self.collections:
             return []
+        return self.collections[collection_name].search(
+            query_vector, limit, filter_conditions
+        )
 
-        # Simple cosine similarity search (simplified)
-        results = []
-        for i, stored_vector in enumerate(self.embeddings[collection_name]):
-            # Calculate simple similarity (dot product for normalized vectors)
-            similarity = sum(a * b for a, b in zip(query_vector, stored_vector))
-            results.append(
-                {
-                    "id": self.collections[collection_name][i]["id"],
-                    "score": similarity,
-                    "payload": self.collections[collection_name][i]["payload"],
-                }
-            )
+    def search_points_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search points for several query vectors at once."""
+        if collection_name not in self.collections:
+            return [[] for _ in query_vectors]
+        return self.collections[collection_name].search_batch(
+            query_vectors, limit, filter_conditions
+        )
 
-        # Sort by similarity and return top results
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:limit]
+    def search_hybrid(
+        self,
+        collection_name: str,
+        query: str,
+        query_vector: Optional[List[float]] = None,
+        limit: int = 10,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Search points by BM25 keyword rank fused with vector rank."""
+        if collection_name not in self.collections:
+            return []
+        return self.collections[collection_name].search_hybrid(
+            query, query_vector, limit, filter_conditions
+        )
 
     def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
         """Get collection information."""
         if collection_name not in self.collections:
             return {"points_count": 0, "status": "not_found"}
 
-        return {
-            "points_count": len(self.collections[collection_name]),
-            "status": "ok",
-            "vector_size": (
-                len(self.embeddings[collection_name][0])
-                if self.embeddings[collection_name]
-                else 0
-            ),
-        }
+        return self.collections[collection_name].get_info()
 
 
 class EnhancedVectorStore:
     """Enhanced vector store with project-specific databases and fallback support."""
 
-    def __init__(self, qdrant_url: str = "http://localhost:6333"):
+    def __init__(
+        self, qdrant_url: str = "http://localhost:6333", storage_dir: str = None
+    ):
         self.qdrant_url = qdrant_url
         self.client = None
-        self.in_memory_store = InMemoryVectorStore()
+        self.in_memory_store = InMemoryVectorStore(storage_dir)
         self.fallback_mode = False
         self.current_project_id = None
         self.project_collections = {}
 
-        # Try to initialize Qdrant client
-        if QDRANT_AVAILABLE:
+        # Try to initialize Qdrant client ("memory" skips it, e.g. offline runs)
+        if qdrant_url == "memory":
+            logger.info("Qdrant disabled - using in-memory storage")
+            self.fallback_mode = True
+        elif QDRANT_AVAILABLE:
             try:
                 self.client = QdrantClient(url=qdrant_url)
                 # Test connection
@@ -234,6 +378,17 @@ class EnhancedVectorStore:
             self.fallback_mode = True
             return self.in_memory_store.create_collection(full_name, vector_size)
 
+    @staticmethod
+    def _point_id(record_id: Any) -> Any:
+        """Point id for a record id, stable so re-upserts overwrite.
+
+        Ids that are not UUID-like (e.g. ``"domain_some_title"``) are mapped
+        to a UUID derived from the id for Qdrant compatibility.
+        """
+        if isinstance(record_id, str) and not record_id.replace("-", "").isalnum():
+            return str(uuid.uuid5(uuid.NAMESPACE_URL, record_id))
+        return record_id
+
     def upsert_conversation(
         self,
         conversation_id: str,
@@ -244,22 +399,22 @@ class EnhancedVectorStore:
     ) -> bool:
         """Upsert a conversation point."""
         collection_name = self.get_collection_name("conversations")
+        point = self.build_conversation_point(
+            conversation_id, message, response, embedding, metadata
+        )
+        return self.upsert_points(collection_name, [point])
 
-        # Convert string ID to UUID for Qdrant compatibility
-        try:
-            if (
-                isinstance(conversation_id, str)
-                and not conversation_id.replace("-", "").isalnum()
-            ):
-                # If it's not a valid UUID format, generate one
-                point_id = str(uuid.uuid4())
-            else:
-                point_id = conversation_id
-        except:
-            point_id = str(uuid.uuid4())
-
-        point = {
-            "id": point_id,
+    def build_conversation_point(
+        self,
+        conversation_id: str,
+        message: str,
+        response: str,
+        embedding: List[float],
+        metadata: Dict[str, Any] = None,
+    ) -> Dict[str, Any]:
+        """Conversation point for :meth:`upsert_points` or :meth:`bulk_upsert`."""
+        return {
+            "id": self._point_id(conversation_id),
             "vector": embedding,
             "payload": {
                 "conversation_id": conversation_id,  # Store original ID in payload
@@ -271,8 +426,6 @@ class EnhancedVectorStore:
             },
         }
 
-        return self.upsert_points(collection_name, [point])
-
     def upsert_knowledge(
         self,
         knowledge_id: str,
@@ -282,22 +435,19 @@ class EnhancedVectorStore:
     ) -> bool:
         """Upsert a knowledge point."""
         collection_name = self.get_collection_name("knowledge")
+        point = self.build_knowledge_point(knowledge_id, content, embedding, metadata)
+        return self.upsert_points(collection_name, [point])
 
-        # Convert string ID to UUID for Qdrant compatibility
-        try:
-            if (
-                isinstance(knowledge_id, str)
-                and not knowledge_id.replace("-", "").isalnum()
-            ):
-                # If it's not a valid UUID format, generate one
-                point_id = str(uuid.uuid4())
-            else:
-                point_id = knowledge_id
-        except:
-            point_id = str(uuid.uuid4())
-
-        point = {
-            "id": point_id,
+    def build_knowledge_point(
+        self,
+        knowledge_id: str,
+        content: str,
+        embedding: List[float],
+        metadata: Dict[str, Any] = None,
+    ) -> Dict[str, Any]:
+        """Knowledge point for :meth:`upsert_points` or :meth:`bulk_upsert`."""
+        return {
+            "id": self._point_id(knowledge_id),
             "vector": embedding,
             "payload": {
                 "knowledge_id": knowledge_id,  # Store original ID in payload
@@ -308,8 +458,6 @@ class EnhancedVectorStore:
             },
         }
 
-        return self.upsert_points(collection_name, [point])
-
     def upsert_points(self, collection_name: str, points: List[Dict[str, Any]]) -> bool:
         """Upsert points to collection."""
         if self.fallback_mode:
@@ -336,6 +484,144 @@ class EnhancedVectorStore:
             self.fallback_mode = True
             return self.in_memory_store.upsert_points(collection_name, points)
 
+    @staticmethod
+    def _build_filter(filter_conditions: Optional[Dict[str, Any]]):
+        """Qdrant filter for ``filter_conditions``, or None without conditions.
+
+        Plain values become ``MatchValue``, lists ``MatchAny`` and
+        ``{"gt", "gte", "lt", "lte"}`` dicts a ``Range``.
+        """
+        if not filter_conditions:
+            return None
+
+        conditions = []
+        for key, value in filter_conditions.items():
+            if is_range(value):
+                conditions.append(FieldCondition(key=key, range=Range(**value)))
+            elif isinstance(value, (list, tuple, set)):
+                conditions.append(
+                    FieldCondition(key=key, match=MatchAny(any=list(value)))
+                )
+            else:
+                conditions.append(
+                    FieldCondition(key=key, match=MatchValue(value=value))
+                )
+        return Filter(must=conditions)
+
+    def bulk_upsert(
+        self,
+        collection_name: str,
+        points: Iterable[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_BATCH_BYTES,
+        parallel: int = 4,
+        max_retries: int = 3,
+    ) -> Dict[str, Any]:
+        """Upsert a stream of points in batches.
+
+        Points are read lazily from ``points`` (e.g. a generator) and grouped
+        into batches of at most ``batch_size`` points and ``max_batch_bytes``.
+        Qdrant receives up to ``parallel`` batches at a time with
+        ``wait=False``; a failing batch is retried with backoff and, once
+        retries run out, written to the in-memory fallback like
+        :meth:`upsert_points` does.
+
+        Returns:
+            Counts of points, batches, retries and failed batches, and seconds
+        """
+        if self.fallback_mode:
+            return self.in_memory_store.bulk_upsert(collection_name, points, batch_size)
+
+        def upload(batch: List[Dict[str, Any]]) -> None:
+            if self.fallback_mode:
+                self.in_memory_store.upsert_points(collection_name, batch)
+                return
+            self.client.upsert(
+                collection_name=collection_name,
+                points=[
+                    PointStruct(
+                        id=point.get("id", str(uuid.uuid4())),
+                        vector=point["vector"],
+                        payload=point.get("payload", {}),
+                    )
+                    for point in batch
+                ],
+                wait=False,
+            )
+
+        def fall_back(batch: List[Dict[str, Any]], error: Exception) -> None:
+            logger.error(f"Failed to upsert batch to {collection_name}: {error}")
+            logger.info("Falling back to in-memory storage")
+            self.fallback_mode = True
+            self.in_memory_store.upsert_points(collection_name, batch)
+
+        stats = upload_batches(
+            iter_batches(points, batch_size, max_batch_bytes),
+            upload,
+            parallel=parallel,
+            max_retries=max_retries,
+            on_failure=fall_back,
+        )
+        logger.info(
+            f"Bulk upserted {stats['points']} points to {collection_name} "
+            f"in {stats['batches']} batches ({stats['seconds']}s)"
+        )
+        return stats
+
+    def delete_points(
+        self,
+        collection_name: str,
+        point_ids: Optional[List[Any]] = None,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Delete points by id and/or by a payload filter.
+
+        Returns the number of points deleted in fallback mode; Qdrant does not
+        report a count, so it returns the number of ids requested instead.
+        """
+        if self.fallback_mode:
+            return self.in_memory_store.delete_points(
+                collection_name, point_ids, filter_conditions
+            )
+
+        try:
+            if point_ids:
+                self.client.delete(
+                    collection_name=collection_name,
+                    points_selector=PointIdsList(points=list(point_ids)),
+                )
+            if filter_conditions:
+                self.client.delete(
+                    collection_name=collection_name,
+                    points_selector=self._build_filter(filter_conditions),
+                )
+            logger.info(f"Deleted points from {collection_name}")
+            return len(point_ids or [])
+        except Exception as e:
+            logger.error(f"Failed to delete points from {collection_name}: {e}")
+            logger.info("Falling back to in-memory storage")
+            self.fallback_mode = True
+            return self.in_memory_store.delete_points(
+                collection_name, point_ids, filter_conditions
+            )
+
+    def count_points(
+        self, collection_name: str, filter_conditions: Dict[str, Any] = None
+    ) -> int:
+        """Number of points in a collection, optionally matching a filter."""
+        if self.fallback_mode:
+            return self.in_memory_store.count_points(collection_name, filter_conditions)
+
+        try:
+            return self.client.count(
+                collection_name=collection_name,
+                count_filter=self._build_filter(filter_conditions),
+                exact=True,
+            ).count
+        except Exception as e:
+            logger.error(f"Failed to count points in {collection_name}: {e}")
+            return 0
+
     def search_conversations(
         self, query_embedding: List[float], limit: int = 10
     ) -> List[Dict[str, Any]]:
@@ -357,28 +643,22 @@ class EnhancedVectorStore:
         limit: int = 10,
         filter_conditions: Dict[str, Any] = None,
     ) -> List[Dict[str, Any]]:
-        """Search points in collection."""
+        """Search points in collection.
+
+        ``filter_conditions`` maps payload keys to a value, a list of
+        values (match any) or a ``{"gte": ..., "lt": ...}`` range.
+        """
         if self.fallback_mode:
             return self.in_memory_store.search_points(
-                collection_name, query_vector, limit
+                collection_name, query_vector, limit, filter_conditions
             )
 
         try:
-            # Build filter if provided
-            search_filter = None
-            if filter_conditions:
-                conditions = []
-                for key, value in filter_conditions.items():
-                    conditions.append(
-                        FieldCondition(key=key, match=MatchValue(value=value))
-                    )
-                search_filter = Filter(must=conditions)
-
             results = self.client.search(
                 collection_name=collection_name,
                 query_vector=query_vector,
                 limit=limit,
-                query_filter=search_filter,
+                query_filter=self._build_filter(filter_conditions),
             )
 
             # Convert to standard format
@@ -394,7 +674,93 @@ class EnhancedVectorStore:
             logger.info("Falling back to in-memory search")
             self.fallback_mode = True
             return self.in_memory_store.search_points(
-                collection_name, query_vector, limit
+                collection_name, query_vector, limit, filter_conditions
+            )
+
+    def search_hybrid(
+        self,
+        collection_name: str,
+        query: str,
+        query_vector: Optional[List[float]] = None,
+        limit: int = 10,
+        filter_conditions: Dict[str, Any] = None,
+    ) -> List[Dict[str, Any]]:
+        """Search points by keyword and vector rank, fused.
+
+        In memory, the collection's BM25 index and vector search are fused
+        by reciprocal rank. With Qdrant, the vector hits are reranked by
+        fusing their own order with a BM25 ranking of their text. A failed
+        Qdrant search (e.g. a collection not created yet) returns no hits
+        and leaves the store in Qdrant mode.
+        """
+        if self.fallback_mode:
+            return self.in_memory_store.search_hybrid(
+                collection_name, query, query_vector, limit, filter_conditions
+            )
+        if query_vector is None:
+            query_vector = self._get_simple_embedding(query)
+
+        depth = max(limit * HYBRID_DEPTH, limit)
+        try:
+            results = self.client.search(
+                collection_name=collection_name,
+                query_vector=query_vector,
+                limit=depth,
+                query_filter=self._build_filter(filter_conditions),
+            )
+        except Exception as e:
+            logger.warning(f"Hybrid search in {collection_name} failed: {e}")
+            return []
+        hits = [
+            {"id": result.id, "score": result.score, "payload": result.payload}
+            for result in results
+        ]
+        lexical = BM25Index()
+        for row, hit in enumerate(hits):
+            lexical.add(row, hit["payload"] or {})
+        keyword_hits = [hits[row] for row, _ in lexical.search(query, depth)]
+        return fuse_hits([keyword_hits, hits], limit)
+
+    def search_points_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        filter_conditions: Dict[str, Any] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search points for several query vectors in one call."""
+        if self.fallback_mode:
+            return self.in_memory_store.search_points_batch(
+                collection_name, query_vectors, limit, filter_conditions
+            )
+
+        try:
+            search_filter = self._build_filter(filter_conditions)
+            batches = self.client.search_batch(
+                collection_name=collection_name,
+                requests=[
+                    SearchRequest(
+                        vector=vector,
+                        limit=limit,
+                        filter=search_filter,
+                        with_payload=True,
+                    )
+                    for vector in query_vectors
+                ],
+            )
+            return [
+                [
+                    {"id": result.id, "score": result.score, "payload": result.payload}
+                    for result in results
+                ]
+                for results in batches
+            ]
+        except Exception as e:
+            logger.error(f"Failed to batch search in {collection_name}: {e}")
+            logger.info("Falling back to in-memory search")
+            self.fallback_mode = True
+            return self.in_memory_store.search_points_batch(
+                collection_name, query_vectors, limit, filter_conditions
             )
 
     def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
@@ -443,75 +809,69 @@ class EnhancedVectorStore:
         self, project_id: str, preserve_general_knowledge: bool = True
     ) -> bool:
         """Reset memory for a specific project while optionally preserving general knowledge."""
+        updates = self.iter_reset_project_memory(project_id, preserve_general_knowledge)
+        while True:
+            try:
+                next(updates)
+            except StopIteration as done:
+                return done.value
+
+    def iter_reset_project_memory(
+        self, project_id: str, preserve_general_knowledge: bool = True
+    ) -> Generator[Dict[str, Any], None, bool]:
+        """Reset project memory, yielding a progress update per collection.
+
+        Returns the same result as :meth:`reset_project_memory`.
+        """
+        collections = ["conversations", "knowledge", "agents"]
         try:
             self.set_current_project(project_id)
 
-            if self.fallback_mode:
-                # Reset in-memory store for this project
-                for collection_name in ["conversations", "knowledge", "agents"]:
-                    full_name = self.get_collection_name(collection_name)
+            for index, collection_name in enumerate(collections, start=1):
+                full_name = self.get_collection_name(collection_name)
+                keep_general = (
+                    preserve_general_knowledge and collection_name == "knowledge"
+                )
+                if self.fallback_mode:
+                    # Reset in-memory store for this project
                     if full_name in self.in_memory_store.collections:
-                        if (
-                            preserve_general_knowledge
-                            and collection_name == "knowledge"
-                        ):
+                        if keep_general:
                             # Keep only general knowledge (not project-specific)
-                            original_collection = self.in_memory_store.collections[
-                                full_name
-                            ]
-                            self.in_memory_store.collections[full_name] = [
-                                point
-                                for point in original_collection
-                                if point.get("payload", {}).get("project_id")
-                                != project_id
-                            ]
-                        else:
-                            # Clear all project-specific data
-                            self.in_memory_store.collections[full_name] = []
-
-                logger.info(f"Reset project memory for {project_id} (in-memory mode)")
-                return True
-            else:
-                # Reset Qdrant collections for this project
-                for collection_name in ["conversations", "knowledge", "agents"]:
-                    full_name = self.get_collection_name(collection_name)
-                    try:
-                        if (
-                            preserve_general_knowledge
-                            and collection_name == "knowledge"
-                        ):
-                            # Delete only project-specific knowledge points
-                            self.client.delete(
-                                collection_name=full_name,
-                                points_selector=Filter(
-                                    must=[
-                                        FieldCondition(
-                                            key="project_id",
-                                            match=MatchValue(value=project_id),
-                                        )
-                                    ]
-                                ),
+                            self.in_memory_store.delete_points(
+                                full_name, filter_conditions={"project_id": project_id}
                             )
                         else:
                             # Clear all project-specific data
-                            self.client.delete(
-                                collection_name=full_name,
-                                points_selector=Filter(
-                                    must=[
-                                        FieldCondition(
-                                            key="project_id",
-                                            match=MatchValue(value=project_id),
-                                        )
-                                    ]
-                                ),
-                            )
+                            self.in_memory_store.collections[full_name].clear()
+                else:
+                    # Delete the project's points from the Qdrant collection
+                    try:
+                        self.client.delete(
+                            collection_name=full_name,
+                            points_selector=Filter(
+                                must=[
+                                    FieldCondition(
+                                        key="project_id",
+                                        match=MatchValue(value=project_id),
+                                    )
+                                ]
+                            ),
+                        )
                     except Exception as e:
                         logger.warning(
                             f"Failed to reset {collection_name} for project {project_id}: {e}"
                         )
 
-                logger.info(f"Reset project memory for {project_id} (Qdrant mode)")
-                return True
+                yield {
+                    "progress": index,
+                    "total": len(collections),
+                    "message": f"Reset {collection_name}",
+                    "partial": {"collection": full_name},
+                }
+
+            mode = "in-memory" if self.fallback_mode else "Qdrant"
+            logger.info(f"Reset project memory for {project_id} ({mode} mode)")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to reset project memory for {project_id}: {e}")
@@ -524,12 +884,14 @@ class EnhancedVectorStore:
 
             if self.fallback_mode:
                 # In-memory archiving - just mark as archived
+                archived = {"archived": True, "archived_at": datetime.now().isoformat()}
                 for collection_name in ["conversations", "knowledge", "agents"]:
                     full_name = self.get_collection_name(collection_name)
-                    if full_name in self.in_memory_store.collections:
-                        for point in self.in_memory_store.collections[full_name]:
-                            point["payload"]["archived"] = True
-                            point["payload"]["archived_at"] = datetime.now().isoformat()
+                    collection = self.in_memory_store.collections.get(full_name)
+                    if collection is not None:
+                        self.in_memory_store.set_payload(
+                            full_name, [point["id"] for point in collection], archived
+                        )
 
                 logger.info(
                     f"Archived project memory for {project_id} (in-memory mode)"
@@ -572,90 +934,29 @@ class EnhancedVectorStore:
     # Fast search methods for performance-optimized coordinator
 
     def search_knowledge_simple(self, query: str, limit: int = 5) -> List[Any]:
-        """Fast knowledge search with minimal processing."""
+        """Fast knowledge search: payloads ranked by keyword and vector rank."""
         try:
-            if self.fallback_mode:
-                # Simple text matching for fallback
-                results = []
-                knowledge_collection = self.in_memory_store.collections.get(
-                    self.get_collection_name("knowledge"), []
-                )
-
-                query_lower = query.lower()
-                for point in knowledge_collection:
-                    payload = point.get("payload", {})
-                    content = str(payload.get("content", "")).lower()
-                    title = str(payload.get("title", "")).lower()
-
-                    if query_lower in content or query_lower in title:
-                        results.append(payload)
-
-                    if len(results) >= limit:
-                        break
-
-                return results
-            else:
-                # Fast Qdrant search without heavy embedding
-                collection_name = self.get_collection_name("knowledge")
-
-                # Use a simple embedding or fallback to text search
-                try:
-                    embedding = self._get_simple_embedding(query)
-                    search_result = self.client.search(
-                        collection_name=collection_name,
-                        query_vector=embedding,
-                        limit=limit,
-                        with_payload=True,
-                    )
-
-                    return [hit.payload for hit in search_result]
-                except Exception:
-                    # Fallback to empty results if search fails
-                    return []
-
+            hits = self.search_hybrid(
+                self.get_collection_name("knowledge"),
+                query,
+                self._get_query_embedding_if_ready(query),
+                limit,
+            )
+            return [hit["payload"] for hit in hits]
         except Exception as e:
             logger.warning(f"Fast knowledge search failed: {e}")
             return []
 
     def search_conversations_simple(self, query: str, limit: int = 3) -> List[Any]:
-        """Fast conversation search with minimal processing."""
+        """Fast conversation search: payloads ranked by keyword and vector rank."""
         try:
-            if self.fallback_mode:
-                # Simple text matching for fallback
-                results = []
-                conv_collection = self.in_memory_store.collections.get(
-                    self.get_collection_name("conversations"), []
-                )
-
-                query_lower = query.lower()
-                for point in conv_collection:
-                    payload = point.get("payload", {})
-                    message = str(payload.get("message", "")).lower()
-
-                    if query_lower in message:
-                        results.append(payload)
-
-                    if len(results) >= limit:
-                        break
-
-                return results
-            else:
-                # Fast Qdrant search
-                collection_name = self.get_collection_name("conversations")
-
-                try:
-                    embedding = self._get_simple_embedding(query)
-                    search_result = self.client.search(
-                        collection_name=collection_name,
-                        query_vector=embedding,
-                        limit=limit,
-                        with_payload=True,
-                    )
-
-                    return [hit.payload for hit in search_result]
-                except Exception:
-                    return []
-
+            hits = self.search_hybrid(
+                self.get_collection_name("conversations"),
+                query,
+                self._get_query_embedding_if_ready(query),
+                limit,
+            )
+            return [hit["payload"] for hit in hits]
         except Exception as e:
             logger.warning(f"Fast conversation search failed: {e}")
             return []
@@ -688,28 +989,26 @@ class EnhancedVectorStore:
             logger.warning(f"Fast success pattern retrieval failed: {e}")
             return []
 
-    def _get_simple_embedding(self, text: str) -> List[float]:
-        """Get a simple embedding for fast search."""
-        try:
-            # Try to use the embeddings if available
-            if hasattr(self, "embeddings") and self.embeddings:
-                return self.embeddings.encode_text(text)
-            else:
-                # Fallback to a simple hash-based embedding
-                import hashlib
+    def _get_query_embedding_if_ready(self, text: str) -> Optional[List[float]]:
+        """Query embedding, or None in memory while the model still loads.
+
+        Keyword ranking alone serves in-memory searches until then, so they
+        never wait for the model; Qdrant searches always need the vector.
+        """
+        if self.fallback_mode:
+            from .embedding_service import embedding_service
 
-                text_hash = hashlib.md5(text.encode()).hexdigest()
-                # Convert hash to float vector
-                embedding = []
-                for i in range(0, len(text_hash), 2):
-                    val = int(text_hash[i : i + 2], 16) / 255.0
-                    embedding.append(val)
+            embedding_service.start()
+            if not embedding_service.ready.is_set():
+                return None
+        return self._get_simple_embedding(text)
 
-                # Pad or truncate to 384 dimensions
-                while len(embedding) < 384:
-                    embedding.extend(embedding[: 384 - len(embedding)])
+    def _get_simple_embedding(self, text: str) -> List[float]:
+        """Get a query embedding from the shared embedding service."""
+        try:
+            from .embedding_service import embedding_service
 
-                return embedding[:384]
+            return embedding_service.encode_one(text).tolist()
 
         except Exception as e:
             logger.warning(f"Simple embedding failed: {e}")
@@ -725,5 +1024,7 @@ def get_enhanced_vector_store() -> EnhancedVectorStore:
     """Get the global enhanced vector store instance."""
     global _enhanced_vector_store
     if _enhanced_vector_store is None:
-        _enhanced_vector_store = EnhancedVectorStore()
+        _enhanced_vector_store = EnhancedVectorStore(
+            os.getenv("QDRANT_URL", "http://localhost:6333"), default_storage_dir()
+        )
     return _enhanced_vector_store
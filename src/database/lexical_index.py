@@ -0,0 +1,127 @@
+"""BM25 keyword index and rank fusion for the in-memory vector store.
+
+:class:`BM25Index` keeps an inverted index from each word of a point's text
+fields (``content``, ``title`` and ``message`` by default) to the rows using
+it, with term counts and document lengths, so a keyword query only touches
+the postings of its own words. :func:`fuse_hits` merges a vector ranking and a
+keyword ranking by reciprocal rank fusion, which needs no score calibration
+between the two.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Payload fields whose text is indexed
+TEXT_FIELDS = ("content", "title", "message")
+
+# BM25 term frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+# Reciprocal rank fusion constant; larger values flatten the rank weights
+RRF_K = 60
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case words of ``text``."""
+    return _TOKEN.findall(text.lower())
+
+
+def payload_text(payload: Dict[str, Any], fields: Iterable[str] = TEXT_FIELDS) -> str:
+    """Indexed text of a payload: its text fields joined."""
+    return " ".join(str(payload[field]) for field in fields if payload.get(field))
+
+
+class BM25Index:
+    """Inverted index over the text fields of a collection's payloads."""
+
+    def __init__(self, fields: Iterable[str] = TEXT_FIELDS):
+        self.fields = tuple(fields)
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.lengths: Dict[int, int] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def add(self, row: int, payload: Dict[str, Any]) -> None:
+        tokens = tokenize(payload_text(payload, self.fields))
+        if not tokens:
+            return
+        for term, count in Counter(tokens).items():
+            self.postings.setdefault(term, {})[row] = count
+        self.lengths[row] = len(tokens)
+        self.total_length += len(tokens)
+
+    def remove(self, row: int, payload: Dict[str, Any]) -> None:
+        length = self.lengths.pop(row, None)
+        if length is None:
+            return
+        self.total_length -= length
+        for term in set(tokenize(payload_text(payload, self.fields))):
+            rows = self.postings.get(term)
+            if rows is not None:
+                rows.pop(row, None)
+                if not rows:
+                    del self.postings[term]
+
+    def clear(self) -> None:
+        self.postings = {}
+        self.lengths = {}
+        self.total_length = 0
+
+    def search(
+        self, query: str, limit: int, rows: Optional[Iterable[int]] = None
+    ) -> List[Tuple[int, float]]:
+        """Top ``limit`` ``(row, score)`` pairs by BM25, best first.
+
+        Only rows sharing a word with ``query`` score; ``rows`` restricts the
+        result to those rows.
+        """
+        if not self.lengths or limit <= 0:
+            return []
+        allowed = set(rows) if rows is not None else None
+        documents = len(self.lengths)
+        average = self.total_length / documents
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(
+                1 + (documents - len(postings) + 0.5) / (len(postings) + 0.5)
+            )
+            for row, count in postings.items():
+                if allowed is not None and row not in allowed:
+                    continue
+                norm = K1 * (1 - B + B * self.lengths[row] / average)
+                scores[row] = scores.get(row, 0.0) + idf * count * (K1 + 1) / (
+                    count + norm
+                )
+        return heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+
+
+def fuse_hits(
+    rankings: Sequence[List[Dict[str, Any]]], limit: int, k: int = RRF_K
+) -> List[Dict[str, Any]]:
+    """Merge ranked hit lists by reciprocal rank fusion.
+
+    Each hit is a ``{"id", "score", "payload"}`` dict; a point scores
+    ``sum(1 / (k + rank))`` over the lists it appears in.
+    """
+    fused: Dict[Any, float] = {}
+    payloads: Dict[Any, Dict[str, Any]] = {}
+    for hits in rankings:
+        for rank, hit in enumerate(hits, start=1):
+            fused[hit["id"]] = fused.get(hit["id"], 0.0) + 1.0 / (k + rank)
+            payloads.setdefault(hit["id"], hit["payload"])
+    return [
+        {"id": point_id, "score": score, "payload": payloads[point_id]}
+        for point_id, score in heapq.nlargest(limit, fused.items(), key=itemgetter(1))
+    ]
@@ -0,0 +1,234 @@
+"""Secondary payload indexes for the in-memory vector store.
+
+Filters use the same shape as ``EnhancedVectorStore.search_points``: a dict of
+payload key to condition, all of which must hold. A condition is
+
+* a plain value - the payload value equals it (or contains it, for lists),
+* a list, tuple or set - the payload value matches any of them,
+* a dict with ``gt``, ``gte``, ``lt`` and/or ``lte`` - a range.
+
+Keyword fields such as ``project_id`` get a hash index from value to rows and
+``timestamp`` gets a sorted index, so a filter on them becomes a set of
+candidate rows without looking at other points. Conditions on other fields
+are checked against the payloads of the remaining candidates.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Payload fields with a hash index
+KEYWORD_FIELDS = ("project_id", "session_id", "agent_id", "domain")
+
+# Payload fields with a sorted index, for range conditions
+SORTED_FIELDS = ("timestamp",)
+
+RANGE_KEYS = ("gt", "gte", "lt", "lte")
+
+
+def is_range(condition: Any) -> bool:
+    """Whether ``condition`` is a ``{"gt": ..., "lte": ...}`` style range."""
+    return (
+        isinstance(condition, dict)
+        and bool(condition)
+        and all(key in RANGE_KEYS for key in condition)
+    )
+
+
+def _in_range(value: Any, condition: Dict[str, Any]) -> bool:
+    try:
+        return (
+            ("gt" not in condition or value > condition["gt"])
+            and ("gte" not in condition or value >= condition["gte"])
+            and ("lt" not in condition or value < condition["lt"])
+            and ("lte" not in condition or value <= condition["lte"])
+        )
+    except TypeError:
+        return False
+
+
+def matches(payload: Dict[str, Any], conditions: Dict[str, Any]) -> bool:
+    """Whether ``payload`` satisfies every condition in ``conditions``."""
+    for key, condition in conditions.items():
+        value = payload.get(key)
+        if is_range(condition):
+            if value is None or not _in_range(value, condition):
+                return False
+            continue
+
+        wanted = condition if isinstance(condition, (list, tuple, set)) else [condition]
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        if not any(item in wanted for item in values):
+            return False
+    return True
+
+
+def _keys(value: Any) -> List[Any]:
+    """Hashable index keys for a payload value; list values index each item."""
+    items = value if isinstance(value, (list, tuple, set)) else [value]
+    keys = []
+    for item in items:
+        try:
+            hash(item)
+        except TypeError:
+            continue
+        keys.append(item)
+    return keys
+
+
+class KeywordIndex:
+    """Hash index from a payload value to the rows holding it."""
+
+    def __init__(self):
+        self.rows: Dict[Any, Set[int]] = {}
+
+    def add(self, row: int, value: Any) -> None:
+        for key in _keys(value):
+            self.rows.setdefault(key, set()).add(row)
+
+    def remove(self, row: int, value: Any) -> None:
+        for key in _keys(value):
+            rows = self.rows.get(key)
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del self.rows[key]
+
+    def lookup(self, condition: Any) -> Set[int]:
+        """Rows matching a plain value or any value of a list."""
+        wanted = condition if isinstance(condition, (list, tuple, set)) else [condition]
+        found: Set[int] = set()
+        for key in _keys(wanted):
+            found |= self.rows.get(key, set())
+        return found
+
+
+class SortedIndex:
+    """Payload values kept in order next to their rows, for range lookups."""
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self.rows: List[int] = []
+
+    def add(self, row: int, value: Any) -> None:
+        if value is None:
+            return
+        try:
+            position = bisect_right(self.values, value)
+        except TypeError:
+            # Not comparable with the indexed values; a range never matches it
+            logger.debug(f"Not indexing unordered value {value!r}")
+            return
+        self.values.insert(position, value)
+        self.rows.insert(position, row)
+
+    def remove(self, row: int, value: Any) -> None:
+        if value is None:
+            return
+        try:
+            low = bisect_left(self.values, value)
+            high = bisect_right(self.values, value)
+        except TypeError:
+            return
+        for position in range(low, high):
+            if self.rows[position] == row:
+                del self.values[position]
+                del self.rows[position]
+                return
+
+    def lookup(self, condition: Any) -> Set[int]:
+        """Rows within a range, equal to a value or to any value of a list."""
+        if not is_range(condition):
+            wanted = (
+                condition if isinstance(condition, (list, tuple, set)) else [condition]
+            )
+            found: Set[int] = set()
+            for value in wanted:
+                found |= self.lookup({"gte": value, "lte": value})
+            return found
+
+        try:
+            low = 0
+            if "gte" in condition:
+                low = bisect_left(self.values, condition["gte"])
+            if "gt" in condition:
+                low = max(low, bisect_right(self.values, condition["gt"]))
+            high = len(self.values)
+            if "lte" in condition:
+                high = bisect_right(self.values, condition["lte"])
+            if "lt" in condition:
+                high = min(high, bisect_left(self.values, condition["lt"]))
+        except TypeError:
+            return set()
+        return set(self.rows[low:high])
+
+
+class PayloadIndex:
+    """Keyword and sorted indexes over the payloads of one collection."""
+
+    def __init__(
+        self,
+        keyword_fields: Iterable[str] = KEYWORD_FIELDS,
+        sorted_fields: Iterable[str] = SORTED_FIELDS,
+    ):
+        self.indexes: Dict[str, Any] = {
+            field: KeywordIndex() for field in keyword_fields
+        }
+        self.indexes.update({field: SortedIndex() for field in sorted_fields})
+
+    def add(self, row: int, payload: Dict[str, Any]) -> None:
+        for field, index in self.indexes.items():
+            if field in payload:
+                index.add(row, payload[field])
+
+    def remove(self, row: int, payload: Dict[str, Any]) -> None:
+        for field, index in self.indexes.items():
+            if field in payload:
+                index.remove(row, payload[field])
+
+    def clear(self) -> None:
+        for field, index in self.indexes.items():
+            self.indexes[field] = type(index)()
+
+    def _usable(self, field: str, condition: Any) -> bool:
+        index = self.indexes.get(field)
+        if isinstance(index, KeywordIndex):
+            return not isinstance(condition, dict)
+        return index is not None
+
+    def candidates(
+        self,
+        conditions: Dict[str, Any],
+        live_rows: Iterable[int],
+        payloads: List[Dict[str, Any]],
+    ) -> List[int]:
+        """Sorted rows whose payloads satisfy ``conditions``.
+
+        Indexed conditions are intersected narrowest first; the rest are
+        checked against the payloads of what remains, or of ``live_rows``
+        when no condition is indexed.
+        """
+        lookups = [
+            self.indexes[field].lookup(condition)
+            for field, condition in conditions.items()
+            if self._usable(field, condition)
+        ]
+        residual = {
+            field: condition
+            for field, condition in conditions.items()
+            if not self._usable(field, condition)
+        }
+
+        rows: Optional[Set[int]] = None
+        for found in sorted(lookups, key=len):
+            rows = set(found) if rows is None else rows & found
+            if not rows:
+                return []
+        if rows is None:
+            rows = live_rows
+
+        if residual:
+            rows = [row for row in rows if matches(payloads[row], residual)]
+        return sorted(rows)
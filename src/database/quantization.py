@@ -0,0 +1,133 @@
+"""Int8 vector storage for in-memory vector collections.
+
+In quantized mode a collection keeps only int8 codes in memory: each
+normalized row is scaled so its largest component maps to 127 and rounded,
+plus one float32 scale per row. The float16 originals go to a memory-mapped
+file that the OS can page out. A search scores the codes, takes the best
+``rescore`` times ``limit`` rows and rescores those against their originals,
+so the returned scores are exact and only the candidate selection is
+approximate.
+"""
+
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+# Values converted to float32 at a time when coding or scoring; small enough
+# for the converted block to stay in cache
+CHUNK_VALUES = 1 << 17
+
+
+@dataclass
+class QuantizationConfig:
+    """Parameters of the quantized storage mode."""
+
+    # Candidates rescored against the originals, in multiples of the limit
+    rescore: int = 4
+    # Directory for the float16 originals; None uses the system temp dir
+    directory: Optional[str] = None
+
+
+def config_from_env() -> Optional[QuantizationConfig]:
+    """Quantization for new collections, or None to store float32 vectors.
+
+    ``VECTOR_QUANTIZATION=int8`` enables it; ``VECTOR_RESCORE`` overrides the
+    rescoring depth.
+    """
+    if os.getenv("VECTOR_QUANTIZATION", "none").lower() != "int8":
+        return None
+    config = QuantizationConfig()
+    if os.getenv("VECTOR_RESCORE"):
+        config.rescore = int(os.environ["VECTOR_RESCORE"])
+    return config
+
+
+def chunk_rows(dim: int) -> int:
+    """Rows per block of ``CHUNK_VALUES`` values."""
+    return max(CHUNK_VALUES // max(dim, 1), 1)
+
+
+def quantize(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Int8 codes and per-row scales with ``codes * scales ~= vectors``."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scales = np.abs(vectors).max(axis=1, initial=0.0) / 127
+    scales[scales == 0] = 1.0
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def originals_matrix(capacity: int, dim: int, directory: Optional[str]) -> np.ndarray:
+    """A float16 matrix backed by an unlinked file in ``directory``.
+
+    The file disappears from the directory at once; its pages stay mapped
+    until the matrix is garbage collected.
+    """
+    if not capacity:
+        return np.empty((0, dim), dtype=np.float16)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    handle, path = tempfile.mkstemp(prefix="originals-", suffix=".f16", dir=directory)
+    try:
+        return np.memmap(path, dtype=np.float16, mode="w+", shape=(capacity, dim))
+    finally:
+        os.close(handle)
+        os.unlink(path)
+
+
+class Int8Codes:
+    """Int8 codes and scales of a collection's rows."""
+
+    def __init__(self, dim: int = 0):
+        self.reset(dim)
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.scales.nbytes
+
+    def reset(self, dim: int) -> None:
+        self.codes = np.empty((0, dim), dtype=np.int8)
+        self.scales = np.empty(0, dtype=np.float32)
+
+    def reserve(self, capacity: int, rows: int) -> None:
+        """Grow to ``capacity`` rows, keeping the first ``rows``."""
+        codes = np.empty((capacity, self.codes.shape[1]), dtype=np.int8)
+        codes[:rows] = self.codes[:rows]
+        scales = np.ones(capacity, dtype=np.float32)
+        scales[:rows] = self.scales[:rows]
+        self.codes, self.scales = codes, scales
+
+    def keep(self, rows: np.ndarray, capacity: int) -> None:
+        """Keep only ``rows``, renumbered from 0, in ``capacity`` rows."""
+        codes = np.empty((capacity, self.codes.shape[1]), dtype=np.int8)
+        codes[: len(rows)] = self.codes[rows]
+        scales = np.ones(capacity, dtype=np.float32)
+        scales[: len(rows)] = self.scales[rows]
+        self.codes, self.scales = codes, scales
+
+    def put(self, rows: Union[slice, np.ndarray, list], vectors: np.ndarray) -> None:
+        """Store the codes of ``vectors`` at ``rows``."""
+        self.codes[rows], self.scales[rows] = quantize(vectors)
+
+
+def approximate_scores(
+    codes: np.ndarray,
+    scales: np.ndarray,
+    queries: np.ndarray,
+    rows: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Approximate dot products of ``queries`` with coded rows.
+
+    Scores every row of ``codes``, or only ``rows``; one row per query.
+    """
+    count = len(codes) if rows is None else len(rows)
+    step = chunk_rows(codes.shape[1])
+    scores = np.empty((len(queries), count), dtype=np.float32)
+    for start in range(0, count, step):
+        chunk = slice(start, min(start + step, count))
+        picked = chunk if rows is None else rows[chunk]
+        block = codes[picked].astype(np.float32) @ queries.T
+        scores[:, chunk] = (block * scales[picked, None]).T
+    return scores
@@ -0,0 +1,890 @@
+"""NumPy storage and search engine for the in-memory vector store.
+
+A collection keeps its vectors in one contiguous float32 matrix whose rows are
+normalized when they are written, so cosine similarity for a query is a single
+matrix-vector product. The matrix grows by doubling its capacity, which keeps
+appends amortized O(1). Search picks the top hits with ``argpartition`` and
+only builds result dicts for those hits.
+
+Points are keyed by id: upserting a known id overwrites its row in place, and
+deleting marks rows as tombstones that search skips. Once tombstones make up
+``COMPACT_RATIO`` of the rows, a background thread rewrites the matrix
+without them, so memory and search cost follow the live point count.
+
+Searches can take a payload filter (see :mod:`.payload_index`). The filter is
+resolved to candidate rows through secondary indexes first and only those
+rows are scored, so narrower filters make searches cheaper. Payload text is
+also kept in a BM25 index (see :mod:`.lexical_index`) for keyword and hybrid
+searches.
+
+A collection attached to a :class:`.vector_persistence.CollectionJournal`
+logs every write and snapshots itself in the background, so it survives
+restarts.
+
+Large collections can keep an approximate index (see :mod:`.ann_index`):
+unfiltered searches then only score the rows the index probes. The index is
+trained on a background thread once the collection is large enough.
+
+In quantized mode (see :mod:`.quantization`) the matrix holds float16
+originals in a memory-mapped file and searches score int8 codes, rescoring
+only the best candidates against the originals.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from .ann_index import IVFConfig, IVFIndex, nearest_centroids, train_centroids
+from .lexical_index import BM25Index, fuse_hits
+from .payload_index import PayloadIndex
+from .quantization import (
+    Int8Codes,
+    QuantizationConfig,
+    approximate_scores,
+    chunk_rows,
+    originals_matrix,
+)
+from .vector_persistence import SNAPSHOT_EVERY, CollectionJournal
+
+logger = logging.getLogger(__name__)
+
+# Rows allocated by the first insert into a collection
+INITIAL_CAPACITY = 64
+
+# Compact once this share of the rows are tombstones ...
+COMPACT_RATIO = 0.25
+# ... and there are at least this many of them
+COMPACT_MIN_TOMBSTONES = 64
+
+# Hits per search, in multiples of the limit, merged by a hybrid search
+HYBRID_DEPTH = 4
+
+# Vectors accepted by writes: a matrix or one sequence of floats per point
+Vectors = Union[np.ndarray, Sequence[Sequence[float]]]
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length in place; zero rows stay zero."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors /= norms
+    return vectors
+
+
+def top_k(scores: np.ndarray, limit: int) -> np.ndarray:
+    """Indexes of the ``limit`` highest scores, best first."""
+    if limit <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.intp)
+    if limit < scores.size:
+        candidates = np.argpartition(-scores, limit - 1)[:limit]
+    else:
+        candidates = np.arange(scores.size)
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class VectorCollection:
+    """Points of one collection: a float32 matrix plus ids and payloads."""
+
+    def __init__(
+        self,
+        name: str,
+        vector_size: Optional[int] = None,
+        ann: Optional[IVFConfig] = None,
+        quantization: Optional[QuantizationConfig] = None,
+    ):
+        """Initialize an empty collection.
+
+        Args:
+            name: Collection name, for logging
+            vector_size: Vector dimension; taken from the first point if None
+            ann: Approximate index parameters; None always searches exactly
+            quantization: Quantized storage parameters; None keeps float32
+                vectors in memory
+        """
+        self.name = name
+        self.vector_size = vector_size
+        self.quantization = quantization
+        self.quantized = Int8Codes(vector_size or 0) if quantization else None
+        self.originals_dir = quantization.directory if quantization else None
+        self.matrix = self._new_matrix(0)
+        self.alive = np.zeros(0, dtype=bool)
+        self.rows = 0
+        self.count = 0
+        self.index: Dict[Any, int] = {}
+        self.ids: List[Any] = []
+        self.payloads: List[Dict[str, Any]] = []
+        self.timestamps: List[str] = []
+        self.payload_index = PayloadIndex()
+        self.lexical = BM25Index()
+        self.lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self.journal: Optional[CollectionJournal] = None
+        self._snapshotter: Optional[threading.Thread] = None
+        self._snapshot_lock = threading.Lock()
+        self.ann = IVFIndex(ann) if ann else None
+        self._trainer: Optional[threading.Thread] = None
+        # Bumped whenever rows are renumbered, so training can tell
+        self._layout = 0
+        # Rows overwritten while the index trains, refiled once it is installed
+        self._touched: Optional[Set[int]] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, point_id: Any) -> bool:
+        return point_id in self.index
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Live points as ``{"id", "payload", "timestamp"}`` dicts."""
+        with self.lock:
+            rows = [
+                (self.ids[row], self.payloads[row], self.timestamps[row])
+                for row in self.index.values()
+            ]
+        for point_id, payload, timestamp in rows:
+            yield {"id": point_id, "payload": payload, "timestamp": timestamp}
+
+    @property
+    def capacity(self) -> int:
+        """Rows allocated in the matrix."""
+        return int(self.matrix.shape[0])
+
+    @property
+    def tombstones(self) -> int:
+        """Deleted rows still held in the matrix."""
+        return self.rows - self.count
+
+    def _fit(self, vectors: Vectors) -> np.ndarray:
+        """Vectors as a normalized float32 matrix of the collection's width.
+
+        Vectors of another dimension are zero padded or truncated, matching
+        how the pure Python dot product over ``zip`` used to compare them.
+        """
+        if self.vector_size is None:
+            self.vector_size = len(vectors[0]) if len(vectors) else 0
+            self.matrix = self._new_matrix(0)
+            if self.quantized:
+                self.quantized.reset(self.vector_size)
+
+        if isinstance(vectors, np.ndarray) or len({len(v) for v in vectors}) == 1:
+            rows = np.array(vectors, dtype=np.float32, ndmin=2)
+            if rows.ndim == 2 and rows.shape[1] == self.vector_size:
+                return normalize_rows(rows)
+
+        rows = np.zeros((len(vectors), self.vector_size), dtype=np.float32)
+        for row, vector in zip(rows, vectors):
+            vector = np.asarray(vector, dtype=np.float32).ravel()
+            width = min(vector.size, self.vector_size)
+            if vector.size != self.vector_size:
+                logger.debug(
+                    f"Resizing {vector.size}-d vector to {self.vector_size} "
+                    f"for collection {self.name}"
+                )
+            row[:width] = vector[:width]
+        return normalize_rows(rows)
+
+    def _index_payload(self, row: int, payload: Dict[str, Any]) -> None:
+        self.payload_index.add(row, payload)
+        self.lexical.add(row, payload)
+
+    def _unindex_payload(self, row: int, payload: Dict[str, Any]) -> None:
+        self.payload_index.remove(row, payload)
+        self.lexical.remove(row, payload)
+
+    def _clear_payload_indexes(self) -> None:
+        self.payload_index.clear()
+        self.lexical.clear()
+
+    def _new_matrix(self, capacity: int) -> np.ndarray:
+        """Uninitialized vector storage for ``capacity`` rows."""
+        if self.quantized is None:
+            return np.empty((capacity, self.vector_size or 0), dtype=np.float32)
+        return originals_matrix(capacity, self.vector_size or 0, self.originals_dir)
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix, doubling its capacity, to hold ``rows`` rows."""
+        if rows <= self.capacity:
+            return
+        capacity = max(self.capacity * 2, rows, INITIAL_CAPACITY)
+        matrix = self._new_matrix(capacity)
+        matrix[: self.rows] = self.matrix[: self.rows]
+        if self.quantized:
+            self.quantized.reserve(capacity, self.rows)
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self.rows] = self.alive[: self.rows]
+        self.matrix, self.alive = matrix, alive
+
+    def upsert(
+        self,
+        ids: Sequence[Any],
+        vectors: Vectors,
+        payloads: Sequence[Dict[str, Any]],
+        timestamp: Optional[str] = None,
+    ) -> None:
+        """Insert or overwrite points; ``ids``, ``vectors`` and ``payloads`` line up.
+
+        A known id keeps its row and has its vector and payload replaced. When
+        an id repeats within one call the last occurrence wins.
+        """
+        if not ids:
+            return
+        timestamp = timestamp or datetime.now().isoformat()
+        with self.lock:
+            fitted = self._fit(vectors)
+            if self.journal:
+                self.journal.log_upsert(ids, fitted, payloads, timestamp)
+            latest = {point_id: position for position, point_id in enumerate(ids)}
+            existing = [
+                (self.index[point_id], position)
+                for point_id, position in latest.items()
+                if point_id in self.index
+            ]
+            new = [
+                (point_id, position)
+                for point_id, position in latest.items()
+                if point_id not in self.index
+            ]
+            if existing:
+                self._overwrite(existing, fitted, payloads, timestamp)
+            if new:
+                self._append(new, fitted, payloads, timestamp)
+        self._maybe_train()
+        self._maybe_snapshot()
+
+    def _overwrite(
+        self,
+        existing: List[Tuple[int, int]],
+        fitted: np.ndarray,
+        payloads: Sequence[Dict[str, Any]],
+        timestamp: str,
+    ) -> None:
+        """Replace the rows of known points; ``existing`` holds (row, position)."""
+        rows = [row for row, _ in existing]
+        vectors = fitted[[position for _, position in existing]]
+        self.matrix[rows] = vectors
+        if self.quantized:
+            self.quantized.put(rows, vectors)
+        if self.ann:
+            self.ann.assign(rows, vectors)
+        if self._touched is not None:
+            self._touched.update(rows)
+        for row, position in existing:
+            self._unindex_payload(row, self.payloads[row])
+            self._index_payload(row, payloads[position])
+            self.payloads[row] = payloads[position]
+            self.timestamps[row] = timestamp
+
+    def _append(
+        self,
+        new: List[Tuple[Any, int]],
+        fitted: np.ndarray,
+        payloads: Sequence[Dict[str, Any]],
+        timestamp: str,
+    ) -> None:
+        """Add rows for unknown points; ``new`` holds (id, position)."""
+        start = self.rows
+        added = slice(start, start + len(new))
+        vectors = fitted[[position for _, position in new]]
+        self._reserve(start + len(new))
+        self.matrix[added] = vectors
+        if self.quantized:
+            self.quantized.put(added, vectors)
+        self.alive[added] = True
+        if self.ann:
+            self.ann.assign(range(start, start + len(new)), vectors)
+        for row, (point_id, position) in enumerate(new, start=start):
+            self.index[point_id] = row
+            self.ids.append(point_id)
+            self.payloads.append(payloads[position])
+            self._index_payload(row, payloads[position])
+            self.timestamps.append(timestamp)
+        self.rows += len(new)
+        self.count += len(new)
+
+    def delete(self, ids: Sequence[Any]) -> int:
+        """Tombstone the points with the given ids.
+
+        Returns the number of points removed; unknown ids are ignored.
+        """
+        with self.lock:
+            rows = [
+                self.index.pop(point_id) for point_id in ids if point_id in self.index
+            ]
+            self._tombstone(rows)
+        self._maybe_compact()
+        self._maybe_snapshot()
+        return len(rows)
+
+    def delete_where(self, filter_conditions: Dict[str, Any]) -> int:
+        """Tombstone the points whose payloads match ``filter_conditions``.
+
+        Returns the number of points removed.
+        """
+        with self.lock:
+            rows = self.payload_index.candidates(
+                filter_conditions, self.index.values(), self.payloads
+            )
+            for row in rows:
+                del self.index[self.ids[row]]
+            self._tombstone(rows)
+        self._maybe_compact()
+        self._maybe_snapshot()
+        return len(rows)
+
+    def retain(self, keep: Callable[[Dict[str, Any]], bool]) -> int:
+        """Keep only points for which ``keep(point)`` is true.
+
+        Returns the number of points removed.
+        """
+        with self.lock:
+            rows = [
+                row
+                for point_id, row in self.index.items()
+                if not keep(
+                    {
+                        "id": point_id,
+                        "payload": self.payloads[row],
+                        "timestamp": self.timestamps[row],
+                    }
+                )
+            ]
+            for row in rows:
+                del self.index[self.ids[row]]
+            self._tombstone(rows)
+        self._maybe_compact()
+        self._maybe_snapshot()
+        return len(rows)
+
+    def set_payload(self, ids: Sequence[Any], payload: Dict[str, Any]) -> int:
+        """Merge ``payload`` into the payloads of the points with the given ids.
+
+        Payloads are replaced rather than changed in place, so dicts handed
+        out earlier keep their values. Returns the number of points updated;
+        unknown ids are ignored.
+        """
+        with self.lock:
+            known = [point_id for point_id in ids if point_id in self.index]
+            if not known:
+                return 0
+            if self.journal:
+                self.journal.log_set_payload(known, payload)
+            for point_id in known:
+                row = self.index[point_id]
+                self._unindex_payload(row, self.payloads[row])
+                self.payloads[row] = {**self.payloads[row], **payload}
+                self._index_payload(row, self.payloads[row])
+        self._maybe_snapshot()
+        return len(known)
+
+    def _tombstone(self, rows: List[int]) -> None:
+        """Mark rows dead; the caller holds the lock and updated the index."""
+        if not rows:
+            return
+        if self.journal:
+            self.journal.log_delete([self.ids[row] for row in rows])
+        self.alive[rows] = False
+        for row in rows:
+            self._unindex_payload(row, self.payloads[row])
+        self.count -= len(rows)
+
+    def _maybe_compact(self) -> None:
+        """Start a background compaction once tombstones pass the threshold."""
+        with self.lock:
+            due = self.tombstones >= max(
+                COMPACT_MIN_TOMBSTONES, COMPACT_RATIO * self.rows
+            )
+            if not due or (self._compactor and self._compactor.is_alive()):
+                return
+            self._compactor = threading.Thread(
+                target=self.compact, name=f"compact-{self.name}", daemon=True
+            )
+            self._compactor.start()
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        """Block until a running background compaction has finished."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join(timeout)
+
+    def compact(self) -> int:
+        """Rewrite the matrix without tombstones.
+
+        Returns the number of rows reclaimed.
+        """
+        with self.lock:
+            reclaimed = self.tombstones
+            if not reclaimed:
+                return 0
+            rows = np.flatnonzero(self.alive[: self.rows])
+            capacity = max(len(rows), INITIAL_CAPACITY) if len(rows) else 0
+            matrix = self._new_matrix(capacity)
+            matrix[: len(rows)] = self.matrix[rows]
+            if self.quantized:
+                self.quantized.keep(rows, capacity)
+            alive = np.zeros(capacity, dtype=bool)
+            alive[: len(rows)] = True
+            self.matrix, self.alive = matrix, alive
+            self.ids = [self.ids[row] for row in rows]
+            self.payloads = [self.payloads[row] for row in rows]
+            self.timestamps = [self.timestamps[row] for row in rows]
+            self.index = {point_id: row for row, point_id in enumerate(self.ids)}
+            self._clear_payload_indexes()
+            for row, payload in enumerate(self.payloads):
+                self._index_payload(row, payload)
+            if self.ann:
+                self.ann.remap(rows)
+            self._layout += 1
+            self.rows = self.count = len(rows)
+        logger.debug(f"Compacted {reclaimed} deleted points from {self.name}")
+        return reclaimed
+
+    def clear(self) -> None:
+        """Remove every point, keeping the vector size."""
+        with self.lock:
+            if self.journal:
+                self.journal.log_clear()
+            self.matrix = self._new_matrix(0)
+            if self.quantized:
+                self.quantized.reset(self.vector_size or 0)
+            self.alive = np.zeros(0, dtype=bool)
+            self.index = {}
+            self._clear_payload_indexes()
+            self.ids, self.payloads, self.timestamps = [], [], []
+            self.rows = self.count = 0
+            if self.ann:
+                self.ann.reset()
+            self._layout += 1
+
+    def attach(self, journal: CollectionJournal) -> None:
+        """Load the points stored in ``journal`` and log later writes to it."""
+        snapshot, entries = journal.load()
+        if self.quantized:
+            self.originals_dir = journal.directory
+        if snapshot:
+            with self.lock:
+                self.matrix = snapshot["matrix"]
+                self.rows = self.count = len(self.matrix)
+                self.vector_size = snapshot["vector_size"]
+                if self.quantized:
+                    self._quantize_loaded()
+                self.alive = np.ones(self.rows, dtype=bool)
+                self.ids = snapshot["ids"]
+                self.payloads = snapshot["payloads"]
+                self.timestamps = snapshot["timestamps"]
+                self.index = {point_id: row for row, point_id in enumerate(self.ids)}
+                for row, payload in enumerate(self.payloads):
+                    self._index_payload(row, payload)
+                self._layout += 1
+
+        replayed = 0
+        for entry in entries:
+            if entry["op"] == "upsert":
+                self.upsert(
+                    entry["ids"],
+                    entry["vectors"],
+                    entry["payloads"],
+                    entry["timestamp"],
+                )
+                replayed += len(entry["ids"])
+            elif entry["op"] == "delete":
+                replayed += self.delete(entry["ids"])
+            elif entry["op"] == "set_payload":
+                replayed += self.set_payload(entry["ids"], entry["payload"])
+            elif entry["op"] == "clear":
+                self.clear()
+        logger.info(
+            f"Loaded {self.count} points for {self.name} "
+            f"({replayed} from the write-ahead log)"
+        )
+
+        self.journal = journal
+        journal.pending = replayed
+        self._maybe_train()
+        self._maybe_snapshot()
+
+    def _quantize_loaded(self) -> None:
+        """Move a loaded float32 matrix to originals and codes; holds the lock."""
+        loaded = self.matrix
+        self.matrix = self._new_matrix(self.rows)
+        self.quantized.reset(self.vector_size)
+        self.quantized.reserve(self.rows, 0)
+        step = chunk_rows(self.vector_size)
+        for start in range(0, self.rows, step):
+            chunk = slice(start, min(start + step, self.rows))
+            self.matrix[chunk] = loaded[chunk]
+            self.quantized.put(chunk, loaded[chunk])
+
+    def _maybe_train(self) -> None:
+        """(Re)train the approximate index in the background once it is due."""
+        if self.ann is None:
+            return
+        with self.lock:
+            if not self.ann.due(self.count) or (
+                self._trainer and self._trainer.is_alive()
+            ):
+                return
+            self._trainer = threading.Thread(
+                target=self.train_index, name=f"train-{self.name}", daemon=True
+            )
+            self._trainer.start()
+
+    def train_index(self) -> None:
+        """Train the approximate index on the live points and file every row.
+
+        Centroids are trained and rows assigned outside the lock; points
+        written meanwhile are filed when the new index is installed.
+        """
+        if self.ann is None:
+            return
+        config = self.ann.config
+        with self.lock:
+            live = np.flatnonzero(self.alive[: self.rows])
+            if not len(live):
+                return
+            nlist = config.lists_for(len(live))
+            rng = np.random.default_rng(len(live))
+            sample_rows = np.sort(
+                rng.choice(
+                    live, min(len(live), nlist * config.sample_per_list), replace=False
+                )
+            )
+            sample = self.matrix[sample_rows].astype(np.float32)
+            matrix, alive = self.matrix, self.alive[: self.rows].copy()
+            rows, layout = self.rows, self._layout
+            self._touched = set()
+
+        started = time.perf_counter()
+        centroids = train_centroids(sample, nlist, config.iterations)
+        assignment = nearest_centroids(matrix[:rows], centroids)
+        assignment[~alive] = -1
+
+        with self.lock:
+            touched, self._touched = self._touched, None
+            if layout != self._layout:
+                # Compacted or reloaded meanwhile; assign the new rows afresh
+                rows, touched = 0, set()
+                assignment = assignment[:0]
+            self.ann.install(centroids, assignment, self.count)
+            refile = sorted(
+                row for row in touched.union(range(rows, self.rows)) if self.alive[row]
+            )
+            self.ann.assign(refile, self.matrix[refile])
+        logger.info(
+            f"Trained {len(centroids)}-list index for {self.name} on "
+            f"{len(sample)} of {len(live)} points in "
+            f"{time.perf_counter() - started:.2f}s"
+        )
+
+    def wait_for_training(self, timeout: Optional[float] = None) -> None:
+        """Block until a running background index training has finished."""
+        trainer = self._trainer
+        if trainer is not None:
+            trainer.join(timeout)
+
+    def _maybe_snapshot(self) -> None:
+        """Snapshot in the background once enough writes have been logged."""
+        journal = self.journal
+        if journal is None or journal.read_only or journal.pending < SNAPSHOT_EVERY:
+            return
+        with self.lock:
+            if self._snapshotter and self._snapshotter.is_alive():
+                return
+            self._snapshotter = threading.Thread(
+                target=self.write_snapshot, name=f"snapshot-{self.name}", daemon=True
+            )
+            self._snapshotter.start()
+
+    def write_snapshot(self) -> None:
+        """Write the live points to a new segment and start a fresh log."""
+        journal = self.journal
+        if journal is None or journal.read_only:
+            return
+        with self._snapshot_lock:
+            with self.lock:
+                generation = journal.rotate()
+                rows = np.flatnonzero(self.alive[: self.rows])
+                matrix = self.matrix[rows]
+                ids = [self.ids[row] for row in rows]
+                payloads = [dict(self.payloads[row]) for row in rows]
+                timestamps = [self.timestamps[row] for row in rows]
+                vector_size = self.vector_size
+            journal.write_snapshot(
+                generation, matrix, ids, payloads, timestamps, vector_size
+            )
+
+    def wait_for_snapshot(self, timeout: Optional[float] = None) -> None:
+        """Block until a running background snapshot has finished."""
+        snapshotter = self._snapshotter
+        if snapshotter is not None:
+            snapshotter.join(timeout)
+
+    def close(self) -> None:
+        """Finish background work and release the journal."""
+        self.wait_for_compaction()
+        self.wait_for_training()
+        self.wait_for_snapshot()
+        if self.journal:
+            self.journal.close()
+            self.journal = None
+
+    def count_matching(self, filter_conditions: Optional[Dict[str, Any]] = None) -> int:
+        """Number of live points whose payloads match ``filter_conditions``."""
+        if not filter_conditions:
+            return self.count
+        with self.lock:
+            return len(
+                self.payload_index.candidates(
+                    filter_conditions, self.index.values(), self.payloads
+                )
+            )
+
+    def _search_view(self, filter_conditions: Optional[Dict[str, Any]] = None):
+        """Matrix to score, its live-row mask (None if all live), ids, payloads.
+
+        With a filter the matrix holds only the candidate rows, and ids and
+        payloads are narrowed to match.
+        """
+        with self.lock:
+            if filter_conditions:
+                candidate_rows = self.payload_index.candidates(
+                    filter_conditions, self.index.values(), self.payloads
+                )
+                return (
+                    self.matrix[candidate_rows],
+                    None,
+                    [self.ids[row] for row in candidate_rows],
+                    [self.payloads[row] for row in candidate_rows],
+                )
+            row_count = self.rows
+            alive = None if self.count == row_count else self.alive[:row_count]
+            return self.matrix[:row_count], alive, self.ids, self.payloads
+
+    def _ann_view(self, queries: np.ndarray):
+        """Matrix, live-row mask, ids, payloads and the rows the approximate
+        index probes for each query; None when searching exactly."""
+        with self.lock:
+            if (
+                self.ann is None
+                or not self.ann.trained
+                or self.count < self.ann.config.min_points
+            ):
+                return None
+            rows = self.rows
+            return (
+                self.matrix[:rows],
+                self.alive[:rows],
+                self.ids,
+                self.payloads,
+                self.ann.probe(queries),
+            )
+
+    def _hits(self, scores: np.ndarray, limit: int, ids, payloads, rows=None):
+        """Result dicts for the top scores; ``rows`` maps scores to rows."""
+        hits = []
+        for index in top_k(scores, limit):
+            if scores[index] == -np.inf:
+                continue
+            row = index if rows is None else rows[index]
+            hits.append(
+                {
+                    "id": ids[row],
+                    "score": float(scores[index]),
+                    "payload": payloads[row],
+                }
+            )
+        return hits
+
+    def _search_approximate(
+        self, query_vectors: Vectors, limit: int
+    ) -> Optional[List[List[Dict[str, Any]]]]:
+        """Hits from the rows the approximate index probes; None if not used."""
+        if self.ann is None or not self.ann.trained:
+            return None
+        queries = self._fit(query_vectors)
+        view = self._ann_view(queries)
+        if view is None:
+            return None
+        matrix, alive, ids, payloads, candidates = view
+        results = []
+        for query, rows in zip(queries, candidates):
+            if len(rows) < limit:
+                # Too few rows in the probed cells; score every live row
+                rows = np.flatnonzero(alive)
+            scores = matrix[rows] @ query
+            scores[~alive[rows]] = -np.inf
+            results.append(self._hits(scores, limit, ids, payloads, rows))
+        return results
+
+    def search(
+        self,
+        query_vector: Sequence[float],
+        limit: int = 10,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+    ):
+        """Top ``limit`` points by cosine similarity to ``query_vector``."""
+        return self.search_batch([query_vector], limit, filter_conditions)[0]
+
+    def search_batch(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        limit: int = 10,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Top ``limit`` points for each query, scored in one matrix product.
+
+        Only points whose payloads match ``filter_conditions`` are scored.
+        Unfiltered searches of a collection with a trained approximate index
+        only score the rows it probes.
+        """
+        if not len(query_vectors):
+            return []
+        if self.quantized is not None:
+            return self._search_quantized(query_vectors, limit, filter_conditions)
+        if not filter_conditions:
+            approximate = self._search_approximate(query_vectors, limit)
+            if approximate is not None:
+                return approximate
+        matrix, alive, ids, payloads = self._search_view(filter_conditions)
+        if not len(matrix):
+            return [[] for _ in query_vectors]
+
+        queries = self._fit(query_vectors)
+        scores = queries @ matrix.T
+        if alive is not None:
+            scores[:, ~alive] = -np.inf
+        return [self._hits(row, limit, ids, payloads) for row in scores]
+
+    def _search_quantized(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        limit: int,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Hits scored on the int8 codes, the best ``rescore`` times ``limit``
+        of them rescored against the float16 originals."""
+        if not self.count:
+            return [[] for _ in query_vectors]
+        queries = self._fit(query_vectors)
+        with self.lock:
+            row_count = self.rows
+            matrix, alive = self.matrix, self.alive[:row_count]
+            codes, scales = self.quantized.codes[:row_count], self.quantized.scales
+            ids, payloads = self.ids, self.payloads
+            if filter_conditions:
+                candidates = np.array(
+                    self.payload_index.candidates(
+                        filter_conditions, self.index.values(), self.payloads
+                    ),
+                    dtype=np.intp,
+                )
+                probed = None
+            elif (
+                self.ann is not None
+                and self.ann.trained
+                and self.count >= self.ann.config.min_points
+            ):
+                candidates, probed = None, self.ann.probe(queries)
+            else:
+                candidates = probed = None
+
+        depth = max(limit * self.quantization.rescore, limit)
+
+        def rescore(query, scores, scored_rows):
+            if scored_rows is None:
+                scores[~alive] = -np.inf
+            else:
+                scores[~alive[scored_rows]] = -np.inf
+            top = top_k(scores, depth)
+            top = top[scores[top] != -np.inf]
+            picked = top if scored_rows is None else scored_rows[top]
+            exact = matrix[picked].astype(np.float32) @ query
+            return self._hits(exact, limit, ids, payloads, picked)
+
+        if probed is None:
+            all_scores = approximate_scores(codes, scales, queries, candidates)
+            return [
+                rescore(query, query_scores, candidates)
+                for query, query_scores in zip(queries, all_scores)
+            ]
+        results = []
+        for query, probed_rows in zip(queries, probed):
+            if len(probed_rows) < limit:
+                probed_rows = np.flatnonzero(alive)
+            scores = approximate_scores(codes, scales, query[None], probed_rows)[0]
+            results.append(rescore(query, scores, probed_rows))
+        return results
+
+    def search_text(
+        self,
+        query: str,
+        limit: int = 10,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Top ``limit`` points by BM25 keyword score for ``query``."""
+        with self.lock:
+            rows = (
+                self.payload_index.candidates(
+                    filter_conditions, self.index.values(), self.payloads
+                )
+                if filter_conditions
+                else None
+            )
+            return [
+                {"id": self.ids[row], "score": score, "payload": self.payloads[row]}
+                for row, score in self.lexical.search(query, limit, rows)
+            ]
+
+    def search_hybrid(
+        self,
+        query: str,
+        query_vector: Optional[Sequence[float]] = None,
+        limit: int = 10,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Top ``limit`` points by keyword and vector rank, fused.
+
+        The ``HYBRID_DEPTH`` times ``limit`` best hits of each search are
+        merged by reciprocal rank fusion; without ``query_vector`` this is a
+        keyword search.
+        """
+        depth = max(limit * HYBRID_DEPTH, limit)
+        rankings = [self.search_text(query, depth, filter_conditions)]
+        if query_vector is not None and len(query_vector):
+            rankings.append(self.search(query_vector, depth, filter_conditions))
+        return fuse_hits(rankings, limit)
+
+    def get_info(self) -> Dict[str, Any]:
+        """Point count, vector size, allocated rows, pending tombstones and
+        the approximate index, if trained."""
+        return {
+            "points_count": self.count,
+            "status": "ok",
+            "vector_size": self.vector_size if self.count else 0,
+            "capacity": self.capacity,
+            "tombstones": self.tombstones,
+            "ann": self.ann.get_info() if self.ann and self.ann.trained else None,
+            "quantization": (
+                {
+                    "mode": "int8",
+                    "memory_bytes": self.quantized.nbytes,
+                    "originals_bytes": self.matrix.nbytes,
+                }
+                if self.quantized
+                else None
+            ),
+        }
@@ -0,0 +1,308 @@
+"""On-disk storage for in-memory vector collections.
+
+Each collection gets a directory holding numbered generations:
+
+* ``segment-<gen>.npy`` - float32 vectors of every live point at snapshot time
+* ``snapshot-<gen>.json`` - ids, payloads and timestamps of those rows
+* ``wal-<gen>.jsonl`` - append-only log of upserts, payload updates, deletes
+  and clears
+* ``wal-<gen>.f32`` - raw float32 rows of the logged upserts; each log entry
+  records its byte offset and row count in this file
+* ``CURRENT`` - generation of the newest complete snapshot
+
+Snapshot ``s`` holds the state after every log older than ``s``, so loading
+maps the current segment and replays the logs from ``s`` on. Segments are
+opened copy-on-write, so a restart maps them instead of re-inserting every
+point, and processes opening the same directory share their pages. One
+process holds the writer lock; others open the directory read-only.
+"""
+
+import json
+import logging
+import os
+import re
+from typing import IO, Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote, unquote
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Logged rows (upserted or deleted) after which a collection snapshots itself
+SNAPSHOT_EVERY = 10000
+
+_GENERATION = re.compile(r"^(?:segment|snapshot|wal)-(\d+)\.")
+
+
+def default_storage_dir() -> Optional[str]:
+    """Directory the shared vector store persists its fallback to, if any.
+
+    ``VECTOR_STORE_DIR`` overrides the default; an empty value or ``none``
+    keeps the fallback purely in memory.
+    """
+    directory = os.getenv(
+        "VECTOR_STORE_DIR", os.path.join(os.path.expanduser("~"), ".mcp_vectors")
+    )
+    if not directory or directory.lower() == "none":
+        return None
+    return directory
+
+
+def collection_path(root: str, collection_name: str) -> str:
+    """Directory of one collection under ``root``."""
+    return os.path.join(root, quote(collection_name, safe=""))
+
+
+def stored_collections(root: str) -> List[str]:
+    """Names of the collections persisted under ``root``."""
+    if not os.path.isdir(root):
+        return []
+    return sorted(
+        unquote(name)
+        for name in os.listdir(root)
+        if os.path.isdir(os.path.join(root, name))
+    )
+
+
+def _encode_id(point_id: Any) -> Any:
+    # JSON keeps str and int ids; anything else is stored as its string form
+    return point_id if isinstance(point_id, (str, int)) else str(point_id)
+
+
+class CollectionJournal:
+    """Snapshot segments and write-ahead log of one collection."""
+
+    def __init__(self, directory: str, read_only: bool = False):
+        """Open (and create) a collection directory.
+
+        Args:
+            directory: Collection directory
+            read_only: Never write; also the fallback when another process
+                holds the writer lock
+        """
+        self.directory = directory
+        self.read_only = read_only
+        self.generation = 0
+        self.pending = 0
+        self._lock_file: Optional[IO[str]] = None
+        self._log: Optional[BinaryIO] = None
+        self._vectors: Optional[BinaryIO] = None
+
+        if not read_only:
+            os.makedirs(directory, exist_ok=True)
+            self.read_only = not self._acquire()
+
+    def _path(self, kind: str, generation: int, suffix: str) -> str:
+        return os.path.join(self.directory, f"{kind}-{generation:08d}.{suffix}")
+
+    def _acquire(self) -> bool:
+        """Take the writer lock; False if another process holds it."""
+        if fcntl is None:
+            return True
+        self._lock_file = open(os.path.join(self.directory, "LOCK"), "w")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            logger.warning(f"{self.directory} is locked by another process - read-only")
+            self._lock_file.close()
+            self._lock_file = None
+            return False
+
+    def _generations(self) -> List[int]:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            {
+                int(match.group(1))
+                for match in map(_GENERATION.match, os.listdir(self.directory))
+                if match
+            }
+        )
+
+    def _current(self) -> int:
+        try:
+            with open(os.path.join(self.directory, "CURRENT")) as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def load(self) -> Tuple[Optional[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+        """The current snapshot (or None) and the log entries after it.
+
+        The snapshot's ``matrix`` is a copy-on-write memory map. Log entries
+        are dicts with an ``op`` of ``upsert`` (with ``ids``, ``vectors``,
+        ``payloads`` and ``timestamp``), ``set_payload`` (with ``ids`` and
+        ``payload``), ``delete`` (with ``ids``) or ``clear``. Opening for writing starts a fresh log afterwards.
+        """
+        current = self._current()
+        snapshot = None
+        if current:
+            with open(self._path("snapshot", current, "json")) as f:
+                snapshot = json.load(f)
+            snapshot["matrix"] = np.load(
+                self._path("segment", current, "npy"), mmap_mode="c"
+            )
+
+        logs = [
+            generation for generation in self._generations() if generation >= current
+        ]
+        self.generation = max(logs + [current])
+        if not self.read_only:
+            self._open_log(self.generation + 1)
+        return snapshot, self._replay(logs)
+
+    def _replay(self, generations: List[int]) -> Iterator[Dict[str, Any]]:
+        for generation in generations:
+            path = self._path("wal", generation, "jsonl")
+            if not os.path.exists(path):
+                continue
+            vectors = self._path("wal", generation, "f32")
+            with open(path, "rb") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A write cut short by a crash; later logs still apply
+                        logger.warning(f"Skipping truncated entry in {path}")
+                        break
+                    if entry["op"] == "upsert":
+                        entry["vectors"] = np.fromfile(
+                            vectors,
+                            dtype=np.float32,
+                            count=entry["rows"] * entry["dim"],
+                            offset=entry["offset"],
+                        ).reshape(entry["rows"], entry["dim"])
+                    yield entry
+
+    def _open_log(self, generation: int) -> None:
+        self.generation = generation
+        self._log = open(self._path("wal", generation, "jsonl"), "ab")
+        self._vectors = open(self._path("wal", generation, "f32"), "ab")
+
+    def _append(self, entry: Dict[str, Any], rows: int) -> None:
+        if self._log is None:
+            return
+        self._log.write(json.dumps(entry, default=str).encode() + b"\n")
+        self._log.flush()
+        self.pending += rows
+
+    def log_upsert(
+        self,
+        ids: Sequence[Any],
+        vectors: np.ndarray,
+        payloads: Sequence[Dict[str, Any]],
+        timestamp: str,
+    ) -> None:
+        """Log written points; ``vectors`` is their float32 matrix."""
+        if self._vectors is None:
+            return
+        offset = self._vectors.tell()
+        self._vectors.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        self._vectors.flush()
+        self._append(
+            {
+                "op": "upsert",
+                "ids": [_encode_id(point_id) for point_id in ids],
+                "payloads": list(payloads),
+                "timestamp": timestamp,
+                "offset": offset,
+                "rows": len(vectors),
+                "dim": vectors.shape[1],
+            },
+            len(vectors),
+        )
+
+    def log_set_payload(self, ids: Sequence[Any], payload: Dict[str, Any]) -> None:
+        """Log payload fields merged into the given points."""
+        self._append(
+            {
+                "op": "set_payload",
+                "ids": [_encode_id(point_id) for point_id in ids],
+                "payload": payload,
+            },
+            len(ids),
+        )
+
+    def log_delete(self, ids: Sequence[Any]) -> None:
+        """Log deleted point ids."""
+        if ids:
+            self._append(
+                {"op": "delete", "ids": [_encode_id(point_id) for point_id in ids]},
+                len(ids),
+            )
+
+    def log_clear(self) -> None:
+        """Log that every point was removed."""
+        self._append({"op": "clear"}, 1)
+
+    def rotate(self) -> int:
+        """Start a new log for a snapshot; returns the snapshot's generation.
+
+        Called under the collection lock, so the snapshot taken with it holds
+        exactly the entries of the logs before the returned generation.
+        """
+        self.close_log()
+        self._open_log(self.generation + 1)
+        self.pending = 0
+        return self.generation
+
+    def write_snapshot(
+        self,
+        generation: int,
+        matrix: np.ndarray,
+        ids: List[Any],
+        payloads: List[Dict[str, Any]],
+        timestamps: List[str],
+        vector_size: Optional[int],
+    ) -> None:
+        """Write snapshot ``generation``, then drop older files."""
+        segment = self._path("segment", generation, "npy")
+        with open(f"{segment}.tmp", "wb") as f:
+            np.save(f, np.ascontiguousarray(matrix, dtype=np.float32))
+        os.replace(f"{segment}.tmp", segment)
+
+        snapshot = self._path("snapshot", generation, "json")
+        with open(f"{snapshot}.tmp", "w") as f:
+            json.dump(
+                {
+                    "generation": generation,
+                    "vector_size": vector_size,
+                    "ids": [_encode_id(point_id) for point_id in ids],
+                    "payloads": payloads,
+                    "timestamps": timestamps,
+                },
+                f,
+                default=str,
+            )
+        os.replace(f"{snapshot}.tmp", snapshot)
+
+        current = os.path.join(self.directory, "CURRENT")
+        with open(f"{current}.tmp", "w") as f:
+            f.write(str(generation))
+        os.replace(f"{current}.tmp", current)
+
+        # Readers that mapped an older segment keep it until they unmap it
+        for name in os.listdir(self.directory):
+            match = _GENERATION.match(name)
+            if match and int(match.group(1)) < generation:
+                os.remove(os.path.join(self.directory, name))
+        logger.info(f"Snapshot {generation} of {len(ids)} points in {self.directory}")
+
+    def close_log(self) -> None:
+        for handle in (self._log, self._vectors):
+            if handle is not None:
+                handle.close()
+        self._log = self._vectors = None
+
+    def close(self) -> None:
+        """Close the log and release the writer lock."""
+        self.close_log()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
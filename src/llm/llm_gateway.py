@@ -2,11 +2,16 @@
 
 import logging
 import asyncio
+import os
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 import httpx
 import json
+import time
+
+from ..core.cancellation import request_timeout
+from ..core.tool_metrics import Histogram
 
 logger = logging.getLogger(__name__)
 
@@ -387,7 +392,8 @@ class DockerOllamaProvider:
 
             # Try to connect to external service first
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                # Bounded by the deadline of the tool call being served
+                async with httpx.AsyncClient(timeout=request_timeout(30.0)) as client:
                     response = await client.post(
                         f"{self.api_base}/api/generate",
                         json={
@@ -429,7 +435,9 @@ class LLMGateway:
 
     def __init__(self):
         self.cursor_llms = CursorLLMProvider()
-        self.docker_ollama = DockerOllamaProvider()
+        self.docker_ollama = DockerOllamaProvider(
+            os.getenv("OLLAMA_URL", "http://localhost:11434")
+        )
         self.model_performance = {}  # Track model performance
         self.fallback_strategy = "auto"  # auto, cursor_first, ollama_first
 
@@ -547,6 +555,7 @@ class LLMGateway:
             selected_model = await self.select_best_model(task_type, prompt)
 
             # Try generation with selected model
+            start = time.perf_counter()
             try:
                 if selected_model.provider == LLMProvider.CURSOR:
                     result = await self.cursor_llms.generate(
@@ -558,12 +567,16 @@ class LLMGateway:
                     )
 
                 # Update performance metrics
-                self._update_model_performance(selected_model.name, success=True)
+                self._update_model_performance(
+                    selected_model.name, True, time.perf_counter() - start
+                )
                 return result
 
             except Exception as e:
                 logger.error(f"Selected model {selected_model.name} failed: {e}")
-                self._update_model_performance(selected_model.name, success=False)
+                self._update_model_performance(
+                    selected_model.name, False, time.perf_counter() - start
+                )
 
                 # Try fallback to other available models
                 return await self._try_fallback_generation(
@@ -596,6 +609,7 @@ class LLMGateway:
 
         # Try each fallback model
         for model in fallback_models:
+            start = time.perf_counter()
             try:
                 if model.provider == LLMProvider.CURSOR:
                     result = await self.cursor_llms.generate(
@@ -606,30 +620,41 @@ class LLMGateway:
                         model.name, prompt, **kwargs
                     )
 
-                self._update_model_performance(model.name, success=True)
+                self._update_model_performance(
+                    model.name, True, time.perf_counter() - start
+                )
                 logger.info(f"Fallback generation successful with {model.name}")
                 return result
 
             except Exception as e:
                 logger.warning(f"Fallback model {model.name} failed: {e}")
-                self._update_model_performance(model.name, success=False)
+                self._update_model_performance(
+                    model.name, False, time.perf_counter() - start
+                )
                 continue
 
         raise Exception("All fallback models failed")
 
-    def _update_model_performance(self, model_name: str, success: bool):
-        """Update model performance metrics."""
+    def _update_model_performance(
+        self, model_name: str, success: bool, elapsed: float = 0.0
+    ):
+        """Update model performance metrics with a call's outcome and duration."""
         if model_name not in self.model_performance:
             self.model_performance[model_name] = {
                 "successes": 0,
                 "failures": 0,
                 "total_time": 0.0,
+                # Generation time in microseconds
+                "latency": Histogram(),
             }
 
+        metrics = self.model_performance[model_name]
         if success:
-            self.model_performance[model_name]["successes"] += 1
+            metrics["successes"] += 1
         else:
-            self.model_performance[model_name]["failures"] += 1
+            metrics["failures"] += 1
+        metrics["total_time"] += elapsed
+        metrics["latency"].record(elapsed * 1_000_000)
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics for all models."""
@@ -642,6 +667,8 @@ class LLMGateway:
                     "total_requests": total,
                     "successes": metrics["successes"],
                     "failures": metrics["failures"],
+                    "average_time": metrics["total_time"] / total,
+                    "latency_ms": metrics["latency"].summary(scale=1000.0),
                 }
         return stats
 
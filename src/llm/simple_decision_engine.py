@@ -13,6 +13,8 @@ from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 
+from ..core.cancellation import request_timeout
+
 # Try to import Cursor LLM tools
 try:
     from mcp_tools.cursor_llm import generate_with_cursor_llm
@@ -411,7 +413,8 @@ Respond with just the action name:"""
                     "stream": False,
                     "options": {"temperature": 0.1, "max_tokens": 20},
                 },
-                timeout=60,
+                # Never wait past the deadline of the tool call being served
+                timeout=request_timeout(60),
             )
 
             if response.status_code == 200:
@@ -8,8 +8,12 @@ from .handlers import (
     communication_tools,
     knowledge_tools,
 )
+from .registry import ToolRegistry, ToolSpec, tool_registry
 
 __all__ = [
+    "ToolRegistry",
+    "ToolSpec",
+    "tool_registry",
     "basic_tools",
     "system_tools",
     "database_tools",
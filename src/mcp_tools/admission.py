@@ -0,0 +1,243 @@
+"""Admission control for the MCP request queue.
+
+Requests are sorted into cost classes before they are queued. Each class has
+its own bounded queue and concurrency limit, and workers always take the
+highest-priority class that still has capacity, so interactive cheap calls are
+never stuck behind a burst of project generations. When a class is saturated
+the request is shed immediately with a "server busy, retry after N ms" error
+instead of waiting without bound.
+
+The ``llm`` and ``write`` classes are also metered per client by the shared
+:class:`~src.security.rate_limiting.RateLimiter` (endpoint types ``mcp_llm``
+and ``mcp_write``).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Cost classes
+CHEAP = "cheap"  # in-memory lookups answered on the loop
+READ = "read"  # read-only tools that may touch disk, network or the vector store
+LLM = "llm"  # tools that call a language model
+WRITE = "write"  # tools that change state
+
+COST_CLASSES = (CHEAP, READ, LLM, WRITE)
+
+# JSON-RPC error code for shed requests (implementation-defined server error)
+SERVER_BUSY = -32000
+
+# priority (lower runs first), max concurrent, max queued
+_DEFAULT_LIMITS = {
+    CHEAP: (0, 8, 256),
+    READ: (1, 4, 64),
+    WRITE: (2, 2, 32),
+    LLM: (3, 2, 8),
+}
+
+# Classes metered by the rate limiter, by its endpoint type
+_RATE_LIMITED = {LLM: "mcp_llm", WRITE: "mcp_write"}
+
+
+class CostClass:
+    """Queue, limits and counters of one cost class."""
+
+    def __init__(self, name: str, priority: int, concurrency: int, queue_size: int):
+        """Initialize cost class."""
+        self.name = name
+        self.priority = priority
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.queue: Deque[Any] = deque()
+        self.running = 0
+
+        # Moving average of execution time, used to estimate retry delays
+        self.avg_ms = 100.0
+        self.stats = {
+            "admitted": 0,
+            "shed": 0,
+            "rate_limited": 0,
+            "completed": 0,
+            "max_depth": 0,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get class configuration and counters."""
+        return {
+            "priority": self.priority,
+            "concurrency": self.concurrency,
+            "queue_size": self.queue_size,
+            "depth": len(self.queue),
+            "running": self.running,
+            "avg_ms": round(self.avg_ms, 3),
+            **self.stats,
+        }
+
+
+class AdmissionController:
+    """Bounded, prioritized per-class queues in front of the dispatcher."""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[int, int, int]]] = None,
+        rate_limiter: Any = None,
+        min_retry_ms: Optional[int] = None,
+        max_depth: Optional[int] = None,
+    ):
+        """Initialize admission controller.
+
+        Args:
+            limits: ``{class: (priority, concurrency, queue size)}`` overrides
+            rate_limiter: RateLimiter metering llm/write calls (shared one if None)
+            min_retry_ms: Smallest retry hint sent with a busy error
+            max_depth: Cap on queued requests across all classes
+        """
+        self.classes: Dict[str, CostClass] = {}
+        for name, (priority, concurrency, queue_size) in _DEFAULT_LIMITS.items():
+            priority, concurrency, queue_size = (limits or {}).get(
+                name,
+                (
+                    priority,
+                    int(os.getenv(f"MCP_{name.upper()}_CONCURRENCY", concurrency)),
+                    int(os.getenv(f"MCP_{name.upper()}_QUEUE_SIZE", queue_size)),
+                ),
+            )
+            self.classes[name] = CostClass(name, priority, concurrency, queue_size)
+
+        self.by_priority = sorted(self.classes.values(), key=lambda c: c.priority)
+        self._rate_limiter = rate_limiter
+        self.min_retry_ms = min_retry_ms or int(os.getenv("MCP_MIN_RETRY_MS", "100"))
+        self.max_depth = max_depth or int(os.getenv("MCP_REQUEST_QUEUE_SIZE", "256"))
+        self.condition: Optional[asyncio.Condition] = None
+        self.pending = 0
+        self.idle: Optional[asyncio.Event] = None
+
+    def _bind(self) -> None:
+        # asyncio primitives must be created on the loop that uses them
+        if self.condition is None:
+            self.condition = asyncio.Condition()
+            self.idle = asyncio.Event()
+            self.idle.set()
+
+    @property
+    def rate_limiter(self):
+        """Shared rate limiter, imported on first use to keep startup light."""
+        if self._rate_limiter is None:
+            from src.security.rate_limiting import rate_limiter
+
+            self._rate_limiter = rate_limiter
+        return self._rate_limiter
+
+    def classify(self, cost: Optional[str]) -> CostClass:
+        """Get the class for a cost name, treating unknown costs as reads."""
+        return self.classes.get(cost or READ, self.classes[READ])
+
+    def retry_after_ms(self, cost_class: CostClass) -> int:
+        """Estimate when a slot in a saturated class frees up."""
+        backlog = len(cost_class.queue) + cost_class.running
+        estimate = cost_class.avg_ms * backlog / max(cost_class.concurrency, 1)
+        return max(int(estimate), self.min_retry_ms)
+
+    async def admit(
+        self, item: Any, cost: Optional[str], client_id: str = "local"
+    ) -> Optional[Dict[str, Any]]:
+        """Queue an item; returns a busy error instead if it has to be shed."""
+        self._bind()
+        cost_class = self.classify(cost)
+
+        if (
+            len(cost_class.queue) >= cost_class.queue_size
+            or self.depth() >= self.max_depth
+        ):
+            cost_class.stats["shed"] += 1
+            return self._busy(cost_class, self.retry_after_ms(cost_class), "queue full")
+
+        endpoint = _RATE_LIMITED.get(cost_class.name)
+        if endpoint:
+            decision = self.rate_limiter.is_allowed(client_id, endpoint)
+            if not decision["allowed"]:
+                cost_class.stats["rate_limited"] += 1
+                cost_class.stats["shed"] += 1
+                wait_ms = (decision["reset_time"] - time.time()) * 1000
+                return self._busy(
+                    cost_class, max(int(wait_ms), self.min_retry_ms), decision["reason"]
+                )
+
+        async with self.condition:
+            cost_class.queue.append(item)
+            cost_class.stats["admitted"] += 1
+            cost_class.stats["max_depth"] = max(
+                cost_class.stats["max_depth"], len(cost_class.queue)
+            )
+            self.pending += 1
+            self.idle.clear()
+            self.condition.notify()
+        return None
+
+    def _busy(
+        self, cost_class: CostClass, retry_ms: int, reason: str
+    ) -> Dict[str, Any]:
+        logger.warning(
+            f"Shedding {cost_class.name} request ({reason}), retry after {retry_ms}ms"
+        )
+        return {
+            "code": SERVER_BUSY,
+            "message": f"Server busy, retry after {retry_ms} ms",
+            "data": {
+                "retryAfterMs": retry_ms,
+                "costClass": cost_class.name,
+                "reason": reason,
+            },
+        }
+
+    def _next(self) -> Optional[Tuple[Any, CostClass]]:
+        for cost_class in self.by_priority:
+            if cost_class.queue and cost_class.running < cost_class.concurrency:
+                cost_class.running += 1
+                return cost_class.queue.popleft(), cost_class
+        return None
+
+    async def get(self) -> Tuple[Any, CostClass]:
+        """Wait for the highest-priority item whose class has a free slot."""
+        self._bind()
+        async with self.condition:
+            while True:
+                entry = self._next()
+                if entry is not None:
+                    return entry
+                await self.condition.wait()
+
+    async def done(self, cost_class: CostClass, elapsed_ms: float) -> None:
+        """Release a class slot after an item finished."""
+        async with self.condition:
+            cost_class.running -= 1
+            cost_class.stats["completed"] += 1
+            cost_class.avg_ms = 0.8 * cost_class.avg_ms + 0.2 * elapsed_ms
+            self.pending -= 1
+            if self.pending == 0:
+                self.idle.set()
+            self.condition.notify_all()
+
+    async def join(self) -> None:
+        """Wait until every admitted item is done."""
+        self._bind()
+        await self.idle.wait()
+
+    def depth(self) -> int:
+        """Number of queued (not yet running) items."""
+        return sum(len(c.queue) for c in self.classes.values())
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get per-class queue depth, concurrency and shed counts."""
+        return {
+            "depth": self.depth(),
+            "max_depth": self.max_depth,
+            "pending": self.pending,
+            "shed": sum(c.stats["shed"] for c in self.classes.values()),
+            "classes": {name: c.to_dict() for name, c in self.classes.items()},
+        }
@@ -0,0 +1,137 @@
+"""Precomputed MCP tool catalogue.
+
+``initialize`` and ``tools/list`` return the same data for the lifetime of the
+server, so the catalogue serializes it once into ready-to-write UTF-8 bytes and
+only rebuilds when the tool registry changes. The content hash of the tool list
+doubles as the catalogue version.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, List
+
+from .registry import ToolRegistry
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = "2024-11-05"
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize compactly to UTF-8 JSON bytes."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def validate_tool_definition(definition: Dict[str, Any]) -> None:
+    """Raise ValueError if a tool definition is not a valid MCP tool."""
+    name = definition.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError(f"Tool definition without a name: {definition}")
+    if not isinstance(definition.get("description"), str):
+        raise ValueError(f"Tool {name} has no description")
+
+    schema = definition.get("inputSchema")
+    if not isinstance(schema, dict) or schema.get("type") != "object":
+        raise ValueError(f"Tool {name} inputSchema must be an object schema")
+    if not isinstance(schema.get("properties", {}), dict):
+        raise ValueError(f"Tool {name} inputSchema properties must be an object")
+    for key in schema.get("required", []):
+        if key not in schema.get("properties", {}):
+            raise ValueError(f"Tool {name} requires undeclared property {key}")
+
+
+class ToolCatalog:
+    """Serialized ``initialize`` and ``tools/list`` results."""
+
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        server_info: Dict[str, Any],
+        protocol_version: str = PROTOCOL_VERSION,
+    ):
+        """Initialize catalogue for a registry; built lazily on first use."""
+        self.registry = registry
+        self.server_info = server_info
+        self.protocol_version = protocol_version
+        self.lock = threading.Lock()
+
+        self._revision = None
+        self._tools_list = b""
+        self._initialize = b""
+        self._version = ""
+        self.builds = 0
+        self.build_time_ms = 0.0
+
+    def _build(self) -> None:
+        """Validate the registered tools and serialize the catalogue."""
+        start = time.perf_counter()
+        revision = self.registry.revision
+        definitions: List[Dict[str, Any]] = self.registry.list_definitions()
+
+        for definition in definitions:
+            validate_tool_definition(definition)
+
+        tools_list = _dumps({"tools": definitions})
+        version = hashlib.sha256(tools_list).hexdigest()[:16]
+        initialize = _dumps(
+            {
+                "protocolVersion": self.protocol_version,
+                "capabilities": {"tools": {"tools": definitions}},
+                "serverInfo": {**self.server_info, "toolsVersion": version},
+            }
+        )
+
+        self._tools_list = tools_list
+        self._initialize = initialize
+        self._version = version
+        self._revision = revision
+        self.builds += 1
+        self.build_time_ms = (time.perf_counter() - start) * 1000
+
+        logger.info(
+            f"Built tool catalogue {version}: {len(definitions)} tools, "
+            f"{len(tools_list)} bytes in {self.build_time_ms:.1f}ms"
+        )
+
+    def refresh(self) -> bool:
+        """Rebuild if tools were registered or removed; returns True if rebuilt."""
+        if self._revision == self.registry.revision:
+            return False
+        with self.lock:
+            if self._revision == self.registry.revision:
+                return False
+            self._build()
+            return True
+
+    @property
+    def tools_list_bytes(self) -> bytes:
+        """Serialized ``tools/list`` result."""
+        self.refresh()
+        return self._tools_list
+
+    @property
+    def initialize_bytes(self) -> bytes:
+        """Serialized ``initialize`` result."""
+        self.refresh()
+        return self._initialize
+
+    @property
+    def version(self) -> str:
+        """Content hash of the current tool list."""
+        self.refresh()
+        return self._version
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get catalogue statistics."""
+        self.refresh()
+        return {
+            "version": self._version,
+            "tools": len(self.registry.tools),
+            "tools_list_bytes": len(self._tools_list),
+            "initialize_bytes": len(self._initialize),
+            "builds": self.builds,
+            "build_time_ms": round(self.build_time_ms, 3),
+        }
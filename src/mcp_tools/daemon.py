@@ -0,0 +1,282 @@
+"""Shared multi-client MCP daemon.
+
+One long-running server owns the agent system, vector store client, knowledge
+base and dashboard, and serves every Cursor window over a Unix domain socket
+or localhost TCP (see :mod:`src.core.mcp_shim` for the client side).
+
+Each connection is a :class:`ClientSession` with its own dispatcher, admission
+queues, batch collector and response writer. Request ids, cancellation, batch
+arrays and progress notifications therefore never cross between clients, and
+one busy window cannot get another window's requests shed. The session bound
+to the current context decides where responses go, so tool handlers keep
+calling the same ``send_response`` as in stdio mode.
+"""
+
+import asyncio
+import contextvars
+import itertools
+import logging
+import os
+import socket
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Optional
+
+from src.core.mcp_shim import Address, connect, daemon_address
+
+from .dispatcher import BatchCollector, RequestDispatcher
+from .writer import ResponseWriter
+
+logger = logging.getLogger(__name__)
+
+DispatcherFactory = Callable[["ClientSession"], RequestDispatcher]
+
+
+class ClientSession:
+    """One connected MCP client and its transport state."""
+
+    def __init__(
+        self,
+        client_id: str,
+        sock: socket.socket,
+        dispatcher_factory: DispatcherFactory,
+        peer: Any = None,
+    ):
+        """Initialize session.
+
+        Args:
+            client_id: Unique id, also used as the rate limiting key
+            sock: Connected client socket
+            dispatcher_factory: Builds the dispatcher serving this session
+            peer: Remote address for logs
+        """
+        self.client_id = client_id
+        self.sock = sock
+        self.peer = peer
+        self.connected_at = time.time()
+        self.disconnected_at: Optional[float] = None
+
+        self.reader = sock.makefile("r", encoding="utf-8", newline="\n")
+        self.writer = ResponseWriter(stream=sock.makefile("wb"))
+        self.batches = BatchCollector()
+        self.dispatcher = dispatcher_factory(self)
+
+    def send(self, message: Any) -> None:
+        """Write a message object, or a list of them as a batch response."""
+        if isinstance(message, list):
+            self.writer.write_batch(message)
+        else:
+            self.writer.write(message)
+
+    def serve(self) -> None:
+        """Serve the client until it disconnects, then drain its responses."""
+        logger.info(f"Client {self.client_id} connected from {self.peer}")
+        try:
+            with bind_session(self):
+                asyncio.run(self.dispatcher.run(self.reader))
+        except Exception as e:
+            logger.error(f"Client {self.client_id} failed: {e}")
+        finally:
+            self.writer.close()
+            self.close()
+            self.disconnected_at = time.time()
+            logger.info(
+                f"Client {self.client_id} disconnected: {self.get_statistics()}"
+            )
+
+    def disconnect(self) -> None:
+        """Shut the connection down; the dispatcher then sees end of input."""
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        """Release the connection once the dispatcher has stopped."""
+        for closeable in (self.reader, self.writer.stream, self.sock):
+            try:
+                closeable.close()
+            except OSError:
+                pass
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get per-client request and transport metrics."""
+        end = self.disconnected_at or time.time()
+        dispatcher = self.dispatcher.stats
+        transport = self.writer.stats
+        return {
+            "client_id": self.client_id,
+            "peer": str(self.peer) if self.peer else None,
+            "connected": self.disconnected_at is None,
+            "connected_at": self.connected_at,
+            "duration_seconds": round(end - self.connected_at, 3),
+            "requests": dispatcher["received"],
+            "completed": dispatcher["completed"],
+            "failed": dispatcher["failed"],
+            "in_flight": dispatcher["in_flight"],
+            "cancelled": dispatcher["cancelled"],
+            "timeouts": dispatcher["timeouts"],
+            "shed": dispatcher["shed"],
+            "batches": dispatcher["batches"],
+            "messages_sent": transport["messages"],
+            "bytes_sent": transport["bytes"],
+        }
+
+
+_current_session: contextvars.ContextVar[Optional[ClientSession]] = (
+    contextvars.ContextVar("mcp_client_session", default=None)
+)
+
+
+def current_session() -> Optional[ClientSession]:
+    """Session of the client whose request is handled in this context, if any."""
+    return _current_session.get()
+
+
+@contextmanager
+def bind_session(session: Optional[ClientSession]):
+    """Make ``session`` the current session for the enclosed code."""
+    reset = _current_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_session.reset(reset)
+
+
+class MCPDaemon:
+    """Accepts MCP clients on a socket and serves each in its own session."""
+
+    def __init__(
+        self,
+        dispatcher_factory: DispatcherFactory,
+        address: Optional[Address] = None,
+        max_clients: Optional[int] = None,
+    ):
+        """Initialize daemon.
+
+        Args:
+            dispatcher_factory: Builds the dispatcher serving a session
+            address: ``("unix", path)`` or ``("tcp", (host, port))``
+            max_clients: Connections accepted at the same time
+        """
+        self.dispatcher_factory = dispatcher_factory
+        self.address = address or daemon_address()
+        self.max_clients = max_clients or int(os.getenv("MCP_DAEMON_MAX_CLIENTS", "32"))
+
+        self.server: Optional[socket.socket] = None
+        self.sessions: Dict[str, ClientSession] = {}
+        # Metrics of recently disconnected clients
+        self.finished: Deque[Dict[str, Any]] = deque(maxlen=32)
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.ids = itertools.count(1)
+        self.started_at = time.time()
+        self.stats = {"connections": 0, "rejected": 0}
+
+    def bind(self) -> socket.socket:
+        """Create the listening socket.
+
+        Raises:
+            RuntimeError: If another daemon already listens at the address
+        """
+        kind, target = self.address
+        if kind == "unix":
+            assert isinstance(target, str), "unix addresses are socket paths"
+            if os.path.exists(target):
+                try:
+                    connect(self.address, timeout=0.5).close()
+                except OSError:
+                    # Left behind by a daemon that did not shut down cleanly
+                    os.unlink(target)
+                else:
+                    raise RuntimeError(f"An MCP daemon is already running at {target}")
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(target)
+            # Only the owning user may talk to the agent system
+            os.chmod(target, 0o600)
+        else:
+            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server.bind(target)
+            if target[1] == 0:
+                self.address = (kind, server.getsockname())
+
+        server.listen()
+        self.server = server
+        logger.info(f"MCP daemon listening on {kind} {self.address[1]}")
+        return server
+
+    def serve_forever(self) -> None:
+        """Accept clients until :meth:`stop` is called."""
+        server = self.server or self.bind()
+        while not self.stopping.is_set():
+            try:
+                sock, peer = server.accept()
+            except OSError:
+                if self.stopping.is_set():
+                    return
+                raise
+            self._accept(sock, peer)
+
+    def _accept(self, sock: socket.socket, peer: Any) -> None:
+        with self.lock:
+            if len(self.sessions) >= self.max_clients:
+                self.stats["rejected"] += 1
+                logger.warning(f"Rejecting client {peer}: {self.max_clients} connected")
+                sock.close()
+                return
+            client_id = f"client-{next(self.ids)}"
+            self.stats["connections"] += 1
+
+        session = ClientSession(client_id, sock, self.dispatcher_factory, peer or None)
+        with self.lock:
+            self.sessions[client_id] = session
+        threading.Thread(
+            target=self._serve_session,
+            args=(session,),
+            name=f"mcp-{client_id}",
+            daemon=True,
+        ).start()
+
+    def _serve_session(self, session: ClientSession) -> None:
+        try:
+            session.serve()
+        finally:
+            with self.lock:
+                self.sessions.pop(session.client_id, None)
+                self.finished.append(session.get_statistics())
+
+    def stop(self) -> None:
+        """Stop accepting clients and disconnect the connected ones."""
+        self.stopping.set()
+        if self.server is not None:
+            try:
+                # Wakes up a thread blocked in accept(); close() alone does not
+                self.server.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.server.close()
+            kind, target = self.address
+            if kind == "unix" and isinstance(target, str) and os.path.exists(target):
+                os.unlink(target)
+        with self.lock:
+            sessions = list(self.sessions.values())
+        for session in sessions:
+            session.disconnect()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get connection counts and per-client metrics."""
+        with self.lock:
+            active = [session.get_statistics() for session in self.sessions.values()]
+            finished = list(self.finished)
+        return {
+            "address": f"{self.address[0]}:{self.address[1]}",
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "active_clients": len(active),
+            "max_clients": self.max_clients,
+            **self.stats,
+            "clients": active,
+            "recent_clients": finished,
+        }
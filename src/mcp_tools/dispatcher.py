@@ -0,0 +1,415 @@
+"""Concurrent JSON-RPC dispatcher for the MCP stdio transport.
+
+The dispatcher decouples reading requests from executing them: a reader task
+parses incoming lines and hands them to admission control, which queues them
+per cost class (or sheds them when a class is saturated), and a pool of
+workers drains the queues in priority order.
+Coroutine handlers run on the event loop, blocking handlers run on a thread
+pool, and responses are written as soon as each request finishes, so a slow
+LLM call no longer stalls cheap tools queued behind it. Responses are matched
+to requests by their JSON-RPC ``id``.
+
+JSON-RPC batch arrays are split into their calls, which run concurrently like
+any other request; their responses are collected by id and written back as a
+single array once every call in the batch has finished.
+
+Every request carries a :class:`CancelToken`. ``notifications/cancelled`` and
+``$/cancelRequest`` are handled as soon as they are read: queued requests are
+dropped and running ones are interrupted. Requests that outlive their route's
+deadline are cancelled the same way and answered with a timeout error.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TextIO, Union
+
+from src.core.cancellation import REQUEST_TIMEOUT, CancelToken, bind_token
+
+from .admission import AdmissionController
+
+logger = logging.getLogger(__name__)
+
+# Execution modes understood by the dispatcher
+MODE_INLINE = "inline"  # cheap, non-blocking work executed on the loop thread
+MODE_ASYNC = "async"  # coroutine executed on the loop
+MODE_BLOCKING = "blocking"  # synchronous work executed on the thread pool
+
+
+@dataclass
+class Route:
+    """How a single request should be executed."""
+
+    func: Callable[[], Union[Any, Awaitable[Any]]]
+    mode: str = MODE_BLOCKING
+    timeout: Optional[float] = None  # seconds; None means no deadline
+
+
+Router = Callable[[Dict[str, Any]], Route]
+Classifier = Callable[[Dict[str, Any]], Optional[str]]
+ErrorHandler = Callable[[Dict[str, Any], Exception], None]
+MessageSender = Callable[[Any], None]
+
+INVALID_REQUEST = {"code": -32600, "message": "Invalid Request"}
+
+# Cancellation notifications (MCP and LSP spelling) and their id parameter
+CANCEL_METHODS = {"notifications/cancelled": "requestId", "$/cancelRequest": "id"}
+
+
+def _hashable(value: Any) -> bool:
+    """Whether a request id can key the batch lookup."""
+    return isinstance(value, (str, int, float))
+
+
+class Batch:
+    """Responses collected for one JSON-RPC batch array."""
+
+    def __init__(self, size: int):
+        """Initialize batch expecting ``size`` dispatched messages."""
+        self.pending = size
+        self.ids: List[Any] = []
+        self.responses: List[Any] = []
+
+
+class BatchCollector:
+    """Routes responses for requests that belong to a batch into that batch."""
+
+    def __init__(self):
+        """Initialize batch collector."""
+        self.lock = threading.Lock()
+        self.open_ids: Dict[Any, Batch] = {}
+
+    def open(self, messages: List[Dict[str, Any]]) -> Batch:
+        """Start collecting responses for the requests in a batch."""
+        batch = Batch(len(messages))
+        with self.lock:
+            for message in messages:
+                request_id = message.get("id")
+                if request_id is not None and _hashable(request_id):
+                    batch.ids.append(request_id)
+                    self.open_ids[request_id] = batch
+        return batch
+
+    def collect(self, request_id: Any, response: Any) -> bool:
+        """Keep a response if its request is part of an open batch."""
+        if request_id is None or not _hashable(request_id):
+            return False
+        with self.lock:
+            batch = self.open_ids.get(request_id)
+            if batch is None:
+                return False
+            batch.responses.append(response)
+            return True
+
+    def finish(self, batch: Batch) -> bool:
+        """Mark one message done; returns True when the whole batch is done."""
+        with self.lock:
+            batch.pending -= 1
+            if batch.pending > 0:
+                return False
+            for request_id in batch.ids:
+                if self.open_ids.get(request_id) is batch:
+                    del self.open_ids[request_id]
+            return True
+
+
+class RequestDispatcher:
+    """Reads JSON-RPC messages and executes them concurrently."""
+
+    def __init__(
+        self,
+        router: Router,
+        on_error: Optional[ErrorHandler] = None,
+        max_workers: Optional[int] = None,
+        max_async: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        send_message: Optional[MessageSender] = None,
+        batches: Optional[BatchCollector] = None,
+        classify: Optional[Classifier] = None,
+        admission: Optional[AdmissionController] = None,
+        client_id: str = "local",
+    ):
+        """Initialize dispatcher.
+
+        Args:
+            router: Maps a parsed message to the :class:`Route` executing it.
+            on_error: Called when a route raises; used to send error responses.
+            max_workers: Size of the thread pool for blocking handlers.
+            max_async: Number of concurrently executing requests.
+            queue_size: Maximum number of parsed requests waiting for a worker.
+            send_message: Writes a response object or a list of them (batches).
+            batches: Collector the response path checks for batched requests.
+            classify: Maps a message to its cost class (reads if not given).
+            admission: Admission controller queuing requests per cost class.
+            client_id: Client the requests come from, for per-client rate limits.
+        """
+        self.router = router
+        self.on_error = on_error
+        self.send_message = send_message
+        self.batches = batches or BatchCollector()
+        self.max_workers = max_workers or int(os.getenv("MCP_MAX_WORKERS", "8"))
+        self.max_async = max_async or int(
+            os.getenv("MCP_MAX_CONCURRENT_REQUESTS", str(self.max_workers * 2))
+        )
+        self.queue_size = queue_size or int(os.getenv("MCP_REQUEST_QUEUE_SIZE", "256"))
+        self.classify = classify
+        self.admission = admission or AdmissionController(max_depth=self.queue_size)
+        self.client_id = client_id
+
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        # Cancel tokens of queued and running requests by id
+        self.requests: Dict[Any, CancelToken] = {}
+
+        self.stats = {
+            "received": 0,
+            "completed": 0,
+            "failed": 0,
+            "invalid": 0,
+            "in_flight": 0,
+            "batches": 0,
+            "cancelled": 0,
+            "timeouts": 0,
+            "shed": 0,
+        }
+
+    async def run(self, stream: Optional[TextIO] = None) -> None:
+        """Serve requests from ``stream`` until EOF, then drain in-flight work."""
+        stream = stream or sys.stdin
+        self.loop = asyncio.get_running_loop()
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="mcp-worker"
+        )
+
+        workers = [
+            asyncio.create_task(self._worker(i), name=f"mcp-dispatch-{i}")
+            for i in range(self.max_async)
+        ]
+        reader = asyncio.create_task(self._reader(stream), name="mcp-reader")
+
+        try:
+            await reader
+            await self.admission.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.executor.shutdown(wait=True)
+            logger.info(f"Dispatcher stopped: {self.get_statistics()}")
+
+    async def _reader(self, stream: TextIO) -> None:
+        """Read lines from the stream and queue parsed messages."""
+        while True:
+            # Reading happens off-loop so a quiet client never blocks workers
+            line = await self.loop.run_in_executor(None, stream.readline)
+            if not line:
+                logger.info("Input stream closed, stopping reader")
+                return
+
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                self.stats["invalid"] += 1
+                logger.error(f"Invalid JSON: {line}")
+                continue
+
+            if isinstance(message, list):
+                await self._queue_batch(message)
+            elif isinstance(message, dict) and message.get("method") in CANCEL_METHODS:
+                self._handle_cancel(message)
+            else:
+                await self._enqueue(message)
+
+    async def _enqueue(self, message: Dict[str, Any], batch: Optional[Batch] = None):
+        """Admit one request with a cancel token keyed by its id, or shed it."""
+        self.stats["received"] += 1
+        token = None
+        request_id = message.get("id") if isinstance(message, dict) else None
+        if request_id is not None and _hashable(request_id):
+            token = CancelToken(request_id)
+            self.requests[request_id] = token
+
+        cost = self.classify(message) if self.classify else None
+        busy = await self.admission.admit((message, batch, token), cost, self.client_id)
+        if busy is None:
+            return
+
+        # Shed: answer right away so the client can back off and retry
+        self.stats["shed"] += 1
+        if token is not None:
+            del self.requests[request_id]
+        self._respond_error(message, busy)
+        self._finish_batch(batch)
+
+    def _finish_batch(self, batch: Optional[Batch]) -> None:
+        """Count one batch member done, sending the batch once all are."""
+        if batch is not None and self.batches.finish(batch):
+            # Notifications-only batches get no response at all
+            if batch.responses:
+                self._send(batch.responses)
+
+    def _handle_cancel(self, message: Dict[str, Any]) -> None:
+        """Apply a cancellation notification."""
+        params = message.get("params") or {}
+        request_id = params.get(CANCEL_METHODS[message["method"]])
+        self.cancel(request_id, params.get("reason") or "cancelled by client")
+
+    def cancel(self, request_id: Any, reason: str = "cancelled") -> bool:
+        """Cancel a queued or running request; returns False if unknown."""
+        token = self.requests.get(request_id) if _hashable(request_id) else None
+        if token is None:
+            logger.info(f"Cancel for unknown or finished request {request_id}")
+            return False
+        logger.info(f"Cancelling request {request_id}: {reason}")
+        return token.cancel(reason)
+
+    async def _queue_batch(self, messages: List[Any]) -> None:
+        """Queue every call of a batch array, collecting their responses."""
+        if not messages:
+            self.stats["invalid"] += 1
+            self._send({"jsonrpc": "2.0", "id": None, "error": INVALID_REQUEST})
+            return
+
+        for message in messages:
+            if isinstance(message, dict) and message.get("method") in CANCEL_METHODS:
+                self._handle_cancel(message)
+
+        calls = [
+            m
+            for m in messages
+            if isinstance(m, dict) and m.get("method") not in CANCEL_METHODS
+        ]
+        invalid = sum(1 for m in messages if not isinstance(m, dict))
+        self.stats["batches"] += 1
+        self.stats["invalid"] += invalid
+
+        batch = self.batches.open(calls)
+        batch.responses.extend(
+            {"jsonrpc": "2.0", "id": None, "error": INVALID_REQUEST}
+            for _ in range(invalid)
+        )
+        if not calls:
+            if batch.responses:
+                self._send(batch.responses)
+            return
+
+        for message in calls:
+            await self._enqueue(message, batch)
+
+    async def _worker(self, worker_id: int) -> None:
+        """Execute queued messages one at a time."""
+        while True:
+            (message, batch, token), cost_class = await self.admission.get()
+            self.stats["in_flight"] += 1
+            start = time.perf_counter()
+            try:
+                if token is not None and token.cancelled:
+                    # Cancelled while waiting in the queue: never started
+                    self.stats["cancelled"] += 1
+                else:
+                    await self.dispatch(message, token)
+                    self.stats["completed"] += 1
+            except Exception as e:
+                self.stats["failed"] += 1
+                logger.error(f"Dispatcher worker {worker_id} error: {e}")
+                if self.on_error:
+                    self.on_error(message, e)
+            finally:
+                self.stats["in_flight"] -= 1
+                if token is not None and self.requests.get(token.request_id) is token:
+                    del self.requests[token.request_id]
+                self._finish_batch(batch)
+                await self.admission.done(
+                    cost_class, (time.perf_counter() - start) * 1000
+                )
+
+    def _send(self, message: Any) -> None:
+        if self.send_message is None:
+            logger.warning("No sender configured, dropping response")
+            return
+        self.send_message(message)
+
+    async def dispatch(
+        self, message: Dict[str, Any], token: Optional[CancelToken] = None
+    ) -> Any:
+        """Route and execute a single message according to its mode.
+
+        Returns None without a response if the request is cancelled, and sends
+        a timeout error if it outlives the route's deadline.
+        """
+        route = self.router(message)
+        token = token or CancelToken(message.get("id"))
+        token.start(route.timeout)
+
+        if route.mode == MODE_INLINE:
+            with bind_token(token):
+                return route.func()
+
+        task = asyncio.ensure_future(self._execute(route, token))
+        loop = self.loop or asyncio.get_running_loop()
+        token.add_callback(lambda: loop.call_soon_threadsafe(task.cancel))
+        try:
+            done, _ = await asyncio.wait({task}, timeout=route.timeout)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+
+        if not done:
+            token.cancel("timed out")
+            self.stats["timeouts"] += 1
+            logger.warning(
+                f"Request {message.get('id')} timed out after {route.timeout}s"
+            )
+            self._respond_error(
+                message,
+                {
+                    "code": REQUEST_TIMEOUT,
+                    "message": f"Request timed out after {route.timeout}s",
+                },
+            )
+            return None
+        if task.cancelled():
+            self.stats["cancelled"] += 1
+            return None
+        return task.result()
+
+    async def _execute(self, route: Route, token: CancelToken) -> Any:
+        """Run a non-inline route with its cancel token bound."""
+        with bind_token(token):
+            if route.mode == MODE_ASYNC:
+                return await route.func()
+            # Carry the token into the worker thread
+            context = contextvars.copy_context()
+            return await self.loop.run_in_executor(
+                self.executor, context.run, route.func
+            )
+
+    def _respond_error(self, message: Dict[str, Any], error: Dict[str, Any]) -> None:
+        request_id = message.get("id")
+        if request_id is None:
+            return
+        response = {"jsonrpc": "2.0", "id": request_id, "error": error}
+        if not self.batches.collect(request_id, response):
+            self._send(response)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get dispatcher statistics."""
+        return {
+            **self.stats,
+            "queued": self.admission.depth(),
+            "max_workers": self.max_workers,
+            "max_async": self.max_async,
+            "queue_size": self.queue_size,
+            "admission": self.admission.get_statistics(),
+        }
@@ -2,6 +2,9 @@
 
 from typing import Dict, Any, List
 
+from ..admission import LLM, WRITE
+from ..registry import tool_registry
+
 
 def get_autogen_tools() -> List[Dict[str, Any]]:
     """Get Enhanced AutoGen Integration MCP tools definitions."""
@@ -147,321 +150,355 @@ def get_autogen_tools() -> List[Dict[str, Any]]:
     ]
 
 
-def handle_autogen_tool(
-    tool_name: str, arguments: Dict[str, Any], request_id: str, send_response
-) -> bool:
-    """Handle Enhanced AutoGen Integration tool calls."""
+tool = tool_registry.bind(get_autogen_tools(), group="autogen")
 
-    if tool_name == "create_agent":
-        try:
-            from src.llm.enhanced_autogen import get_enhanced_autogen, AgentRole
-
-            agent_id = arguments.get("agent_id")
-            role_name = arguments.get("role_name")
-            capabilities = arguments.get("capabilities", [])
-            system_message = arguments.get("system_message")
-            project_id = arguments.get("project_id")
-
-            if not all([agent_id, role_name, capabilities, system_message]):
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "Missing required parameters"},
-                )
-                return True
-
-            # Create agent role
-            role = AgentRole(
-                role_name=role_name,
-                capabilities=capabilities,
-                system_message=system_message,
-            )
 
-            enhanced_autogen = get_enhanced_autogen()
-            agent_info = enhanced_autogen.create_agent(agent_id, role, project_id)
+@tool("create_agent", cost=WRITE)
+def handle_create_agent(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the create_agent tool."""
+    try:
+        from src.llm.enhanced_autogen import get_enhanced_autogen, AgentRole
+
+        agent_id = arguments.get("agent_id")
+        role_name = arguments.get("role_name")
+        capabilities = arguments.get("capabilities", [])
+        system_message = arguments.get("system_message")
+        project_id = arguments.get("project_id")
 
+        if not all([agent_id, role_name, capabilities, system_message]):
             send_response(
                 request_id,
-                {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Created agent '{agent_id}' with role '{role_name}'",
-                        }
-                    ],
-                    "structuredContent": {"success": True, "agent_info": agent_info},
-                },
+                error={"code": -32602, "message": "Missing required parameters"},
             )
-        except Exception as e:
+            return
+
+        # Create agent role
+        role = AgentRole(
+            role_name=role_name,
+            capabilities=capabilities,
+            system_message=system_message,
+        )
+
+        enhanced_autogen = get_enhanced_autogen()
+        agent_info = enhanced_autogen.create_agent(agent_id, role, project_id)
+
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Created agent '{agent_id}' with role '{role_name}'",
+                    }
+                ],
+                "structuredContent": {"success": True, "agent_info": agent_info},
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error creating agent: {str(e)}"},
+        )
+
+
+@tool("create_group_chat", cost=WRITE)
+def handle_create_group_chat(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the create_group_chat tool."""
+    try:
+        from src.llm.enhanced_autogen import get_enhanced_autogen
+
+        chat_id = arguments.get("chat_id")
+        agents = arguments.get("agents", [])
+        project_id = arguments.get("project_id")
+
+        if not all([chat_id, agents]):
             send_response(
                 request_id,
-                error={"code": -32603, "message": f"Error creating agent: {str(e)}"},
+                error={"code": -32602, "message": "Missing required parameters"},
             )
-        return True
+            return
 
-    elif tool_name == "create_group_chat":
-        try:
-            from src.llm.enhanced_autogen import get_enhanced_autogen
+        enhanced_autogen = get_enhanced_autogen()
+        chat_info = enhanced_autogen.create_group_chat(chat_id, agents, project_id)
 
-            chat_id = arguments.get("chat_id")
-            agents = arguments.get("agents", [])
-            project_id = arguments.get("project_id")
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Created group chat '{chat_id}' with {len(agents)} agents",
+                    }
+                ],
+                "structuredContent": {"success": True, "chat_info": chat_info},
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error creating group chat: {str(e)}",
+            },
+        )
 
-            if not all([chat_id, agents]):
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "Missing required parameters"},
-                )
-                return True
 
-            enhanced_autogen = get_enhanced_autogen()
-            chat_info = enhanced_autogen.create_group_chat(chat_id, agents, project_id)
+@tool("start_workflow", cost=LLM)
+def handle_start_workflow(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the start_workflow tool."""
+    try:
+        from src.llm.enhanced_autogen import get_enhanced_autogen
 
+        workflow_id = arguments.get("workflow_id")
+        workflow_type = arguments.get("workflow_type")
+        participants = arguments.get("participants", [])
+
+        if not all([workflow_id, workflow_type, participants]):
             send_response(
                 request_id,
-                {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Created group chat '{chat_id}' with {len(agents)} agents",
-                        }
-                    ],
-                    "structuredContent": {"success": True, "chat_info": chat_info},
-                },
+                error={"code": -32602, "message": "Missing required parameters"},
             )
-        except Exception as e:
+            return
+
+        enhanced_autogen = get_enhanced_autogen()
+        workflow_info = enhanced_autogen.start_workflow(
+            workflow_id, workflow_type, participants
+        )
+
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Started workflow '{workflow_id}' of type '{workflow_type}'",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "workflow_info": workflow_info,
+                },
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error starting workflow: {str(e)}"},
+        )
+
+
+@tool("get_roles", cache_tags=("autogen",))
+def handle_get_roles(arguments: Dict[str, Any], request_id: str, send_response) -> None:
+    """Handle the get_roles tool."""
+    try:
+        from src.llm.enhanced_autogen import get_enhanced_autogen
+
+        enhanced_autogen = get_enhanced_autogen()
+        roles = enhanced_autogen.get_roles()
+
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Retrieved {len(roles)} available roles",
+                    }
+                ],
+                "structuredContent": {"success": True, "roles": roles},
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error getting roles: {str(e)}"},
+        )
+
+
+@tool("get_workflows", cache_tags=("autogen",))
+def handle_get_workflows(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_workflows tool."""
+    try:
+        from src.llm.enhanced_autogen import get_enhanced_autogen
+
+        enhanced_autogen = get_enhanced_autogen()
+        workflows = enhanced_autogen.get_workflows()
+
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Retrieved {len(workflows)} available workflows",
+                    }
+                ],
+                "structuredContent": {"success": True, "workflows": workflows},
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error getting workflows: {str(e)}"},
+        )
+
+
+@tool("get_agent_info")
+def handle_get_agent_info(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_agent_info tool."""
+    try:
+        from src.llm.enhanced_autogen import get_enhanced_autogen
+
+        agent_id = arguments.get("agent_id")
+
+        if not agent_id:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error creating group chat: {str(e)}",
-                },
-            )
-        return True
-
-    elif tool_name == "start_workflow":
-        try:
-            from src.llm.enhanced_autogen import get_enhanced_autogen
-
-            workflow_id = arguments.get("workflow_id")
-            workflow_type = arguments.get("workflow_type")
-            participants = arguments.get("participants", [])
-
-            if not all([workflow_id, workflow_type, participants]):
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "Missing required parameters"},
-                )
-                return True
-
-            enhanced_autogen = get_enhanced_autogen()
-            workflow_info = enhanced_autogen.start_workflow(
-                workflow_id, workflow_type, participants
+                error={"code": -32602, "message": "agent_id is required"},
             )
+            return
+
+        enhanced_autogen = get_enhanced_autogen()
+        agent_info = enhanced_autogen.get_agent_info(agent_id)
 
+        if agent_info:
             send_response(
                 request_id,
                 {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"Started workflow '{workflow_id}' of type '{workflow_type}'",
+                            "text": f"Retrieved information for agent '{agent_id}'",
                         }
                     ],
                     "structuredContent": {
                         "success": True,
-                        "workflow_info": workflow_info,
+                        "agent_info": agent_info,
                     },
                 },
             )
-        except Exception as e:
+        else:
             send_response(
                 request_id,
-                error={"code": -32603, "message": f"Error starting workflow: {str(e)}"},
+                error={"code": -32601, "message": f"Agent '{agent_id}' not found"},
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting agent info: {str(e)}",
+            },
+        )
 
-    elif tool_name == "get_roles":
-        try:
-            from src.llm.enhanced_autogen import get_enhanced_autogen
 
-            enhanced_autogen = get_enhanced_autogen()
-            roles = enhanced_autogen.get_roles()
+@tool("get_chat_info")
+def handle_get_chat_info(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_chat_info tool."""
+    try:
+        from src.llm.enhanced_autogen import get_enhanced_autogen
 
+        chat_id = arguments.get("chat_id")
+
+        if not chat_id:
             send_response(
-                request_id,
-                {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Retrieved {len(roles)} available roles",
-                        }
-                    ],
-                    "structuredContent": {"success": True, "roles": roles},
-                },
-            )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={"code": -32603, "message": f"Error getting roles: {str(e)}"},
+                request_id, error={"code": -32602, "message": "chat_id is required"}
             )
-        return True
-
-    elif tool_name == "get_workflows":
-        try:
-            from src.llm.enhanced_autogen import get_enhanced_autogen
+            return
 
-            enhanced_autogen = get_enhanced_autogen()
-            workflows = enhanced_autogen.get_workflows()
+        enhanced_autogen = get_enhanced_autogen()
+        chat_info = enhanced_autogen.get_chat_info(chat_id)
 
+        if chat_info:
             send_response(
                 request_id,
                 {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"Retrieved {len(workflows)} available workflows",
+                            "text": f"Retrieved information for chat '{chat_id}'",
                         }
                     ],
-                    "structuredContent": {"success": True, "workflows": workflows},
+                    "structuredContent": {"success": True, "chat_info": chat_info},
                 },
             )
-        except Exception as e:
+        else:
             send_response(
                 request_id,
-                error={"code": -32603, "message": f"Error getting workflows: {str(e)}"},
+                error={"code": -32601, "message": f"Chat '{chat_id}' not found"},
             )
-        return True
-
-    elif tool_name == "get_agent_info":
-        try:
-            from src.llm.enhanced_autogen import get_enhanced_autogen
-
-            agent_id = arguments.get("agent_id")
-
-            if not agent_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "agent_id is required"},
-                )
-                return True
-
-            enhanced_autogen = get_enhanced_autogen()
-            agent_info = enhanced_autogen.get_agent_info(agent_id)
-
-            if agent_info:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Retrieved information for agent '{agent_id}'",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "agent_info": agent_info,
-                        },
-                    },
-                )
-            else:
-                send_response(
-                    request_id,
-                    error={"code": -32601, "message": f"Agent '{agent_id}' not found"},
-                )
-        except Exception as e:
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error getting chat info: {str(e)}"},
+        )
+
+
+@tool("start_conversation", cost=LLM)
+def handle_start_conversation(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the start_conversation tool."""
+    try:
+        from src.llm.enhanced_autogen import get_enhanced_autogen
+
+        conversation_id = arguments.get("conversation_id")
+        participants = arguments.get("participants", [])
+        conversation_type = arguments.get("conversation_type", "general")
+
+        if not all([conversation_id, participants]):
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting agent info: {str(e)}",
-                },
+                error={"code": -32602, "message": "Missing required parameters"},
             )
-        return True
-
-    elif tool_name == "get_chat_info":
-        try:
-            from src.llm.enhanced_autogen import get_enhanced_autogen
+            return
 
-            chat_id = arguments.get("chat_id")
+        enhanced_autogen = get_enhanced_autogen()
+        conversation_info = enhanced_autogen.start_conversation(
+            conversation_id, participants, conversation_type
+        )
 
-            if not chat_id:
-                send_response(
-                    request_id, error={"code": -32602, "message": "chat_id is required"}
-                )
-                return True
-
-            enhanced_autogen = get_enhanced_autogen()
-            chat_info = enhanced_autogen.get_chat_info(chat_id)
-
-            if chat_info:
-                send_response(
-                    request_id,
+        send_response(
+            request_id,
+            {
+                "content": [
                     {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Retrieved information for chat '{chat_id}'",
-                            }
-                        ],
-                        "structuredContent": {"success": True, "chat_info": chat_info},
-                    },
-                )
-            else:
-                send_response(
-                    request_id,
-                    error={"code": -32601, "message": f"Chat '{chat_id}' not found"},
-                )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={"code": -32603, "message": f"Error getting chat info: {str(e)}"},
-            )
-        return True
-
-    elif tool_name == "start_conversation":
-        try:
-            from src.llm.enhanced_autogen import get_enhanced_autogen
-
-            conversation_id = arguments.get("conversation_id")
-            participants = arguments.get("participants", [])
-            conversation_type = arguments.get("conversation_type", "general")
-
-            if not all([conversation_id, participants]):
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "Missing required parameters"},
-                )
-                return True
-
-            enhanced_autogen = get_enhanced_autogen()
-            conversation_info = enhanced_autogen.start_conversation(
-                conversation_id, participants, conversation_type
-            )
-
-            send_response(
-                request_id,
-                {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Started conversation '{conversation_id}' with {len(participants)} participants",
-                        }
-                    ],
-                    "structuredContent": {
-                        "success": True,
-                        "conversation_info": conversation_info,
-                    },
-                },
-            )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error starting conversation: {str(e)}",
+                        "type": "text",
+                        "text": f"Started conversation '{conversation_id}' with {len(participants)} participants",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "conversation_info": conversation_info,
                 },
-            )
-        return True
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error starting conversation: {str(e)}",
+            },
+        )
+
 
-    return False
+def handle_autogen_tool(
+    tool_name: str, arguments: Dict[str, Any], request_id: str, send_response
+) -> bool:
+    """Handle Enhanced AutoGen Integration tool calls."""
+    return tool_registry.dispatch(
+        tool_name, arguments, request_id, send_response, group="autogen"
+    )
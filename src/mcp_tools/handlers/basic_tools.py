@@ -2,6 +2,8 @@
 
 from typing import Dict, Any, List
 
+from ..registry import tool_registry
+
 
 def get_basic_tools() -> List[Dict[str, Any]]:
     """Get basic MCP tools definitions."""
@@ -27,37 +29,48 @@ def get_basic_tools() -> List[Dict[str, Any]]:
     ]
 
 
+tool = tool_registry.bind(get_basic_tools(), group="basic")
+
+
+@tool("add_numbers", blocking=False)
+def handle_add_numbers(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the add_numbers tool."""
+    a = arguments.get("a", 0)
+    b = arguments.get("b", 0)
+    result = a + b
+    send_response(
+        request_id,
+        {
+            "content": [
+                {"type": "text", "text": f"The sum of {a} and {b} is {result}"}
+            ],
+            "structuredContent": {"result": result},
+        },
+    )
+
+
+@tool("reverse_text", blocking=False)
+def handle_reverse_text(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the reverse_text tool."""
+    text = arguments.get("text", "")
+    result = text[::-1]
+    send_response(
+        request_id,
+        {
+            "content": [{"type": "text", "text": f"'{text}' reversed is '{result}'"}],
+            "structuredContent": {"result": result},
+        },
+    )
+
+
 def handle_basic_tool(
     tool_name: str, arguments: Dict[str, Any], request_id: str, send_response
 ) -> bool:
     """Handle basic tool calls."""
-    if tool_name == "add_numbers":
-        a = arguments.get("a", 0)
-        b = arguments.get("b", 0)
-        result = a + b
-        send_response(
-            request_id,
-            {
-                "content": [
-                    {"type": "text", "text": f"The sum of {a} and {b} is {result}"}
-                ],
-                "structuredContent": {"result": result},
-            },
-        )
-        return True
-
-    elif tool_name == "reverse_text":
-        text = arguments.get("text", "")
-        result = text[::-1]
-        send_response(
-            request_id,
-            {
-                "content": [
-                    {"type": "text", "text": f"'{text}' reversed is '{result}'"}
-                ],
-                "structuredContent": {"result": result},
-            },
-        )
-        return True
-
-    return False
+    return tool_registry.dispatch(
+        tool_name, arguments, request_id, send_response, group="basic"
+    )
@@ -2,6 +2,9 @@
 
 from typing import Dict, Any, List
 
+from ..admission import WRITE
+from ..registry import tool_registry
+
 
 def get_communication_tools() -> List[Dict[str, Any]]:
     """Get Advanced Communication Features MCP tools definitions."""
@@ -98,326 +101,362 @@ def get_communication_tools() -> List[Dict[str, Any]]:
     ]
 
 
-def handle_communication_tool(
-    tool_name: str, arguments: Dict[str, Any], request_id: str, send_response
-) -> bool:
-    """Handle Advanced Communication Features tool calls."""
+tool = tool_registry.bind(get_communication_tools(), group="communication")
 
-    if tool_name == "send_message":
-        try:
-            from src.communication.advanced_communication import (
-                get_advanced_communication,
-            )
 
-            content = arguments.get("content")
-            sender = arguments.get("sender")
-            recipients = arguments.get("recipients", [])
-            message_type = arguments.get("message_type", "agent")
-            priority = arguments.get("priority", "normal")
-            compression = arguments.get("compression", False)
-            ttl = arguments.get("ttl")
-
-            if not all([content, sender, recipients]):
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "Missing required parameters"},
-                )
-                return True
-
-            advanced_comm = get_advanced_communication()
-            result = advanced_comm.send_message(
-                content=content,
-                sender=sender,
-                recipients=recipients,
-                message_type=message_type,
-                priority=priority,
-                compression=compression,
-                ttl=ttl,
-            )
+@tool("send_message", cost=WRITE)
+def handle_send_message(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the send_message tool."""
+    try:
+        from src.communication.advanced_communication import (
+            get_advanced_communication,
+        )
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Message sent successfully with ID: {result['message_id']}",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "message_id": result["message_id"],
-                            "routing_result": result["routing_result"],
-                            "compression_applied": result["compression_applied"],
-                        },
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        content = arguments.get("content")
+        sender = arguments.get("sender")
+        recipients = arguments.get("recipients", [])
+        message_type = arguments.get("message_type", "agent")
+        priority = arguments.get("priority", "normal")
+        compression = arguments.get("compression", False)
+        ttl = arguments.get("ttl")
+
+        if not all([content, sender, recipients]):
             send_response(
                 request_id,
-                error={"code": -32603, "message": f"Error sending message: {str(e)}"},
-            )
-        return True
-
-    elif tool_name == "get_analytics":
-        try:
-            from src.communication.advanced_communication import (
-                get_advanced_communication,
+                error={"code": -32602, "message": "Missing required parameters"},
             )
-
-            advanced_comm = get_advanced_communication()
-            analytics = advanced_comm.get_analytics()
-
+            return
+
+        advanced_comm = get_advanced_communication()
+        result = advanced_comm.send_message(
+            content=content,
+            sender=sender,
+            recipients=recipients,
+            message_type=message_type,
+            priority=priority,
+            compression=compression,
+            ttl=ttl,
+        )
+
+        if result["success"]:
             send_response(
                 request_id,
                 {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"Retrieved communication analytics: {analytics.get('total_messages', 0)} messages analyzed",
+                            "text": f"Message sent successfully with ID: {result['message_id']}",
                         }
                     ],
-                    "structuredContent": {"success": True, "analytics": analytics},
+                    "structuredContent": {
+                        "success": True,
+                        "message_id": result["message_id"],
+                        "routing_result": result["routing_result"],
+                        "compression_applied": result["compression_applied"],
+                    },
                 },
             )
-        except Exception as e:
+        else:
             send_response(
-                request_id,
-                error={"code": -32603, "message": f"Error getting analytics: {str(e)}"},
+                request_id, error={"code": -32603, "message": result["error"]}
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error sending message: {str(e)}"},
+        )
+
+
+@tool("get_analytics")
+def handle_get_analytics(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_analytics tool."""
+    try:
+        from src.communication.advanced_communication import (
+            get_advanced_communication,
+        )
+
+        advanced_comm = get_advanced_communication()
+        analytics = advanced_comm.get_analytics()
+
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Retrieved communication analytics: {analytics.get('total_messages', 0)} messages analyzed",
+                    }
+                ],
+                "structuredContent": {"success": True, "analytics": analytics},
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error getting analytics: {str(e)}"},
+        )
+
+
+@tool("get_queue_status")
+def handle_get_queue_status(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_queue_status tool."""
+    try:
+        from src.communication.advanced_communication import (
+            get_advanced_communication,
+        )
+
+        advanced_comm = get_advanced_communication()
+        queue_status = advanced_comm.get_queue_status()
+
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Retrieved queue status: {queue_status.get('total_messages', 0)} messages in queues",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "queue_status": queue_status,
+                },
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting queue status: {str(e)}",
+            },
+        )
 
-    elif tool_name == "get_queue_status":
-        try:
-            from src.communication.advanced_communication import (
-                get_advanced_communication,
-            )
 
-            advanced_comm = get_advanced_communication()
-            queue_status = advanced_comm.get_queue_status()
+@tool("enable_cross_project", cost=WRITE)
+def handle_enable_cross_project(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the enable_cross_project tool."""
+    try:
+        from src.communication.advanced_communication import (
+            get_advanced_communication,
+        )
 
+        advanced_comm = get_advanced_communication()
+        result = advanced_comm.enable_cross_project()
+
+        if result["success"]:
             send_response(
                 request_id,
                 {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"Retrieved queue status: {queue_status.get('total_messages', 0)} messages in queues",
+                            "text": "Cross-project communication enabled successfully",
                         }
                     ],
                     "structuredContent": {
                         "success": True,
-                        "queue_status": queue_status,
+                        "cross_project_enabled": result["cross_project_enabled"],
                     },
                 },
             )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting queue status: {str(e)}",
-                },
-            )
-        return True
-
-    elif tool_name == "enable_cross_project":
-        try:
-            from src.communication.advanced_communication import (
-                get_advanced_communication,
-            )
-
-            advanced_comm = get_advanced_communication()
-            result = advanced_comm.enable_cross_project()
-
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "Cross-project communication enabled successfully",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "cross_project_enabled": result["cross_project_enabled"],
-                        },
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error enabling cross-project communication: {str(e)}",
-                },
-            )
-        return True
-
-    elif tool_name == "disable_cross_project":
-        try:
-            from src.communication.advanced_communication import (
-                get_advanced_communication,
-            )
-
-            advanced_comm = get_advanced_communication()
-            result = advanced_comm.disable_cross_project()
-
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "Cross-project communication disabled successfully",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "cross_project_enabled": result["cross_project_enabled"],
-                        },
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        else:
             send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error disabling cross-project communication: {str(e)}",
-                },
-            )
-        return True
-
-    elif tool_name == "share_knowledge":
-        try:
-            from src.communication.advanced_communication import (
-                get_advanced_communication,
-            )
-
-            knowledge = arguments.get("knowledge")
-            source_project = arguments.get("source_project")
-            target_projects = arguments.get("target_projects", [])
-
-            if not all([knowledge, source_project, target_projects]):
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "Missing required parameters"},
-                )
-                return True
-
-            advanced_comm = get_advanced_communication()
-            result = advanced_comm.share_knowledge(
-                knowledge, source_project, target_projects
+                request_id, error={"code": -32603, "message": result["error"]}
             )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error enabling cross-project communication: {str(e)}",
+            },
+        )
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Knowledge shared from {source_project} to {len(target_projects)} projects",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "knowledge_shared": result["knowledge_shared"],
-                            "source_project": result["source_project"],
-                            "target_projects": result["target_projects"],
-                        },
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={"code": -32603, "message": f"Error sharing knowledge: {str(e)}"},
-            )
-        return True
 
-    elif tool_name == "get_compression_stats":
-        try:
-            from src.communication.advanced_communication import (
-                get_advanced_communication,
-            )
+@tool("disable_cross_project", cost=WRITE)
+def handle_disable_cross_project(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the disable_cross_project tool."""
+    try:
+        from src.communication.advanced_communication import (
+            get_advanced_communication,
+        )
 
-            advanced_comm = get_advanced_communication()
-            stats = advanced_comm.get_compression_stats()
+        advanced_comm = get_advanced_communication()
+        result = advanced_comm.disable_cross_project()
 
+        if result["success"]:
             send_response(
                 request_id,
                 {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"Retrieved compression stats: {stats.get('total_compressed', 0)} messages compressed",
+                            "text": "Cross-project communication disabled successfully",
                         }
                     ],
-                    "structuredContent": {"success": True, "compression_stats": stats},
+                    "structuredContent": {
+                        "success": True,
+                        "cross_project_enabled": result["cross_project_enabled"],
+                    },
                 },
             )
-        except Exception as e:
+        else:
             send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting compression stats: {str(e)}",
-                },
+                request_id, error={"code": -32603, "message": result["error"]}
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error disabling cross-project communication: {str(e)}",
+            },
+        )
+
 
-    elif tool_name == "get_message_types":
-        try:
-            from src.communication.advanced_communication import (
-                get_advanced_communication,
+@tool("share_knowledge", cost=WRITE)
+def handle_share_knowledge(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the share_knowledge tool."""
+    try:
+        from src.communication.advanced_communication import (
+            get_advanced_communication,
+        )
+
+        knowledge = arguments.get("knowledge")
+        source_project = arguments.get("source_project")
+        target_projects = arguments.get("target_projects", [])
+
+        if not all([knowledge, source_project, target_projects]):
+            send_response(
+                request_id,
+                error={"code": -32602, "message": "Missing required parameters"},
             )
+            return
 
-            advanced_comm = get_advanced_communication()
-            message_types = advanced_comm.get_message_types()
+        advanced_comm = get_advanced_communication()
+        result = advanced_comm.share_knowledge(
+            knowledge, source_project, target_projects
+        )
 
+        if result["success"]:
             send_response(
                 request_id,
                 {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"Retrieved {len(message_types)} message types",
+                            "text": f"Knowledge shared from {source_project} to {len(target_projects)} projects",
                         }
                     ],
                     "structuredContent": {
                         "success": True,
-                        "message_types": message_types,
+                        "knowledge_shared": result["knowledge_shared"],
+                        "source_project": result["source_project"],
+                        "target_projects": result["target_projects"],
                     },
                 },
             )
-        except Exception as e:
+        else:
             send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting message types: {str(e)}",
-                },
+                request_id, error={"code": -32603, "message": result["error"]}
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error sharing knowledge: {str(e)}"},
+        )
+
+
+@tool("get_compression_stats")
+def handle_get_compression_stats(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_compression_stats tool."""
+    try:
+        from src.communication.advanced_communication import (
+            get_advanced_communication,
+        )
+
+        advanced_comm = get_advanced_communication()
+        stats = advanced_comm.get_compression_stats()
+
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Retrieved compression stats: {stats.get('total_compressed', 0)} messages compressed",
+                    }
+                ],
+                "structuredContent": {"success": True, "compression_stats": stats},
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting compression stats: {str(e)}",
+            },
+        )
+
+
+@tool("get_message_types")
+def handle_get_message_types(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_message_types tool."""
+    try:
+        from src.communication.advanced_communication import (
+            get_advanced_communication,
+        )
+
+        advanced_comm = get_advanced_communication()
+        message_types = advanced_comm.get_message_types()
+
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Retrieved {len(message_types)} message types",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "message_types": message_types,
+                },
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting message types: {str(e)}",
+            },
+        )
 
-    return False
+
+def handle_communication_tool(
+    tool_name: str, arguments: Dict[str, Any], request_id: str, send_response
+) -> bool:
+    """Handle Advanced Communication Features tool calls."""
+    return tool_registry.dispatch(
+        tool_name, arguments, request_id, send_response, group="communication"
+    )
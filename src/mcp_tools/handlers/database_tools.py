@@ -1,6 +1,9 @@
 """Database Management MCP tools for project-specific Qdrant databases."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Generator, List
+
+from ..admission import WRITE
+from ..registry import tool_registry
 
 
 def get_database_tools() -> List[Dict[str, Any]]:
@@ -143,489 +146,529 @@ def get_database_tools() -> List[Dict[str, Any]]:
     ]
 
 
-def handle_database_tool(
-    tool_name: str, arguments: Dict[str, Any], request_id: str, send_response
-) -> bool:
-    """Handle Database Management tool calls."""
+tool = tool_registry.bind(get_database_tools(), group="database")
 
-    if tool_name == "start_container":
-        try:
-            from src.database.docker_manager import get_docker_manager
 
-            docker_manager = get_docker_manager()
-            success = docker_manager.start_qdrant_container()
+@tool("start_container", timeout=180, cost=WRITE)
+def handle_start_container(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the start_container tool."""
+    try:
+        from src.database.docker_manager import get_docker_manager
 
-            if success:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "Qdrant container started successfully",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "message": "Container started",
-                        },
+        docker_manager = get_docker_manager()
+        success = docker_manager.start_qdrant_container()
+
+        if success:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "Qdrant container started successfully",
+                        }
+                    ],
+                    "structuredContent": {
+                        "success": True,
+                        "message": "Container started",
                     },
-                )
-            else:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {"type": "text", "text": "Failed to start Qdrant container"}
-                        ],
-                        "structuredContent": {
-                            "success": False,
-                            "message": "Container start failed",
-                        },
+                },
+            )
+        else:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {"type": "text", "text": "Failed to start Qdrant container"}
+                    ],
+                    "structuredContent": {
+                        "success": False,
+                        "message": "Container start failed",
                     },
-                )
-        except Exception as e:
+                },
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error starting container: {str(e)}",
+            },
+        )
+
+
+@tool("create_database", cost=WRITE)
+def handle_create_database(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the create_database tool."""
+    try:
+        from src.database.project_manager import get_project_manager
+
+        project_name = arguments.get("project_name")
+        project_id = arguments.get("project_id")
+
+        if not project_name:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error starting container: {str(e)}",
+                error={"code": -32602, "message": "project_name is required"},
+            )
+            return
+
+        project_manager = get_project_manager()
+        project = project_manager.create_project_database(project_name, project_id)
+
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Created project database '{project_name}' with ID: {project.project_id}",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "project_id": project.project_id,
+                    "project_name": project.project_name,
+                    "database_name": project.database_name,
+                    "collections": list(project.collections.keys()),
                 },
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error creating database: {str(e)}"},
+        )
+
+
+@tool("list_databases")
+def handle_list_databases(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the list_databases tool."""
+    try:
+        from src.database.project_manager import get_project_manager
+
+        project_manager = get_project_manager()
+        projects = project_manager.list_project_databases()
+
+        project_list = []
+        for project in projects:
+            project_list.append(
+                {
+                    "project_id": project.project_id,
+                    "project_name": project.project_name,
+                    "database_name": project.database_name,
+                    "status": project.status,
+                    "created_at": project.created_at.isoformat(),
+                }
             )
-        return True
 
-    elif tool_name == "create_database":
-        try:
-            from src.database.project_manager import get_project_manager
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Found {len(project_list)} project databases",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "projects": project_list,
+                    "count": len(project_list),
+                },
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error listing databases: {str(e)}"},
+        )
+
 
-            project_name = arguments.get("project_name")
-            project_id = arguments.get("project_id")
+@tool("switch_database", cost=WRITE)
+def handle_switch_database(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the switch_database tool."""
+    try:
+        from src.database.enhanced_vector_store import get_enhanced_vector_store
 
-            if not project_name:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_name is required"},
-                )
-                return True
+        project_id = arguments.get("project_id")
 
-            project_manager = get_project_manager()
-            project = project_manager.create_project_database(project_name, project_id)
+        if not project_id:
+            send_response(
+                request_id,
+                error={"code": -32602, "message": "project_id is required"},
+            )
+            return
 
+        vector_store = get_enhanced_vector_store()
+        success = vector_store.set_current_project(project_id)
+
+        if success:
             send_response(
                 request_id,
                 {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"Created project database '{project_name}' with ID: {project.project_id}",
+                            "text": f"Switched to project database: {project_id}",
                         }
                     ],
                     "structuredContent": {
                         "success": True,
-                        "project_id": project.project_id,
-                        "project_name": project.project_name,
-                        "database_name": project.database_name,
-                        "collections": list(project.collections.keys()),
+                        "project_id": project_id,
                     },
                 },
             )
-        except Exception as e:
+        else:
             send_response(
                 request_id,
-                error={"code": -32603, "message": f"Error creating database: {str(e)}"},
+                error={
+                    "code": -32603,
+                    "message": f"Failed to switch to project: {project_id}",
+                },
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error switching database: {str(e)}",
+            },
+        )
 
-    elif tool_name == "list_databases":
-        try:
-            from src.database.project_manager import get_project_manager
 
-            project_manager = get_project_manager()
-            projects = project_manager.list_project_databases()
+@tool("archive_database", cost=WRITE)
+def handle_archive_database(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the archive_database tool."""
+    try:
+        from src.database.project_manager import get_project_manager
 
-            project_list = []
-            for project in projects:
-                project_list.append(
-                    {
-                        "project_id": project.project_id,
-                        "project_name": project.project_name,
-                        "database_name": project.database_name,
-                        "status": project.status,
-                        "created_at": project.created_at.isoformat(),
-                    }
-                )
+        project_id = arguments.get("project_id")
+
+        if not project_id:
+            send_response(
+                request_id,
+                error={"code": -32602, "message": "project_id is required"},
+            )
+            return
+
+        project_manager = get_project_manager()
+        success = project_manager.archive_project_database(project_id)
 
+        if success:
             send_response(
                 request_id,
                 {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"Found {len(project_list)} project databases",
+                            "text": f"Archived project database: {project_id}",
                         }
                     ],
                     "structuredContent": {
                         "success": True,
-                        "projects": project_list,
-                        "count": len(project_list),
+                        "project_id": project_id,
+                        "action": "archived",
                     },
                 },
             )
-        except Exception as e:
+        else:
             send_response(
                 request_id,
-                error={"code": -32603, "message": f"Error listing databases: {str(e)}"},
+                error={
+                    "code": -32603,
+                    "message": f"Failed to archive project: {project_id}",
+                },
             )
-        return True
-
-    elif tool_name == "switch_database":
-        try:
-            from src.database.enhanced_vector_store import get_enhanced_vector_store
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error archiving database: {str(e)}",
+            },
+        )
 
-            project_id = arguments.get("project_id")
 
-            if not project_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_id is required"},
-                )
-                return True
+@tool("restore_database", cost=WRITE)
+def handle_restore_database(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the restore_database tool."""
+    try:
+        from src.database.project_manager import get_project_manager
 
-            vector_store = get_enhanced_vector_store()
-            success = vector_store.set_current_project(project_id)
+        project_id = arguments.get("project_id")
 
-            if success:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Switched to project database: {project_id}",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "project_id": project_id,
-                        },
-                    },
-                )
-            else:
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32603,
-                        "message": f"Failed to switch to project: {project_id}",
-                    },
-                )
-        except Exception as e:
+        if not project_id:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error switching database: {str(e)}",
-                },
+                error={"code": -32602, "message": "project_id is required"},
             )
-        return True
+            return
+
+        project_manager = get_project_manager()
+        # Note: restore functionality would need to be implemented in project_manager
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Restore functionality for project {project_id} - not yet implemented",
+                    }
+                ],
+                "structuredContent": {
+                    "success": False,
+                    "message": "Restore not implemented",
+                    "project_id": project_id,
+                },
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error restoring database: {str(e)}",
+            },
+        )
 
-    elif tool_name == "archive_database":
-        try:
-            from src.database.project_manager import get_project_manager
 
-            project_id = arguments.get("project_id")
+@tool("delete_database", cost=WRITE)
+def handle_delete_database(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the delete_database tool."""
+    try:
+        from src.database.project_manager import get_project_manager
 
-            if not project_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_id is required"},
-                )
-                return True
+        project_id = arguments.get("project_id")
+        confirm = arguments.get("confirm", False)
 
-            project_manager = get_project_manager()
-            success = project_manager.archive_project_database(project_id)
+        if not project_id:
+            send_response(
+                request_id,
+                error={"code": -32602, "message": "project_id is required"},
+            )
+            return
 
-            if success:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Archived project database: {project_id}",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "project_id": project_id,
-                            "action": "archived",
-                        },
-                    },
-                )
-            else:
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32603,
-                        "message": f"Failed to archive project: {project_id}",
-                    },
-                )
-        except Exception as e:
+        if not confirm:
             send_response(
                 request_id,
                 error={
-                    "code": -32603,
-                    "message": f"Error archiving database: {str(e)}",
+                    "code": -32602,
+                    "message": "confirmation required for deletion",
                 },
             )
-        return True
-
-    elif tool_name == "restore_database":
-        try:
-            from src.database.project_manager import get_project_manager
+            return
 
-            project_id = arguments.get("project_id")
+        project_manager = get_project_manager()
+        success = project_manager.delete_project_database(project_id)
 
-            if not project_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_id is required"},
-                )
-                return True
-
-            project_manager = get_project_manager()
-            # Note: restore functionality would need to be implemented in project_manager
+        if success:
             send_response(
                 request_id,
                 {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"Restore functionality for project {project_id} - not yet implemented",
+                            "text": f"Deleted project database: {project_id}",
                         }
                     ],
                     "structuredContent": {
-                        "success": False,
-                        "message": "Restore not implemented",
+                        "success": True,
                         "project_id": project_id,
+                        "action": "deleted",
                     },
                 },
             )
-        except Exception as e:
+        else:
             send_response(
                 request_id,
                 error={
                     "code": -32603,
-                    "message": f"Error restoring database: {str(e)}",
+                    "message": f"Failed to delete project: {project_id}",
                 },
             )
-        return True
-
-    elif tool_name == "delete_database":
-        try:
-            from src.database.project_manager import get_project_manager
-
-            project_id = arguments.get("project_id")
-            confirm = arguments.get("confirm", False)
-
-            if not project_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_id is required"},
-                )
-                return True
-
-            if not confirm:
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32602,
-                        "message": "confirmation required for deletion",
-                    },
-                )
-                return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error deleting database: {str(e)}"},
+        )
 
-            project_manager = get_project_manager()
-            success = project_manager.delete_project_database(project_id)
 
-            if success:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Deleted project database: {project_id}",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "project_id": project_id,
-                            "action": "deleted",
-                        },
-                    },
-                )
-            else:
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32603,
-                        "message": f"Failed to delete project: {project_id}",
-                    },
-                )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={"code": -32603, "message": f"Error deleting database: {str(e)}"},
-            )
-        return True
+@tool("get_stats")
+def handle_get_stats(arguments: Dict[str, Any], request_id: str, send_response) -> None:
+    """Handle the get_stats tool."""
+    try:
+        from src.database.project_manager import get_project_manager
+        from src.database.enhanced_vector_store import get_enhanced_vector_store
+
+        project_id = arguments.get("project_id")
 
-    elif tool_name == "get_stats":
-        try:
-            from src.database.project_manager import get_project_manager
-            from src.database.enhanced_vector_store import get_enhanced_vector_store
+        project_manager = get_project_manager()
+        vector_store = get_enhanced_vector_store()
 
-            project_id = arguments.get("project_id")
+        # Get general database stats
+        db_stats = project_manager.get_database_stats()
 
-            project_manager = get_project_manager()
-            vector_store = get_enhanced_vector_store()
+        # Get project-specific stats if project_id provided
+        project_stats = None
+        if project_id:
+            project_stats = vector_store.get_project_stats(project_id)
 
-            # Get general database stats
-            db_stats = project_manager.get_database_stats()
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Database statistics retrieved successfully",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "database_stats": db_stats,
+                    "project_stats": project_stats,
+                },
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error getting stats: {str(e)}"},
+        )
+
+
+@tool("reset_project_memory", cost=WRITE)
+def handle_reset_project_memory(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> Generator[Dict[str, Any], None, None]:
+    """Handle the reset_project_memory tool, streaming a progress update per collection."""
+    try:
+        from src.database.enhanced_vector_store import get_enhanced_vector_store
+
+        project_id = arguments.get("project_id")
+        preserve_general_knowledge = arguments.get("preserve_general_knowledge", True)
+
+        if not project_id:
+            send_response(
+                request_id,
+                error={"code": -32602, "message": "project_id is required"},
+            )
+            return
 
-            # Get project-specific stats if project_id provided
-            project_stats = None
-            if project_id:
-                project_stats = vector_store.get_project_stats(project_id)
+        vector_store = get_enhanced_vector_store()
+        success = yield from vector_store.iter_reset_project_memory(
+            project_id, preserve_general_knowledge
+        )
 
+        if success:
             send_response(
                 request_id,
                 {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"Database statistics retrieved successfully",
+                            "text": f"Project memory reset for {project_id} (preserved general knowledge: {preserve_general_knowledge})",
                         }
                     ],
                     "structuredContent": {
                         "success": True,
-                        "database_stats": db_stats,
-                        "project_stats": project_stats,
+                        "project_id": project_id,
+                        "preserved_general_knowledge": preserve_general_knowledge,
+                        "action": "memory_reset",
                     },
                 },
             )
-        except Exception as e:
+        else:
             send_response(
                 request_id,
-                error={"code": -32603, "message": f"Error getting stats: {str(e)}"},
+                error={
+                    "code": -32603,
+                    "message": f"Failed to reset project memory for: {project_id}",
+                },
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error resetting project memory: {str(e)}",
+            },
+        )
 
-    elif tool_name == "reset_project_memory":
-        try:
-            from src.database.enhanced_vector_store import get_enhanced_vector_store
 
-            project_id = arguments.get("project_id")
-            preserve_general_knowledge = arguments.get(
-                "preserve_general_knowledge", True
-            )
+@tool("archive_project_memory", cost=WRITE)
+def handle_archive_project_memory(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the archive_project_memory tool."""
+    try:
+        from src.database.enhanced_vector_store import get_enhanced_vector_store
 
-            if not project_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_id is required"},
-                )
-                return True
+        project_id = arguments.get("project_id")
 
-            vector_store = get_enhanced_vector_store()
-            success = vector_store.reset_project_memory(
-                project_id, preserve_general_knowledge
-            )
-
-            if success:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Project memory reset for {project_id} (preserved general knowledge: {preserve_general_knowledge})",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "project_id": project_id,
-                            "preserved_general_knowledge": preserve_general_knowledge,
-                            "action": "memory_reset",
-                        },
-                    },
-                )
-            else:
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32603,
-                        "message": f"Failed to reset project memory for: {project_id}",
-                    },
-                )
-        except Exception as e:
+        if not project_id:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error resetting project memory: {str(e)}",
-                },
+                error={"code": -32602, "message": "project_id is required"},
             )
-        return True
-
-    elif tool_name == "archive_project_memory":
-        try:
-            from src.database.enhanced_vector_store import get_enhanced_vector_store
-
-            project_id = arguments.get("project_id")
+            return
 
-            if not project_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_id is required"},
-                )
-                return True
+        vector_store = get_enhanced_vector_store()
+        success = vector_store.archive_project_memory(project_id)
 
-            vector_store = get_enhanced_vector_store()
-            success = vector_store.archive_project_memory(project_id)
-
-            if success:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Project memory archived for {project_id}",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "project_id": project_id,
-                            "action": "memory_archived",
-                        },
-                    },
-                )
-            else:
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32603,
-                        "message": f"Failed to archive project memory for: {project_id}",
+        if success:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Project memory archived for {project_id}",
+                        }
+                    ],
+                    "structuredContent": {
+                        "success": True,
+                        "project_id": project_id,
+                        "action": "memory_archived",
                     },
-                )
-        except Exception as e:
+                },
+            )
+        else:
             send_response(
                 request_id,
                 error={
                     "code": -32603,
-                    "message": f"Error archiving project memory: {str(e)}",
+                    "message": f"Failed to archive project memory for: {project_id}",
                 },
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error archiving project memory: {str(e)}",
+            },
+        )
+
 
-    return False
+def handle_database_tool(
+    tool_name: str, arguments: Dict[str, Any], request_id: str, send_response
+) -> bool:
+    """Handle Database Management tool calls."""
+    return tool_registry.dispatch(
+        tool_name, arguments, request_id, send_response, group="database"
+    )
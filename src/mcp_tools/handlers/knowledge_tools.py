@@ -2,6 +2,10 @@
 
 from typing import Dict, Any, List
 
+from ..admission import WRITE
+from ..pagination import PAGINATION_PROPERTIES, InvalidCursor, Page
+from ..registry import tool_registry
+
 
 def get_knowledge_tools() -> List[Dict[str, Any]]:
     """Get Predetermined Knowledge Bases MCP tools definitions."""
@@ -31,13 +35,14 @@ def get_knowledge_tools() -> List[Dict[str, Any]]:
             "inputSchema": {
                 "type": "object",
                 "properties": {
+                    **PAGINATION_PROPERTIES,
                     "limit": {
                         "type": "integer",
                         "description": "Maximum number of items to return",
                     },
                     "offset": {
                         "type": "integer",
-                        "description": "Number of items to skip",
+                        "description": "Number of items to skip (or pass cursor)",
                     },
                 },
                 "required": [],
@@ -113,368 +118,388 @@ def get_knowledge_tools() -> List[Dict[str, Any]]:
     ]
 
 
-def handle_knowledge_tool(
-    tool_name: str, arguments: Dict[str, Any], request_id: str, send_response
-) -> bool:
-    """Handle Predetermined Knowledge Bases tool calls."""
+tool = tool_registry.bind(get_knowledge_tools(), group="knowledge")
 
-    if tool_name == "get_domains":
-        try:
-            from src.knowledge.predetermined_knowledge import (
-                get_predetermined_knowledge,
-            )
 
-            knowledge_base = get_predetermined_knowledge()
-            domains = knowledge_base.get_available_domains()
+@tool("get_domains", blocking=False, cache_tags=("knowledge",))
+def handle_get_domains(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_domains tool."""
+    try:
+        from src.knowledge.predetermined_knowledge import (
+            get_predetermined_knowledge,
+        )
 
-            send_response(
-                request_id,
-                {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Retrieved {len(domains)} knowledge domains",
-                        }
-                    ],
-                    "structuredContent": {
-                        "success": True,
-                        "domains": domains,
-                        "total_domains": len(domains),
-                    },
+        knowledge_base = get_predetermined_knowledge()
+        domains = knowledge_base.get_available_domains()
+
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Retrieved {len(domains)} knowledge domains",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "domains": domains,
+                    "total_domains": len(domains),
                 },
-            )
-        except Exception as e:
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error getting domains: {str(e)}"},
+        )
+
+
+@tool("get_domain_knowledge", blocking=False, cache_tags=("knowledge",))
+def handle_get_domain_knowledge(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_domain_knowledge tool."""
+    try:
+        from src.knowledge.predetermined_knowledge import (
+            get_predetermined_knowledge,
+        )
+
+        domain = arguments.get("domain")
+
+        if not domain:
             send_response(
-                request_id,
-                error={"code": -32603, "message": f"Error getting domains: {str(e)}"},
+                request_id, error={"code": -32602, "message": "domain is required"}
             )
-        return True
+            return
 
-    elif tool_name == "get_domain_knowledge":
-        try:
-            from src.knowledge.predetermined_knowledge import (
-                get_predetermined_knowledge,
-            )
+        knowledge_base = get_predetermined_knowledge()
+        knowledge_items = knowledge_base.get_knowledge_for_domain(domain)
 
-            domain = arguments.get("domain")
+        # Convert to dictionaries
+        items_dict = [item.to_dict() for item in knowledge_items]
 
-            if not domain:
-                send_response(
-                    request_id, error={"code": -32602, "message": "domain is required"}
-                )
-                return True
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Retrieved {len(knowledge_items)} knowledge items for domain '{domain}'",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "domain": domain,
+                    "knowledge_items": items_dict,
+                    "total_items": len(knowledge_items),
+                },
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting domain knowledge: {str(e)}",
+            },
+        )
+
+
+@tool("get_all", blocking=False, cache_tags=("knowledge",))
+def handle_get_all(arguments: Dict[str, Any], request_id: str, send_response) -> None:
+    """Handle the get_all tool."""
+    try:
+        from src.knowledge.predetermined_knowledge import (
+            get_predetermined_knowledge,
+        )
+
+        page = Page("get_all", arguments, default_limit=100)
+
+        knowledge_base = get_predetermined_knowledge()
+        all_knowledge = knowledge_base.get_all_knowledge()
+
+        # Flatten all knowledge items
+        all_items = []
+        for domain, items in all_knowledge.items():
+            for item in items:
+                item_dict = item.to_dict()
+                item_dict["domain"] = domain
+                all_items.append(item_dict)
+
+        send_response(
+            request_id,
+            page.to_result(
+                all_items,
+                "knowledge_items",
+                "knowledge items",
+                total=len(all_items),
+                success=True,
+            ),
+        )
+    except InvalidCursor as e:
+        send_response(request_id, error={"code": -32602, "message": str(e)})
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting all knowledge: {str(e)}",
+            },
+        )
 
-            knowledge_base = get_predetermined_knowledge()
-            knowledge_items = knowledge_base.get_knowledge_for_domain(domain)
 
-            # Convert to dictionaries
-            items_dict = [item.to_dict() for item in knowledge_items]
+@tool("search", blocking=False)
+def handle_search(arguments: Dict[str, Any], request_id: str, send_response) -> None:
+    """Handle the search tool."""
+    try:
+        from src.knowledge.predetermined_knowledge import (
+            get_predetermined_knowledge,
+        )
 
+        query = arguments.get("query")
+        domain = arguments.get("domain")
+
+        if not query:
             send_response(
-                request_id,
-                {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Retrieved {len(knowledge_items)} knowledge items for domain '{domain}'",
-                        }
-                    ],
-                    "structuredContent": {
-                        "success": True,
-                        "domain": domain,
-                        "knowledge_items": items_dict,
-                        "total_items": len(knowledge_items),
-                    },
-                },
-            )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting domain knowledge: {str(e)}",
-                },
+                request_id, error={"code": -32602, "message": "query is required"}
             )
-        return True
+            return
 
-    elif tool_name == "get_all":
-        try:
-            from src.knowledge.predetermined_knowledge import (
-                get_predetermined_knowledge,
-            )
+        knowledge_base = get_predetermined_knowledge()
+        search_results = knowledge_base.search_knowledge(query, domain)
 
-            limit = arguments.get("limit", 100)
-            offset = arguments.get("offset", 0)
+        # Convert to dictionaries
+        results_dict = [item.to_dict() for item in search_results]
 
-            knowledge_base = get_predetermined_knowledge()
-            all_knowledge = knowledge_base.get_all_knowledge()
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Found {len(search_results)} knowledge items matching '{query}'",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "query": query,
+                    "domain": domain,
+                    "results": results_dict,
+                    "total_results": len(search_results),
+                },
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error searching knowledge: {str(e)}",
+            },
+        )
+
+
+@tool("get_statistics", blocking=False)
+def handle_get_statistics(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_statistics tool."""
+    try:
+        from src.knowledge.predetermined_knowledge import (
+            get_predetermined_knowledge,
+        )
+
+        knowledge_base = get_predetermined_knowledge()
+        stats = knowledge_base.get_statistics()
+
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Knowledge base statistics: {stats.get('total_items', 0)} items across {stats.get('total_domains', 0)} domains",
+                    }
+                ],
+                "structuredContent": {"success": True, "statistics": stats},
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting statistics: {str(e)}",
+            },
+        )
 
-            # Flatten all knowledge items
-            all_items = []
-            for domain, items in all_knowledge.items():
-                for item in items:
-                    item_dict = item.to_dict()
-                    item_dict["domain"] = domain
-                    all_items.append(item_dict)
 
-            # Apply pagination
-            total_items = len(all_items)
-            paginated_items = all_items[offset : offset + limit]
+@tool("initialize_project", cost=WRITE)
+def handle_initialize_project(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the initialize_project tool."""
+    try:
+        from src.knowledge.predetermined_knowledge import (
+            get_predetermined_knowledge,
+        )
 
+        project_id = arguments.get("project_id")
+        domains = arguments.get("domains")
+
+        if not project_id:
             send_response(
                 request_id,
-                {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Retrieved {len(paginated_items)} of {total_items} total knowledge items",
-                        }
-                    ],
-                    "structuredContent": {
-                        "success": True,
-                        "knowledge_items": paginated_items,
-                        "total_items": total_items,
-                        "limit": limit,
-                        "offset": offset,
-                        "has_more": offset + limit < total_items,
-                    },
-                },
-            )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting all knowledge: {str(e)}",
-                },
-            )
-        return True
-
-    elif tool_name == "search":
-        try:
-            from src.knowledge.predetermined_knowledge import (
-                get_predetermined_knowledge,
+                error={"code": -32602, "message": "project_id is required"},
             )
+            return
 
-            query = arguments.get("query")
-            domain = arguments.get("domain")
-
-            if not query:
-                send_response(
-                    request_id, error={"code": -32602, "message": "query is required"}
-                )
-                return True
-
-            knowledge_base = get_predetermined_knowledge()
-            search_results = knowledge_base.search_knowledge(query, domain)
-
-            # Convert to dictionaries
-            results_dict = [item.to_dict() for item in search_results]
+        knowledge_base = get_predetermined_knowledge()
+        result = knowledge_base.initialize_project(project_id, domains)
 
+        if result["success"]:
             send_response(
                 request_id,
                 {
                     "content": [
                         {
                             "type": "text",
-                            "text": f"Found {len(search_results)} knowledge items matching '{query}'",
+                            "text": f"Initialized project '{project_id}' with {result['total_items']} knowledge items",
                         }
                     ],
                     "structuredContent": {
                         "success": True,
-                        "query": query,
-                        "domain": domain,
-                        "results": results_dict,
-                        "total_results": len(search_results),
+                        "project_id": result["project_id"],
+                        "domains_initialized": result["domains_initialized"],
+                        "total_items": result["total_items"],
                     },
                 },
             )
-        except Exception as e:
+        else:
             send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error searching knowledge: {str(e)}",
-                },
+                request_id, error={"code": -32603, "message": result["error"]}
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error initializing project: {str(e)}",
+            },
+        )
 
-    elif tool_name == "get_statistics":
-        try:
-            from src.knowledge.predetermined_knowledge import (
-                get_predetermined_knowledge,
-            )
 
-            knowledge_base = get_predetermined_knowledge()
-            stats = knowledge_base.get_statistics()
+@tool("get_by_category", blocking=False, cache_tags=("knowledge",))
+def handle_get_by_category(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_by_category tool."""
+    try:
+        from src.knowledge.predetermined_knowledge import (
+            get_predetermined_knowledge,
+        )
 
+        category = arguments.get("category")
+
+        if not category:
             send_response(
                 request_id,
-                {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Knowledge base statistics: {stats.get('total_items', 0)} items across {stats.get('total_domains', 0)} domains",
-                        }
-                    ],
-                    "structuredContent": {"success": True, "statistics": stats},
-                },
-            )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting statistics: {str(e)}",
-                },
+                error={"code": -32602, "message": "category is required"},
             )
-        return True
+            return
 
-    elif tool_name == "initialize_project":
-        try:
-            from src.knowledge.predetermined_knowledge import (
-                get_predetermined_knowledge,
-            )
+        knowledge_base = get_predetermined_knowledge()
+        category_items = knowledge_base.get_by_category(category)
 
-            project_id = arguments.get("project_id")
-            domains = arguments.get("domains")
+        # Convert to dictionaries
+        items_dict = [item.to_dict() for item in category_items]
 
-            if not project_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_id is required"},
-                )
-                return True
-
-            knowledge_base = get_predetermined_knowledge()
-            result = knowledge_base.initialize_project(project_id, domains)
-
-            if result["success"]:
-                send_response(
-                    request_id,
+        send_response(
+            request_id,
+            {
+                "content": [
                     {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Initialized project '{project_id}' with {result['total_items']} knowledge items",
-                            }
-                        ],
-                        "structuredContent": {
-                            "success": True,
-                            "project_id": result["project_id"],
-                            "domains_initialized": result["domains_initialized"],
-                            "total_items": result["total_items"],
-                        },
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error initializing project: {str(e)}",
+                        "type": "text",
+                        "text": f"Retrieved {len(category_items)} knowledge items for category '{category}'",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "category": category,
+                    "knowledge_items": items_dict,
+                    "total_items": len(category_items),
                 },
-            )
-        return True
-
-    elif tool_name == "get_by_category":
-        try:
-            from src.knowledge.predetermined_knowledge import (
-                get_predetermined_knowledge,
-            )
-
-            category = arguments.get("category")
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting by category: {str(e)}",
+            },
+        )
 
-            if not category:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "category is required"},
-                )
-                return True
 
-            knowledge_base = get_predetermined_knowledge()
-            category_items = knowledge_base.get_by_category(category)
+@tool("get_by_priority", blocking=False, cache_tags=("knowledge",))
+def handle_get_by_priority(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_by_priority tool."""
+    try:
+        from src.knowledge.predetermined_knowledge import (
+            get_predetermined_knowledge,
+        )
 
-            # Convert to dictionaries
-            items_dict = [item.to_dict() for item in category_items]
+        priority = arguments.get("priority")
 
+        if not priority:
             send_response(
                 request_id,
-                {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Retrieved {len(category_items)} knowledge items for category '{category}'",
-                        }
-                    ],
-                    "structuredContent": {
-                        "success": True,
-                        "category": category,
-                        "knowledge_items": items_dict,
-                        "total_items": len(category_items),
-                    },
-                },
-            )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting by category: {str(e)}",
-                },
-            )
-        return True
-
-    elif tool_name == "get_by_priority":
-        try:
-            from src.knowledge.predetermined_knowledge import (
-                get_predetermined_knowledge,
+                error={"code": -32602, "message": "priority is required"},
             )
+            return
 
-            priority = arguments.get("priority")
+        knowledge_base = get_predetermined_knowledge()
+        priority_items = knowledge_base.get_by_priority(priority)
 
-            if not priority:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "priority is required"},
-                )
-                return True
+        # Convert to dictionaries
+        items_dict = [item.to_dict() for item in priority_items]
 
-            knowledge_base = get_predetermined_knowledge()
-            priority_items = knowledge_base.get_by_priority(priority)
-
-            # Convert to dictionaries
-            items_dict = [item.to_dict() for item in priority_items]
-
-            send_response(
-                request_id,
-                {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Retrieved {len(priority_items)} knowledge items with priority '{priority}'",
-                        }
-                    ],
-                    "structuredContent": {
-                        "success": True,
-                        "priority": priority,
-                        "knowledge_items": items_dict,
-                        "total_items": len(priority_items),
-                    },
-                },
-            )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting by priority: {str(e)}",
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Retrieved {len(priority_items)} knowledge items with priority '{priority}'",
+                    }
+                ],
+                "structuredContent": {
+                    "success": True,
+                    "priority": priority,
+                    "knowledge_items": items_dict,
+                    "total_items": len(priority_items),
                 },
-            )
-        return True
+            },
+        )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting by priority: {str(e)}",
+            },
+        )
+
 
-    return False
+def handle_knowledge_tool(
+    tool_name: str, arguments: Dict[str, Any], request_id: str, send_response
+) -> bool:
+    """Handle Predetermined Knowledge Bases tool calls."""
+    return tool_registry.dispatch(
+        tool_name, arguments, request_id, send_response, group="knowledge"
+    )
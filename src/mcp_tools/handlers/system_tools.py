@@ -1,6 +1,12 @@
 """System MCP tools (coordinator, project management, communication, etc.)."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Generator, List
+
+from src.core.tool_metrics import tool_metrics
+
+from ..admission import LLM, WRITE
+from ..pagination import PAGINATION_PROPERTIES, InvalidCursor, Page
+from ..registry import tool_registry
 
 
 def get_system_tools() -> List[Dict[str, Any]]:
@@ -68,12 +74,13 @@ def get_system_tools() -> List[Dict[str, Any]]:
         },
         {
             "name": "get_cross_chat_messages",
-            "description": "Get cross-chat messages for a specific chat or all chats",
+            "description": "Get cross-chat messages for a specific chat or all chats, "
+            "newest first",
             "inputSchema": {
                 "type": "object",
                 "properties": {
                     "chat_id": {"type": "string"},
-                    "limit": {"type": "integer"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": [],
             },
@@ -86,7 +93,7 @@ def get_system_tools() -> List[Dict[str, Any]]:
                 "properties": {
                     "query": {"type": "string"},
                     "chat_id": {"type": "string"},
-                    "limit": {"type": "integer"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["query"],
             },
@@ -281,7 +288,7 @@ def get_system_tools() -> List[Dict[str, Any]]:
         {
             "name": "list_generated_projects",
             "description": "List all generated projects",
-            "inputSchema": {"type": "object", "properties": {}},
+            "inputSchema": {"type": "object", "properties": PAGINATION_PROPERTIES},
         },
         # Security Tools
         {
@@ -319,10 +326,11 @@ def get_system_tools() -> List[Dict[str, Any]]:
             "inputSchema": {
                 "type": "object",
                 "properties": {
+                    **PAGINATION_PROPERTIES,
                     "limit": {
                         "type": "integer",
                         "description": "Maximum number of connections to return (default: 50)",
-                    }
+                    },
                 },
             },
         },
@@ -401,1489 +409,1742 @@ def get_system_tools() -> List[Dict[str, Any]]:
                 "required": ["host"],
             },
         },
+        {
+            "name": "get_daemon_clients",
+            "description": "Get per-client metrics of the shared MCP daemon",
+            "inputSchema": {"type": "object", "properties": {}},
+        },
+        {
+            "name": "get_tool_metrics",
+            "description": "Get per-tool call counts and latency/size percentiles",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "tool": {"type": "string"},
+                    "sort_by": {
+                        "type": "string",
+                        "enum": ["calls", "errors", "p95", "p99", "bytes"],
+                    },
+                    "limit": {"type": "integer"},
+                },
+            },
+        },
     ]
 
 
-def handle_system_tool(
-    tool_name: str, arguments: Dict[str, Any], request_id: str, send_response
-) -> bool:
-    """Handle system tool calls."""
+tool = tool_registry.bind(get_system_tools(), group="system")
 
-    # Import agent system for tool handling
-    try:
-        import protocol_server
+# Agent system used by the handlers, provided by protocol_server at startup
+_agent_system = None
+_daemon = None
 
-        agent_system = protocol_server.agent_system
-    except Exception as e:
-        send_response(
-            request_id,
-            error={
-                "code": -32603,
-                "message": f"Failed to access agent system: {str(e)}",
-            },
-        )
-        return True
 
-    # Core System Tools
-    if tool_name == "start_project":
-        try:
-            project_type = arguments.get("project_type")
-            project_name = arguments.get("project_name")
+def set_agent_system(agent_system) -> None:
+    """Set the agent system used by system tool handlers."""
+    global _agent_system
+    _agent_system = agent_system
 
-            if not project_type or not project_name:
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32602,
-                        "message": "project_type and project_name are required",
-                    },
-                )
-                return True
 
-            result = agent_system.start_project(project_type, project_name)
+def set_daemon(daemon) -> None:
+    """Set the MCP daemon reported by get_daemon_clients (daemon mode only)."""
+    global _daemon
+    _daemon = daemon
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [{"type": "text", "text": result["message"]}],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
-            send_response(
-                request_id,
-                error={"code": -32603, "message": f"Error starting project: {str(e)}"},
-            )
-        return True
 
-    elif tool_name == "chat_with_coordinator":
-        try:
-            message = arguments.get("message")
+def _get_agent_system():
+    """Get the agent system, importing protocol_server only as a last resort."""
+    if _agent_system is None:
+        import protocol_server
 
-            if not message:
-                send_response(
-                    request_id, error={"code": -32602, "message": "message is required"}
-                )
-                return True
+        set_agent_system(protocol_server.agent_system)
+    return _agent_system
 
-            result = agent_system.chat_with_coordinator(message)
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [{"type": "text", "text": result["response"]}],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+@tool("start_project", cost=LLM)
+def handle_start_project(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the start_project tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        project_type = arguments.get("project_type")
+        project_name = arguments.get("project_name")
+
+        if not project_type or not project_name:
             send_response(
                 request_id,
                 error={
-                    "code": -32603,
-                    "message": f"Error chatting with coordinator: {str(e)}",
+                    "code": -32602,
+                    "message": "project_type and project_name are required",
                 },
             )
-        return True
+            return
 
-    # Communication System Tools
-    elif tool_name == "start_communication_system":
-        try:
-            result = agent_system.start_communication_system()
+        result = agent_system.start_project(project_type, project_name)
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [{"type": "text", "text": result["message"]}],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        if result["success"]:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error starting communication system: {str(e)}",
+                {
+                    "content": [{"type": "text", "text": result["message"]}],
+                    "structuredContent": result,
                 },
             )
-        return True
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error starting project: {str(e)}"},
+        )
 
-    elif tool_name == "get_communication_status":
-        try:
-            result = agent_system.get_communication_status()
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "Communication system status retrieved",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+@tool("chat_with_coordinator", timeout=90, cost=LLM)
+def handle_chat_with_coordinator(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the chat_with_coordinator tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        message = arguments.get("message")
+
+        if not message:
+            send_response(
+                request_id, error={"code": -32602, "message": "message is required"}
+            )
+            return
+
+        result = agent_system.chat_with_coordinator(message)
+
+        if result["success"]:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting communication status: {str(e)}",
+                {
+                    "content": [{"type": "text", "text": result["response"]}],
+                    "structuredContent": result,
                 },
             )
-        return True
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error chatting with coordinator: {str(e)}",
+            },
+        )
 
-    elif tool_name == "create_cross_chat_session":
-        try:
-            chat_id = arguments.get("chat_id")
-            chat_type = arguments.get("chat_type")
-            participants = arguments.get("participants", [])
 
-            if not chat_id or not chat_type:
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32602,
-                        "message": "chat_id and chat_type are required",
-                    },
-                )
-                return True
+@tool("start_communication_system", cost=WRITE)
+def handle_start_communication_system(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the start_communication_system tool."""
+    agent_system = _get_agent_system()
 
-            result = agent_system.create_cross_chat_session(
-                chat_id, chat_type, participants
-            )
+    try:
+        result = agent_system.start_communication_system()
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [{"type": "text", "text": result["message"]}],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        if result["success"]:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error creating cross-chat session: {str(e)}",
+                {
+                    "content": [{"type": "text", "text": result["message"]}],
+                    "structuredContent": result,
                 },
             )
-        return True
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error starting communication system: {str(e)}",
+            },
+        )
 
-    elif tool_name == "broadcast_cross_chat_message":
-        try:
-            source_chat = arguments.get("source_chat")
-            source_agent = arguments.get("source_agent")
-            content = arguments.get("content")
-            target_chats = arguments.get("target_chats", [])
 
-            if not all([source_chat, source_agent, content]):
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32602,
-                        "message": "source_chat, source_agent, and content are required",
-                    },
-                )
-                return True
+@tool("get_communication_status")
+def handle_get_communication_status(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_communication_status tool."""
+    agent_system = _get_agent_system()
 
-            result = agent_system.broadcast_cross_chat_message(
-                source_chat, source_agent, content, target_chats
-            )
+    try:
+        result = agent_system.get_communication_status()
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [{"type": "text", "text": result["message"]}],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        if result["success"]:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error broadcasting message: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "Communication system status retrieved",
+                        }
+                    ],
+                    "structuredContent": result,
                 },
             )
-        return True
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting communication status: {str(e)}",
+            },
+        )
 
-    elif tool_name == "get_cross_chat_messages":
-        try:
-            chat_id = arguments.get("chat_id")
-            limit = arguments.get("limit", 50)
 
-            result = agent_system.get_cross_chat_messages(chat_id, limit)
+@tool("create_cross_chat_session", cost=WRITE)
+def handle_create_cross_chat_session(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the create_cross_chat_session tool."""
+    agent_system = _get_agent_system()
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Retrieved {result['message_count']} messages",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+    try:
+        chat_id = arguments.get("chat_id")
+        chat_type = arguments.get("chat_type")
+        participants = arguments.get("participants", [])
+
+        if not chat_id or not chat_type:
             send_response(
                 request_id,
                 error={
-                    "code": -32603,
-                    "message": f"Error getting cross-chat messages: {str(e)}",
+                    "code": -32602,
+                    "message": "chat_id and chat_type are required",
                 },
             )
-        return True
-
-    elif tool_name == "search_cross_chat_messages":
-        try:
-            query = arguments.get("query")
-            chat_id = arguments.get("chat_id")
-            limit = arguments.get("limit", 50)
-
-            if not query:
-                send_response(
-                    request_id, error={"code": -32602, "message": "query is required"}
-                )
-                return True
+            return
 
-            result = agent_system.search_cross_chat_messages(query, chat_id, limit)
+        result = agent_system.create_cross_chat_session(
+            chat_id, chat_type, participants
+        )
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Found {result['results_count']} results",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        if result["success"]:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error searching cross-chat messages: {str(e)}",
+                {
+                    "content": [{"type": "text", "text": result["message"]}],
+                    "structuredContent": result,
                 },
             )
-        return True
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error creating cross-chat session: {str(e)}",
+            },
+        )
 
-    # Agile/Scrum Tools
-    elif tool_name == "create_agile_project":
-        try:
-            project_name = arguments.get("project_name")
-            project_type = arguments.get("project_type", "scrum")
-            sprint_length = arguments.get("sprint_length")
-            team_size = arguments.get("team_size", 5)
 
-            if not project_name:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_name is required"},
-                )
-                return True
+@tool("broadcast_cross_chat_message", cost=WRITE)
+def handle_broadcast_cross_chat_message(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the broadcast_cross_chat_message tool."""
+    agent_system = _get_agent_system()
 
-            result = agent_system.create_agile_project(
-                project_name, project_type, sprint_length, team_size
-            )
+    try:
+        source_chat = arguments.get("source_chat")
+        source_agent = arguments.get("source_agent")
+        content = arguments.get("content")
+        target_chats = arguments.get("target_chats", [])
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Agile project '{project_name}' created successfully",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        if not all([source_chat, source_agent, content]):
             send_response(
                 request_id,
                 error={
-                    "code": -32603,
-                    "message": f"Error creating agile project: {str(e)}",
+                    "code": -32602,
+                    "message": "source_chat, source_agent, and content are required",
                 },
             )
-        return True
+            return
 
-    elif tool_name == "create_user_story":
-        try:
-            project_id = arguments.get("project_id")
-            title = arguments.get("title")
-            description = arguments.get("description")
-            acceptance_criteria = arguments.get("acceptance_criteria", [])
-            story_points = arguments.get("story_points")
-            priority = arguments.get("priority", "medium")
-            epic = arguments.get("epic")
-
-            if not all([project_id, title, description]):
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32602,
-                        "message": "project_id, title, and description are required",
-                    },
-                )
-                return True
+        result = agent_system.broadcast_cross_chat_message(
+            source_chat, source_agent, content, target_chats
+        )
 
-            result = agent_system.create_user_story(
-                project_id,
-                title,
-                description,
-                acceptance_criteria,
-                story_points,
-                priority,
-                epic,
+        if result["success"]:
+            send_response(
+                request_id,
+                {
+                    "content": [{"type": "text", "text": result["message"]}],
+                    "structuredContent": result,
+                },
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
             )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error broadcasting message: {str(e)}",
+            },
+        )
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"User story '{title}' created successfully",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+
+@tool("get_cross_chat_messages")
+def handle_get_cross_chat_messages(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_cross_chat_messages tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        chat_id = arguments.get("chat_id")
+        page = Page("get_cross_chat_messages", arguments)
+
+        result = agent_system.get_cross_chat_messages(chat_id, page.fetch_count)
+
+        if result["success"]:
+            # The newest messages come last; page through them newest first
+            messages = list(reversed(result.pop("messages")))
+            result.pop("message_count", None)
             send_response(
-                request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error creating user story: {str(e)}",
-                },
+                request_id, page.to_result(messages, "messages", "messages", **result)
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
             )
-        return True
+    except InvalidCursor as e:
+        send_response(request_id, error={"code": -32602, "message": str(e)})
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting cross-chat messages: {str(e)}",
+            },
+        )
 
-    elif tool_name == "create_sprint":
-        try:
-            project_id = arguments.get("project_id")
-            sprint_name = arguments.get("sprint_name")
-            start_date = arguments.get("start_date")
-            end_date = arguments.get("end_date")
-            goal = arguments.get("goal")
 
-            if not all([project_id, sprint_name]):
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32602,
-                        "message": "project_id and sprint_name are required",
-                    },
-                )
-                return True
+@tool("search_cross_chat_messages")
+def handle_search_cross_chat_messages(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the search_cross_chat_messages tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        query = arguments.get("query")
+        chat_id = arguments.get("chat_id")
 
-            result = agent_system.create_sprint(
-                project_id, sprint_name, start_date, end_date, goal
+        if not query:
+            send_response(
+                request_id, error={"code": -32602, "message": "query is required"}
             )
+            return
+        page = Page("search_cross_chat_messages", arguments)
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Sprint '{sprint_name}' created successfully",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        result = agent_system.search_cross_chat_messages(
+            query, chat_id, page.fetch_count
+        )
+
+        if result["success"]:
+            results = result.pop("results")
+            result.pop("results_count", None)
             send_response(
                 request_id,
-                error={"code": -32603, "message": f"Error creating sprint: {str(e)}"},
+                page.to_result(results, "results", "results", verb="Found", **result),
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
             )
-        return True
+    except InvalidCursor as e:
+        send_response(request_id, error={"code": -32602, "message": str(e)})
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error searching cross-chat messages: {str(e)}",
+            },
+        )
 
-    elif tool_name == "plan_sprint":
-        try:
-            sprint_id = arguments.get("sprint_id")
-            story_ids = arguments.get("story_ids", [])
 
-            if not all([sprint_id, story_ids]):
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32602,
-                        "message": "sprint_id and story_ids are required",
-                    },
-                )
-                return True
+@tool("create_agile_project", cost=WRITE, invalidates=("agile",))
+def handle_create_agile_project(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the create_agile_project tool."""
+    agent_system = _get_agent_system()
 
-            result = agent_system.plan_sprint(sprint_id, story_ids)
+    try:
+        project_name = arguments.get("project_name")
+        project_type = arguments.get("project_type", "scrum")
+        sprint_length = arguments.get("sprint_length")
+        team_size = arguments.get("team_size", 5)
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Sprint {sprint_id} planned with {len(story_ids)} stories",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        if not project_name:
             send_response(
                 request_id,
-                error={"code": -32603, "message": f"Error planning sprint: {str(e)}"},
+                error={"code": -32602, "message": "project_name is required"},
             )
-        return True
-
-    elif tool_name == "complete_user_story":
-        try:
-            story_id = arguments.get("story_id")
-            actual_hours = arguments.get("actual_hours")
-
-            if not story_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "story_id is required"},
-                )
-                return True
+            return
 
-            result = agent_system.complete_user_story(story_id, actual_hours)
+        result = agent_system.create_agile_project(
+            project_name, project_type, sprint_length, team_size
+        )
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"User story {story_id} completed successfully",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        if result["success"]:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error completing user story: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Agile project '{project_name}' created successfully",
+                        }
+                    ],
+                    "structuredContent": result,
                 },
             )
-        return True
-
-    elif tool_name == "get_project_status":
-        try:
-            project_id = arguments.get("project_id")
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error creating agile project: {str(e)}",
+            },
+        )
 
-            if not project_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_id is required"},
-                )
-                return True
 
-            result = agent_system.get_project_status(project_id)
+@tool("create_user_story", cost=WRITE, invalidates=("agile",))
+def handle_create_user_story(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the create_user_story tool."""
+    agent_system = _get_agent_system()
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Project status for {project_id} retrieved",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+    try:
+        project_id = arguments.get("project_id")
+        title = arguments.get("title")
+        description = arguments.get("description")
+        acceptance_criteria = arguments.get("acceptance_criteria", [])
+        story_points = arguments.get("story_points")
+        priority = arguments.get("priority", "medium")
+        epic = arguments.get("epic")
+
+        if not all([project_id, title, description]):
             send_response(
                 request_id,
                 error={
-                    "code": -32603,
-                    "message": f"Error getting project status: {str(e)}",
+                    "code": -32602,
+                    "message": "project_id, title, and description are required",
                 },
             )
-        return True
-
-    elif tool_name == "get_sprint_burndown":
-        try:
-            sprint_id = arguments.get("sprint_id")
-
-            if not sprint_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "sprint_id is required"},
-                )
-                return True
-
-            result = agent_system.get_sprint_burndown(sprint_id)
+            return
+
+        result = agent_system.create_user_story(
+            project_id,
+            title,
+            description,
+            acceptance_criteria,
+            story_points,
+            priority,
+            epic,
+        )
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Burndown data for sprint {sprint_id} generated",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        if result["success"]:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting sprint burndown: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"User story '{title}' created successfully",
+                        }
+                    ],
+                    "structuredContent": result,
                 },
             )
-        return True
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error creating user story: {str(e)}",
+            },
+        )
 
-    elif tool_name == "calculate_team_velocity":
-        try:
-            project_id = arguments.get("project_id")
-            sprint_count = arguments.get("sprint_count")
 
-            if not project_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_id is required"},
-                )
-                return True
+@tool("create_sprint", cost=WRITE, invalidates=("agile",))
+def handle_create_sprint(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the create_sprint tool."""
+    agent_system = _get_agent_system()
 
-            result = agent_system.calculate_team_velocity(project_id, sprint_count)
+    try:
+        project_id = arguments.get("project_id")
+        sprint_name = arguments.get("sprint_name")
+        start_date = arguments.get("start_date")
+        end_date = arguments.get("end_date")
+        goal = arguments.get("goal")
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Team velocity for project {project_id} calculated",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        if not all([project_id, sprint_name]):
             send_response(
                 request_id,
                 error={
-                    "code": -32603,
-                    "message": f"Error calculating team velocity: {str(e)}",
+                    "code": -32602,
+                    "message": "project_id and sprint_name are required",
                 },
             )
-        return True
-
-    # Project Generation Tools
-    elif tool_name == "list_project_templates":
-        try:
-            language = arguments.get("language")
-            category = arguments.get("category")
+            return
 
-            result = agent_system.list_project_templates(language, category)
+        result = agent_system.create_sprint(
+            project_id, sprint_name, start_date, end_date, goal
+        )
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Retrieved {result.get('total_count', 0)} project templates",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        if result["success"]:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error listing project templates: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Sprint '{sprint_name}' created successfully",
+                        }
+                    ],
+                    "structuredContent": result,
                 },
             )
-        return True
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error creating sprint: {str(e)}"},
+        )
 
-    elif tool_name == "generate_project":
-        try:
-            template_id = arguments.get("template_id")
-            project_name = arguments.get("project_name")
-            target_path = arguments.get("target_path", ".")
-            customizations = arguments.get("customizations", {})
 
-            if not all([template_id, project_name]):
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32602,
-                        "message": "template_id and project_name are required",
-                    },
-                )
-                return True
+@tool("plan_sprint", cost=WRITE, invalidates=("agile",))
+def handle_plan_sprint(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the plan_sprint tool."""
+    agent_system = _get_agent_system()
 
-            result = agent_system.generate_project(
-                template_id, project_name, target_path, customizations
-            )
+    try:
+        sprint_id = arguments.get("sprint_id")
+        story_ids = arguments.get("story_ids", [])
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Project '{project_name}' generated successfully",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        if not all([sprint_id, story_ids]):
             send_response(
                 request_id,
                 error={
-                    "code": -32603,
-                    "message": f"Error generating project: {str(e)}",
+                    "code": -32602,
+                    "message": "sprint_id and story_ids are required",
                 },
             )
-        return True
+            return
 
-    elif tool_name == "customize_project_template":
-        try:
-            template_id = arguments.get("template_id")
-            customizations = arguments.get("customizations", {})
+        result = agent_system.plan_sprint(sprint_id, story_ids)
 
-            if not all([template_id, customizations]):
-                send_response(
-                    request_id,
-                    error={
-                        "code": -32602,
-                        "message": "template_id and customizations are required",
-                    },
-                )
-                return True
+        if result["success"]:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Sprint {sprint_id} planned with {len(story_ids)} stories",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error planning sprint: {str(e)}"},
+        )
+
+
+@tool("complete_user_story", cost=WRITE, invalidates=("agile",))
+def handle_complete_user_story(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the complete_user_story tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        story_id = arguments.get("story_id")
+        actual_hours = arguments.get("actual_hours")
 
-            result = agent_system.customize_project_template(
-                template_id, customizations
+        if not story_id:
+            send_response(
+                request_id,
+                error={"code": -32602, "message": "story_id is required"},
             )
+            return
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Template '{template_id}' customized successfully",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+        result = agent_system.complete_user_story(story_id, actual_hours)
+
+        if result["success"]:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"User story {story_id} completed successfully",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error completing user story: {str(e)}",
+            },
+        )
+
+
+@tool("get_project_status", cache_tags=("agile",))
+def handle_get_project_status(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_project_status tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        project_id = arguments.get("project_id")
+
+        if not project_id:
+            send_response(
+                request_id,
+                error={"code": -32602, "message": "project_id is required"},
+            )
+            return
+
+        result = agent_system.get_project_status(project_id)
+
+        if result["success"]:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Project status for {project_id} retrieved",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting project status: {str(e)}",
+            },
+        )
+
+
+@tool("get_sprint_burndown", cache_tags=("agile",))
+def handle_get_sprint_burndown(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_sprint_burndown tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        sprint_id = arguments.get("sprint_id")
+
+        if not sprint_id:
+            send_response(
+                request_id,
+                error={"code": -32602, "message": "sprint_id is required"},
+            )
+            return
+
+        result = agent_system.get_sprint_burndown(sprint_id)
+
+        if result["success"]:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Burndown data for sprint {sprint_id} generated",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting sprint burndown: {str(e)}",
+            },
+        )
+
+
+@tool("calculate_team_velocity", cache_tags=("agile",))
+def handle_calculate_team_velocity(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the calculate_team_velocity tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        project_id = arguments.get("project_id")
+        sprint_count = arguments.get("sprint_count")
+
+        if not project_id:
+            send_response(
+                request_id,
+                error={"code": -32602, "message": "project_id is required"},
+            )
+            return
+
+        result = agent_system.calculate_team_velocity(project_id, sprint_count)
+
+        if result["success"]:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Team velocity for project {project_id} calculated",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error calculating team velocity: {str(e)}",
+            },
+        )
+
+
+@tool("list_project_templates", cache_tags=("templates",))
+def handle_list_project_templates(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the list_project_templates tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        language = arguments.get("language")
+        category = arguments.get("category")
+
+        result = agent_system.list_project_templates(language, category)
+
+        if result["success"]:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Retrieved {result.get('total_count', 0)} project templates",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error listing project templates: {str(e)}",
+            },
+        )
+
+
+@tool("generate_project", timeout=300, cost=WRITE)
+def handle_generate_project(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> Generator[Dict[str, Any], None, None]:
+    """Handle the generate_project tool, streaming a progress update per file."""
+    agent_system = _get_agent_system()
+
+    try:
+        template_id = arguments.get("template_id")
+        project_name = arguments.get("project_name")
+        target_path = arguments.get("target_path", ".")
+        customizations = arguments.get("customizations", {})
+
+        if not all([template_id, project_name]):
             send_response(
                 request_id,
                 error={
-                    "code": -32603,
-                    "message": f"Error customizing template: {str(e)}",
+                    "code": -32602,
+                    "message": "template_id and project_name are required",
                 },
             )
-        return True
+            return
 
-    elif tool_name == "get_generated_project_status":
-        try:
-            project_id = arguments.get("project_id")
+        result = yield from agent_system.iter_generate_project(
+            template_id, project_name, target_path, customizations
+        )
 
-            if not project_id:
-                send_response(
-                    request_id,
-                    error={"code": -32602, "message": "project_id is required"},
-                )
-                return True
+        if result["success"]:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Project '{project_name}' generated successfully",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error generating project: {str(e)}",
+            },
+        )
 
-            result = agent_system.get_generated_project_status(project_id)
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Project status for {project_id} retrieved",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
+@tool("customize_project_template", cost=WRITE, invalidates=("templates",))
+def handle_customize_project_template(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the customize_project_template tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        template_id = arguments.get("template_id")
+        customizations = arguments.get("customizations", {})
+
+        if not all([template_id, customizations]):
             send_response(
                 request_id,
                 error={
-                    "code": -32603,
-                    "message": f"Error getting generated project status: {str(e)}",
+                    "code": -32602,
+                    "message": "template_id and customizations are required",
+                },
+            )
+            return
+
+        result = agent_system.customize_project_template(template_id, customizations)
+
+        if result["success"]:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Template '{template_id}' customized successfully",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error customizing template: {str(e)}",
+            },
+        )
+
+
+@tool("get_generated_project_status")
+def handle_get_generated_project_status(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_generated_project_status tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        project_id = arguments.get("project_id")
+
+        if not project_id:
+            send_response(
+                request_id,
+                error={"code": -32602, "message": "project_id is required"},
+            )
+            return
+
+        result = agent_system.get_generated_project_status(project_id)
+
+        if result["success"]:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Project status for {project_id} retrieved",
+                        }
+                    ],
+                    "structuredContent": result,
                 },
             )
-        return True
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting generated project status: {str(e)}",
+            },
+        )
+
 
-    elif tool_name == "list_generated_projects":
+@tool("list_generated_projects")
+def handle_list_generated_projects(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the list_generated_projects tool."""
+    agent_system = _get_agent_system()
+
+    try:
+        page = Page("list_generated_projects", arguments)
+        result = agent_system.list_generated_projects()
+
+        if result["success"]:
+            projects = result.pop("projects")
+            for key in ("message", "total_count"):
+                result.pop(key, None)
+            send_response(
+                request_id,
+                page.to_result(projects, "projects", "generated projects", **result),
+            )
+        else:
+            send_response(
+                request_id, error={"code": -32603, "message": result["error"]}
+            )
+    except InvalidCursor as e:
+        send_response(request_id, error={"code": -32602, "message": str(e)})
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error listing generated projects: {str(e)}",
+            },
+        )
+
+
+@tool("get_security_status")
+def handle_get_security_status(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_security_status tool."""
+    try:
+        # Import security middleware
         try:
-            result = agent_system.list_generated_projects()
+            from src.security.middleware import security_middleware
+            from src.security.headers import SecurityHeaders
+
+            # Get security statistics
+            security_stats = security_middleware.get_security_statistics()
+
+            # Get headers validation
+            headers = SecurityHeaders()
+            headers_validation = headers.validate_headers()
+
+            result = {
+                "security_middleware": security_stats,
+                "headers_validation": headers_validation,
+                "security_available": True,
+            }
 
-            if result["success"]:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Retrieved {result.get('total_count', 0)} generated projects",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            else:
-                send_response(
-                    request_id, error={"code": -32603, "message": result["error"]}
-                )
-        except Exception as e:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error listing generated projects: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "Security status retrieved successfully",
+                        }
+                    ],
+                    "structuredContent": result,
                 },
             )
-        return True
+        except ImportError:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "Security middleware not available",
+                        }
+                    ],
+                    "structuredContent": {"security_available": False},
+                },
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting security status: {str(e)}",
+            },
+        )
+
 
-    # Security Tools
-    elif tool_name == "get_security_status":
+@tool("get_rate_limit_status")
+def handle_get_rate_limit_status(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_rate_limit_status tool."""
+    try:
+        # Import rate limiter
         try:
-            # Import security middleware
-            try:
-                from src.security.middleware import security_middleware
-                from src.security.headers import SecurityHeaders
-
-                # Get security statistics
-                security_stats = security_middleware.get_security_statistics()
-
-                # Get headers validation
-                headers = SecurityHeaders()
-                headers_validation = headers.validate_headers()
-
-                result = {
-                    "security_middleware": security_stats,
-                    "headers_validation": headers_validation,
-                    "security_available": True,
-                }
+            from src.security.rate_limiting import rate_limiter
+
+            client_id = arguments.get("client_id", "default")
+
+            # Get rate limit statistics
+            stats = rate_limiter.get_statistics()
+
+            # Test rate limit for client
+            test_result = rate_limiter.is_allowed(client_id, "general")
+
+            result = {
+                "statistics": stats,
+                "client_test": {
+                    "client_id": client_id,
+                    "allowed": test_result["allowed"],
+                    "remaining": test_result["remaining"],
+                    "limit": test_result["limit"],
+                },
+                "rate_limiting_available": True,
+            }
 
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "Security status retrieved successfully",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            except ImportError:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "Security middleware not available",
-                            }
-                        ],
-                        "structuredContent": {"security_available": False},
-                    },
-                )
-        except Exception as e:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting security status: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Rate limit status for client '{client_id}' retrieved",
+                        }
+                    ],
+                    "structuredContent": result,
                 },
             )
-        return True
+        except ImportError:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {"type": "text", "text": "Rate limiting not available"}
+                    ],
+                    "structuredContent": {"rate_limiting_available": False},
+                },
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting rate limit status: {str(e)}",
+            },
+        )
+
 
-    elif tool_name == "get_rate_limit_status":
+@tool("validate_security_headers")
+def handle_validate_security_headers(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the validate_security_headers tool."""
+    try:
+        # Import security headers
         try:
-            # Import rate limiter
-            try:
-                from src.security.rate_limiting import rate_limiter
+            from src.security.headers import SecurityHeaders
 
-                client_id = arguments.get("client_id", "default")
+            headers = SecurityHeaders()
+            validation_result = headers.validate_headers()
+            headers_list = headers.get_headers()
 
-                # Get rate limit statistics
-                stats = rate_limiter.get_statistics()
+            result = {
+                "validation": validation_result,
+                "headers": headers_list,
+                "headers_count": len(headers_list),
+                "security_headers_available": True,
+            }
 
-                # Test rate limit for client
-                test_result = rate_limiter.is_allowed(client_id, "general")
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Security headers validation completed - {len(headers_list)} headers configured",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        except ImportError:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {"type": "text", "text": "Security headers not available"}
+                    ],
+                    "structuredContent": {"security_headers_available": False},
+                },
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error validating security headers: {str(e)}",
+            },
+        )
 
-                result = {
-                    "statistics": stats,
-                    "client_test": {
-                        "client_id": client_id,
-                        "allowed": test_result["allowed"],
-                        "remaining": test_result["remaining"],
-                        "limit": test_result["limit"],
-                    },
-                    "rate_limiting_available": True,
-                }
 
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Rate limit status for client '{client_id}' retrieved",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            except ImportError:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {"type": "text", "text": "Rate limiting not available"}
-                        ],
-                        "structuredContent": {"rate_limiting_available": False},
-                    },
-                )
-        except Exception as e:
+@tool("get_network_statistics")
+def handle_get_network_statistics(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_network_statistics tool."""
+    try:
+        # Import network monitor
+        try:
+            from src.security.network_security import network_monitor
+
+            # Get network statistics
+            stats = network_monitor.get_network_statistics()
+
+            result = {
+                "network_statistics": stats,
+                "network_monitoring_available": True,
+            }
+
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting rate limit status: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Network statistics retrieved - {stats['total_connections']} connections, {len(stats['recent_events'])} recent events",
+                        }
+                    ],
+                    "structuredContent": result,
                 },
             )
-        return True
+        except ImportError:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {"type": "text", "text": "Network monitoring not available"}
+                    ],
+                    "structuredContent": {"network_monitoring_available": False},
+                },
+            )
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting network statistics: {str(e)}",
+            },
+        )
+
 
-    elif tool_name == "validate_security_headers":
+@tool("get_network_connections")
+def handle_get_network_connections(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_network_connections tool."""
+    try:
+        # Import network monitor
         try:
-            # Import security headers
-            try:
-                from src.security.headers import SecurityHeaders
-
-                headers = SecurityHeaders()
-                validation_result = headers.validate_headers()
-                headers_list = headers.get_headers()
-
-                result = {
-                    "validation": validation_result,
-                    "headers": headers_list,
-                    "headers_count": len(headers_list),
-                    "security_headers_available": True,
-                }
+            from src.security.network_security import network_monitor
+
+            page = Page("get_network_connections", arguments)
+            connections = network_monitor.get_connections(page.fetch_count)
 
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Security headers validation completed - {len(headers_list)} headers configured",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            except ImportError:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {"type": "text", "text": "Security headers not available"}
-                        ],
-                        "structuredContent": {"security_headers_available": False},
-                    },
-                )
-        except Exception as e:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error validating security headers: {str(e)}",
+                page.to_result(
+                    connections,
+                    "connections",
+                    "network connections",
+                    network_monitoring_available=True,
+                ),
+            )
+        except ImportError:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {"type": "text", "text": "Network monitoring not available"}
+                    ],
+                    "structuredContent": {"network_monitoring_available": False},
+                },
+            )
+    except InvalidCursor as e:
+        send_response(request_id, error={"code": -32602, "message": str(e)})
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting network connections: {str(e)}",
+            },
+        )
+
+
+@tool("get_security_events")
+def handle_get_security_events(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_security_events tool."""
+    try:
+        # Import network monitor
+        try:
+            from src.security.network_security import network_monitor
+
+            limit = arguments.get("limit", 50)
+            events = network_monitor.get_security_events(limit)
+
+            result = {
+                "security_events": events,
+                "event_count": len(events),
+                "limit": limit,
+                "network_monitoring_available": True,
+            }
+
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Retrieved {len(events)} security events",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        except ImportError:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {"type": "text", "text": "Network monitoring not available"}
+                    ],
+                    "structuredContent": {"network_monitoring_available": False},
                 },
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting security events: {str(e)}",
+            },
+        )
+
 
-    # Network Security Tools
-    elif tool_name == "get_network_statistics":
+@tool("validate_ssl_config")
+def handle_validate_ssl_config(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the validate_ssl_config tool."""
+    try:
+        # Import SSL config
         try:
-            # Import network monitor
-            try:
-                from src.security.network_security import network_monitor
+            from src.security.network_security import ssl_config
 
-                # Get network statistics
-                stats = network_monitor.get_network_statistics()
+            validation_result = ssl_config.validate_ssl_config()
 
-                result = {
-                    "network_statistics": stats,
-                    "network_monitoring_available": True,
-                }
+            result = {
+                "ssl_validation": validation_result,
+                "ssl_config_available": True,
+            }
 
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Network statistics retrieved - {stats['total_connections']} connections, {len(stats['recent_events'])} recent events",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            except ImportError:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {"type": "text", "text": "Network monitoring not available"}
-                        ],
-                        "structuredContent": {"network_monitoring_available": False},
-                    },
-                )
-        except Exception as e:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting network statistics: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"SSL configuration validation completed - {validation_result['contexts']} contexts, {validation_result['certificates']} certificates",
+                        }
+                    ],
+                    "structuredContent": result,
                 },
             )
-        return True
-
-    elif tool_name == "get_network_connections":
-        try:
-            # Import network monitor
-            try:
-                from src.security.network_security import network_monitor
-
-                limit = arguments.get("limit", 50)
-                connections = network_monitor.get_connections(limit)
-
-                result = {
-                    "connections": connections,
-                    "connection_count": len(connections),
-                    "limit": limit,
-                    "network_monitoring_available": True,
-                }
-
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Retrieved {len(connections)} network connections",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            except ImportError:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {"type": "text", "text": "Network monitoring not available"}
-                        ],
-                        "structuredContent": {"network_monitoring_available": False},
-                    },
-                )
-        except Exception as e:
+        except ImportError:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting network connections: {str(e)}",
+                {
+                    "content": [
+                        {"type": "text", "text": "SSL configuration not available"}
+                    ],
+                    "structuredContent": {"ssl_config_available": False},
                 },
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error validating SSL config: {str(e)}",
+            },
+        )
 
-    elif tool_name == "get_security_events":
+
+@tool("get_firewall_status")
+def handle_get_firewall_status(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_firewall_status tool."""
+    try:
+        # Import firewall manager
         try:
-            # Import network monitor
-            try:
-                from src.security.network_security import network_monitor
-
-                limit = arguments.get("limit", 50)
-                events = network_monitor.get_security_events(limit)
-
-                result = {
-                    "security_events": events,
-                    "event_count": len(events),
-                    "limit": limit,
-                    "network_monitoring_available": True,
-                }
+            from src.security.network_security import firewall_manager
+
+            status = firewall_manager.get_firewall_status()
+
+            result = {"firewall_status": status, "firewall_available": True}
 
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Retrieved {len(events)} security events",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            except ImportError:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {"type": "text", "text": "Network monitoring not available"}
-                        ],
-                        "structuredContent": {"network_monitoring_available": False},
-                    },
-                )
-        except Exception as e:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting security events: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Firewall status retrieved - {status['total_rules']} rules, {len(status['blocked_ips'])} blocked IPs",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        except ImportError:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "Firewall management not available",
+                        }
+                    ],
+                    "structuredContent": {"firewall_available": False},
                 },
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error getting firewall status: {str(e)}",
+            },
+        )
 
-    elif tool_name == "validate_ssl_config":
-        try:
-            # Import SSL config
-            try:
-                from src.security.network_security import ssl_config
 
-                validation_result = ssl_config.validate_ssl_config()
+@tool("block_ip", cost=WRITE)
+def handle_block_ip(arguments: Dict[str, Any], request_id: str, send_response) -> None:
+    """Handle the block_ip tool."""
+    try:
+        # Import firewall manager
+        try:
+            from src.security.network_security import firewall_manager
 
-                result = {
-                    "ssl_validation": validation_result,
-                    "ssl_config_available": True,
-                }
+            ip = arguments.get("ip")
+            reason = arguments.get("reason", "Manual block")
 
+            if not ip:
                 send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"SSL configuration validation completed - {validation_result['contexts']} contexts, {validation_result['certificates']} certificates",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            except ImportError:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {"type": "text", "text": "SSL configuration not available"}
-                        ],
-                        "structuredContent": {"ssl_config_available": False},
-                    },
+                    request_id, error={"code": -32602, "message": "ip is required"}
                 )
-        except Exception as e:
+                return
+
+            success = firewall_manager.block_ip(ip, reason)
+
+            result = {
+                "blocked_ip": ip,
+                "reason": reason,
+                "success": success,
+                "firewall_available": True,
+            }
+
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error validating SSL config: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"IP {ip} {'blocked' if success else 'block failed'} - {reason}",
+                        }
+                    ],
+                    "structuredContent": result,
+                },
+            )
+        except ImportError:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "Firewall management not available",
+                        }
+                    ],
+                    "structuredContent": {"firewall_available": False},
                 },
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error blocking IP: {str(e)}"},
+        )
 
-    elif tool_name == "get_firewall_status":
-        try:
-            # Import firewall manager
-            try:
-                from src.security.network_security import firewall_manager
 
-                status = firewall_manager.get_firewall_status()
+@tool("allow_ip", cost=WRITE)
+def handle_allow_ip(arguments: Dict[str, Any], request_id: str, send_response) -> None:
+    """Handle the allow_ip tool."""
+    try:
+        # Import firewall manager
+        try:
+            from src.security.network_security import firewall_manager
 
-                result = {"firewall_status": status, "firewall_available": True}
+            ip = arguments.get("ip")
+            reason = arguments.get("reason", "Manual allow")
 
+            if not ip:
                 send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Firewall status retrieved - {status['total_rules']} rules, {len(status['blocked_ips'])} blocked IPs",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            except ImportError:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "Firewall management not available",
-                            }
-                        ],
-                        "structuredContent": {"firewall_available": False},
-                    },
+                    request_id, error={"code": -32602, "message": "ip is required"}
                 )
-        except Exception as e:
+                return
+
+            success = firewall_manager.allow_ip(ip, reason)
+
+            result = {
+                "allowed_ip": ip,
+                "reason": reason,
+                "success": success,
+                "firewall_available": True,
+            }
+
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error getting firewall status: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"IP {ip} {'allowed' if success else 'allow failed'} - {reason}",
+                        }
+                    ],
+                    "structuredContent": result,
                 },
             )
-        return True
-
-    elif tool_name == "block_ip":
-        try:
-            # Import firewall manager
-            try:
-                from src.security.network_security import firewall_manager
-
-                ip = arguments.get("ip")
-                reason = arguments.get("reason", "Manual block")
-
-                if not ip:
-                    send_response(
-                        request_id, error={"code": -32602, "message": "ip is required"}
-                    )
-                    return True
-
-                success = firewall_manager.block_ip(ip, reason)
-
-                result = {
-                    "blocked_ip": ip,
-                    "reason": reason,
-                    "success": success,
-                    "firewall_available": True,
-                }
-
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"IP {ip} {'blocked' if success else 'block failed'} - {reason}",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            except ImportError:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "Firewall management not available",
-                            }
-                        ],
-                        "structuredContent": {"firewall_available": False},
-                    },
-                )
-        except Exception as e:
+        except ImportError:
             send_response(
                 request_id,
-                error={"code": -32603, "message": f"Error blocking IP: {str(e)}"},
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "Firewall management not available",
+                        }
+                    ],
+                    "structuredContent": {"firewall_available": False},
+                },
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={"code": -32603, "message": f"Error allowing IP: {str(e)}"},
+        )
 
-    elif tool_name == "allow_ip":
-        try:
-            # Import firewall manager
-            try:
-                from src.security.network_security import firewall_manager
-
-                ip = arguments.get("ip")
-                reason = arguments.get("reason", "Manual allow")
-
-                if not ip:
-                    send_response(
-                        request_id, error={"code": -32602, "message": "ip is required"}
-                    )
-                    return True
-
-                success = firewall_manager.allow_ip(ip, reason)
-
-                result = {
-                    "allowed_ip": ip,
-                    "reason": reason,
-                    "success": success,
-                    "firewall_available": True,
-                }
 
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"IP {ip} {'allowed' if success else 'allow failed'} - {reason}",
-                            }
-                        ],
-                        "structuredContent": result,
-                    },
-                )
-            except ImportError:
-                send_response(
-                    request_id,
-                    {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "Firewall management not available",
-                            }
-                        ],
-                        "structuredContent": {"firewall_available": False},
-                    },
-                )
-        except Exception as e:
+@tool("test_network_connectivity", timeout=30)
+def handle_test_network_connectivity(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the test_network_connectivity tool."""
+    try:
+        import socket
+        import time
+
+        host = arguments.get("host")
+        port = arguments.get("port", 80)
+        timeout = arguments.get("timeout", 5)
+
+        if not host:
             send_response(
-                request_id,
-                error={"code": -32603, "message": f"Error allowing IP: {str(e)}"},
+                request_id, error={"code": -32602, "message": "host is required"}
             )
-        return True
+            return
 
-    elif tool_name == "test_network_connectivity":
+        # Test connectivity
+        start_time = time.time()
         try:
-            import socket
-            import time
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            result = sock.connect_ex((host, port))
+            sock.close()
 
-            host = arguments.get("host")
-            port = arguments.get("port", 80)
-            timeout = arguments.get("timeout", 5)
+            end_time = time.time()
+            response_time = (end_time - start_time) * 1000  # Convert to milliseconds
 
-            if not host:
-                send_response(
-                    request_id, error={"code": -32602, "message": "host is required"}
-                )
-                return True
-
-            # Test connectivity
-            start_time = time.time()
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(timeout)
-                result = sock.connect_ex((host, port))
-                sock.close()
-
-                end_time = time.time()
-                response_time = (
-                    end_time - start_time
-                ) * 1000  # Convert to milliseconds
-
-                if result == 0:
-                    send_response(
-                        request_id,
-                        {
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": f"Successfully connected to {host}:{port}",
-                                }
-                            ],
-                            "structuredContent": {
-                                "host": host,
-                                "port": port,
-                                "connected": True,
-                                "response_time_ms": round(response_time, 2),
-                                "timeout": timeout,
-                            },
-                        },
-                    )
-                else:
-                    send_response(
-                        request_id,
-                        {
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": f"Failed to connect to {host}:{port}",
-                                }
-                            ],
-                            "structuredContent": {
-                                "host": host,
-                                "port": port,
-                                "connected": False,
-                                "error_code": result,
-                                "timeout": timeout,
-                            },
-                        },
-                    )
-            except socket.timeout:
+            if result == 0:
                 send_response(
                     request_id,
                     {
                         "content": [
                             {
                                 "type": "text",
-                                "text": f"Connection to {host}:{port} timed out",
+                                "text": f"Successfully connected to {host}:{port}",
                             }
                         ],
                         "structuredContent": {
                             "host": host,
                             "port": port,
-                            "connected": False,
-                            "error": "timeout",
+                            "connected": True,
+                            "response_time_ms": round(response_time, 2),
                             "timeout": timeout,
                         },
                     },
                 )
-            except Exception as e:
+            else:
                 send_response(
                     request_id,
                     {
                         "content": [
                             {
                                 "type": "text",
-                                "text": f"Error connecting to {host}:{port}: {str(e)}",
+                                "text": f"Failed to connect to {host}:{port}",
                             }
                         ],
                         "structuredContent": {
                             "host": host,
                             "port": port,
                             "connected": False,
-                            "error": str(e),
+                            "error_code": result,
                             "timeout": timeout,
                         },
                     },
                 )
+        except socket.timeout:
+            send_response(
+                request_id,
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Connection to {host}:{port} timed out",
+                        }
+                    ],
+                    "structuredContent": {
+                        "host": host,
+                        "port": port,
+                        "connected": False,
+                        "error": "timeout",
+                        "timeout": timeout,
+                    },
+                },
+            )
         except Exception as e:
             send_response(
                 request_id,
-                error={
-                    "code": -32603,
-                    "message": f"Error testing connectivity: {str(e)}",
+                {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Error connecting to {host}:{port}: {str(e)}",
+                        }
+                    ],
+                    "structuredContent": {
+                        "host": host,
+                        "port": port,
+                        "connected": False,
+                        "error": str(e),
+                        "timeout": timeout,
+                    },
                 },
             )
-        return True
+    except Exception as e:
+        send_response(
+            request_id,
+            error={
+                "code": -32603,
+                "message": f"Error testing connectivity: {str(e)}",
+            },
+        )
+
+
+@tool("get_daemon_clients", blocking=False)
+def handle_get_daemon_clients(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_daemon_clients tool."""
+    if _daemon is None:
+        send_response(
+            request_id,
+            {
+                "content": [
+                    {"type": "text", "text": "Server is not running in daemon mode"}
+                ],
+                "structuredContent": {"daemon": False},
+            },
+        )
+        return
+
+    stats = _daemon.get_statistics()
+    send_response(
+        request_id,
+        {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"{stats['active_clients']} clients connected to the MCP daemon",
+                }
+            ],
+            "structuredContent": {"daemon": True, **stats},
+        },
+    )
+
+
+_METRIC_SORT_KEYS = {
+    "calls": lambda entry: entry["calls"],
+    "errors": lambda entry: entry["errors"],
+    "p95": lambda entry: entry["execution_ms"]["p95"],
+    "p99": lambda entry: entry["execution_ms"]["p99"],
+    "bytes": lambda entry: entry["response_bytes"]["p95"],
+}
+
+
+@tool("get_tool_metrics", blocking=False)
+def handle_get_tool_metrics(
+    arguments: Dict[str, Any], request_id: str, send_response
+) -> None:
+    """Handle the get_tool_metrics tool."""
+    stats = tool_metrics.get_statistics(arguments.get("tool"))
+    sort_key = _METRIC_SORT_KEYS[arguments.get("sort_by") or "calls"]
+    ranked = sorted(stats["tools"].items(), key=lambda item: sort_key(item[1]))
+    ranked.reverse()
+    if arguments.get("limit"):
+        ranked = ranked[: arguments["limit"]]
+    stats["tools"] = dict(ranked)
+    stats["result_cache"] = tool_registry.result_cache.get_statistics()
+
+    # Imported here so listing tools does not load NumPy
+    from src.database.embedding_service import embedding_service
+
+    stats["embeddings"] = embedding_service.get_statistics()
+
+    lines = [
+        f"{name}: {entry['calls']} calls, {entry['errors']} errors, "
+        f"p50 {entry['execution_ms']['p50']}ms, p95 {entry['execution_ms']['p95']}ms"
+        for name, entry in ranked
+    ]
+    send_response(
+        request_id,
+        {
+            "content": [
+                {
+                    "type": "text",
+                    "text": "\n".join(lines) or "No tool calls recorded yet",
+                }
+            ],
+            "structuredContent": stats,
+        },
+    )
+
 
-    return False
+def handle_system_tool(
+    tool_name: str, arguments: Dict[str, Any], request_id: str, send_response
+) -> bool:
+    """Handle system tool calls."""
+    return tool_registry.dispatch(
+        tool_name, arguments, request_id, send_response, group="system"
+    )
@@ -0,0 +1,195 @@
+"""Cursor pagination and field projection for list-style MCP tools.
+
+List tools accept ``limit``, an opaque ``cursor`` from a previous page and a
+``fields`` list selecting which (dotted) keys of each item to return. Pages
+are also cut short once their items would exceed ``MCP_MAX_RESPONSE_BYTES``,
+so Cursor never has to parse multi-megabyte lines; the ``next_cursor`` in the
+``pagination`` block of the result continues where the page stopped.
+"""
+
+import base64
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+# Arguments that select a page rather than the query being paged through
+PAGE_ARGUMENTS = ("cursor", "limit", "offset", "fields")
+
+# Input schema properties shared by every paginated tool
+PAGINATION_PROPERTIES = {
+    "limit": {"type": "integer"},
+    "cursor": {"type": "string"},
+    "fields": {"type": "array", "items": {"type": "string"}},
+}
+
+
+def _fingerprint(tool_name: str, arguments: Dict[str, Any]) -> str:
+    query = {
+        key: value for key, value in arguments.items() if key not in PAGE_ARGUMENTS
+    }
+    canonical = json.dumps([tool_name, query], sort_keys=True, default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:12]
+
+
+def encode_cursor(tool_name: str, arguments: Dict[str, Any], offset: int) -> str:
+    """Opaque cursor continuing a query at ``offset``."""
+    state = {"t": tool_name, "q": _fingerprint(tool_name, arguments), "o": offset}
+    raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+class InvalidCursor(ValueError):
+    """A cursor that is malformed or belongs to another query."""
+
+
+def decode_cursor(tool_name: str, arguments: Dict[str, Any], cursor: str) -> int:
+    """Offset a cursor continues at.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or belongs to another query
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        offset = int(state["o"])
+        matches = (
+            state["t"] == tool_name
+            and state["q"] == _fingerprint(tool_name, arguments)
+            and offset >= 0
+        )
+    except (ValueError, TypeError, KeyError, UnicodeEncodeError):
+        raise InvalidCursor("Invalid cursor")
+    if not matches:
+        raise InvalidCursor("Cursor does not belong to this query")
+    return offset
+
+
+def project(item: Any, fields: Optional[Sequence[str]]) -> Any:
+    """Keep only ``fields`` of an item; dotted names select nested keys."""
+    if not fields or not isinstance(item, dict):
+        return item
+
+    projected: Dict[str, Any] = {}
+    for field in fields:
+        source, target = item, projected
+        parts = field.split(".")
+        for part in parts[:-1]:
+            source = source.get(part) if isinstance(source, dict) else None
+            if not isinstance(source, dict):
+                break
+            target = target.setdefault(part, {})
+        else:
+            if parts[-1] in source:
+                target[parts[-1]] = source[parts[-1]]
+    return projected
+
+
+class Page:
+    """The page of a list a tool call asked for."""
+
+    def __init__(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        default_limit: int = 50,
+        max_limit: int = 500,
+        max_bytes: Optional[int] = None,
+    ):
+        """Read ``limit``, ``cursor`` (or ``offset``) and ``fields``.
+
+        Raises:
+            InvalidCursor: If the cursor is invalid for this query
+        """
+        self.tool_name = tool_name
+        self.arguments = arguments or {}
+        self.limit = min(
+            max(int(self.arguments.get("limit") or default_limit), 1), max_limit
+        )
+        cursor = self.arguments.get("cursor")
+        if cursor:
+            self.offset = decode_cursor(tool_name, self.arguments, cursor)
+        else:
+            self.offset = max(int(self.arguments.get("offset") or 0), 0)
+        self.fields = self.arguments.get("fields") or None
+        self.max_bytes = max_bytes or int(
+            os.getenv("MCP_MAX_RESPONSE_BYTES", "1000000")
+        )
+
+    @property
+    def fetch_count(self) -> int:
+        """Items to load from a source that only takes a limit.
+
+        One more than the page needs, so we know whether another page exists.
+        """
+        return self.offset + self.limit + 1
+
+    def apply(
+        self, items: Sequence[Any], total: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Slice, project and size-limit ``items`` (the list from offset 0).
+
+        Returns ``{"items": [...], "pagination": {...}}``. ``total`` is the
+        full list length when known; by default it is ``len(items)`` unless
+        the source was cut at :attr:`fetch_count`.
+        """
+        window = items[self.offset : self.offset + self.limit]
+        page: List[Any] = []
+        size = 0
+        truncated = False
+        for item in window:
+            projected = project(item, self.fields)
+            size += len(json.dumps(projected, default=str)) + 1
+            # Always return one item so paging makes progress
+            if page and size > self.max_bytes:
+                truncated = True
+                break
+            page.append(projected)
+
+        end = self.offset + len(page)
+        has_more = end < len(items)
+        if total is None and len(items) < self.fetch_count:
+            total = len(items)
+        return {
+            "items": page,
+            "pagination": {
+                "count": len(page),
+                "total": total,
+                "offset": self.offset,
+                "limit": self.limit,
+                "has_more": has_more,
+                "next_cursor": (
+                    encode_cursor(self.tool_name, self.arguments, end)
+                    if has_more
+                    else None
+                ),
+                "truncated": truncated,
+            },
+        }
+
+    def to_result(
+        self,
+        items: Sequence[Any],
+        key: str,
+        noun: str,
+        verb: str = "Retrieved",
+        total: Optional[int] = None,
+        **extra: Any,
+    ) -> Dict[str, Any]:
+        """MCP tool result for the page: a one-line summary plus the items.
+
+        ``extra`` fields are added to the structured content next to the items
+        under ``key`` and the ``pagination`` block.
+        """
+        page = self.apply(items, total)
+        info = page["pagination"]
+        text = f"{verb} {info['count']}"
+        if info["total"] is not None:
+            text += f" of {info['total']}"
+        text += f" {noun}"
+        if info["has_more"]:
+            text += " (more available: pass pagination.next_cursor as cursor)"
+        return {
+            "content": [{"type": "text", "text": text}],
+            "structuredContent": {**extra, key: page["items"], "pagination": info},
+        }
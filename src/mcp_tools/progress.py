@@ -0,0 +1,111 @@
+"""MCP progress notifications for long-running tools.
+
+A tool handler written as a generator (or async generator) yields progress
+updates as work completes: each generated file, each cleared collection. The
+registry turns every update into a ``notifications/progress`` message for the
+``progressToken`` the client sent in ``params._meta``, so the client sees the
+first useful output long before the final response, which can stay small.
+
+Updates are dicts with any of ``progress``, ``total``, ``message`` and
+``partial`` (a partial result). ``progress`` counts up automatically when
+omitted. Without a progress token updates are dropped, but the handler still
+stops at the next update if its request was cancelled.
+"""
+
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+from src.core.cancellation import current_token
+
+logger = logging.getLogger(__name__)
+
+Notifier = Callable[[str, Dict[str, Any]], None]
+
+PROGRESS_METHOD = "notifications/progress"
+
+
+class ProgressReporter:
+    """Sends progress notifications for one tool call."""
+
+    def __init__(
+        self,
+        progress_token: Any = None,
+        notify: Optional[Notifier] = None,
+        tool_name: str = "",
+    ):
+        """Initialize reporter.
+
+        Args:
+            progress_token: Token from the request's ``_meta`` (None: no updates)
+            notify: ``send_notification(method, params)`` callable
+            tool_name: Tool name for logs
+        """
+        self.progress_token = progress_token
+        self.notify = notify
+        self.tool_name = tool_name
+        self.progress = 0.0
+        self.sent = 0
+        self.started = time.perf_counter()
+        self.first_update_ms: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the client asked for progress notifications."""
+        return self.progress_token is not None and self.notify is not None
+
+    def report(self, update: Optional[Dict[str, Any]] = None) -> None:
+        """Send one update; stops the handler if its request was cancelled."""
+        token = current_token()
+        if token is not None:
+            token.check()
+
+        update = update or {}
+        self.progress = float(update.get("progress", self.progress + 1))
+        if not self.enabled:
+            return
+
+        params: Dict[str, Any] = {
+            "progressToken": self.progress_token,
+            "progress": self.progress,
+        }
+        for key in ("total", "message", "partial"):
+            if update.get(key) is not None:
+                params[key] = update[key]
+
+        self.notify(PROGRESS_METHOD, params)
+        self.sent += 1
+        if self.first_update_ms is None:
+            self.first_update_ms = (time.perf_counter() - self.started) * 1000
+            logger.debug(
+                f"First progress for {self.tool_name} after "
+                f"{self.first_update_ms:.1f}ms"
+            )
+
+
+_current_reporter: contextvars.ContextVar[Optional[ProgressReporter]] = (
+    contextvars.ContextVar("mcp_progress_reporter", default=None)
+)
+
+
+def current_progress() -> Optional[ProgressReporter]:
+    """Reporter of the tool call running in this context, if any."""
+    return _current_reporter.get()
+
+
+def progress_enabled() -> bool:
+    """Whether the running tool call streams progress to the client."""
+    reporter = current_progress()
+    return reporter is not None and reporter.enabled
+
+
+@contextmanager
+def bind_progress(reporter: Optional[ProgressReporter]):
+    """Make ``reporter`` the current reporter for the enclosed code."""
+    reset = _current_reporter.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _current_reporter.reset(reset)
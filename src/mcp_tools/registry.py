@@ -0,0 +1,570 @@
+"""Central MCP tool registry.
+
+Every tool registers once, at import time, with the ``@tool`` decorator of its
+handler module. The registry keeps the tool definition, the handler, a JSON
+schema validator compiled in advance and the scheduling flags the dispatcher
+uses, so serving ``tools/call`` is a single dict lookup. Idempotent tools
+registered with ``cache_tags`` are served from a read-through
+:class:`ResultCache`; write tools name the tags they ``invalidates``.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.core.cancellation import RequestCancelled, current_token
+from src.core.event_loop import run_async
+from src.core.tool_metrics import (
+    CALLS,
+    ERRORS,
+    EXECUTION,
+    QUEUE_WAIT,
+    bind_tool,
+    tool_metrics,
+)
+
+from .admission import CHEAP, READ
+from .progress import ProgressReporter, bind_progress
+from .result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+ToolHandler = Callable[[Dict[str, Any], Any, Callable], Any]
+Validator = Callable[[Dict[str, Any]], Optional[str]]
+
+_JSON_TYPES = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+def _check_type(types: List[str], label: str) -> Validator:
+    type_checks = [_JSON_TYPES[t] for t in types if t in _JSON_TYPES]
+
+    def check_type(value):
+        if not any(check(value) for check in type_checks):
+            return f"{label} must be of type {' or '.join(types)}"
+        return None
+
+    return check_type
+
+
+def _compile_enum(schema: Dict[str, Any], path: str) -> List[Validator]:
+    allowed = list(schema["enum"])
+
+    def check_enum(value):
+        if value not in allowed:
+            return f"{path or 'value'} must be one of {allowed}"
+        return None
+
+    return [check_enum]
+
+
+def _check_required(required: Tuple[str, ...]) -> Validator:
+    def check_required(value):
+        if isinstance(value, dict):
+            missing = [key for key in required if key not in value]
+            if missing:
+                return f"Missing required parameters: {', '.join(missing)}"
+        return None
+
+    return check_required
+
+
+def _check_properties(properties: Dict[str, Validator]) -> Validator:
+    def check_properties(value):
+        if not isinstance(value, dict):
+            return None
+        for name, validator in properties.items():
+            if name in value and value[name] is not None:
+                error = validator(value[name])
+                if error:
+                    return error
+        return None
+
+    return check_properties
+
+
+def _compile_object(schema: Dict[str, Any], path: str) -> List[Validator]:
+    checks: List[Validator] = []
+    required = tuple(schema.get("required", ()))
+    if required:
+        checks.append(_check_required(required))
+    properties = {
+        name: compile_schema_validator(subschema, f"{path}{name}")
+        for name, subschema in schema.get("properties", {}).items()
+    }
+    if properties:
+        checks.append(_check_properties(properties))
+    return checks
+
+
+def _compile_array(schema: Dict[str, Any], path: str) -> List[Validator]:
+    if "items" not in schema:
+        return []
+    item_validator = compile_schema_validator(schema["items"], f"{path}[]")
+
+    def check_items(value):
+        if not isinstance(value, list):
+            return None
+        for item in value:
+            error = item_validator(item)
+            if error:
+                return error
+        return None
+
+    return [check_items]
+
+
+# Checks beyond the type itself, per schema type; scalar types have none
+_COMPILERS: Dict[str, Callable[[Dict[str, Any], str], List[Validator]]] = {
+    "enum": _compile_enum,
+    "object": _compile_object,
+    "array": _compile_array,
+}
+
+
+def _schema_kinds(schema: Dict[str, Any], types: List[str]) -> List[str]:
+    """Compilers that apply to ``schema``, in ``_COMPILERS`` order.
+
+    Untyped schemas are treated as objects or arrays by their keywords.
+    """
+    kinds = set(types)
+    if not types:
+        if "properties" in schema or "required" in schema:
+            kinds.add("object")
+        if "items" in schema:
+            kinds.add("array")
+    if "enum" in schema:
+        kinds.add("enum")
+    return [kind for kind in _COMPILERS if kind in kinds]
+
+
+def compile_schema_validator(schema: Dict[str, Any], path: str = "") -> Validator:
+    """Compile a JSON schema into a validator function.
+
+    Supports the subset used by our tool definitions: ``type``, ``properties``,
+    ``required``, ``enum`` and ``items``. The returned function yields an error
+    message for invalid input and ``None`` otherwise. ``null`` is accepted for
+    optional properties because clients commonly send it for omitted values.
+    """
+    expected_type = schema.get("type")
+    types = expected_type if isinstance(expected_type, list) else [expected_type]
+    types = [t for t in types if t]
+    checks: List[Validator] = []
+    if types:
+        checks.append(_check_type(types, path or "arguments"))
+    for kind in _schema_kinds(schema, types):
+        checks.extend(_COMPILERS[kind](schema, path))
+
+    def validate(value):
+        for check in checks:
+            error = check(value)
+            if error:
+                return error
+        return None
+
+    return validate
+
+
+@dataclass
+class ToolSpec:
+    """A registered MCP tool."""
+
+    name: str
+    handler: ToolHandler
+    definition: Dict[str, Any]
+    validator: Validator
+    group: str
+    is_async: bool = False
+    streams: bool = False
+    blocking: bool = True
+    timeout: Optional[float] = None
+    cost: str = READ
+    # Results are cached when set; bumping any of the tags invalidates them
+    cache_tags: Optional[Tuple[str, ...]] = None
+    cache_ttl: Optional[float] = None
+    # Cache tags bumped after every call
+    invalidates: Tuple[str, ...] = ()
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def cacheable(self) -> bool:
+        """Whether results of this tool go through the result cache."""
+        return self.cache_tags is not None and not self.streams
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get scheduling metadata for this tool."""
+        return {
+            "name": self.name,
+            "group": self.group,
+            "is_async": self.is_async,
+            "streams": self.streams,
+            "blocking": self.blocking,
+            "timeout": self.timeout,
+            "cost": self.cost,
+            "cached": self.cacheable,
+            "invalidates": list(self.invalidates),
+            **self.metadata,
+        }
+
+
+class ToolRegistry:
+    """Registry of MCP tools keyed by tool name."""
+
+    def __init__(self):
+        """Initialize tool registry."""
+        self.tools: Dict[str, ToolSpec] = {}
+        self.lock = threading.RLock()
+        # Bumped on every change so cached catalogues know when to rebuild
+        self.revision = 0
+        # Deadline in seconds for tools registered without their own
+        self.default_timeout = float(os.getenv("MCP_TOOL_TIMEOUT", "120"))
+        # send_notification(method, params) used for progress updates
+        self.notify: Optional[Callable[[str, Dict[str, Any]], None]] = None
+        # send_raw_response(request_id, result_json) used for cached results
+        self.send_raw: Optional[Callable[[Any, bytes], None]] = None
+        self.result_cache = ResultCache()
+
+    def set_notifier(self, notify: Callable[[str, Dict[str, Any]], None]) -> None:
+        """Set the function progress notifications are sent through."""
+        self.notify = notify
+
+    def set_raw_sender(self, send_raw: Callable[[Any, bytes], None]) -> None:
+        """Set the function already serialized results are sent through."""
+        self.send_raw = send_raw
+
+    def register(
+        self,
+        definition: Dict[str, Any],
+        handler: ToolHandler,
+        group: str = "default",
+        blocking: bool = True,
+        timeout: Optional[float] = None,
+        cost: Optional[str] = None,
+        cache_tags: Optional[Tuple[str, ...]] = None,
+        cache_ttl: Optional[float] = None,
+        invalidates: Tuple[str, ...] = (),
+        **metadata: Any,
+    ) -> ToolSpec:
+        """Register a tool handler for a tool definition.
+
+        ``cost`` is the admission cost class; non-blocking tools default to
+        cheap and blocking ones to read-only. Generator handlers stream: every
+        value they yield is sent as a progress notification. Results of tools
+        with ``cache_tags`` are cached for ``cache_ttl`` seconds or until a
+        tool that ``invalidates`` one of the tags runs.
+        """
+        name = definition["name"]
+        spec = ToolSpec(
+            name=name,
+            handler=handler,
+            definition=definition,
+            validator=compile_schema_validator(
+                definition.get("inputSchema", {"type": "object"})
+            ),
+            group=group,
+            is_async=asyncio.iscoroutinefunction(handler)
+            or inspect.isasyncgenfunction(handler),
+            streams=inspect.isgeneratorfunction(handler)
+            or inspect.isasyncgenfunction(handler),
+            blocking=blocking,
+            timeout=timeout,
+            cost=cost or (READ if blocking else CHEAP),
+            cache_tags=tuple(cache_tags) if cache_tags is not None else None,
+            cache_ttl=cache_ttl,
+            invalidates=tuple(invalidates),
+            metadata=metadata,
+        )
+
+        with self.lock:
+            if name in self.tools:
+                logger.warning(f"Tool {name} re-registered by group {group}")
+            self.tools[name] = spec
+            self.revision += 1
+
+        return spec
+
+    def unregister(self, name: str) -> bool:
+        """Remove a tool from the registry."""
+        with self.lock:
+            removed = self.tools.pop(name, None) is not None
+            if removed:
+                self.revision += 1
+            return removed
+
+    def bind(self, definitions: List[Dict[str, Any]], group: str) -> Callable:
+        """Create a ``@tool(name)`` decorator for a module's tool definitions."""
+        by_name = {definition["name"]: definition for definition in definitions}
+
+        def tool(
+            name: str,
+            blocking: bool = True,
+            timeout: Optional[float] = None,
+            cost: Optional[str] = None,
+            cache_tags: Optional[Tuple[str, ...]] = None,
+            cache_ttl: Optional[float] = None,
+            invalidates: Tuple[str, ...] = (),
+            **metadata: Any,
+        ) -> Callable:
+            if name not in by_name:
+                raise KeyError(f"No definition for tool {name} in group {group}")
+
+            def decorator(handler: ToolHandler) -> ToolHandler:
+                self.register(
+                    by_name[name],
+                    handler,
+                    group=group,
+                    blocking=blocking,
+                    timeout=timeout,
+                    cost=cost,
+                    cache_tags=cache_tags,
+                    cache_ttl=cache_ttl,
+                    invalidates=invalidates,
+                    **metadata,
+                )
+                return handler
+
+            return decorator
+
+        return tool
+
+    def get(self, name: str) -> Optional[ToolSpec]:
+        """Get a registered tool by name."""
+        return self.tools.get(name)
+
+    def get_timeout(self, name: str) -> Optional[float]:
+        """Deadline in seconds for a tool call (its own or the default)."""
+        spec = self.tools.get(name)
+        if spec is None:
+            return None
+        return spec.timeout if spec.timeout is not None else self.default_timeout
+
+    def list_definitions(self) -> List[Dict[str, Any]]:
+        """Get all tool definitions in registration order."""
+        return [spec.definition for spec in list(self.tools.values())]
+
+    def get_metadata(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-tool scheduling metadata."""
+        return {name: spec.to_dict() for name, spec in list(self.tools.items())}
+
+    def validate(
+        self, spec: ToolSpec, arguments: Dict[str, Any], request_id, send_response
+    ) -> bool:
+        """Validate arguments, sending an invalid params error on failure."""
+        error = spec.validator(arguments)
+        if error:
+            send_response(request_id, error={"code": -32602, "message": error})
+            return False
+        return True
+
+    def dispatch(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        request_id: Any,
+        send_response: Callable,
+        group: Optional[str] = None,
+        progress_token: Any = None,
+    ) -> bool:
+        """Run a synchronous tool handler; returns False for unknown tools."""
+        spec = self.tools.get(tool_name)
+        if spec is None or (group and spec.group != group):
+            return False
+
+        with self._calling(spec):
+            send_response = self._read_through(
+                spec, arguments, request_id, send_response
+            )
+            if send_response is not None:
+                self._dispatch(
+                    spec, arguments, request_id, send_response, progress_token
+                )
+        return True
+
+    def _dispatch(
+        self, spec: ToolSpec, arguments, request_id, send_response, progress_token
+    ) -> None:
+        tool_name = spec.name
+        if not self.validate(spec, arguments or {}, request_id, send_response):
+            return
+
+        reporter = ProgressReporter(progress_token, self.notify, tool_name)
+        try:
+            with bind_progress(reporter):
+                if spec.is_async:
+                    run_async(
+                        self._run_async(
+                            spec, arguments, request_id, send_response, reporter
+                        )
+                    )
+                elif spec.streams:
+                    self._drain(
+                        spec.handler(arguments or {}, request_id, send_response),
+                        reporter,
+                    )
+                else:
+                    spec.handler(arguments or {}, request_id, send_response)
+        except RequestCancelled as e:
+            # The client gave up on this request, so nobody reads a response
+            logger.info(f"Tool {tool_name} abandoned: {e}")
+        except Exception as e:
+            logger.error(f"Tool {tool_name} failed: {e}")
+            send_response(
+                request_id,
+                error={"code": -32603, "message": f"Error in {tool_name}: {str(e)}"},
+            )
+
+    async def dispatch_async(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        request_id: Any,
+        send_response: Callable,
+        progress_token: Any = None,
+    ) -> bool:
+        """Run a coroutine tool handler on the current loop."""
+        spec = self.tools.get(tool_name)
+        if spec is None:
+            return False
+
+        with self._calling(spec):
+            send_response = self._read_through(
+                spec, arguments, request_id, send_response
+            )
+            if send_response is None:
+                return True
+            if not self.validate(spec, arguments or {}, request_id, send_response):
+                return True
+
+            reporter = ProgressReporter(progress_token, self.notify, tool_name)
+            try:
+                with bind_progress(reporter):
+                    await self._run_async(
+                        spec, arguments, request_id, send_response, reporter
+                    )
+            except RequestCancelled as e:
+                # The client gave up on this request, so nobody reads a response
+                logger.info(f"Tool {tool_name} abandoned: {e}")
+            except Exception as e:
+                logger.error(f"Tool {tool_name} failed: {e}")
+                send_response(
+                    request_id,
+                    error={
+                        "code": -32603,
+                        "message": f"Error in {tool_name}: {str(e)}",
+                    },
+                )
+        return True
+
+    def _read_through(
+        self, spec: ToolSpec, arguments, request_id, send_response: Callable[..., None]
+    ) -> Optional[Callable]:
+        """Answer a call from the result cache if possible.
+
+        Returns None when the cached result was sent, otherwise the function
+        the handler should answer through, which fills the cache on success.
+        """
+        cache = self.result_cache
+        if not spec.cacheable or not cache.enabled:
+            return send_response
+        key = cache.make_key(spec.name, arguments)
+        if key is None:
+            return send_response
+
+        data = cache.get(key)
+        if data is not None:
+            self._send_serialized(request_id, data, send_response)
+            return None
+
+        tags = spec.cache_tags
+        versions = cache.versions(tags)
+
+        def send_and_cache(request_id, result=None, error=None):
+            if error or not _cacheable_result(result):
+                send_response(request_id, result, error)
+                return
+            data = cache.put(key, result, tags, versions, spec.cache_ttl)
+            self._send_serialized(request_id, data, send_response)
+
+        return send_and_cache
+
+    def _send_serialized(self, request_id, data: bytes, send_response) -> None:
+        if self.send_raw is not None:
+            self.send_raw(request_id, data)
+        else:
+            send_response(request_id, json.loads(data))
+
+    @contextmanager
+    def _calling(self, spec: ToolSpec):
+        """Time a call and apply its cache invalidations once it is done."""
+        # Error responses are counted where they are sent (see bind_tool)
+        tool_name = spec.name
+        start = time.perf_counter()
+        token = current_token()
+        tool_metrics.increment(tool_name, CALLS)
+        if token is not None:
+            tool_metrics.record_seconds(tool_name, QUEUE_WAIT, start - token.created)
+        try:
+            with bind_tool(tool_name):
+                yield
+        finally:
+            tool_metrics.record_seconds(
+                tool_name, EXECUTION, time.perf_counter() - start
+            )
+            if token is not None and token.reason == "timed out":
+                tool_metrics.increment(tool_name, ERRORS)
+            if spec.invalidates:
+                self.result_cache.invalidate(*spec.invalidates)
+
+    @staticmethod
+    def _drain(updates, reporter: ProgressReporter) -> None:
+        # Closing the generator on cancellation runs the handler's cleanup
+        try:
+            for update in updates:
+                reporter.report(update)
+        finally:
+            updates.close()
+
+    @staticmethod
+    async def _run_async(
+        spec: ToolSpec,
+        arguments: Dict[str, Any],
+        request_id,
+        send_response,
+        reporter: ProgressReporter,
+    ) -> None:
+        if not spec.streams:
+            await spec.handler(arguments or {}, request_id, send_response)
+            return
+
+        updates = spec.handler(arguments or {}, request_id, send_response)
+        try:
+            async for update in updates:
+                reporter.report(update)
+        finally:
+            await updates.aclose()
+
+
+def _cacheable_result(result: Any) -> bool:
+    """Whether a tool result is a success worth caching."""
+    if not isinstance(result, dict) or result.get("isError"):
+        return False
+    structured = result.get("structuredContent")
+    return not (isinstance(structured, dict) and structured.get("success") is False)
+
+
+# Global tool registry instance
+tool_registry = ToolRegistry()
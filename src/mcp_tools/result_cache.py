@@ -0,0 +1,179 @@
+"""Read-through cache for the results of idempotent MCP tools.
+
+Tools registered with ``cache_tags`` have their results cached under the tool
+name and canonical JSON of the arguments, already serialized, so a hit skips
+both the handler and the encoder. Entries leave the cache when they are least
+recently used, when their TTL expires, or when a write tool bumps one of their
+tags: every entry remembers the tag versions current when its call started
+and is stale as soon as any of them moved on.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+Versions = Tuple[int, ...]
+
+
+class _Entry:
+    """A cached result."""
+
+    __slots__ = ("data", "expires_at", "tags", "versions")
+
+    def __init__(
+        self, data: bytes, expires_at: float, tags: Tuple[str, ...], versions: Versions
+    ):
+        self.data = data
+        self.expires_at = expires_at
+        self.tags = tags
+        self.versions = versions
+
+
+class ResultCache:
+    """LRU and TTL cache of serialized tool results with invalidation tags."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        default_ttl: Optional[float] = None,
+        enabled: Optional[bool] = None,
+        encode: Optional[Callable[[Any], bytes]] = None,
+    ):
+        """Initialize result cache.
+
+        Args:
+            max_entries: Most results kept before the least recently used go
+            default_ttl: Seconds a result stays valid unless the tool says
+            enabled: Cache anything at all (``MCP_RESULT_CACHE``)
+            encode: Serializer for results (defaults to the response writer's)
+        """
+        self.max_entries = max_entries or int(os.getenv("MCP_RESULT_CACHE_SIZE", "512"))
+        self.default_ttl = (
+            default_ttl
+            if default_ttl is not None
+            else float(os.getenv("MCP_RESULT_CACHE_TTL", "300"))
+        )
+        if enabled is None:
+            enabled = os.getenv("MCP_RESULT_CACHE", "true").lower() == "true"
+        self.enabled = enabled
+        self._encode = encode
+
+        self.entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self.tag_versions: Dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expired": 0,
+            "invalidated": 0,
+        }
+
+    def encode(self, result: Any) -> bytes:
+        """Serialize a result the way the response writer would."""
+        if self._encode is None:
+            from .writer import response_writer
+
+            self._encode = response_writer.encode
+        return self._encode(result)
+
+    @staticmethod
+    def make_key(
+        tool_name: str, arguments: Optional[Dict[str, Any]]
+    ) -> Optional[CacheKey]:
+        """Cache key for a call, None if the arguments are not JSON."""
+        try:
+            canonical = json.dumps(
+                arguments or {}, sort_keys=True, separators=(",", ":")
+            )
+        except (TypeError, ValueError):
+            return None
+        return tool_name, canonical
+
+    def versions(self, tags: Iterable[str]) -> Versions:
+        """Current versions of ``tags``; take them before running the tool."""
+        return tuple(self.tag_versions.get(tag, 0) for tag in tags)
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        """Serialized result for a call, None on a miss."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self.entries[key]
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            if entry.versions != self.versions(entry.tags):
+                del self.entries[key]
+                self.stats["invalidated"] += 1
+                self.stats["misses"] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry.data
+
+    def put(
+        self,
+        key: CacheKey,
+        result: Any,
+        tags: Tuple[str, ...] = (),
+        versions: Optional[Versions] = None,
+        ttl: Optional[float] = None,
+    ) -> bytes:
+        """Serialize and cache a result; returns the serialized bytes.
+
+        ``versions`` are the tag versions from before the tool ran, so a write
+        that finished meanwhile leaves the result stale instead of cached.
+        """
+        data = self.encode(result)
+        ttl = self.default_ttl if ttl is None else ttl
+        with self.lock:
+            if versions is None:
+                versions = self.versions(tags)
+            self.entries[key] = _Entry(data, time.monotonic() + ttl, tags, versions)
+            self.entries.move_to_end(key)
+            self.stats["stores"] += 1
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.stats["evictions"] += 1
+        return data
+
+    def invalidate(self, *tags: str) -> None:
+        """Make every result cached under any of ``tags`` stale."""
+        with self.lock:
+            for tag in tags:
+                self.tag_versions[tag] = self.tag_versions.get(tag, 0) + 1
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self.lock:
+            self.entries.clear()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get hit rate, size and eviction counts."""
+        with self.lock:
+            stats = dict(self.stats)
+            size = len(self.entries)
+            cached_bytes = sum(len(entry.data) for entry in self.entries.values())
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            **stats,
+            "enabled": self.enabled,
+            "entries": size,
+            "max_entries": self.max_entries,
+            "bytes": cached_bytes,
+            "default_ttl": self.default_ttl,
+            "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+            "tag_versions": dict(self.tag_versions),
+        }
@@ -0,0 +1,280 @@
+"""Buffered, off-thread JSON-RPC response writer.
+
+Handlers hand response objects to a queue and return immediately; a single
+writer thread serializes them, joins everything that is ready into one write
+and flushes once, so a slow client pipe never blocks a handler thread.
+Serialization uses orjson or msgspec when installed and the standard library
+otherwise. Responses queued with a tool label have their encoding time and
+size recorded in that tool's metrics.
+"""
+
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from src.core.tool_metrics import (
+    RESPONSE_BYTES,
+    SERIALIZATION,
+    ToolMetrics,
+    tool_metrics,
+)
+
+logger = logging.getLogger(__name__)
+
+Encoder = Callable[[Any], bytes]
+
+
+def _stdlib_encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _load_encoder(preference: str) -> Tuple[str, Encoder]:
+    """Pick the fastest available encoder, honouring an explicit preference."""
+    if preference in ("auto", "orjson"):
+        try:
+            import orjson
+
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+            def orjson_encode(value: Any) -> bytes:
+                return orjson.dumps(value, option=options)
+
+            return "orjson", orjson_encode
+        except ImportError:
+            pass
+
+    if preference in ("auto", "msgspec"):
+        try:
+            import msgspec
+
+            return "msgspec", msgspec.json.Encoder().encode
+        except ImportError:
+            pass
+
+    return "json", _stdlib_encode
+
+
+class ResponseWriter:
+    """Serializes and writes JSON-RPC messages on a dedicated thread."""
+
+    # Queued item that stops the writer thread
+    _STOP = object()
+
+    def __init__(
+        self,
+        stream: Optional[BinaryIO] = None,
+        encoder: Optional[str] = None,
+        max_batch: Optional[int] = None,
+        metrics: Optional[ToolMetrics] = None,
+    ):
+        """Initialize writer; the thread starts on first write.
+
+        Args:
+            stream: Binary stream to write to (defaults to stdout)
+            encoder: "auto", "orjson", "msgspec" or "json"
+            max_batch: Most messages coalesced into a single write
+            metrics: Per-tool metrics for labelled responses
+        """
+        self.stream = stream
+        self.metrics = metrics or tool_metrics
+        self.encoder_name, self._encode = _load_encoder(
+            encoder or os.getenv("MCP_JSON_ENCODER", "auto")
+        )
+        self.max_batch = max_batch or int(os.getenv("MCP_WRITER_MAX_BATCH", "64"))
+
+        self.queue: "queue.Queue[Any]" = queue.Queue()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+        self.started_at = time.monotonic()
+        self.stats = {
+            "messages": 0,
+            "bytes": 0,
+            "writes": 0,
+            "encode_errors": 0,
+            "write_errors": 0,
+            "max_queue_depth": 0,
+            "encode_seconds": 0.0,
+            "write_seconds": 0.0,
+        }
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value with the selected encoder."""
+        try:
+            return self._encode(value)
+        except TypeError:
+            # Fast encoders reject some types json.dumps accepts (and vice versa)
+            return _stdlib_encode(value)
+
+    def start(self) -> None:
+        """Start the writer thread if needed."""
+        if self.thread is not None and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self._run, name="mcp-response-writer", daemon=True
+                )
+                self.thread.start()
+
+    def write(self, message: Dict[str, Any], label: Optional[str] = None) -> None:
+        """Queue a JSON-RPC message object for serialization and writing.
+
+        ``label`` names the tool the message answers, for per-tool metrics.
+        """
+        self._put(message, label)
+
+    def write_raw(self, data: bytes, label: Optional[str] = None) -> None:
+        """Queue an already serialized JSON-RPC message (without newline)."""
+        self._put(data, label)
+
+    def _put(self, item: Any, label: Optional[str] = None) -> None:
+        self.start()
+        self.queue.put((item, label))
+        depth = self.queue.qsize()
+        if depth > self.stats["max_queue_depth"]:
+            self.stats["max_queue_depth"] = depth
+
+    def write_batch(self, messages: List[Any]) -> None:
+        """Queue a JSON-RPC batch response (message objects or raw bytes)."""
+        self._put(list(messages))
+
+    def _serialize(self, item: Any) -> Optional[bytes]:
+        if isinstance(item, bytes):
+            return item
+        if isinstance(item, list):
+            parts = [self._serialize(member) for member in item]
+            return b"[" + b",".join(p for p in parts if p is not None) + b"]"
+
+        start = time.perf_counter()
+        try:
+            return self.encode(item)
+        except Exception as e:
+            # Report the failure to the client instead of dropping the response
+            self.stats["encode_errors"] += 1
+            logger.error(f"Failed to serialize response {item.get('id')}: {e}")
+            if item.get("id") is None:
+                return None
+            return _stdlib_encode(
+                {
+                    "jsonrpc": "2.0",
+                    "id": item.get("id"),
+                    "error": {
+                        "code": -32603,
+                        "message": f"Response not serializable: {str(e)}",
+                    },
+                }
+            )
+        finally:
+            self.stats["encode_seconds"] += time.perf_counter() - start
+
+    def _run(self) -> None:
+        while True:
+            items = self._drain()
+            lines = self._serialize_items(items)
+            if lines:
+                self._flush_lines(lines)
+            for _ in items:
+                self.queue.task_done()
+            if any(item is self._STOP for item, _ in items):
+                return
+
+    def _drain(self) -> List[Tuple[Any, Optional[str]]]:
+        """Wait for one queued item, then take whatever else is waiting."""
+        items = [self.queue.get()]
+        while len(items) < self.max_batch:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _serialize_items(self, items: List[Tuple[Any, Optional[str]]]) -> List[bytes]:
+        """Serialized lines of ``items``, recording per-tool metrics."""
+        lines: List[bytes] = []
+        for item, label in items:
+            if item is self._STOP:
+                continue
+            start = time.perf_counter()
+            line = self._serialize(item)
+            if line is None:
+                continue
+            lines.append(line)
+            if label is not None:
+                self.metrics.record_seconds(
+                    label, SERIALIZATION, time.perf_counter() - start
+                )
+                self.metrics.record(label, RESPONSE_BYTES, len(line))
+        return lines
+
+    def _flush_lines(self, lines: List[bytes]) -> None:
+        data = b"\n".join(lines) + b"\n"
+        start = time.perf_counter()
+        try:
+            stream = self.stream
+            if stream is None:
+                # Resolved per write so redirected stdout is honoured
+                sys.stdout.flush()
+                stream = getattr(sys.stdout, "buffer", None)
+            if stream is None:
+                # Text-only streams (e.g. redirected in tests)
+                sys.stdout.write(data.decode("utf-8"))
+                sys.stdout.flush()
+            else:
+                stream.write(data)
+                stream.flush()
+        except Exception as e:
+            self.stats["write_errors"] += 1
+            logger.error(f"Failed to write {len(lines)} responses: {e}")
+            return
+        finally:
+            self.stats["write_seconds"] += time.perf_counter() - start
+
+        self.stats["messages"] += len(lines)
+        self.stats["bytes"] += len(data)
+        self.stats["writes"] += 1
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far is written."""
+        if self.thread is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write everything still queued and stop the writer thread."""
+        thread = self.thread
+        if thread is None or not thread.is_alive():
+            return
+        self.queue.put((self._STOP, None))
+        thread.join(timeout)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get transport statistics including throughput."""
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        stats = dict(self.stats)
+        return {
+            **stats,
+            "encoder": self.encoder_name,
+            "queue_depth": self.queue.qsize(),
+            "messages_per_second": round(stats["messages"] / elapsed, 3),
+            "bytes_per_second": round(stats["bytes"] / elapsed, 3),
+            "messages_per_write": round(
+                stats["messages"] / stats["writes"] if stats["writes"] else 0.0, 3
+            ),
+            "encode_seconds": round(stats["encode_seconds"], 6),
+            "write_seconds": round(stats["write_seconds"], 6),
+        }
+
+
+# Global response writer for the stdio transport
+response_writer = ResponseWriter()
@@ -42,6 +42,19 @@ class RateLimiter:
                 ),
                 "burst_size": int(os.getenv("RATE_LIMIT_MCP_BURST_SIZE", "10")),
             },
+            # Admission control cost classes (see src/mcp_tools/admission.py)
+            "mcp_llm": {
+                "requests_per_minute": int(
+                    os.getenv("RATE_LIMIT_MCP_LLM_PER_MINUTE", "60")
+                ),
+                "burst_size": int(os.getenv("RATE_LIMIT_MCP_LLM_BURST_SIZE", "10")),
+            },
+            "mcp_write": {
+                "requests_per_minute": int(
+                    os.getenv("RATE_LIMIT_MCP_WRITE_PER_MINUTE", "300")
+                ),
+                "burst_size": int(os.getenv("RATE_LIMIT_MCP_WRITE_BURST_SIZE", "50")),
+            },
             "authentication": {
                 "requests_per_minute": int(
                     os.getenv("RATE_LIMIT_AUTH_PER_MINUTE", "10")
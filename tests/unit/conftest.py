@@ -0,0 +1,17 @@
+"""Shared fixtures for the unit tests."""
+
+import pytest
+
+
+@pytest.fixture
+def tool_definition():
+    """Factory for minimal MCP tool definitions: ``(name, schema=None)``."""
+
+    def make(name, schema=None):
+        return {
+            "name": name,
+            "description": f"{name} tool",
+            "inputSchema": schema or {"type": "object", "properties": {}},
+        }
+
+    return make
@@ -0,0 +1,108 @@
+"""Tests for admission control in front of the MCP dispatcher."""
+
+import asyncio
+import io
+import json
+import threading
+import time
+
+from src.mcp_tools.admission import (
+    CHEAP,
+    LLM,
+    READ,
+    SERVER_BUSY,
+    AdmissionController,
+)
+from src.mcp_tools.dispatcher import MODE_BLOCKING, RequestDispatcher, Route
+from src.security.rate_limiting import RateLimiter
+
+
+class DenyingLimiter:
+    """Rate limiter stub that refuses everything."""
+
+    def is_allowed(self, client_id, endpoint_type="general"):
+        return {
+            "allowed": False,
+            "reason": "burst_limit_exceeded",
+            "reset_time": time.time() + 2,
+        }
+
+
+def test_cheap_requests_run_before_queued_heavy_ones():
+    """Workers take the highest-priority class that has a free slot."""
+    admission = AdmissionController(limits={LLM: (3, 1, 8)}, rate_limiter=RateLimiter())
+
+    async def scenario():
+        await admission.admit("llm-1", LLM)
+        await admission.admit("llm-2", LLM)
+        await admission.admit("cheap", CHEAP)
+
+        first, cheap_class = await admission.get()
+        second, llm_class = await admission.get()
+        # The second LLM item waits for the single LLM slot
+        assert admission.get_statistics()["classes"][LLM]["depth"] == 1
+
+        await admission.done(llm_class, 5.0)
+        third, _ = await admission.get()
+        return [first, second, third]
+
+    assert asyncio.run(scenario()) == ["cheap", "llm-1", "llm-2"]
+
+
+def test_saturated_class_is_shed_with_retry_hint():
+    """A full class queue and a rate-limited class both fail fast."""
+    admission = AdmissionController(
+        limits={READ: (1, 1, 1)}, rate_limiter=DenyingLimiter(), min_retry_ms=10
+    )
+
+    async def scenario():
+        assert await admission.admit("read-1", READ) is None
+        return await admission.admit("read-2", READ), await admission.admit("x", LLM)
+
+    full, limited = asyncio.run(scenario())
+
+    assert full["code"] == SERVER_BUSY
+    assert full["data"]["reason"] == "queue full"
+    assert full["data"]["retryAfterMs"] >= 10
+    assert "retry after" in full["message"]
+    assert limited["data"]["reason"] == "burst_limit_exceeded"
+    assert limited["data"]["retryAfterMs"] > 1000
+
+    stats = admission.get_statistics()
+    assert stats["shed"] == 2
+    assert stats["classes"][LLM]["rate_limited"] == 1
+
+
+def test_dispatcher_sheds_when_llm_class_is_full():
+    """Requests beyond an LLM class's queue get busy errors immediately."""
+    sent = []
+    lock = threading.Lock()
+
+    def router(message):
+        def run():
+            time.sleep(0.1)
+            with lock:
+                sent.append({"jsonrpc": "2.0", "id": message["id"], "result": "ok"})
+
+        return Route(run, MODE_BLOCKING)
+
+    admission = AdmissionController(limits={LLM: (3, 1, 1)}, rate_limiter=RateLimiter())
+    dispatcher = RequestDispatcher(
+        router,
+        max_workers=2,
+        max_async=2,
+        send_message=sent.append,
+        classify=lambda message: message["method"],
+        admission=admission,
+    )
+    lines = [
+        {"jsonrpc": "2.0", "id": i, "method": LLM if i < 4 else CHEAP} for i in range(5)
+    ]
+    stream = io.StringIO("".join(json.dumps(m) + "\n" for m in lines))
+    asyncio.run(dispatcher.run(stream))
+
+    busy = [m for m in sent if "error" in m]
+    assert busy and all(m["error"]["code"] == SERVER_BUSY for m in busy)
+    assert {m["id"] for m in sent} == {0, 1, 2, 3, 4}
+    assert dispatcher.stats["shed"] == len(busy)
+    assert dispatcher.get_statistics()["admission"]["pending"] == 0
@@ -0,0 +1,99 @@
+"""Tests for the approximate (IVF) index of in-memory vector collections."""
+
+import numpy as np
+
+from src.database.ann_index import IVFConfig, config_from_env, train_centroids
+from src.database.vector_collection import VectorCollection, normalize_rows
+
+
+def _clustered(count, dim=16, topics=8, seed=0):
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(topics, dim))
+    vectors = centres[rng.integers(topics, size=count)] + 0.3 * rng.normal(
+        size=(count, dim)
+    )
+    return normalize_rows(vectors.astype(np.float32))
+
+
+def _collection(vectors, **config):
+    config = {"nlist": 16, "nprobe": 4, "min_points": 500, **config}
+    collection = VectorCollection("docs", ann=IVFConfig(**config))
+    collection.upsert(
+        list(range(len(vectors))), vectors, [{"n": n} for n in range(len(vectors))]
+    )
+    collection.wait_for_training()
+    return collection
+
+
+def test_centroids_are_unit_vectors():
+    centroids = train_centroids(_clustered(400), 8)
+    assert centroids.shape == (8, 16)
+    assert np.allclose(np.linalg.norm(centroids, axis=1), 1.0, atol=1e-5)
+
+
+def test_small_collections_are_searched_exactly():
+    collection = _collection(_clustered(100))
+    assert not collection.ann.trained
+    assert collection.get_info()["ann"] is None
+
+
+def test_probed_search_recalls_exact_neighbours():
+    """Trained searches score few rows, exactly, and find the true top hits."""
+    vectors = _clustered(2000)
+    collection = _collection(vectors)
+    queries = _clustered(50, seed=1)
+
+    assert collection.get_info()["ann"]["nlist"] == 16
+    found = collection.search_batch(queries, limit=10)
+    truth = np.argsort(-(queries @ vectors.T), axis=1)[:, :10]
+    recall = np.mean(
+        [
+            len({hit["id"] for hit in hits} & set(expected)) / 10
+            for hits, expected in zip(found, truth.tolist())
+        ]
+    )
+    assert recall >= 0.9
+    for hits, query in zip(found, queries):
+        scores = vectors[[hit["id"] for hit in hits]] @ query
+        assert np.allclose([hit["score"] for hit in hits], scores, atol=1e-5)
+    assert max(len(rows) for rows in collection.ann.probe(queries)) < 2000
+
+
+def test_writes_after_training_are_filed():
+    """New and overwritten points are found; deleted ones never are."""
+    vectors = _clustered(1000)
+    collection = _collection(vectors)
+    fresh = _clustered(2, seed=7)
+
+    collection.upsert(["new", 0], fresh, [{}, {}])
+    assert collection.search(fresh[0], 1)[0]["id"] == "new"
+    assert collection.search(fresh[1], 1)[0]["id"] == 0
+
+    collection.delete(["new"])
+    assert "new" not in [hit["id"] for hit in collection.search(fresh[0], 10)]
+
+
+def test_compaction_and_clear_keep_the_index_consistent():
+    vectors = _clustered(1000)
+    collection = _collection(vectors)
+
+    collection.delete(list(range(0, 1000, 2)))
+    collection.wait_for_compaction()
+    assert collection.tombstones == 0
+    for n in (1, 501, 999):
+        assert collection.search(vectors[n], 1)[0]["id"] == n
+
+    collection.clear()
+    assert not collection.ann.trained
+    collection.upsert(["a"], vectors[:1], [{}])
+    assert collection.search(vectors[0], 1)[0]["id"] == "a"
+
+
+def test_environment_selects_the_index(monkeypatch):
+    monkeypatch.setenv("VECTOR_ANN_NPROBE", "3")
+    monkeypatch.setenv("VECTOR_ANN_MIN_POINTS", "10")
+    config = config_from_env()
+    assert (config.nprobe, config.min_points, config.nlist) == (3, 10, None)
+
+    monkeypatch.setenv("VECTOR_ANN", "exact")
+    assert config_from_env() is None
@@ -0,0 +1,130 @@
+"""Tests for batched, parallel bulk upserts."""
+
+import threading
+
+import pytest
+
+from src.database.bulk_upsert import iter_batches, point_bytes, upload_batches
+from src.database.enhanced_vector_store import EnhancedVectorStore, InMemoryVectorStore
+
+
+def _points(count, dim=4):
+    for n in range(count):
+        yield {"id": f"p{n}", "vector": [float(n)] * dim, "payload": {"n": n}}
+
+
+def test_batches_are_bounded_by_count_and_bytes():
+    """Batches never exceed either bound; an oversized point travels alone."""
+    points = list(_points(10))
+    by_count = list(iter_batches(points, batch_size=4, max_bytes=0))
+    assert [len(batch) for batch in by_count] == [4, 4, 2]
+
+    limit = 2 * point_bytes(points[0]) + 1
+    by_bytes = list(iter_batches(points, batch_size=100, max_bytes=limit))
+    assert all(len(batch) == 2 for batch in by_bytes)
+    assert sum(by_bytes, []) == points
+
+    huge = {"id": "big", "vector": [0.0] * 1000, "payload": {}}
+    assert [len(b) for b in iter_batches([huge, points[0]], max_bytes=100)] == [1, 1]
+
+
+def test_stream_is_read_only_as_far_as_uploads_allow():
+    """At most ``parallel`` batches are pulled ahead of finished uploads."""
+    pulled = []
+    release = threading.Event()
+
+    def stream():
+        for point in _points(100):
+            pulled.append(point["id"])
+            yield point
+
+    def upload(batch):
+        release.wait(5)
+
+    worker = threading.Thread(
+        target=upload_batches,
+        args=(iter_batches(stream(), batch_size=10, max_bytes=0), upload),
+        kwargs={"parallel": 2},
+    )
+    worker.start()
+    try:
+        threading.Event().wait(0.1)
+        # Two batches in flight plus the one waiting for a slot
+        assert len(pulled) <= 31
+    finally:
+        release.set()
+        worker.join(5)
+    assert len(pulled) == 100
+
+
+def test_failed_batches_are_retried_then_handed_over():
+    """Transient failures are retried; persistent ones reach ``on_failure``."""
+    attempts = {}
+    uploaded, failed = [], []
+
+    def upload(batch):
+        first = batch[0]["id"]
+        attempts[first] = attempts.get(first, 0) + 1
+        if first == "p0" and attempts[first] < 3:
+            raise ConnectionError("flaky")
+        if first == "p5":
+            raise ConnectionError("down")
+        uploaded.extend(point["id"] for point in batch)
+
+    stats = upload_batches(
+        iter_batches(_points(10), batch_size=5, max_bytes=0),
+        upload,
+        parallel=2,
+        max_retries=2,
+        backoff=0,
+        on_failure=lambda batch, error: failed.extend(p["id"] for p in batch),
+    )
+
+    assert attempts == {"p0": 3, "p5": 3}
+    assert stats["retries"] == 4
+    assert len(uploaded) == 5 and len(failed) == 5
+    assert (stats["points"], stats["batches"], stats["failed_batches"]) == (10, 2, 0)
+
+
+def test_batches_without_a_fallback_are_counted_as_failed():
+    def upload(batch):
+        raise ValueError("rejected")
+
+    stats = upload_batches(
+        iter_batches(_points(6), batch_size=3, max_bytes=0),
+        upload,
+        max_retries=1,
+        backoff=0,
+    )
+
+    assert (stats["points"], stats["failed_batches"]) == (0, 2)
+
+
+@pytest.mark.parametrize("make_store", [InMemoryVectorStore, EnhancedVectorStore])
+def test_bulk_upsert_into_memory(make_store):
+    """The in-memory engine and the fallback path take the same stream."""
+    store = make_store() if make_store is InMemoryVectorStore else make_store("memory")
+
+    stats = store.bulk_upsert("docs", _points(1000), batch_size=128)
+    store.bulk_upsert("docs", _points(10))
+
+    assert (stats["points"], stats["batches"]) == (1000, 8)
+    assert store.count_points("docs") == 1000
+    assert store.count_points("docs", {"n": {"gte": 990}}) == 10
+
+
+def test_knowledge_points_build_like_single_upserts():
+    """A bulk-loaded knowledge point equals one written by upsert_knowledge."""
+    single = EnhancedVectorStore("memory")
+    single.upsert_knowledge("k1", "text", [1.0, 0.0], {"domain": "python"})
+    bulk = EnhancedVectorStore("memory")
+    bulk.bulk_upsert(
+        bulk.get_collection_name("knowledge"),
+        [bulk.build_knowledge_point("k1", "text", [1.0, 0.0], {"domain": "python"})],
+    )
+
+    def stored(store):
+        hits = store.search_points(store.get_collection_name("knowledge"), [1.0, 0.0])
+        return [(hit["id"], hit["payload"]["domain"]) for hit in hits]
+
+    assert stored(single) == stored(bulk)
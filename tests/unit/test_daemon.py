@@ -0,0 +1,181 @@
+"""Tests for the shared multi-client MCP daemon and its stdio shim."""
+
+import io
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from src.core.mcp_shim import connect, forward
+from src.mcp_tools.daemon import MCPDaemon, current_session
+from src.mcp_tools.dispatcher import (
+    MODE_BLOCKING,
+    MODE_INLINE,
+    RequestDispatcher,
+    Route,
+)
+
+
+def _dispatcher_factory(session):
+    """Echo server answering with the id of the session that handled a call."""
+
+    def route(message):
+        def handle():
+            session_now = current_session()
+            response = {
+                "jsonrpc": "2.0",
+                "id": message["id"],
+                "result": {
+                    "client": session_now.client_id if session_now else None,
+                    "echo": message["params"]["value"],
+                },
+            }
+            if not session_now.batches.collect(message["id"], response):
+                session_now.writer.write(response)
+
+        mode = MODE_INLINE if message["method"] == "inline" else MODE_BLOCKING
+        return Route(handle, mode)
+
+    return RequestDispatcher(
+        router=route,
+        max_workers=2,
+        send_message=session.send,
+        batches=session.batches,
+        client_id=session.client_id,
+    )
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    address = ("unix", str(tmp_path / "mcp.sock"))
+    if not hasattr(socket, "AF_UNIX"):
+        address = ("tcp", ("127.0.0.1", 0))
+    server = MCPDaemon(_dispatcher_factory, address=address, max_clients=3)
+    server.bind()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.stop()
+    thread.join(5)
+
+
+def _exchange(daemon, lines):
+    sock = connect(daemon.address)
+    with sock:
+        sock.sendall("".join(json.dumps(line) + "\n" for line in lines).encode())
+        sock.shutdown(socket.SHUT_WR)
+        data = b""
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    return [json.loads(line) for line in data.decode().splitlines()]
+
+
+def _call(request_id, value, method="blocking"):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": method,
+        "params": {"value": value},
+    }
+
+
+def test_clients_are_isolated_sessions(daemon):
+    """Concurrent clients reuse request ids but only see their own responses."""
+    results = {}
+
+    def client(name):
+        results[name] = _exchange(
+            daemon, [_call(1, f"{name}-1"), _call(2, f"{name}-2", method="inline")]
+        )
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    for name in ("a", "b"):
+        responses = sorted(results[name], key=lambda r: r["id"])
+        assert [r["result"]["echo"] for r in responses] == [f"{name}-1", f"{name}-2"]
+        # Handlers see the session of the client that sent the request
+        assert len({r["result"]["client"] for r in responses}) == 1
+    assert results["a"][0]["result"]["client"] != results["b"][0]["result"]["client"]
+
+
+def test_batches_are_answered_per_client(daemon):
+    """Batch arrays are collected in the session that received them."""
+    responses = _exchange(daemon, [[_call(1, "x"), _call(2, "y")]])
+
+    assert len(responses) == 1
+    assert sorted(r["result"]["echo"] for r in responses[0]) == ["x", "y"]
+
+
+def test_per_client_metrics(daemon):
+    """Finished clients keep their request and transport counters."""
+    _exchange(daemon, [_call(1, "a"), _call(2, "b"), _call(3, "c")])
+
+    deadline = time.monotonic() + 5
+    while not daemon.get_statistics()["recent_clients"]:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    stats = daemon.get_statistics()
+    client = stats["recent_clients"][0]
+    assert stats["connections"] == 1
+    assert client["requests"] == client["completed"] == 3
+    assert client["messages_sent"] == 3
+    assert client["bytes_sent"] > 0
+    assert not client["connected"]
+
+
+def test_clients_over_the_limit_are_rejected(daemon):
+    """Connections beyond max_clients are closed right away."""
+    held = [connect(daemon.address) for _ in range(3)]
+    try:
+        deadline = time.monotonic() + 5
+        while daemon.get_statistics()["active_clients"] < 3:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        extra = connect(daemon.address)
+        with extra:
+            assert extra.recv(1) == b""
+        assert daemon.get_statistics()["rejected"] == 1
+    finally:
+        for sock in held:
+            sock.close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+def test_stale_socket_is_replaced_but_live_one_is_not(tmp_path, daemon):
+    """A leftover socket file is removed; a listening daemon is not replaced."""
+    with pytest.raises(RuntimeError):
+        MCPDaemon(_dispatcher_factory, address=daemon.address).bind()
+
+    stale = tmp_path / "stale.sock"
+    leftover = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    leftover.bind(str(stale))
+    leftover.close()
+
+    replacement = MCPDaemon(_dispatcher_factory, address=("unix", str(stale)))
+    replacement.bind()
+    replacement.stop()
+    assert not os.path.exists(stale)
+
+
+def test_shim_forwards_stdio(daemon):
+    """The shim relays client lines and daemon replies until the daemon closes."""
+    source = io.BytesIO((json.dumps(_call(7, "via-shim")) + "\n").encode())
+    sink = io.BytesIO()
+
+    forward(connect(daemon.address), source, sink)
+
+    response = json.loads(sink.getvalue())
+    assert response["id"] == 7
+    assert response["result"]["echo"] == "via-shim"
@@ -0,0 +1,215 @@
+"""Tests for the concurrent JSON-RPC dispatcher."""
+
+import asyncio
+import io
+import json
+import threading
+import time
+
+from src.core.cancellation import REQUEST_TIMEOUT, current_token
+from src.mcp_tools.dispatcher import (
+    INVALID_REQUEST,
+    BatchCollector,
+    RequestDispatcher,
+    Route,
+    MODE_ASYNC,
+    MODE_BLOCKING,
+    MODE_INLINE,
+)
+
+
+def _stream(*messages):
+    """Build a line-delimited JSON input stream."""
+    return io.StringIO("".join(json.dumps(m) + "\n" for m in messages))
+
+
+def test_slow_blocking_call_does_not_stall_fast_calls():
+    """A slow blocking handler must not delay cheap requests queued after it."""
+    completed = []
+    lock = threading.Lock()
+
+    def router(message):
+        def run():
+            if message["method"] == "slow":
+                time.sleep(0.3)
+            with lock:
+                completed.append(message["id"])
+
+        return Route(run, MODE_BLOCKING)
+
+    dispatcher = RequestDispatcher(router, max_workers=4, max_async=4)
+    stream = _stream(
+        {"jsonrpc": "2.0", "id": 1, "method": "slow"},
+        {"jsonrpc": "2.0", "id": 2, "method": "fast"},
+        {"jsonrpc": "2.0", "id": 3, "method": "fast"},
+    )
+    asyncio.run(dispatcher.run(stream))
+
+    # Responses arrive out of order and are matched by id
+    assert completed[-1] == 1
+    assert sorted(completed) == [1, 2, 3]
+    assert dispatcher.stats["completed"] == 3
+
+
+def test_async_and_inline_modes():
+    """Coroutine handlers run on the loop, inline handlers run immediately."""
+    results = {}
+
+    def router(message):
+        if message["method"] == "async":
+
+            async def run():
+                await asyncio.sleep(0.01)
+                results[message["id"]] = "async"
+
+            return Route(run, MODE_ASYNC)
+
+        return Route(lambda: results.setdefault(message["id"], "inline"), MODE_INLINE)
+
+    dispatcher = RequestDispatcher(router, max_workers=2, max_async=2)
+    asyncio.run(
+        dispatcher.run(
+            _stream(
+                {"jsonrpc": "2.0", "id": "a", "method": "async"},
+                {"jsonrpc": "2.0", "id": "b", "method": "inline"},
+            )
+        )
+    )
+
+    assert results == {"a": "async", "b": "inline"}
+
+
+def test_errors_and_invalid_json_are_reported():
+    """Handler failures go to on_error; malformed lines are counted and skipped."""
+    errors = []
+
+    def router(message):
+        def run():
+            raise RuntimeError("boom")
+
+        return Route(run, MODE_BLOCKING)
+
+    dispatcher = RequestDispatcher(
+        router, on_error=lambda m, e: errors.append((m["id"], str(e))), max_workers=1
+    )
+    stream = io.StringIO('not json\n{"jsonrpc": "2.0", "id": 7, "method": "x"}\n')
+    asyncio.run(dispatcher.run(stream))
+
+    assert errors == [(7, "boom")]
+    assert dispatcher.stats["invalid"] == 1
+    assert dispatcher.stats["failed"] == 1
+
+
+def test_batch_calls_run_concurrently_and_answer_as_one_array():
+    """A batch array is executed in parallel and answered with one array."""
+    sent = []
+    batches = BatchCollector()
+
+    def router(message):
+        def run():
+            time.sleep(0.2)
+            response = {"jsonrpc": "2.0", "id": message["id"], "result": "ok"}
+            if not batches.collect(message["id"], response):
+                sent.append(response)
+
+        if "id" not in message:
+            return Route(lambda: None, MODE_INLINE)
+        return Route(run, MODE_BLOCKING)
+
+    dispatcher = RequestDispatcher(
+        router, max_workers=4, max_async=4, send_message=sent.append, batches=batches
+    )
+    batch = [
+        {"jsonrpc": "2.0", "id": 1, "method": "a"},
+        {"jsonrpc": "2.0", "id": 2, "method": "b"},
+        {"jsonrpc": "2.0", "method": "notify"},
+        "bogus",
+        {"jsonrpc": "2.0", "id": 3, "method": "c"},
+    ]
+    start = time.perf_counter()
+    asyncio.run(dispatcher.run(_stream(batch, [], {"id": 4, "method": "d"})))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    batched = next(m for m in sent if isinstance(m, list))
+    assert sorted(str(r["id"]) for r in batched) == ["1", "2", "3", "None"]
+    assert {"jsonrpc": "2.0", "id": None, "error": INVALID_REQUEST} in sent
+    assert {"jsonrpc": "2.0", "id": 4, "result": "ok"} in sent
+    assert dispatcher.stats["batches"] == 1
+    assert not batches.open_ids
+
+
+class _SlowStream:
+    """Line stream that pauses before handing out selected lines."""
+
+    def __init__(self, *items):
+        self.items = list(items)
+
+    def readline(self):
+        if not self.items:
+            return ""
+        item = self.items.pop(0)
+        if isinstance(item, float):
+            time.sleep(item)
+            return "\n"
+        return json.dumps(item) + "\n"
+
+
+def test_cancellation_interrupts_running_and_drops_queued_requests():
+    """Cancelled requests stop running, never start, and get no response."""
+    started, finished, sent = [], [], []
+
+    def router(message):
+        async def run():
+            started.append(message["id"])
+            await asyncio.sleep(1)
+            finished.append(message["id"])
+
+        return Route(run, MODE_ASYNC)
+
+    dispatcher = RequestDispatcher(
+        router, max_workers=1, max_async=1, send_message=sent.append
+    )
+    stream = _SlowStream(
+        {"jsonrpc": "2.0", "id": 1, "method": "slow"},
+        {"jsonrpc": "2.0", "id": 2, "method": "slow"},
+        0.05,
+        {"jsonrpc": "2.0", "method": "$/cancelRequest", "params": {"id": 2}},
+        {
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": 1, "reason": "user pressed stop"},
+        },
+    )
+    start = time.perf_counter()
+    asyncio.run(dispatcher.run(stream))
+
+    assert time.perf_counter() - start < 0.5
+    assert started == [1]
+    assert finished == []
+    assert sent == []
+    assert dispatcher.stats["cancelled"] == 2
+    assert not dispatcher.requests
+
+
+def test_deadline_sends_timeout_error_and_cancels_token():
+    """A request outliving its deadline gets -32001 and its token is cancelled."""
+    sent, tokens = [], []
+
+    def router(message):
+        def run():
+            token = current_token()
+            tokens.append(token)
+            token.wait(1)
+
+        return Route(run, MODE_BLOCKING, timeout=0.05)
+
+    dispatcher = RequestDispatcher(
+        router, max_workers=1, max_async=1, send_message=sent.append
+    )
+    asyncio.run(dispatcher.run(_stream({"jsonrpc": "2.0", "id": 5, "method": "x"})))
+
+    assert sent[0]["id"] == 5
+    assert sent[0]["error"]["code"] == REQUEST_TIMEOUT
+    assert tokens[0].cancelled and tokens[0].reason == "timed out"
+    assert dispatcher.stats["timeouts"] == 1
@@ -0,0 +1,94 @@
+"""Tests for the persistent embedding cache."""
+
+import numpy as np
+
+from src.database.embedding_cache import EmbeddingCache, text_digest
+from src.database.embedding_service import EmbeddingService
+
+
+def _vector(seed, size=8):
+    return np.random.default_rng(seed).normal(size=size).astype(np.float32)
+
+
+def test_normalized_text_shares_a_key():
+    """Whitespace and Unicode composition do not change the key."""
+    assert text_digest("  hello \n world ") == text_digest("hello world")
+    assert text_digest("café") == text_digest("café")
+    assert text_digest("Hello") != text_digest("hello")
+
+
+def test_hits_survive_a_restart(tmp_path):
+    """A new cache on the same file serves vectors from disk, then memory."""
+    path = str(tmp_path / "cache.sqlite3")
+    cache = EmbeddingCache(path)
+    cache.put_many("model-a", ["one", "two"], [_vector(1), _vector(2)])
+    cache.close()
+
+    warm = EmbeddingCache(path)
+    first = warm.get_many("model-a", ["one", "two", "three"])
+    second = warm.get_many("model-a", ["one"])
+
+    assert np.array_equal(first[0], _vector(1)) and first[2] is None
+    assert np.array_equal(second[0], _vector(1))
+    assert warm.get_many("model-b", ["one"]) == [None]
+    stats = warm.get_statistics()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (2, 1, 2)
+    assert stats["hit_ratio"] == 0.6
+    assert stats["disk_bytes"] == 2 * 32
+    warm.close()
+
+
+def test_cached_vectors_are_private_copies(tmp_path):
+    """Entries do not pin the encoder's batch and callers get writable copies."""
+    path = str(tmp_path / "cache.sqlite3")
+    batch = np.stack([_vector(1), _vector(2)])
+    cache = EmbeddingCache(path)
+    cache.put_many("m", ["one", "two"], list(batch))
+
+    cached = cache.memory[("m", text_digest("one"))]
+    assert not np.shares_memory(cached, batch)
+    assert cache.memory_bytes == batch.nbytes
+
+    (first,) = cache.get_many("m", ["one"])
+    first[:] = 0
+    assert np.array_equal(cache.get_many("m", ["one"])[0], _vector(1))
+    cache.memory.clear()
+    (from_disk,) = cache.get_many("m", ["two"])
+    assert from_disk.flags.writeable
+    assert not np.shares_memory(from_disk, cache.memory[("m", text_digest("two"))])
+    cache.close()
+
+
+def test_disk_cap_evicts_least_recently_used(tmp_path):
+    """Past the size cap the oldest entries are deleted from the file."""
+    path = str(tmp_path / "cache.sqlite3")
+    cache = EmbeddingCache(path, max_bytes=10 * 32, memory_entries=2)
+    for n in range(10):
+        cache.put_many("m", [f"text {n}"], [_vector(n)])
+    cache.get_many("m", ["text 0"])
+    cache.put_many("m", ["text 10"], [_vector(10)])
+
+    assert cache.stats["evicted"] >= 2
+    assert cache.disk_bytes <= 9 * 32
+    cache.memory.clear()
+    kept = cache.get_many("m", ["text 0", "text 1", "text 10"])
+    assert kept[0] is not None and kept[1] is None and kept[2] is not None
+    cache.close()
+
+
+def test_warm_start_embeds_nothing(tmp_path):
+    """A second service with the same cache file encodes no known text."""
+    path = str(tmp_path / "cache.sqlite3")
+    texts = ["alpha beta", "gamma delta", "alpha beta"]
+    cold = EmbeddingService("hash", batch_window=0, cache=EmbeddingCache(path))
+    expected = cold.encode(texts)
+    assert cold.get_statistics()["texts"] == 2
+
+    warm = EmbeddingService("hash", batch_window=0, cache=EmbeddingCache(path))
+    assert np.allclose(warm.encode(texts), expected)
+    warm.wait_ready(5)
+    assert np.allclose(warm.encode(texts + ["new text"])[:3], expected)
+
+    stats = warm.get_statistics()
+    assert stats["texts"] == 1
+    assert stats["cache"]["misses"] == 1
@@ -0,0 +1,58 @@
+"""Tests for the batched embedding service."""
+
+import asyncio
+import threading
+
+import numpy as np
+
+from src.database.embedding_service import EmbeddingService, hash_embedding
+
+
+def test_hash_embedding_reflects_word_overlap():
+    """The degraded embedding is deterministic, normalized and lexical."""
+    first = hash_embedding("Vector search with NumPy")
+    assert np.array_equal(first, hash_embedding("vector search with numpy"))
+    assert np.isclose(np.linalg.norm(first), 1.0)
+    assert first @ hash_embedding("numpy vector search") > first @ hash_embedding(
+        "project planning meeting"
+    )
+    assert not hash_embedding("").any()
+
+
+def test_concurrent_requests_share_a_batch():
+    """Requests arriving within the batch window are encoded together."""
+    service = EmbeddingService("hash", batch_window=0.2)
+    texts = [f"text number {n}" for n in range(8)]
+    barrier = threading.Barrier(len(texts))
+    results = {}
+
+    def request(text):
+        barrier.wait()
+        results[text] = service.encode_one(text)
+
+    threads = [threading.Thread(target=request, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for text in texts:
+        assert np.allclose(results[text], hash_embedding(text))
+    stats = service.get_statistics()
+    assert stats["texts"] == 8 and stats["requests"] == 8
+    assert stats["batches"] < 8
+    assert stats["batch_size"]["max"] > 1
+    assert stats["degraded"] and stats["model"] == "hash"
+
+
+def test_async_encode_and_missing_model():
+    """An unloadable model falls back to the degraded mode explicitly."""
+    service = EmbeddingService("no-such/model-for-tests", batch_window=0)
+
+    vectors = asyncio.run(service.encode_async(["one", "two"]))
+
+    assert vectors.shape == (2, 384) and vectors.dtype == np.float32
+    assert service.wait_ready(5)
+    assert service.degraded and service.model_id == "hash"
+    assert service.encode([]).shape == (0, 384)
+    assert service.get_statistics()["texts_per_second"] > 0
@@ -0,0 +1,95 @@
+"""Tests for the persistent background event loop."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.core.cancellation import CancelToken, RequestCancelled, bind_token
+from src.core.event_loop import BackgroundEventLoop
+
+
+def test_coroutines_share_one_loop_thread():
+    """Every call runs on the same long-lived loop and thread."""
+    background = BackgroundEventLoop(name="test-loop")
+
+    async def where():
+        return asyncio.get_running_loop(), threading.current_thread().name
+
+    try:
+        first = background.run(where())
+        second = background.run(where())
+
+        assert first == second
+        assert first[1] == "test-loop"
+        assert background.get_statistics()["completed"] == 2
+    finally:
+        background.stop()
+
+    assert not background.running
+
+
+def test_deadline_cancels_coroutine():
+    """A missed deadline raises TimeoutError and cancels the coroutine."""
+    background = BackgroundEventLoop(name="test-loop")
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    try:
+        with pytest.raises(TimeoutError):
+            background.run(slow(), timeout=0.05)
+        assert cancelled.wait(1)
+        assert background.get_statistics()["timeouts"] == 1
+    finally:
+        background.stop()
+
+
+def test_exceptions_propagate_and_reentry_is_refused():
+    """Coroutine errors reach the caller; blocking from the loop is refused."""
+    background = BackgroundEventLoop(name="test-loop")
+
+    async def broken():
+        raise ValueError("boom")
+
+    async def reenter():
+        async def inner():
+            return 1
+
+        background.run(inner())
+
+    try:
+        with pytest.raises(ValueError):
+            background.run(broken())
+        with pytest.raises(RuntimeError):
+            background.run(reenter())
+    finally:
+        background.stop()
+
+
+def test_request_token_bounds_and_cancels_bridged_calls():
+    """The current request's deadline caps waits; cancelling it stops the call."""
+    background = BackgroundEventLoop(name="test-loop")
+    token = CancelToken("req-1", timeout=0.05)
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    try:
+        with bind_token(token):
+            with pytest.raises(TimeoutError):
+                background.run(slow(), timeout=30)
+
+            token.start(None)
+            threading.Timer(0.05, token.cancel).start()
+            with pytest.raises(RequestCancelled):
+                background.run(slow())
+            with pytest.raises(RequestCancelled):
+                background.run(slow())
+    finally:
+        background.stop()
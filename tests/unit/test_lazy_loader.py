@@ -0,0 +1,59 @@
+"""Tests for lazy subsystem loading and the startup profiler."""
+
+import sys
+
+from src.core.lazy_loader import SubsystemLoader
+from src.core.startup_profiler import StartupProfiler
+
+
+def test_subsystem_built_once_on_first_use():
+    """Factories run on first access only, and failures are cached as None."""
+    calls = []
+    loader = SubsystemLoader()
+    loader.register("store", lambda: calls.append("store") or {"ok": True})
+    loader.register("broken", lambda: 1 / 0, warm=False)
+
+    assert not loader.is_loaded("store")
+    assert loader.get("store") == {"ok": True}
+    assert loader.get("store") == {"ok": True}
+    assert calls == ["store"]
+
+    assert loader.get("broken") is None
+    stats = loader.get_statistics()
+    assert stats["store"]["available"] is True
+    assert stats["broken"]["available"] is False
+    assert "division" in stats["broken"]["error"]
+
+
+def test_background_warmup_skips_cold_subsystems():
+    """Warm-up builds warm subsystems and leaves the others lazy."""
+    loader = SubsystemLoader()
+    loader.register("warm", lambda: "warm")
+    loader.register("cold", lambda: "cold", warm=False)
+
+    loader.warm_in_background().join(timeout=5)
+
+    assert loader.is_loaded("warm")
+    assert not loader.is_loaded("cold")
+    assert loader.warm_in_background() is loader.warm_thread
+
+
+def test_startup_profiler_records_imports_and_phases():
+    """Imports and phases before mark_ready are reported against the budget."""
+    profiler = StartupProfiler()
+    profiler.budget_ms = 60_000
+    sys.modules.pop("colorsys", None)
+
+    profiler.install()
+    try:
+        with profiler.phase("import colorsys"):
+            import colorsys  # noqa: F401
+    finally:
+        profiler.uninstall()
+    profiler.mark_ready()
+
+    stats = profiler.get_statistics()
+    assert "colorsys" in [record["module"] for record in stats["slowest_imports"]]
+    assert stats["phases"][0]["phase"] == "import colorsys"
+    assert stats["within_budget"] is True
+    assert "Time to initialize" in profiler.format_report()
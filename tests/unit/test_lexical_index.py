@@ -0,0 +1,140 @@
+"""Tests for the BM25 index and hybrid keyword + vector search."""
+
+from src.database.embedding_service import hash_embedding
+from src.database.enhanced_vector_store import EnhancedVectorStore
+from src.database.lexical_index import BM25Index, fuse_hits
+from src.database.vector_collection import VectorCollection
+
+DOCS = [
+    "React hooks manage component state",
+    "Testing React components with hooks and mocks",
+    "Python asyncio event loops",
+    "Deploying Docker containers",
+    "State machines in embedded C",
+]
+
+
+def _collection(texts=DOCS):
+    collection = VectorCollection("docs")
+    collection.upsert(
+        list(range(len(texts))),
+        [hash_embedding(text, 64) for text in texts],
+        [{"content": text, "project_id": f"p{n % 2}"} for n, text in enumerate(texts)],
+    )
+    return collection
+
+
+def test_bm25_ranks_rarer_and_repeated_terms_higher():
+    index = BM25Index()
+    for row, text in enumerate(DOCS):
+        index.add(row, {"content": text})
+
+    ranked = index.search("react hooks state", 10)
+
+    assert [row for row, _ in ranked][:2] == [0, 1]
+    assert {row for row, _ in ranked} == {0, 1, 4}
+    assert index.search("kubernetes", 10) == []
+
+
+def test_removed_rows_leave_the_postings():
+    index = BM25Index()
+    index.add(0, {"content": "alpha beta"})
+    index.add(1, {"title": "beta", "message": "gamma"})
+    index.remove(0, {"content": "alpha beta"})
+
+    assert "alpha" not in index.postings
+    assert [row for row, _ in index.search("beta gamma", 10)] == [1]
+    assert len(index) == 1 and index.total_length == 2
+
+
+def test_rank_fusion_rewards_agreement():
+    keyword = [{"id": "a", "payload": {}}, {"id": "b", "payload": {}}]
+    vector = [{"id": "b", "payload": {}}, {"id": "c", "payload": {}}]
+
+    fused = fuse_hits([keyword, vector], limit=3)
+
+    assert [hit["id"] for hit in fused] == ["b", "a", "c"]
+
+
+def test_collection_text_search_follows_writes_and_filters():
+    collection = _collection()
+
+    assert [hit["id"] for hit in collection.search_text("react", 10)] == [0, 1]
+    assert [
+        hit["id"] for hit in collection.search_text("react", 10, {"project_id": "p1"})
+    ] == [1]
+
+    collection.upsert([0], [hash_embedding("Vue", 64)], [{"content": "Vue templates"}])
+    collection.delete([1])
+    assert collection.search_text("react", 10) == []
+    assert [hit["id"] for hit in collection.search_text("vue", 10)] == [0]
+
+
+def test_text_index_survives_compaction():
+    texts = [f"note {n} about topic{n % 10}" for n in range(200)]
+    collection = _collection(texts)
+    collection.delete(list(range(0, 200, 2)))
+    collection.wait_for_compaction()
+
+    assert collection.tombstones == 0
+    hits = collection.search_text("topic3", 100)
+    assert sorted(hit["id"] for hit in hits) == list(range(3, 200, 10))
+
+
+def test_hybrid_search_fuses_keyword_and_vector_rank():
+    collection = _collection()
+
+    keyword_only = collection.search_hybrid("docker", limit=3)
+    hybrid = collection.search_hybrid(
+        "docker containers", hash_embedding("Deploying Docker containers", 64), 3
+    )
+
+    assert [hit["id"] for hit in keyword_only] == [3]
+    assert hybrid[0]["id"] == 3 and len(hybrid) == 3
+
+
+def test_simple_searches_rank_in_memory(monkeypatch):
+    """The fast coordinator's searches return relevant payloads first."""
+    monkeypatch.setattr(
+        EnhancedVectorStore,
+        "_get_query_embedding_if_ready",
+        lambda self, text: hash_embedding(text, 64).tolist(),
+    )
+    store = EnhancedVectorStore("memory")
+    for n, text in enumerate(DOCS):
+        store.upsert_knowledge(f"k{n}", text, hash_embedding(text, 64).tolist())
+        store.upsert_conversation(
+            f"c{n}", text, "ok", hash_embedding(text, 64).tolist()
+        )
+
+    knowledge = store.search_knowledge_simple("asyncio event loops", limit=2)
+    conversations = store.search_conversations_simple("docker", limit=1)
+
+    assert knowledge[0]["content"] == "Python asyncio event loops"
+    assert [payload["message"] for payload in conversations] == [
+        "Deploying Docker containers"
+    ]
+
+
+class MissingCollectionClient:
+    """Qdrant client whose searches fail like a missing collection."""
+
+    def search(self, **kwargs):
+        raise RuntimeError("404: collection not found")
+
+
+def test_failed_qdrant_hybrid_search_keeps_qdrant_mode(monkeypatch):
+    """A fast search of a missing collection finds nothing without falling back."""
+    monkeypatch.setattr(
+        EnhancedVectorStore,
+        "_get_query_embedding_if_ready",
+        lambda self, text: hash_embedding(text, 64).tolist(),
+    )
+    store = EnhancedVectorStore("memory")
+    store.fallback_mode = False
+    store.client = MissingCollectionClient()
+    store.set_current_project("new")
+
+    assert store.search_knowledge_simple("react hooks") == []
+    assert store.search_hybrid("knowledge", "react", [1.0, 0.0]) == []
+    assert store.fallback_mode is False
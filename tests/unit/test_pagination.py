@@ -0,0 +1,93 @@
+"""Tests for cursor pagination and field projection of list tools."""
+
+import pytest
+
+from src.mcp_tools.handlers.knowledge_tools import handle_get_all
+from src.mcp_tools.pagination import InvalidCursor, Page, decode_cursor, project
+
+ITEMS = [
+    {"id": n, "body": "x" * 100, "meta": {"chat": f"c{n}", "n": n}} for n in range(7)
+]
+
+
+def _walk(arguments, items=ITEMS, **options):
+    """Follow next_cursor until the last page; returns the pages."""
+    pages = []
+    cursor = None
+    while True:
+        page = Page("list_items", {**arguments, "cursor": cursor}, **options)
+        pages.append(page.apply(items[: page.fetch_count]))
+        cursor = pages[-1]["pagination"]["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_cursor_walk_returns_every_item_once():
+    """Pages follow each other through opaque cursors without gaps."""
+    pages = _walk({"limit": 3})
+
+    assert [len(page["items"]) for page in pages] == [3, 3, 1]
+    assert [item["id"] for page in pages for item in page["items"]] == list(range(7))
+    assert [page["pagination"]["has_more"] for page in pages] == [True, True, False]
+    # Only the last page knows the total when the source is fetched by limit
+    assert pages[-1]["pagination"]["total"] == 7
+
+
+def test_cursor_is_bound_to_its_query():
+    """Cursors are rejected for other tools, other queries or when mangled."""
+    cursor = Page("list_items", {"chat_id": "a", "limit": 2}).apply(ITEMS)[
+        "pagination"
+    ]["next_cursor"]
+
+    assert decode_cursor("list_items", {"chat_id": "a", "limit": 5}, cursor) == 2
+    with pytest.raises(InvalidCursor):
+        Page("list_items", {"chat_id": "b", "cursor": cursor})
+    with pytest.raises(InvalidCursor):
+        Page("other_tool", {"chat_id": "a", "cursor": cursor})
+    with pytest.raises(InvalidCursor):
+        Page("list_items", {"chat_id": "a", "cursor": "not-a-cursor"})
+
+
+def test_fields_projection_selects_nested_keys():
+    """Only requested keys are returned, dotted names reach into dicts."""
+    assert project(ITEMS[1], ["id", "meta.chat", "missing", "body.x"]) == {
+        "id": 1,
+        "meta": {"chat": "c1"},
+    }
+    page = Page("list_items", {"fields": ["id"], "limit": 2}).apply(ITEMS)
+    assert page["items"] == [{"id": 0}, {"id": 1}]
+
+
+def test_oversized_pages_continue_with_a_cursor():
+    """A page stops at the size limit and the cursor resumes after it."""
+    pages = _walk({"limit": 5}, max_bytes=300)
+
+    assert all(len(page["items"]) <= 2 for page in pages)
+    assert pages[0]["pagination"]["truncated"]
+    assert [item["id"] for page in pages for item in page["items"]] == list(range(7))
+
+    # A single item over the limit is still returned so paging progresses
+    page = Page("list_items", {}, max_bytes=10).apply(ITEMS)
+    assert len(page["items"]) == 1
+
+
+def test_get_all_pages_knowledge_items():
+    """The knowledge get_all tool returns a pagination block and cursor."""
+    responses = []
+
+    def send_response(request_id, result=None, error=None):
+        responses.append(result or {"error": error})
+
+    handle_get_all({"limit": 2, "fields": ["title"]}, 1, send_response)
+    first = responses[-1]["structuredContent"]
+    assert first["pagination"]["count"] == 2
+    assert all(set(item) <= {"title"} for item in first["knowledge_items"])
+
+    cursor = first["pagination"]["next_cursor"]
+    handle_get_all(
+        {"limit": 2, "fields": ["title"], "cursor": cursor}, 2, send_response
+    )
+    assert responses[-1]["structuredContent"]["pagination"]["offset"] == 2
+
+    handle_get_all({"limit": 3, "cursor": "bogus"}, 3, send_response)
+    assert responses[-1]["error"]["code"] == -32602
@@ -0,0 +1,107 @@
+"""Tests for the payload indexes behind filtered in-memory search."""
+
+import numpy as np
+
+from src.database.payload_index import PayloadIndex, matches
+from src.database.vector_collection import VectorCollection
+
+
+def _collection(count=40):
+    collection = VectorCollection("docs")
+    collection.upsert(
+        [f"p{n}" for n in range(count)],
+        np.random.default_rng(11).normal(size=(count, 8)),
+        [
+            {
+                "project_id": f"proj{n % 4}",
+                "tags": ["even" if n % 2 == 0 else "odd"],
+                "timestamp": f"2026-01-{n + 1:02d}T00:00:00",
+                "priority": n % 3,
+            }
+            for n in range(count)
+        ],
+    )
+    return collection
+
+
+def test_matches_values_lists_and_ranges():
+    """Plain values, any-of lists and ranges follow the Qdrant semantics."""
+    payload = {"project_id": "a", "tags": ["x", "y"], "timestamp": "2026-02-01"}
+
+    assert matches(payload, {"project_id": "a", "tags": "y"})
+    assert matches(payload, {"project_id": ["b", "a"]})
+    assert matches(payload, {"timestamp": {"gte": "2026-01-01", "lt": "2026-03"}})
+    assert not matches(payload, {"timestamp": {"gt": "2026-02-01"}})
+    assert not matches(payload, {"missing": {"gte": 0}})
+    assert not matches(payload, {"project_id": "a", "tags": "z"})
+
+
+def test_index_lookups_track_removals():
+    """Hash and sorted indexes resolve filters and forget removed rows."""
+    index = PayloadIndex()
+    payloads = [
+        {"project_id": "a", "timestamp": "2026-01-01"},
+        {"project_id": "b", "timestamp": "2026-01-02"},
+        {"project_id": "a", "timestamp": "2026-01-03"},
+    ]
+    for row, payload in enumerate(payloads):
+        index.add(row, payload)
+
+    live = range(3)
+    assert index.candidates({"project_id": "a"}, live, payloads) == [0, 2]
+    assert index.candidates({"timestamp": {"gt": "2026-01-01"}}, live, payloads) == [
+        1,
+        2,
+    ]
+    assert index.candidates(
+        {"project_id": "a", "timestamp": {"lte": "2026-01-02"}}, live, payloads
+    ) == [0]
+
+    index.remove(0, payloads[0])
+    assert index.candidates({"project_id": "a"}, live, payloads) == [2]
+    assert index.candidates({"timestamp": "2026-01-01"}, live, payloads) == []
+
+
+def test_filtered_search_equals_post_filtered_search():
+    """A filtered search ranks exactly the matching points."""
+    collection = _collection()
+    query = list(np.random.default_rng(12).normal(size=8))
+    conditions = {
+        "project_id": ["proj1", "proj2"],
+        "tags": "odd",
+        "timestamp": {"gte": "2026-01-05"},
+        "priority": [0, 1],
+    }
+
+    hits = collection.search(query, limit=40, filter_conditions=conditions)
+
+    expected = [
+        hit["id"]
+        for hit in collection.search(query, limit=40)
+        if matches(hit["payload"], conditions)
+    ]
+    assert [hit["id"] for hit in hits] == expected
+    assert hits and len(hits) < 40
+
+
+def test_indexes_follow_upserts_deletes_and_compaction():
+    """Overwritten, deleted and compacted rows stay consistent with filters."""
+    collection = _collection(160)
+    collection.upsert(["p0"], [[1.0] * 8], [{"project_id": "moved"}])
+    assert [
+        hit["id"]
+        for hit in collection.search(
+            [1.0] * 8, filter_conditions={"project_id": "moved"}
+        )
+    ] == ["p0"]
+    assert "p0" not in {
+        hit["id"] for hit in collection.search([1.0] * 8, 200, {"project_id": "proj0"})
+    }
+
+    assert collection.delete_where({"project_id": ["proj1", "proj2"]}) == 80
+    collection.wait_for_compaction()
+    assert collection.tombstones == 0
+
+    hits = collection.search([1.0] * 8, 200, {"project_id": "proj3"})
+    assert len(hits) == 40
+    assert all(hit["payload"]["project_id"] == "proj3" for hit in hits)
@@ -0,0 +1,168 @@
+"""Tests for progress notifications from streaming MCP tools."""
+
+import asyncio
+
+from src.agents.specialized.project_generation_agent import ProjectGenerationAgent
+from src.core.cancellation import CancelToken, bind_token
+from src.core.event_loop import BackgroundEventLoop
+from src.mcp_tools.progress import PROGRESS_METHOD, progress_enabled
+from src.mcp_tools.registry import ToolRegistry
+
+
+class Recorder:
+    """Collects responses and notifications in the order they are sent."""
+
+    def __init__(self):
+        self.events = []
+
+    def send_response(self, request_id, result=None, error=None):
+        self.events.append(("response", request_id, result, error))
+
+    def notify(self, method, params):
+        self.events.append(("notification", method, params))
+
+    @property
+    def notifications(self):
+        return [event[2] for event in self.events if event[0] == "notification"]
+
+
+def _registry(recorder):
+    registry = ToolRegistry()
+    registry.set_notifier(recorder.notify)
+    return registry
+
+
+def test_generator_tool_streams_progress_before_response(tool_definition):
+    """Every yielded update becomes a notification ahead of the final response."""
+    recorder = Recorder()
+    registry = _registry(recorder)
+    seen = {}
+
+    def handler(arguments, request_id, send_response):
+        seen["enabled"] = progress_enabled()
+        for index in range(3):
+            yield {"total": 3, "message": f"step {index}", "partial": {"n": index}}
+        send_response(request_id, {"done": True})
+
+    registry.register(tool_definition("stream"), handler)
+    assert registry.get("stream").streams
+
+    assert registry.dispatch("stream", {}, 1, recorder.send_response, None, "tok")
+
+    assert seen["enabled"]
+    assert [params["progress"] for params in recorder.notifications] == [1, 2, 3]
+    assert recorder.notifications[0] == {
+        "progressToken": "tok",
+        "progress": 1.0,
+        "total": 3,
+        "message": "step 0",
+        "partial": {"n": 0},
+    }
+    assert all(event[1] == PROGRESS_METHOD for event in recorder.events[:3])
+    assert recorder.events[-1] == ("response", 1, {"done": True}, None)
+
+
+def test_no_notifications_without_progress_token(tool_definition):
+    """Streaming tools still answer normally when the client sent no token."""
+    recorder = Recorder()
+    registry = _registry(recorder)
+
+    def handler(arguments, request_id, send_response):
+        assert not progress_enabled()
+        yield {"message": "working"}
+        send_response(request_id, {"done": True})
+
+    registry.register(tool_definition("stream"), handler)
+    registry.dispatch("stream", {}, 2, recorder.send_response)
+
+    assert recorder.events == [("response", 2, {"done": True}, None)]
+
+
+def test_cancelled_request_stops_generator(tool_definition):
+    """A cancelled request stops the handler at its next update."""
+    recorder = Recorder()
+    registry = _registry(recorder)
+    token = CancelToken(request_id=3)
+    state = {"steps": 0, "closed": False}
+
+    def handler(arguments, request_id, send_response):
+        try:
+            while True:
+                state["steps"] += 1
+                if state["steps"] == 2:
+                    token.cancel()
+                yield {"message": "step"}
+        finally:
+            state["closed"] = True
+
+    registry.register(tool_definition("stream"), handler)
+    with bind_token(token):
+        registry.dispatch("stream", {}, 3, recorder.send_response, None, "tok")
+
+    assert state == {"steps": 2, "closed": True}
+    assert len(recorder.notifications) == 1
+    assert not [event for event in recorder.events if event[0] == "response"]
+
+
+def test_async_generator_tool_streams_progress(tool_definition):
+    """Async generator handlers stream through both dispatch paths."""
+    recorder = Recorder()
+    registry = _registry(recorder)
+    loop = BackgroundEventLoop(name="test-progress-loop")
+
+    async def handler(arguments, request_id, send_response):
+        for _ in range(2):
+            await asyncio.sleep(0)
+            yield {"total": 2}
+        send_response(request_id, {"done": True})
+
+    registry.register(tool_definition("astream"), handler)
+    spec = registry.get("astream")
+    assert spec.is_async and spec.streams
+
+    asyncio.run(
+        registry.dispatch_async(
+            "astream", {}, 4, recorder.send_response, progress_token=7
+        )
+    )
+    assert [params["progress"] for params in recorder.notifications] == [1, 2]
+    assert recorder.events[-1][:2] == ("response", 4)
+
+    try:
+        loop.run(
+            registry.dispatch_async(
+                "astream", {}, 5, recorder.send_response, progress_token=8
+            )
+        )
+    finally:
+        loop.stop()
+    assert [params["progressToken"] for params in recorder.notifications] == [
+        7,
+        7,
+        8,
+        8,
+    ]
+
+
+def test_generate_project_yields_an_update_per_file():
+    """Project generation reports each template file and returns the result."""
+    agent = ProjectGenerationAgent()
+    template = agent.project_templates["python_flask_api"]
+
+    updates = agent.iter_generate_project("python_flask_api", "demo")
+    streamed = []
+    while True:
+        try:
+            streamed.append(next(updates))
+        except StopIteration as done:
+            result = done.value
+            break
+
+    assert result["success"]
+    assert [update["partial"]["file"] for update in streamed] == template.files
+    assert streamed[-1]["progress"] == streamed[-1]["total"] == len(template.files)
+    assert result["project_structure"]["files_to_create"] == template.files
+    # Nothing is written to disk, so nothing is reported as created
+    status = agent.get_project_status(result["project_id"])["project"]
+    assert status["files_created"] == status["directories_created"] == []
+    assert agent.generate_project("missing", "demo")["success"] is False
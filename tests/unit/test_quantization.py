@@ -0,0 +1,138 @@
+"""Tests for int8 quantized storage of in-memory vector collections."""
+
+import os
+
+import numpy as np
+
+from src.database.ann_index import IVFConfig
+from src.database.enhanced_vector_store import InMemoryVectorStore
+from src.database.quantization import (
+    QuantizationConfig,
+    approximate_scores,
+    config_from_env,
+    quantize,
+)
+from src.database.vector_collection import VectorCollection, normalize_rows
+
+
+def _vectors(count, dim=32, seed=0):
+    rng = np.random.default_rng(seed)
+    return normalize_rows(rng.normal(size=(count, dim)).astype(np.float32))
+
+
+def _pair(vectors, **kwargs):
+    """The same points in a float32 and in a quantized collection."""
+    collections = (
+        VectorCollection("exact"),
+        VectorCollection("int8", quantization=QuantizationConfig(), **kwargs),
+    )
+    for collection in collections:
+        collection.upsert(
+            list(range(len(vectors))),
+            vectors,
+            [{"project_id": f"p{n % 3}"} for n in range(len(vectors))],
+        )
+    return collections
+
+
+def test_codes_approximate_the_vectors():
+    vectors = _vectors(100)
+    codes, scales = quantize(vectors)
+
+    assert codes.dtype == np.int8 and np.abs(codes).max() == 127
+    error = np.abs(codes * scales[:, None] - vectors)
+    assert np.all(error <= scales[:, None] / 2 + 1e-7)
+
+    query = _vectors(1, seed=1)
+    assert np.allclose(
+        approximate_scores(codes, scales, query), query @ vectors.T, atol=0.02
+    )
+    rows = np.array([5, 3, 99])
+    assert np.allclose(
+        approximate_scores(codes, scales, query, rows),
+        approximate_scores(codes, scales, query)[:, rows],
+    )
+
+
+def test_rescored_search_matches_exact_search():
+    """Hits and their scores match float32 search; codes take a quarter."""
+    exact, quantized = _pair(_vectors(2000))
+    queries = _vectors(20, seed=2)
+
+    for expected, hits in zip(
+        exact.search_batch(queries, 10), quantized.search_batch(queries, 10)
+    ):
+        # float16 originals may swap near ties, but find the same neighbours
+        overlap = {hit["id"] for hit in hits} & {hit["id"] for hit in expected}
+        assert len(overlap) >= 9
+        assert np.allclose(
+            [hit["score"] for hit in hits],
+            [hit["score"] for hit in expected],
+            atol=1e-3,
+        )
+
+    info = quantized.get_info()["quantization"]
+    assert info["memory_bytes"] * 3 < exact.matrix.nbytes
+    assert quantized.matrix.dtype == np.float16
+
+
+def test_filters_writes_and_compaction_follow_the_codes():
+    vectors = _vectors(400)
+    exact, quantized = _pair(vectors)
+    fresh = _vectors(1, seed=3)
+
+    for collection in (exact, quantized):
+        collection.upsert([7], fresh, [{"project_id": "p2"}])
+        collection.delete(list(range(0, 400, 3)))
+        collection.wait_for_compaction()
+    assert quantized.tombstones == 0
+
+    for conditions in (None, {"project_id": "p1"}):
+        assert [hit["id"] for hit in quantized.search(fresh[0], 5, conditions)] == [
+            hit["id"] for hit in exact.search(fresh[0], 5, conditions)
+        ]
+    assert quantized.search(fresh[0], 1)[0]["id"] == 7
+
+    quantized.clear()
+    assert quantized.search(fresh[0], 5) == []
+
+
+def test_quantized_collections_use_the_approximate_index():
+    vectors = _vectors(1000)
+    _, quantized = _pair(vectors, ann=IVFConfig(nlist=8, nprobe=3, min_points=500))
+    quantized.wait_for_training()
+
+    assert quantized.ann.trained
+    for n in (0, 500, 999):
+        assert quantized.search(vectors[n], 1)[0]["id"] == n
+
+
+def test_quantized_store_reloads_without_leaving_files(tmp_path):
+    vectors = _vectors(50)
+    points = [
+        {"id": n, "vector": list(vector), "payload": {}}
+        for n, vector in enumerate(vectors)
+    ]
+    store = InMemoryVectorStore(str(tmp_path), quantization=QuantizationConfig())
+    store.upsert_points("docs", points)
+    store.write_snapshots()
+    store.upsert_points("docs", [{"id": "late", "vector": [1.0] * 32, "payload": {}}])
+    store.close()
+
+    restarted = InMemoryVectorStore(str(tmp_path), quantization=QuantizationConfig())
+
+    collection = restarted.collections["docs"]
+    assert collection.quantized is not None and len(collection) == 51
+    assert restarted.search_points("docs", list(vectors[4]), 1)[0]["id"] == 4
+    assert restarted.search_points("docs", [1.0] * 32, 1)[0]["id"] == "late"
+    assert not [
+        name for name in os.listdir(tmp_path / "docs") if name.startswith("originals-")
+    ]
+    restarted.close()
+
+
+def test_environment_selects_quantization(monkeypatch):
+    assert config_from_env() is None
+    monkeypatch.setenv("VECTOR_QUANTIZATION", "int8")
+    monkeypatch.setenv("VECTOR_RESCORE", "8")
+    assert config_from_env().rescore == 8
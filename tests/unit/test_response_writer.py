@@ -0,0 +1,78 @@
+"""Tests for the buffered off-thread response writer."""
+
+import io
+import json
+from datetime import datetime
+
+from src.mcp_tools.writer import ResponseWriter
+
+
+def _lines(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_messages_are_written_in_order():
+    """Objects and pre-serialized bytes come out in submission order."""
+    stream = io.BytesIO()
+    writer = ResponseWriter(stream=stream)
+
+    writer.write({"jsonrpc": "2.0", "id": 1, "result": {"n": 1}})
+    writer.write_raw(b'{"jsonrpc":"2.0","id":2,"result":{}}')
+    for i in range(3, 50):
+        writer.write({"jsonrpc": "2.0", "id": i, "result": {"n": i}})
+    writer.close()
+
+    assert [line["id"] for line in _lines(stream)] == list(range(1, 50))
+    stats = writer.get_statistics()
+    assert stats["messages"] == 49
+    assert stats["bytes"] == len(stream.getvalue())
+    assert stats["writes"] <= 49
+
+
+def test_stdlib_encoder_and_unserializable_results():
+    """Results that cannot be encoded become internal errors for that id."""
+    stream = io.BytesIO()
+    writer = ResponseWriter(stream=stream, encoder="json")
+
+    writer.write({"jsonrpc": "2.0", "id": 1, "result": {"value": object()}})
+    writer.write({"jsonrpc": "2.0", "method": "bad", "params": {1: object()}})
+    writer.write({"jsonrpc": "2.0", "id": 2, "result": {"text": "héllo"}})
+    assert writer.flush(timeout=5)
+    writer.close()
+
+    lines = _lines(stream)
+    assert writer.encoder_name == "json"
+    assert lines[0]["error"]["code"] == -32603
+    assert lines[1]["result"]["text"] == "héllo"
+    assert writer.get_statistics()["encode_errors"] == 2
+
+
+def test_fast_encoder_falls_back_to_stdlib():
+    """Whatever encoder is picked, output matches json.loads expectations."""
+    stream = io.BytesIO()
+    writer = ResponseWriter(stream=stream)
+    now = datetime(2024, 1, 1)
+
+    writer.write({"jsonrpc": "2.0", "id": 1, "result": {"keys": {1: "int key"}}})
+    writer.write({"jsonrpc": "2.0", "id": 2, "result": {"when": now.isoformat()}})
+    writer.close()
+
+    lines = _lines(stream)
+    assert lines[0]["result"]["keys"] == {"1": "int key"}
+    assert lines[1]["result"]["when"] == "2024-01-01T00:00:00"
+
+
+def test_batch_responses_are_written_as_one_array():
+    """Batch members, including pre-serialized ones, form a single JSON array."""
+    stream = io.BytesIO()
+    writer = ResponseWriter(stream=stream)
+
+    writer.write_batch(
+        [
+            {"jsonrpc": "2.0", "id": 1, "result": {}},
+            b'{"jsonrpc":"2.0","id":2,"result":{"tools":[]}}',
+        ]
+    )
+    writer.close()
+
+    assert [r["id"] for r in _lines(stream)[0]] == [1, 2]
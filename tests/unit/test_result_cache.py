@@ -0,0 +1,119 @@
+"""Tests for the read-through result cache of idempotent MCP tools."""
+
+import json
+
+import pytest
+
+from src.mcp_tools.result_cache import ResultCache
+from src.mcp_tools.registry import ToolRegistry
+
+
+class Client:
+    """Records what the registry sends back, decoding raw results."""
+
+    def __init__(self):
+        self.results = []
+        self.raw = 0
+
+    def send_response(self, request_id, result=None, error=None):
+        self.results.append(result if error is None else {"error": error})
+
+    def send_raw(self, request_id, data):
+        self.raw += 1
+        self.results.append(json.loads(data))
+
+
+@pytest.fixture
+def setup(tool_definition):
+    registry = ToolRegistry()
+    registry.result_cache = ResultCache(max_entries=8, default_ttl=60, enabled=True)
+    client = Client()
+    registry.set_raw_sender(client.send_raw)
+    state = {"reads": 0, "items": ["a"]}
+
+    def list_items(arguments, request_id, send_response):
+        state["reads"] += 1
+        if arguments.get("fail"):
+            send_response(request_id, error={"code": -32603, "message": "nope"})
+            return
+        send_response(
+            request_id,
+            {"structuredContent": {"success": True, "items": list(state["items"])}},
+        )
+
+    def add_item(arguments, request_id, send_response):
+        state["items"].append(arguments["item"])
+        send_response(request_id, {"structuredContent": {"success": True}})
+
+    registry.register(tool_definition("list_items"), list_items, cache_tags=("items",))
+    registry.register(tool_definition("add_item"), add_item, invalidates=("items",))
+    return registry, client, state
+
+
+def test_repeated_reads_are_served_serialized(setup):
+    """Equal arguments in any key order hit the cache and skip the handler."""
+    registry, client, state = setup
+
+    registry.dispatch("list_items", {"a": 1, "b": 2}, 1, client.send_response)
+    registry.dispatch("list_items", {"b": 2, "a": 1}, 2, client.send_response)
+
+    assert state["reads"] == 1
+    assert client.results[0] == client.results[1]
+    assert client.raw == 2
+    assert registry.result_cache.get_statistics()["hits"] == 1
+    assert registry.get("list_items").to_dict()["cached"]
+
+
+def test_write_tools_invalidate_their_tags(setup):
+    """A write bumping the tag makes the next read run the handler again."""
+    registry, client, state = setup
+
+    registry.dispatch("list_items", {}, 1, client.send_response)
+    registry.dispatch("add_item", {"item": "b"}, 2, client.send_response)
+    registry.dispatch("list_items", {}, 3, client.send_response)
+
+    assert state["reads"] == 2
+    assert client.results[-1]["structuredContent"]["items"] == ["a", "b"]
+    assert registry.result_cache.get_statistics()["invalidated"] == 1
+
+
+def test_write_during_read_leaves_result_uncached():
+    """A result computed before a concurrent write finished is not served."""
+    cache = ResultCache(max_entries=8, default_ttl=60, enabled=True)
+    key = cache.make_key("list_items", {})
+    versions = cache.versions(("items",))
+    cache.invalidate("items")
+    cache.put(key, {"items": ["old"]}, ("items",), versions)
+
+    assert cache.get(key) is None
+
+
+def test_errors_are_not_cached(setup):
+    """Error responses always go back to the handler next time."""
+    registry, client, state = setup
+
+    registry.dispatch("list_items", {"fail": True}, 1, client.send_response)
+    registry.dispatch("list_items", {"fail": True}, 2, client.send_response)
+
+    assert state["reads"] == 2
+    assert client.results[0] == {"error": {"code": -32603, "message": "nope"}}
+
+
+def test_lru_and_ttl_eviction(monkeypatch):
+    """The least recently used entry goes first and expired entries miss."""
+    now = [1000.0]
+    monkeypatch.setattr("src.mcp_tools.result_cache.time.monotonic", lambda: now[0])
+    cache = ResultCache(max_entries=2, default_ttl=10, enabled=True)
+    keys = [cache.make_key("tool", {"n": n}) for n in range(3)]
+
+    cache.put(keys[0], 0)
+    cache.put(keys[1], 1)
+    assert cache.get(keys[0]) == b"0"
+    cache.put(keys[2], 2)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == b"0"
+    now[0] += 11
+    assert cache.get(keys[2]) is None
+    assert cache.get_statistics()["evictions"] == 1
+    assert cache.get_statistics()["expired"] == 1
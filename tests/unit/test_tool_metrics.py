@@ -0,0 +1,139 @@
+"""Tests for per-tool latency histograms and their Prometheus export."""
+
+import io
+import random
+import threading
+import time
+
+from src.core.cancellation import CancelToken, bind_token
+from src.core.tool_metrics import (
+    BUCKET_COUNT,
+    CALLS,
+    ERRORS,
+    Histogram,
+    ToolMetrics,
+    bucket_index,
+    bucket_upper_bound,
+    load_exports,
+    render_prometheus,
+)
+from src.mcp_tools import registry as registry_module
+from src.mcp_tools.registry import ToolRegistry
+from src.mcp_tools.writer import ResponseWriter
+
+
+def test_histogram_percentiles_within_bucket_precision():
+    """Percentiles land within ~3% of the exact value in bounded memory."""
+    rng = random.Random(7)
+    values = sorted(int(rng.lognormvariate(9, 1.5)) for _ in range(20000))
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+
+    for percent in (50, 90, 99):
+        exact = values[int(len(values) * percent / 100) - 1]
+        assert abs(histogram.percentile(percent) - exact) <= exact * 0.035 + 1
+    assert histogram.max == values[-1]
+    assert histogram.count == len(values)
+    assert len(histogram.counts) <= BUCKET_COUNT
+    assert bucket_index(2**60) == BUCKET_COUNT - 1
+
+    for value in (0, 63, 64, 65, 127, 128, 10**6):
+        assert value <= bucket_upper_bound(bucket_index(value))
+
+    restored = Histogram.from_dict(histogram.to_dict())
+    assert restored.percentile(95) == histogram.percentile(95)
+
+
+def test_shards_of_finished_threads_are_kept():
+    """Values recorded by threads that exited still show up in snapshots."""
+    metrics = ToolMetrics(enabled=True)
+
+    def work():
+        for _ in range(100):
+            metrics.increment("search", CALLS)
+            metrics.record("search", "execution_us", 1000)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    metrics.increment("search", CALLS)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["search"][CALLS] == 401
+    assert snapshot["search"]["execution_us"].count == 400
+    # Dead shards were folded; a second snapshot does not double count
+    assert metrics.snapshot()["search"][CALLS] == 401
+
+
+def test_registry_times_tool_calls(monkeypatch, tool_definition):
+    """Dispatch records calls, queue wait, execution time and errors."""
+    metrics = ToolMetrics(enabled=True)
+    monkeypatch.setattr(registry_module, "tool_metrics", metrics)
+    registry = ToolRegistry()
+
+    def slow(arguments, request_id, send_response):
+        time.sleep(0.02)
+        send_response(request_id, {"ok": True})
+
+    def failing(arguments, request_id, send_response):
+        raise ValueError("boom")
+
+    registry.register(tool_definition("slow"), slow)
+    registry.register(tool_definition("failing"), failing)
+
+    token = CancelToken(request_id=1)
+    token.created -= 0.05
+    with bind_token(token):
+        registry.dispatch("slow", {}, 1, lambda *args, **kwargs: None)
+    registry.dispatch("failing", {}, 2, lambda *args, **kwargs: None)
+
+    stats = metrics.get_statistics()["tools"]
+    assert stats["slow"]["calls"] == 1
+    assert stats["slow"]["execution_ms"]["p50"] >= 19
+    assert stats["slow"]["queue_wait_ms"]["p50"] >= 49
+    assert stats["failing"]["calls"] == 1
+    assert stats["failing"]["queue_wait_ms"]["count"] == 0
+
+
+def test_writer_records_serialization_for_labelled_responses():
+    """Responses written with a tool label count toward its size histogram."""
+    metrics = ToolMetrics(enabled=True)
+    writer = ResponseWriter(stream=io.BytesIO(), encoder="json", metrics=metrics)
+    writer.write({"jsonrpc": "2.0", "id": 1, "result": {"x": "y" * 100}}, "search")
+    writer.write({"jsonrpc": "2.0", "method": "notifications/progress"})
+    writer.close()
+
+    entry = metrics.snapshot()["search"]
+    assert entry["serialization_us"].count == 1
+    assert entry["response_bytes"].count == 1
+    assert entry["response_bytes"].max > 100
+    assert list(metrics.snapshot()) == ["search"]
+
+
+def test_export_and_prometheus_rendering(tmp_path):
+    """Exported snapshots render as Prometheus counters and histograms."""
+    metrics = ToolMetrics(enabled=True)
+    for micros in (400, 3000, 2_000_000):
+        metrics.increment("search", CALLS)
+        metrics.record("search", "execution_us", micros)
+    metrics.increment("search", ERRORS)
+    metrics.export(str(tmp_path / "mcp_1.json"), instance_id="mcp_1")
+
+    snapshots = load_exports(str(tmp_path))
+    assert [snapshot["instance_id"] for snapshot in snapshots] == ["mcp_1"]
+    assert load_exports(str(tmp_path), instance_id="missing") == []
+
+    text = render_prometheus(snapshots)
+    labels = 'instance_id="mcp_1",tool="search"'
+    assert f"mcp_tool_calls_total{{{labels}}} 3" in text
+    assert f"mcp_tool_errors_total{{{labels}}} 1" in text
+    assert "# TYPE mcp_tool_execution_seconds histogram" in text
+    assert f'mcp_tool_execution_seconds_bucket{{{labels},le="0.0005"}} 1' in text
+    assert f'mcp_tool_execution_seconds_bucket{{{labels},le="0.005"}} 2' in text
+    assert f'mcp_tool_execution_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+    assert f"mcp_tool_execution_seconds_count{{{labels}}} 3" in text
+    # Histograms without samples are left out
+    assert "mcp_tool_response_bytes_count" not in text
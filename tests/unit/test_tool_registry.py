@@ -0,0 +1,143 @@
+"""Tests for the decorator-based MCP tool registry."""
+
+import asyncio
+import json
+
+from src.mcp_tools.catalog import ToolCatalog
+from src.mcp_tools.registry import ToolRegistry, compile_schema_validator
+from src.mcp_tools.consolidated_handlers import (
+    get_all_mcp_tools,
+    get_tool_spec,
+    handle_mcp_tool,
+)
+
+
+class ResponseRecorder:
+    """Collects send_response calls."""
+
+    def __init__(self):
+        self.responses = []
+
+    def __call__(self, request_id, result=None, error=None):
+        self.responses.append({"id": request_id, "result": result, "error": error})
+
+
+def test_schema_validator():
+    """Compiled validators check required keys, types, enums and items."""
+    validate = compile_schema_validator(
+        {
+            "type": "object",
+            "properties": {
+                "count": {"type": "integer"},
+                "mode": {"type": "string", "enum": ["fast", "slow"]},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["count"],
+        }
+    )
+
+    assert validate({"count": 1, "mode": "fast", "tags": ["a"]}) is None
+    assert "count" in validate({})
+    assert "integer" in validate({"count": "1"})
+    assert "integer" in validate({"count": True})
+    assert "one of" in validate({"count": 1, "mode": "medium"})
+    assert "tags[]" in validate({"count": 1, "tags": [1]})
+    assert validate({"count": 1, "mode": None}) is None
+
+
+def test_decorator_registration_and_dispatch(tool_definition):
+    """Tools registered with @tool are dispatched by name with their flags."""
+    registry = ToolRegistry()
+    tool = registry.bind(
+        [
+            tool_definition(
+                "echo",
+                {
+                    "type": "object",
+                    "properties": {"text": {"type": "string"}},
+                    "required": ["text"],
+                },
+            ),
+            tool_definition("wait"),
+        ],
+        group="test",
+    )
+
+    @tool("echo", blocking=False)
+    def echo(arguments, request_id, send_response):
+        send_response(request_id, {"text": arguments["text"]})
+
+    @tool("wait")
+    async def wait(arguments, request_id, send_response):
+        await asyncio.sleep(0)
+        send_response(request_id, {"waited": True})
+
+    assert registry.get("echo").blocking is False
+    assert registry.get("wait").is_async is True
+    assert [d["name"] for d in registry.list_definitions()] == ["echo", "wait"]
+
+    recorder = ResponseRecorder()
+    assert registry.dispatch("echo", {"text": "hi"}, 1, recorder)
+    assert registry.dispatch("echo", {}, 2, recorder)
+    assert asyncio.run(registry.dispatch_async("wait", {}, 3, recorder))
+    assert not registry.dispatch("missing", {}, 4, recorder)
+
+    assert recorder.responses[0]["result"] == {"text": "hi"}
+    assert recorder.responses[1]["error"]["code"] == -32602
+    assert recorder.responses[2]["result"] == {"waited": True}
+
+    assert registry.unregister("echo")
+    assert registry.get("echo") is None
+
+
+def test_handler_exceptions_become_errors(tool_definition):
+    """Unexpected handler failures are reported as internal errors."""
+    registry = ToolRegistry()
+    tool = registry.bind([tool_definition("broken")], group="test")
+
+    @tool("broken")
+    def broken(arguments, request_id, send_response):
+        raise RuntimeError("boom")
+
+    recorder = ResponseRecorder()
+    assert registry.dispatch("broken", {}, 1, recorder)
+    assert recorder.responses[0]["error"]["code"] == -32603
+
+
+def test_builtin_tools_are_registered():
+    """Every handler module registers its tools exactly once."""
+    names = [tool["name"] for tool in get_all_mcp_tools()]
+
+    assert len(names) == len(set(names))
+    assert {"add_numbers", "get_domains", "get_security_status"} <= set(names)
+    assert get_tool_spec("add_numbers").blocking is False
+    assert get_tool_spec("chat_with_coordinator").blocking is True
+    assert get_tool_spec("add_numbers").cost == "cheap"
+    assert get_tool_spec("get_project_status").cost == "read"
+    assert get_tool_spec("chat_with_coordinator").cost == "llm"
+    assert get_tool_spec("generate_project").cost == "write"
+
+    recorder = ResponseRecorder()
+    assert handle_mcp_tool("add_numbers", {"a": 2, "b": 3}, 1, recorder)
+    assert recorder.responses[0]["result"]["structuredContent"] == {"result": 5}
+
+
+def test_catalog_is_cached_until_registry_changes(tool_definition):
+    """The serialized catalogue is rebuilt only when tools change."""
+    registry = ToolRegistry()
+    tool = registry.bind([tool_definition("one"), tool_definition("two")], group="test")
+    tool("one")(lambda arguments, request_id, send_response: None)
+
+    catalog = ToolCatalog(registry, {"name": "test"})
+    first = catalog.tools_list_bytes
+    version = catalog.version
+
+    assert json.loads(first) == {"tools": [tool_definition("one")]}
+    assert catalog.tools_list_bytes is first
+    assert catalog.builds == 1
+
+    tool("two")(lambda arguments, request_id, send_response: None)
+    assert catalog.version != version
+    assert len(json.loads(catalog.tools_list_bytes)["tools"]) == 2
+    assert json.loads(catalog.initialize_bytes)["serverInfo"]["name"] == "test"
+    assert catalog.builds == 2
@@ -0,0 +1,164 @@
+"""Tests for the NumPy engine behind the in-memory vector store."""
+
+import numpy as np
+
+from src.database.enhanced_vector_store import EnhancedVectorStore, InMemoryVectorStore
+from src.database.vector_collection import VectorCollection, top_k
+
+
+def _points(vectors, start=0):
+    return [
+        {"id": f"p{n}", "vector": list(vector), "payload": {"n": n}}
+        for n, vector in enumerate(vectors, start=start)
+    ]
+
+
+def test_search_matches_exact_cosine_ranking():
+    """Hits come back best first with the cosine similarity as score."""
+    rng = np.random.default_rng(3)
+    vectors = rng.normal(size=(300, 32))
+    query = rng.normal(size=32)
+    store = InMemoryVectorStore()
+    store.upsert_points("docs", _points(vectors))
+
+    hits = store.search_points("docs", list(query), limit=5)
+
+    cosine = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+    expected = np.argsort(-cosine)[:5]
+    assert [hit["id"] for hit in hits] == [f"p{n}" for n in expected]
+    assert np.allclose([hit["score"] for hit in hits], cosine[expected], atol=1e-5)
+    assert hits[0]["payload"] == {"n": int(expected[0])}
+
+
+def test_matrix_grows_by_doubling():
+    """Appends keep rows in one contiguous float32 matrix."""
+    collection = VectorCollection("docs")
+    for n in range(100):
+        collection.upsert([n], [[float(n), 1.0]], [{}])
+
+    assert len(collection) == 100
+    assert collection.capacity == 128
+    assert collection.matrix.dtype == np.float32
+    assert collection.matrix.flags["C_CONTIGUOUS"]
+    assert np.allclose(np.linalg.norm(collection.matrix[:100], axis=1), 1.0)
+
+
+def test_batch_search_equals_single_queries():
+    """One batch call returns the same hits as a call per query."""
+    rng = np.random.default_rng(5)
+    store = InMemoryVectorStore()
+    store.upsert_points("docs", _points(rng.normal(size=(50, 8))))
+    queries = [list(query) for query in rng.normal(size=(4, 8))]
+
+    batch = store.search_points_batch("docs", queries, limit=3)
+
+    single = [store.search_points("docs", query, limit=3) for query in queries]
+    for batch_hits, single_hits in zip(batch, single):
+        assert [hit["id"] for hit in batch_hits] == [hit["id"] for hit in single_hits]
+        assert np.allclose(
+            [hit["score"] for hit in batch_hits], [hit["score"] for hit in single_hits]
+        )
+    assert store.search_points_batch("missing", queries) == [[], [], [], []]
+
+
+def test_mismatched_and_zero_vectors():
+    """Short vectors are zero padded and zero vectors score zero."""
+    collection = VectorCollection("docs")
+    collection.upsert(["a", "b", "c"], [[1, 0, 0], [0, 1], [0, 0, 0]], [{}, {}, {}])
+
+    hits = collection.search([0, 1, 0, 5], limit=10)
+    assert [hit["id"] for hit in hits] == ["b", "a", "c"]
+    assert hits[-1]["score"] == 0.0
+    assert list(top_k(np.array([0.1, 0.9, 0.5]), 2)) == [1, 2]
+
+    store = InMemoryVectorStore()
+    store.create_collection("sized", vector_size=4)
+    store.upsert_points("sized", [{"id": "a", "vector": [1.0, 0.0], "payload": {}}])
+    assert store.collections["sized"].vector_size == 4
+
+
+def test_reset_project_memory_in_fallback_mode():
+    """Resetting a project keeps general knowledge and stays searchable."""
+    store = EnhancedVectorStore("memory")
+    store.set_current_project("demo")
+    store.upsert_knowledge("k1", "project note", [1.0, 0.0])
+    store.upsert_points(
+        store.get_collection_name("knowledge"),
+        [{"id": "k2", "vector": [0.0, 1.0], "payload": {"content": "general"}}],
+    )
+    store.upsert_conversation("c1", "hi", "hello", [1.0, 0.0])
+
+    assert store.reset_project_memory("demo")
+
+    assert [
+        point["id"]
+        for point in store.in_memory_store.collections["project_demo_knowledge"]
+    ] == ["k2"]
+    assert store.search_knowledge([1.0, 1.0])[0]["id"] == "k2"
+    assert store.search_conversations([1.0, 0.0]) == []
+
+
+def test_upsert_overwrites_existing_ids():
+    """Re-upserting an id replaces its row instead of adding one."""
+    store = InMemoryVectorStore()
+    store.upsert_points("docs", _points([[1, 0], [0, 1]]))
+    store.upsert_points(
+        "docs",
+        [
+            {"id": "p0", "vector": [0, 1], "payload": {"n": "new"}},
+            {"id": "p2", "vector": [1, 1], "payload": {"n": 2}},
+            {"id": "p2", "vector": [1, 0], "payload": {"n": "last"}},
+        ],
+    )
+
+    collection = store.collections["docs"]
+    assert len(collection) == 3 and collection.rows == 3
+    hits = store.search_points("docs", [1, 0], limit=10)
+    assert [(hit["id"], hit["payload"]["n"]) for hit in hits[:1]] == [("p2", "last")]
+    assert {hit["id"]: hit["payload"]["n"] for hit in hits}["p0"] == "new"
+
+
+def test_delete_by_id_and_filter_hides_points():
+    """Deleted points drop out of search, iteration and the point count."""
+    store = InMemoryVectorStore()
+    store.upsert_points("docs", _points(np.eye(4)))
+
+    assert store.delete_points("docs", point_ids=["p0", "missing"]) == 1
+    assert store.delete_points("docs", filter_conditions={"n": 1}) == 1
+
+    assert [hit["id"] for hit in store.search_points("docs", [1, 1, 1, 1])] == [
+        "p2",
+        "p3",
+    ]
+    assert sorted(point["id"] for point in store.collections["docs"]) == ["p2", "p3"]
+    info = store.get_collection_info("docs")
+    assert info["points_count"] == 2 and info["tombstones"] == 2
+
+
+def test_compaction_reclaims_tombstones():
+    """Passing the tombstone threshold compacts the matrix in the background."""
+    collection = VectorCollection("docs")
+    ids = list(range(200))
+    collection.upsert(ids, np.random.default_rng(7).normal(size=(200, 4)), [{}] * 200)
+
+    collection.delete(ids[:30])
+    assert collection.tombstones == 30
+    collection.delete(ids[30:150])
+    collection.wait_for_compaction()
+
+    assert collection.tombstones == 0
+    assert len(collection) == collection.rows == 50
+    assert collection.capacity == 64
+    assert 150 in collection and 10 not in collection
+    assert {hit["id"] for hit in collection.search([1, 0, 0, 0], limit=100)} == set(
+        ids[150:]
+    )
+
+
+def test_knowledge_reupsert_is_idempotent():
+    """Knowledge ids that are not UUID-like still map to one stable point."""
+    store = EnhancedVectorStore("memory")
+    for _ in range(3):
+        store.upsert_knowledge("domain_some_title", "content", [1.0, 0.0])
+
+    assert store.get_collection_info("knowledge")["points_count"] == 1
@@ -0,0 +1,134 @@
+"""Tests for on-disk storage of the in-memory vector store."""
+
+import os
+
+import numpy as np
+
+from src.database import vector_collection
+from src.database.enhanced_vector_store import EnhancedVectorStore, InMemoryVectorStore
+from src.database.vector_collection import VectorCollection
+from src.database.vector_persistence import CollectionJournal
+
+
+def _points(vectors, project="demo"):
+    return [
+        {
+            "id": f"p{n}",
+            "vector": list(vector),
+            "payload": {"project_id": project, "n": n},
+        }
+        for n, vector in enumerate(vectors)
+    ]
+
+
+def test_restart_replays_the_write_ahead_log(tmp_path):
+    """Upserts, overwrites, deletes and clears survive a restart."""
+    vectors = np.random.default_rng(1).normal(size=(20, 6))
+    store = InMemoryVectorStore(str(tmp_path))
+    store.upsert_points("docs", _points(vectors))
+    store.upsert_points(
+        "docs", [{"id": "p3", "vector": [1] * 6, "payload": {"n": "new"}}]
+    )
+    store.delete_points("docs", point_ids=["p0", "p1"])
+    store.upsert_points("scratch", _points(vectors[:2]))
+    store.collections["scratch"].clear()
+    expected = store.search_points("docs", [1] * 6, limit=5)
+    store.close()
+
+    restarted = InMemoryVectorStore(str(tmp_path))
+
+    assert sorted(restarted.collections) == ["docs", "scratch"]
+    assert len(restarted.collections["docs"]) == 18
+    assert len(restarted.collections["scratch"]) == 0
+    hits = restarted.search_points("docs", [1] * 6, limit=5)
+    assert [hit["id"] for hit in hits] == [hit["id"] for hit in expected]
+    assert hits[0]["payload"] == {"n": "new"}
+    assert restarted.search_points("docs", [1] * 6, filter_conditions={"n": 5})
+    restarted.close()
+
+
+def test_archived_payloads_survive_a_restart(tmp_path):
+    """Archiving logs its payload update and keeps the indexes in step."""
+    store = EnhancedVectorStore("memory", storage_dir=str(tmp_path))
+    store.set_current_project("p1")
+    store.upsert_knowledge("k1", "release notes", [1.0, 0.0])
+    original = next(iter(store.in_memory_store.collections["project_p1_knowledge"]))
+
+    assert store.archive_project_memory("p1")
+    assert "archived" not in original["payload"]
+    store.in_memory_store.close()
+
+    restarted = InMemoryVectorStore(str(tmp_path))
+    collection = restarted.collections["project_p1_knowledge"]
+    (point,) = list(collection)
+    assert point["payload"]["archived"] is True
+    assert point["payload"]["project_id"] == "p1"
+    assert collection.count_matching({"archived": True}) == 1
+    assert collection.search_text("release", 5)[0]["id"] == point["id"]
+    restarted.close()
+
+
+def test_snapshot_maps_segment_and_drops_old_logs(tmp_path):
+    """A snapshot replaces the logs; a restart maps it and replays what follows."""
+    vectors = np.random.default_rng(2).normal(size=(50, 4))
+    store = InMemoryVectorStore(str(tmp_path))
+    store.upsert_points("docs", _points(vectors))
+    store.delete_points("docs", filter_conditions={"n": [0, 1, 2]})
+    store.write_snapshots()
+    store.close()
+
+    directory = os.path.join(str(tmp_path), "docs")
+    names = sorted(os.listdir(directory))
+    assert "segment-00000002.npy" in names and "snapshot-00000002.json" in names
+    assert not [name for name in names if name.startswith("wal-00000001")]
+
+    restarted = InMemoryVectorStore(str(tmp_path))
+    collection = restarted.collections["docs"]
+    assert len(collection) == 47
+    assert isinstance(collection.matrix, np.memmap)
+    assert "p0" not in collection and "p3" in collection
+
+    restarted.upsert_points(
+        "docs", [{"id": "late", "vector": [1, 0, 0, 0], "payload": {}}]
+    )
+    restarted.close()
+    again = InMemoryVectorStore(str(tmp_path))
+    assert len(again.collections["docs"]) == 48
+    assert again.search_points("docs", [1, 0, 0, 0], limit=1)[0]["id"] == "late"
+    again.close()
+
+
+def test_background_snapshot_after_threshold(tmp_path, monkeypatch):
+    """Enough logged rows trigger a snapshot without an explicit call."""
+    monkeypatch.setattr(vector_collection, "SNAPSHOT_EVERY", 10)
+    collection = VectorCollection("docs")
+    collection.attach(CollectionJournal(str(tmp_path)))
+
+    collection.upsert(list(range(12)), np.eye(12), [{}] * 12)
+    collection.wait_for_snapshot()
+
+    assert collection.journal.pending == 0
+    assert (tmp_path / "CURRENT").read_text() == "2"
+    collection.close()
+
+
+def test_second_process_opens_read_only(tmp_path):
+    """Without the writer lock a journal maps the data but never writes."""
+    writer = VectorCollection("docs")
+    writer.attach(CollectionJournal(str(tmp_path)))
+    writer.upsert(["a"], [[1.0, 0.0]], [{}])
+
+    reader_journal = CollectionJournal(str(tmp_path))
+    reader = VectorCollection("docs")
+    reader.attach(reader_journal)
+    reader.upsert(["b"], [[0.0, 1.0]], [{}])
+
+    assert reader_journal.read_only
+    assert "a" in reader and "b" in reader
+    writer.close()
+
+    restarted = VectorCollection("docs")
+    restarted.attach(CollectionJournal(str(tmp_path)))
+    assert "a" in restarted and "b" not in restarted
+    restarted.close()
+    reader.close()